@@ -0,0 +1,45 @@
+{% macro attribution_window_filter(date_column) %}
+    {#
+    Condition selecting the rows an incremental attribution run reprocesses.
+
+    Attribution tables are rebuilt per (tenant_id, order date) window rather
+    than per row: a late-arriving session or campaign can change which
+    campaigns an order is credited to, so every row for an order in the
+    window is recomputed.
+
+    - Backfill mode (backfill_start_date/backfill_end_date vars): the backfill
+      range, optionally narrowed to backfill_tenant_id
+    - Otherwise: the trailing attribution_lookback_days (default 30, matching
+      the Shopify lookback for late refunds and session events)
+
+    Args:
+        date_column: Order/conversion timestamp column the table is partitioned by
+
+    Usage:
+        {% if is_incremental() %}
+            where {{ attribution_window_filter('order_created_at') }}
+        {% endif %}
+    #}
+    {% if var('backfill_start_date', none) and var('backfill_end_date', none) %}
+        {{ backfill_date_filter(date_column, var('backfill_start_date'), var('backfill_end_date')) }}
+        {% if var('backfill_tenant_id', none) %}
+            and tenant_id = '{{ var("backfill_tenant_id") }}'
+        {% endif %}
+    {% else %}
+        {{ date_column }} >= current_date - interval '{{ var("attribution_lookback_days", 30) }} days'
+    {% endif %}
+{% endmacro %}
+
+
+{% macro attribution_window_delete(date_column) %}
+    {#
+    pre_hook for incremental attribution models: clears the window about to
+    be reprocessed so orders whose touchpoints changed (or that dropped out
+    of attribution entirely) leave no stale rows behind. Renders to nothing
+    on the first build and on --full-refresh, where dbt skips empty hooks.
+    #}
+    {% if is_incremental() %}
+        delete from {{ this }}
+        where {{ attribution_window_filter(date_column) }}
+    {% endif %}
+{% endmacro %}
@@ -0,0 +1,98 @@
+{% macro normalize_shop_domain(column) %}
+    {#
+    Normalize a Shopify shop URL to the shop_domain used for tenant mapping:
+    lowercase, protocol and trailing slash stripped.
+
+    Args:
+        column: Raw shop URL column (e.g., 'shop_url')
+    #}
+    lower(
+        trim(
+            trailing '/' from
+            regexp_replace(
+                coalesce({{ column }}, ''),
+                '^https?://',
+                '',
+                'i'
+            )
+        )
+    )
+{% endmacro %}
+
+
+{% macro staging_watermark(column) %}
+    {#
+    Lower bound for the source rows an incremental staging model picks up.
+
+    Returns the newest value of `column` already in the model minus
+    var('staging_watermark_overlap_hours'), so rows committed to the source
+    slightly out of order (long-running Airbyte syncs, webhook retries) are
+    re-read on the next run instead of being skipped. Re-read rows are
+    replaced via the model's unique_key, so the overlap never duplicates.
+
+    Args:
+        column: Column of {{ this }} holding the source extraction time
+                (e.g., 'airbyte_emitted_at', 'created_at')
+
+    Example:
+        {% if is_incremental() %}
+            where received_at >= {{ staging_watermark('airbyte_emitted_at') }}
+        {% endif %}
+    #}
+    (
+        select coalesce(max({{ column }}), '1970-01-01'::timestamp with time zone)
+        from {{ this }}
+    ) - interval '{{ var("staging_watermark_overlap_hours", 6) }} hours'
+{% endmacro %}
+
+
+{% macro shopify_staging_filter(tenant_mapping='tenant_mapping') %}
+    {#
+    Incremental filter for staging models reading Airbyte Shopify streams.
+
+    Picks up rows extracted since the watermark, plus every row for shops
+    whose tenant has no rows in the model yet — a newly connected store's
+    history is usually extracted before its tenant mapping is activated and
+    would otherwise stay behind the watermark until a --full-refresh.
+
+    Renders to nothing outside incremental runs.
+
+    Args:
+        tenant_mapping: CTE with the active (tenant_id, shop_domain) mapping;
+                        must be defined before the CTE this filter is used in
+    #}
+    {% if is_incremental() %}
+        where _airbyte_extracted_at >= {{ staging_watermark('airbyte_emitted_at') }}
+            or {{ normalize_shop_domain('shop_url') }} in (
+                select tm.shop_domain
+                from {{ tenant_mapping }} tm
+                where not exists (
+                    select 1 from {{ this }} existing
+                    where existing.tenant_id = tm.tenant_id
+                )
+            )
+    {% endif %}
+{% endmacro %}
+
+
+{% macro shopify_staging_prune_tenants() %}
+    {#
+    pre_hook for incremental Shopify staging models: removes rows for tenants
+    whose Shopify connection is no longer active, matching what the models
+    returned as views (where the inner join to the tenant mapping dropped
+    them). Renders to nothing on the first build and on --full-refresh.
+    #}
+    {% if is_incremental() %}
+        delete from {{ this }}
+        where tenant_id not in (
+            select tenant_id
+            from {{ ref('_tenant_airbyte_connections') }}
+            where tenant_id is not null
+                and source_type in ('shopify', 'source-shopify')
+                and status = 'active'
+                and is_enabled = true
+                and shop_domain is not null
+                and shop_domain != ''
+        )
+    {% endif %}
+{% endmacro %}
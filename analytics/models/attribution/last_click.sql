@@ -1,7 +1,12 @@
 {{
     config(
-        materialized='view',
-        schema='analytics'
+        materialized='incremental',
+        schema='analytics',
+        unique_key='id',
+        incremental_strategy='delete+insert',
+        on_schema_change='append_new_columns',
+        pre_hook="{{ attribution_window_delete('order_created_at') }}",
+        indexes=[{'columns': ['tenant_id', 'order_created_at']}]
     )
 }}
 
@@ -19,262 +24,11 @@
 -- 5. This is a simplified model that does not track multi-touch customer journeys
 -- 6. Attribution is deterministic: same order + same UTM = same attribution result
 --
+-- INCREMENTAL: Partitioned by (tenant_id, order_created_at). Each run deletes and
+-- rebuilds orders inside attribution_window_filter() (the trailing
+-- attribution_lookback_days, or the backfill range); older orders are left untouched.
+-- tests/test_attribution_incremental_parity.sql checks the table against a full recompute.
+--
 -- SECURITY: Tenant isolation is enforced - all rows must have tenant_id
 
-with raw_orders as (
-    -- Airbyte Destinations V2: typed columns directly
-    select
-        _airbyte_raw_id       as airbyte_record_id,
-        _airbyte_extracted_at as airbyte_emitted_at,
-        id::text              as order_id_v2,
-        note_attributes       as note_attributes_json
-    from {{ source('raw_shopify', 'orders') }}
-),
-
-tenant_mapping as (
-    select
-        tenant_id
-    from {{ ref('_tenant_airbyte_connections') }}
-    where source_type in ('shopify', 'source-shopify')
-        and status = 'active'
-        and is_enabled = true
-    limit 1
-),
-
--- Extract UTM parameters from order note_attributes
--- Shopify stores UTM parameters in note_attributes array: [{"name": "utm_source", "value": "google"}, ...]
-orders_with_utm as (
-    select
-        raw.order_id_v2 as order_id_raw,
-        raw.note_attributes_json::text as note_attributes_json,
-        (select tenant_id from tenant_mapping limit 1) as tenant_id
-    from raw_orders raw
-),
-
--- Parse UTM parameters from note_attributes JSON array
-utm_extracted as (
-    select
-        -- V2: id is already bigint, cast to text for consistency
-        order_id_raw as order_id,
-        
-        -- Extract UTM parameters from note_attributes JSON array using macro
-        {{ extract_utm_param('note_attributes_json', "'utm_source'") }} as utm_source,
-        {{ extract_utm_param('note_attributes_json', "'utm_medium'") }} as utm_medium,
-        {{ extract_utm_param('note_attributes_json', "'utm_campaign'") }} as utm_campaign,
-        {{ extract_utm_param('note_attributes_json', "'utm_term'") }} as utm_term,
-        {{ extract_utm_param('note_attributes_json', "'utm_content'") }} as utm_content,
-        
-        tenant_id
-        
-    from orders_with_utm
-    where tenant_id is not null
-        and order_id_raw is not null
-        and trim(order_id_raw) != ''
-),
-
--- Get order details from fact table
-orders_fact as (
-    select
-        id as order_fact_id,
-        order_id,
-        order_name,
-        order_number,
-        customer_key,  -- Pseudonymized customer identifier (replaces PII)
-        order_created_at,
-        revenue_gross as revenue,
-        currency,
-        tenant_id
-    from {{ ref('orders') }}
-),
-
--- Get campaign performance data
-campaigns as (
-    select
-        id as campaign_fact_id,
-        ad_account_id,
-        campaign_id,
-        campaign_name,
-        source_platform as platform,
-        date as performance_date,
-        spend,
-        clicks,
-        impressions,
-        conversions,
-        currency as campaign_currency,
-        tenant_id
-    from {{ ref('campaign_performance') }}
-),
-
--- Join orders with UTM to campaigns
--- Match on: utm_campaign = campaign_name OR utm_campaign = campaign_id
--- Also match on tenant_id and ensure dates align (order date should be >= campaign performance date)
--- Note: We use LEFT JOIN to include all orders, even those without UTM parameters
-attribution_joined as (
-    select
-        ord.order_fact_id,
-        ord.order_id,
-        ord.order_name,
-        ord.order_number,
-        ord.customer_key,
-        ord.order_created_at,
-        ord.revenue,
-        ord.currency,
-        ord.tenant_id,
-        
-        -- UTM parameters (null if order has no UTM parameters)
-        utm.utm_source,
-        utm.utm_medium,
-        utm.utm_campaign,
-        utm.utm_term,
-        utm.utm_content,
-        
-        -- Campaign attribution (last-click: most recent campaign match)
-        camp.campaign_fact_id,
-        camp.ad_account_id,
-        camp.campaign_id,
-        camp.campaign_name,
-        camp.platform,
-        camp.performance_date as campaign_performance_date,
-        camp.spend as campaign_spend,
-        camp.clicks as campaign_clicks,
-        camp.impressions as campaign_impressions,
-        camp.conversions as campaign_conversions
-        
-    from orders_fact ord
-    left join utm_extracted utm
-        on ord.order_id = utm.order_id
-        and ord.tenant_id = utm.tenant_id
-    left join campaigns camp
-        on ord.tenant_id = camp.tenant_id
-        and utm.utm_campaign is not null
-        and trim(utm.utm_campaign) != ''
-        and (
-            -- Match utm_campaign to campaign_name (case-insensitive)
-            lower(trim(utm.utm_campaign)) = lower(trim(camp.campaign_name))
-            or
-            -- Match utm_campaign to campaign_id (case-insensitive)
-            lower(trim(utm.utm_campaign)) = lower(trim(camp.campaign_id))
-        )
-        -- Ensure campaign performance date is on or before order date (campaign must exist before order)
-        and camp.performance_date <= date(ord.order_created_at)
-),
-
--- Rank campaign matches to select the most recent (last-click)
--- For orders with multiple campaign matches, select the one with the latest performance_date
-attribution_raw as (
-    select
-        *,
-        -- Attribution logic: match utm_campaign to campaign_name or campaign_id
-        -- Use row_number to get the most recent campaign match (last-click)
-        -- Deterministic: same order + same UTM + same campaigns = same rank
-        row_number() over (
-            partition by order_id, tenant_id
-            order by 
-                case when campaign_fact_id is not null then 0 else 1 end,  -- Prioritize matches
-                campaign_performance_date desc nulls last,  -- Most recent campaign
-                campaign_fact_id desc nulls last  -- Tie-breaker for same date
-        ) as attribution_rank
-    from attribution_joined
-),
-
--- Session-based UTM fallback for orders without UTM in note_attributes
--- When an order has no UTM params, try to match via pixel session checkout_completed event
-session_utm_fallback as (
-    select
-        cs.order_id,
-        cs.tenant_id,
-        cs.utm_source,
-        cs.utm_medium,
-        cs.utm_campaign,
-        cs.utm_term,
-        cs.utm_content
-    from {{ ref('customer_sessions') }} cs
-    where cs.order_id is not null
-      and cs.checkout_completed = true
-      and (cs.utm_source is not null or cs.utm_campaign is not null)
-),
-
--- Enrich attribution_raw with session fallback
-attribution_with_session as (
-    select
-        ar.*,
-        -- Use session UTM as fallback when order has no UTM from note_attributes
-        case
-            when ar.utm_source is not null then ar.utm_source
-            else sf.utm_source
-        end as final_utm_source,
-        case
-            when ar.utm_medium is not null then ar.utm_medium
-            else sf.utm_medium
-        end as final_utm_medium,
-        case
-            when ar.utm_campaign is not null then ar.utm_campaign
-            else sf.utm_campaign
-        end as final_utm_campaign,
-        case
-            when ar.utm_term is not null then ar.utm_term
-            else sf.utm_term
-        end as final_utm_term,
-        case
-            when ar.utm_content is not null then ar.utm_content
-            else sf.utm_content
-        end as final_utm_content,
-        sf.order_id is not null as has_session_utm
-    from attribution_raw ar
-    left join session_utm_fallback sf
-        on ar.order_id = sf.order_id
-        and ar.tenant_id = sf.tenant_id
-    where ar.attribution_rank = 1
-)
-
--- Final output: only the top-ranked attribution (last-click) with session fallback
-select
-    -- Primary key: deterministic hash of order_id + tenant_id
-    md5(concat(order_id, '|', tenant_id, '|', 'last_click')) as id,
-
-    -- Order identifiers
-    order_id,
-    order_name,
-    order_number,
-    customer_key,
-    order_created_at,
-
-    -- Financial metrics
-    revenue,
-    currency,
-
-    -- UTM parameters (from note_attributes or session fallback)
-    final_utm_source as utm_source,
-    final_utm_medium as utm_medium,
-    final_utm_campaign as utm_campaign,
-    final_utm_term as utm_term,
-    final_utm_content as utm_content,
-
-    -- Attributed campaign (null if no match found)
-    campaign_fact_id,
-    ad_account_id,
-    campaign_id,
-    campaign_name,
-    platform,
-    campaign_performance_date,
-    campaign_spend,
-    campaign_clicks,
-    campaign_impressions,
-    campaign_conversions,
-
-    -- Attribution metadata (now includes session-based attribution)
-    case
-        when campaign_fact_id is not null then 'attributed'
-        when has_session_utm and final_utm_campaign is not null then 'attributed_via_session'
-        when utm_campaign is not null then 'unattributed_utm_present'
-        when has_session_utm then 'attributed_via_session'
-        else 'unattributed_no_utm'
-    end as attribution_status,
-
-    -- Tenant isolation (CRITICAL)
-    tenant_id,
-
-    -- Audit fields
-    current_timestamp as dbt_updated_at
-
-from attribution_with_session
+{{ last_click_attribution(incremental=is_incremental()) }}
@@ -0,0 +1,168 @@
+{{
+    config(
+        materialized='table',
+        schema='marts',
+        tags=['marts', 'metrics'],
+        indexes=[{'columns': ['tenant_id', 'period_type'], 'unique': True}]
+    )
+}}
+
+-- KPI Summary Snapshot (Overview dashboard)
+--
+-- One row per tenant + period_type with everything the Overview KPI cards
+-- and channel bar chart show for the latest window: totals, prior-period
+-- totals, percentage deltas and the per-channel revenue/spend bars. The
+-- /api/datasets/kpi-summary endpoint is a single point lookup on
+-- (tenant_id, period_type).
+--
+-- Values match the per-request mart queries this replaces, including
+-- average_roas as the average of row-level gross_roas. Deltas are NULL
+-- when the prior value is 0.
+--
+-- Usage:
+--   SELECT * FROM marts.mart_kpi_summary
+--   WHERE tenant_id = :tenant_id AND period_type = 'last_30_days';
+
+with latest as (
+    select * from {{ ref('mart_latest_periods') }}
+),
+
+marketing_rows as (
+    select
+        lp.tenant_id,
+        lp.period_type,
+        m.platform,
+        m.spend,
+        m.orders,
+        m.gross_revenue,
+        m.gross_roas,
+        m.prior_spend,
+        m.prior_orders,
+        m.prior_gross_roas
+    from latest lp
+    inner join {{ ref('mart_marketing_metrics') }} m
+        on m.tenant_id = lp.tenant_id
+        and m.period_type = lp.period_type
+        and m.period_end = lp.marketing_period_end
+),
+
+marketing as (
+    select
+        tenant_id,
+        period_type,
+        coalesce(sum(spend), 0) as total_spend,
+        coalesce(sum(orders), 0) as total_conversions,
+        coalesce(avg(gross_roas), 0) as average_roas,
+        coalesce(sum(prior_spend), 0) as prior_spend,
+        coalesce(sum(prior_orders), 0) as prior_conversions,
+        coalesce(avg(prior_gross_roas), 0) as prior_roas
+    from marketing_rows
+    group by tenant_id, period_type
+),
+
+revenue as (
+    select
+        lp.tenant_id,
+        lp.period_type,
+        coalesce(sum(r.gross_revenue), 0) as total_revenue,
+        coalesce(sum(r.prior_gross_revenue), 0) as prior_revenue
+    from latest lp
+    inner join {{ ref('mart_revenue_metrics') }} r
+        on r.tenant_id = lp.tenant_id
+        and r.period_type = lp.period_type
+        and r.period_end = lp.revenue_period_end
+    group by lp.tenant_id, lp.period_type
+),
+
+channels as (
+    select
+        tenant_id,
+        period_type,
+        coalesce(platform, 'organic') as channel,
+        coalesce(sum(gross_revenue), 0) as revenue,
+        coalesce(sum(spend), 0) as spend
+    from marketing_rows
+    group by tenant_id, period_type, platform
+),
+
+channel_bars as (
+    select
+        tenant_id,
+        period_type,
+        jsonb_agg(
+            jsonb_build_object('channel', channel, 'revenue', revenue, 'spend', spend)
+            order by revenue desc
+        ) as revenue_by_channel,
+        count(distinct case when revenue > 0 or spend > 0 then channel end) as active_channels
+    from channels
+    group by tenant_id, period_type
+),
+
+totals as (
+    select
+        lp.tenant_id,
+        lp.period_type,
+        lp.marketing_period_end,
+        lp.revenue_period_end,
+        lp.as_of_date,
+        coalesce(r.total_revenue, 0) as total_revenue,
+        coalesce(r.prior_revenue, 0) as prior_revenue,
+        coalesce(m.total_spend, 0) as total_spend,
+        coalesce(m.prior_spend, 0) as prior_spend,
+        coalesce(m.average_roas, 0) as average_roas,
+        coalesce(m.prior_roas, 0) as prior_roas,
+        coalesce(m.total_conversions, 0) as total_conversions,
+        coalesce(m.prior_conversions, 0) as prior_conversions,
+        coalesce(cb.revenue_by_channel, '[]'::jsonb) as revenue_by_channel,
+        coalesce(cb.active_channels, 0) as active_channels
+    from latest lp
+    left join marketing m
+        on m.tenant_id = lp.tenant_id
+        and m.period_type = lp.period_type
+    left join revenue r
+        on r.tenant_id = lp.tenant_id
+        and r.period_type = lp.period_type
+    left join channel_bars cb
+        on cb.tenant_id = lp.tenant_id
+        and cb.period_type = lp.period_type
+)
+
+select
+    md5(concat(tenant_id, '|', period_type)) as id,
+    tenant_id,
+    period_type,
+    marketing_period_end,
+    revenue_period_end,
+    as_of_date,
+
+    -- Current and prior totals
+    total_revenue,
+    prior_revenue,
+    total_spend,
+    prior_spend,
+    average_roas,
+    prior_roas,
+    total_conversions,
+    prior_conversions,
+
+    -- Deltas (percent vs prior; NULL without a prior value)
+    case when prior_revenue <> 0
+        then round(((total_revenue - prior_revenue) / abs(prior_revenue) * 100)::numeric, 1)
+    end as revenue_change_pct,
+    case when prior_spend <> 0
+        then round(((total_spend - prior_spend) / abs(prior_spend) * 100)::numeric, 1)
+    end as spend_change_pct,
+    case when prior_roas <> 0
+        then round(((average_roas - prior_roas) / abs(prior_roas) * 100)::numeric, 1)
+    end as roas_change_pct,
+    case when prior_conversions <> 0
+        then round(((total_conversions - prior_conversions)::numeric / abs(prior_conversions) * 100)::numeric, 1)
+    end as conversions_change_pct,
+
+    -- Channel bars: [{"channel", "revenue", "spend"}] by revenue desc
+    revenue_by_channel,
+    active_channels,
+
+    current_timestamp as dbt_updated_at
+
+from totals
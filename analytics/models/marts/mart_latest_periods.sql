@@ -0,0 +1,62 @@
+{{
+    config(
+        materialized='table',
+        schema='marts',
+        tags=['marts', 'metrics'],
+        indexes=[{'columns': ['tenant_id', 'period_type'], 'unique': True}]
+    )
+}}
+
+-- Latest Period Pointer
+--
+-- One row per tenant + period_type naming the most recent materialized
+-- window (period_end on or before the build date) in each metrics mart.
+-- Readers join on these period_end values instead of repeating a
+-- correlated SELECT MAX(period_end) subquery per request.
+--
+-- Rebuilt with the marts on every run, so "latest" is as of the build
+-- (as_of_date), which is also when the mart windows themselves last moved.
+--
+-- Usage:
+--   SELECT m.*
+--   FROM marts.mart_marketing_metrics m
+--   JOIN marts.mart_latest_periods lp
+--     ON lp.tenant_id = m.tenant_id
+--    AND lp.period_type = m.period_type
+--    AND lp.marketing_period_end = m.period_end
+--   WHERE lp.tenant_id = :tenant_id
+--     AND lp.period_type = 'last_30_days';
+
+with marketing as (
+    select
+        tenant_id,
+        period_type,
+        max(period_end) as marketing_period_end
+    from {{ ref('mart_marketing_metrics') }}
+    where tenant_id is not null
+        and period_end <= current_date
+    group by tenant_id, period_type
+),
+
+revenue as (
+    select
+        tenant_id,
+        period_type,
+        max(period_end) as revenue_period_end
+    from {{ ref('mart_revenue_metrics') }}
+    where tenant_id is not null
+        and period_end <= current_date
+    group by tenant_id, period_type
+)
+
+select
+    coalesce(m.tenant_id, r.tenant_id) as tenant_id,
+    coalesce(m.period_type, r.period_type) as period_type,
+    m.marketing_period_end,
+    r.revenue_period_end,
+    current_date as as_of_date,
+    current_timestamp as dbt_updated_at
+from marketing m
+full outer join revenue r
+    on m.tenant_id = r.tenant_id
+    and m.period_type = r.period_type
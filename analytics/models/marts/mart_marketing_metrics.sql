@@ -24,73 +24,30 @@ with date_ranges as (
     select * from {{ ref('dim_date_ranges') }}
 ),
 
--- Daily ROAS metrics
-daily_roas as (
-    select
-        tenant_id,
-        platform,
-        currency,
-        campaign_id,
-        date_trunc('day', period_start)::date as date,
-        sum(total_spend) as spend,
-        sum(order_count) as orders,
-        sum(total_gross_revenue) as gross_revenue,
-        sum(total_net_revenue) as net_revenue
-    from {{ ref('fct_roas') }}
-    where period_type = 'daily'
-        and tenant_id is not null
-    group by 1, 2, 3, 4, 5
-),
-
--- Daily CAC metrics
-daily_cac as (
+-- Daily ROAS + CAC inputs (rollup rows with marketing measures; rows that
+-- only carry delivery or attribution counts would aggregate to zero)
+daily_combined as (
     select
         tenant_id,
         platform,
         currency,
         campaign_id,
-        date_trunc('day', period_start)::date as date,
-        sum(new_customers) as new_customers,
-        sum(net_new_customers) as net_new_customers,
-        sum(total_spend) as spend,
-        sum(first_order_revenue_total) as first_order_revenue
-    from {{ ref('fct_cac') }}
-    where period_type = 'daily'
-        and tenant_id is not null
-    group by 1, 2, 3, 4, 5
-),
-
--- Combine daily ROAS + CAC
-daily_combined as (
-    select
-        coalesce(r.tenant_id, c.tenant_id) as tenant_id,
-        coalesce(r.platform, c.platform) as platform,
-        coalesce(r.currency, c.currency) as currency,
-        coalesce(r.campaign_id, c.campaign_id) as campaign_id,
-        coalesce(r.date, c.date) as date,
-
-        -- ROAS metrics
-        coalesce(r.spend, 0) as roas_spend,
-        coalesce(r.orders, 0) as orders,
-        coalesce(r.gross_revenue, 0) as gross_revenue,
-        coalesce(r.net_revenue, 0) as net_revenue,
-
-        -- CAC metrics
-        coalesce(c.spend, 0) as cac_spend,
-        coalesce(c.new_customers, 0) as new_customers,
-        coalesce(c.net_new_customers, 0) as net_new_customers,
-        coalesce(c.first_order_revenue, 0) as first_order_revenue,
-
-        -- Use max spend (should be same from both tables)
-        greatest(coalesce(r.spend, 0), coalesce(c.spend, 0)) as total_spend
-
-    from daily_roas r
-    full outer join daily_cac c
-        on r.tenant_id = c.tenant_id
-        and r.platform = c.platform
-        and r.currency = c.currency
-        and coalesce(r.campaign_id, '') = coalesce(c.campaign_id, '')
-        and r.date = c.date
+        date,
+        orders,
+        gross_revenue,
+        net_revenue,
+        new_customers,
+        net_new_customers,
+        first_order_revenue,
+        spend as total_spend
+    from {{ ref('rollup_daily_channel') }}
+    where spend > 0
+        or orders > 0
+        or gross_revenue <> 0
+        or net_revenue <> 0
+        or new_customers > 0
+        or net_new_customers > 0
+        or first_order_revenue <> 0
 ),
 
 -- Aggregate to all date ranges (CURRENT period)
@@ -28,15 +28,13 @@ daily_revenue as (
     select
         tenant_id,
         currency,
-        date_trunc('day', revenue_date)::date as date,
-        sum(case when revenue_type = 'gross_revenue' then gross_revenue else 0 end) as gross_revenue,
-        sum(refund_amount) as refund_amount,
-        sum(cancellation_amount) as cancellation_amount,
-        sum(net_revenue) as net_revenue,
-        count(distinct case when revenue_type = 'gross_revenue' then order_id end) as order_count
-    from {{ ref('fct_revenue') }}
-    where tenant_id is not null
-    group by 1, 2, 3
+        date,
+        gross_revenue,
+        refund_amount,
+        cancellation_amount,
+        net_revenue,
+        order_count
+    from {{ ref('rollup_daily_revenue') }}
 ),
 
 -- Aggregate to all date ranges (CURRENT period)
@@ -0,0 +1,184 @@
+{{
+    config(
+        materialized='table',
+        schema='marts',
+        tags=['marts', 'marketing', 'rollups'],
+        indexes=[{'columns': ['tenant_id', 'date']}]
+    )
+}}
+
+-- Daily Channel Rollup
+--
+-- One row per tenant + day + platform + campaign + currency holding only
+-- additive measures (sums and counts). Ratios (ROAS, CAC, CTR, conversion
+-- rate, attribution rate) are NOT stored: they are computed from the sums
+-- at query time, so any date range is a sum over O(days) rollup rows and
+-- ratios stay correct across ranges (sum / sum, never avg of ratios).
+--
+-- mart_marketing_metrics and the channel/attribution APIs read from here
+-- instead of re-aggregating fct_roas, fct_cac, marketing_spend and
+-- last_click per request.
+--
+-- Usage:
+--   SELECT sum(gross_revenue) / nullif(sum(spend), 0) AS gross_roas
+--   FROM marts.rollup_daily_channel
+--   WHERE tenant_id = :tenant_id
+--     AND date BETWEEN :start_date AND :end_date
+--     AND platform = 'meta_ads';
+
+with roas_daily as (
+    select
+        tenant_id,
+        date_trunc('day', period_start)::date as date,
+        platform,
+        campaign_id,
+        currency,
+        total_spend as roas_spend,
+        0 as cac_spend,
+        order_count as orders,
+        total_gross_revenue as gross_revenue,
+        total_net_revenue as net_revenue,
+        0 as new_customers,
+        0 as net_new_customers,
+        0 as first_order_revenue,
+        0 as impressions,
+        0 as clicks,
+        0 as conversions,
+        0 as attributed_orders,
+        0 as unattributed_orders,
+        0 as attributed_revenue
+    from {{ ref('fct_roas') }}
+    where period_type = 'daily'
+        and tenant_id is not null
+),
+
+cac_daily as (
+    select
+        tenant_id,
+        date_trunc('day', period_start)::date as date,
+        platform,
+        campaign_id,
+        currency,
+        0 as roas_spend,
+        total_spend as cac_spend,
+        0 as orders,
+        0 as gross_revenue,
+        0 as net_revenue,
+        new_customers,
+        net_new_customers,
+        first_order_revenue_total as first_order_revenue,
+        0 as impressions,
+        0 as clicks,
+        0 as conversions,
+        0 as attributed_orders,
+        0 as unattributed_orders,
+        0 as attributed_revenue
+    from {{ ref('fct_cac') }}
+    where period_type = 'daily'
+        and tenant_id is not null
+),
+
+delivery_daily as (
+    select
+        tenant_id,
+        date,
+        source_platform as platform,
+        campaign_id,
+        currency,
+        0 as roas_spend,
+        0 as cac_spend,
+        0 as orders,
+        0 as gross_revenue,
+        0 as net_revenue,
+        0 as new_customers,
+        0 as net_new_customers,
+        0 as first_order_revenue,
+        coalesce(impressions, 0) as impressions,
+        coalesce(clicks, 0) as clicks,
+        coalesce(conversions, 0) as conversions,
+        0 as attributed_orders,
+        0 as unattributed_orders,
+        0 as attributed_revenue
+    from {{ ref('marketing_spend') }}
+    where tenant_id is not null
+),
+
+attribution_daily as (
+    select
+        tenant_id,
+        order_created_at::date as date,
+        platform,
+        campaign_id,
+        currency,
+        0 as roas_spend,
+        0 as cac_spend,
+        0 as orders,
+        0 as gross_revenue,
+        0 as net_revenue,
+        0 as new_customers,
+        0 as net_new_customers,
+        0 as first_order_revenue,
+        0 as impressions,
+        0 as clicks,
+        0 as conversions,
+        case when attribution_status = 'attributed' then 1 else 0 end as attributed_orders,
+        case when attribution_status = 'attributed' then 0 else 1 end as unattributed_orders,
+        case when attribution_status = 'attributed' then coalesce(revenue, 0) else 0 end as attributed_revenue
+    from {{ ref('last_click') }}
+    where tenant_id is not null
+        and order_id is not null
+),
+
+unioned as (
+    select * from roas_daily
+    union all
+    select * from cac_daily
+    union all
+    select * from delivery_daily
+    union all
+    select * from attribution_daily
+)
+
+select
+    md5(concat(
+        tenant_id, '|',
+        date::text, '|',
+        coalesce(platform, ''), '|',
+        coalesce(campaign_id, ''), '|',
+        coalesce(currency, '')
+    )) as id,
+
+    tenant_id,
+    date,
+    platform,
+    campaign_id,
+    currency,
+
+    -- Spend: fct_roas and fct_cac report the same platform spend; take the
+    -- larger in case one of them is missing a campaign
+    greatest(sum(roas_spend), sum(cac_spend)) as spend,
+
+    -- ROAS inputs (attributed, paid platforms)
+    sum(orders) as orders,
+    sum(gross_revenue) as gross_revenue,
+    sum(net_revenue) as net_revenue,
+
+    -- CAC inputs
+    sum(new_customers) as new_customers,
+    sum(net_new_customers) as net_new_customers,
+    sum(first_order_revenue) as first_order_revenue,
+
+    -- Delivery (platform-reported)
+    sum(impressions) as impressions,
+    sum(clicks) as clicks,
+    sum(conversions) as conversions,
+
+    -- Last-click attribution coverage
+    sum(attributed_orders) as attributed_orders,
+    sum(unattributed_orders) as unattributed_orders,
+    sum(attributed_revenue) as attributed_revenue,
+
+    current_timestamp as dbt_updated_at
+
+from unioned
+group by tenant_id, date, platform, campaign_id, currency
@@ -0,0 +1,49 @@
+{{
+    config(
+        materialized='table',
+        schema='marts',
+        tags=['marts', 'revenue', 'rollups'],
+        indexes=[{'columns': ['tenant_id', 'date']}]
+    )
+}}
+
+-- Daily Revenue Rollup
+--
+-- One row per tenant + day + currency holding only additive store-level
+-- revenue measures from fct_revenue. AOV and period-over-period changes
+-- are computed from the sums at query time (see rollup_daily_channel for
+-- the per-channel marketing measures).
+--
+-- mart_revenue_metrics and the revenue APIs read from here instead of
+-- scanning order-level revenue events.
+--
+-- Usage:
+--   SELECT sum(net_revenue) / nullif(sum(order_count), 0) AS aov
+--   FROM marts.rollup_daily_revenue
+--   WHERE tenant_id = :tenant_id
+--     AND date BETWEEN :start_date AND :end_date;
+
+select
+    md5(concat(
+        tenant_id, '|',
+        date_trunc('day', revenue_date)::date::text, '|',
+        coalesce(currency, '')
+    )) as id,
+
+    tenant_id,
+    date_trunc('day', revenue_date)::date as date,
+    currency,
+
+    sum(case when revenue_type = 'gross_revenue' then gross_revenue else 0 end) as gross_revenue,
+    sum(refund_amount) as refund_amount,
+    sum(cancellation_amount) as cancellation_amount,
+    sum(net_revenue) as net_revenue,
+    -- An order's gross_revenue event falls on exactly one day, so daily
+    -- distinct counts add up across any date range
+    count(distinct case when revenue_type = 'gross_revenue' then order_id end) as order_count,
+
+    current_timestamp as dbt_updated_at
+
+from {{ ref('fct_revenue') }}
+where tenant_id is not null
+group by tenant_id, date_trunc('day', revenue_date)::date, currency
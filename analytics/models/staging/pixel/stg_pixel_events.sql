@@ -1,7 +1,9 @@
 {{
     config(
-        materialized='view',
-        schema='staging'
+        materialized='incremental',
+        schema='staging',
+        unique_key='event_sk',
+        incremental_strategy='delete+insert'
     )
 }}
 
@@ -13,6 +15,8 @@
     - Normalizes event types and extracts UTM fields
     - Deduplicates by (session_id, event_type, event_timestamp) within 1-second window
     - Applies tenant isolation via tenant_id
+    - Incremental: reads only events created since the watermark; event_sk
+      (the dedup key) lets a later duplicate replace the staged event
     - Returns empty result if source table doesn't exist yet (CI safety)
 
     SECURITY: Tenant isolation enforced via tenant_id column.
@@ -22,6 +26,7 @@
 {% if not source_exists('platform', 'pixel_events') %}
 
 select
+    cast(null as text) as event_sk,
     cast(null as text) as id,
     cast(null as text) as tenant_id,
     cast(null as text) as shop_domain,
@@ -62,6 +67,9 @@ with raw_events as (
     where tenant_id is not null
       and session_id is not null
       and event_type is not null
+    {% if is_incremental() %}
+      and created_at >= {{ staging_watermark('created_at') }}
+    {% endif %}
 ),
 
 -- Deduplicate: same session + event_type within 1 second = same event
@@ -77,6 +85,11 @@ deduped as (
 )
 
 select
+    -- Dedup key: md5(tenant_id | session_id | event_type | event second)
+    md5(
+        tenant_id || '|' || session_id || '|' || event_type || '|'
+        || coalesce(date_trunc('second', event_timestamp)::text, '')
+    ) as event_sk,
     id,
     tenant_id,
     shop_domain,
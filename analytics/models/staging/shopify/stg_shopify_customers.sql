@@ -1,11 +1,37 @@
 {{
     config(
-        materialized='view',
-        schema='staging'
+        materialized='incremental',
+        schema='staging',
+        unique_key=['tenant_id', 'customer_id'],
+        incremental_strategy='delete+insert',
+        pre_hook="{{ shopify_staging_prune_tenants() }}"
     )
 }}
 
-with customers_extracted as (
+{#
+    Staging model for Shopify customers.
+
+    Incremental: each run reads only rows extracted since the watermark
+    (see shopify_staging_filter), keeps the latest emission per
+    (tenant_id, customer_id) and replaces the staged row. A customer version
+    older than the one already staged (late-arriving replay) is skipped.
+
+    SECURITY: Tenant isolation enforced via inner join on shop_domain.
+#}
+
+with tenant_mapping as (
+    select
+        tenant_id,
+        shop_domain
+    from {{ ref('_tenant_airbyte_connections') }}
+    where source_type in ('shopify', 'source-shopify')
+        and status = 'active'
+        and is_enabled = true
+        and shop_domain is not null
+        and shop_domain != ''
+),
+
+customers_extracted as (
     -- Airbyte Destinations V2: typed columns directly on the table.
     -- Cast to text where downstream normalization expects text input.
     select
@@ -29,18 +55,7 @@ with customers_extracted as (
         verified_email::text             as verified_email_raw,
         default_address::text            as default_address_json
     from {{ source('raw_shopify', 'customers') }}
-),
-
-tenant_mapping as (
-    select
-        tenant_id,
-        shop_domain
-    from {{ ref('_tenant_airbyte_connections') }}
-    where source_type in ('shopify', 'source-shopify')
-        and status = 'active'
-        and is_enabled = true
-        and shop_domain is not null
-        and shop_domain != ''
+    {{ shopify_staging_filter() }}
 ),
 
 customers_normalized as (
@@ -147,17 +162,7 @@ customers_normalized as (
 
         -- Normalized shop_domain for tenant mapping
         -- Normalize: lowercase, strip protocol and trailing slash
-        lower(
-            trim(
-                trailing '/' from
-                regexp_replace(
-                    coalesce(shop_url, ''),
-                    '^https?://',
-                    '',
-                    'i'
-                )
-            )
-        ) as shop_domain
+        {{ normalize_shop_domain('shop_url') }} as shop_domain
 
     from customers_extracted
 ),
@@ -190,6 +195,21 @@ customers_with_tenant as (
     from customers_normalized cust
     inner join tenant_mapping tm
         on cust.shop_domain = tm.shop_domain
+),
+
+-- Dedup: keep latest record per (tenant_id, customer_id)
+customers_deduped as (
+    select
+        *,
+        row_number() over (
+            partition by tenant_id, customer_id
+            order by airbyte_emitted_at desc
+        ) as _row_num
+    from customers_with_tenant
+    where customer_id is not null
+        and trim(customer_id) != ''
+        and email is not null
+        and trim(email) != ''
 )
 
 select
@@ -214,8 +234,14 @@ select
     airbyte_record_id,
     airbyte_emitted_at,
     tenant_id
-from customers_with_tenant
-where customer_id is not null
-    and trim(customer_id) != ''
-    and email is not null
-    and trim(email) != ''
+from customers_deduped
+where _row_num = 1
+{% if is_incremental() %}
+    -- Late-arriving replay: keep the staged row if it is a newer version
+    and not exists (
+        select 1 from {{ this }} existing
+        where existing.tenant_id = customers_deduped.tenant_id
+            and existing.customer_id = customers_deduped.customer_id
+            and existing.updated_at > customers_deduped.updated_at
+    )
+{% endif %}
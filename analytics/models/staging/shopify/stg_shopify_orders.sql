@@ -1,7 +1,10 @@
 {{
     config(
-        materialized='view',
-        schema='staging'
+        materialized='incremental',
+        schema='staging',
+        unique_key='record_sk',
+        incremental_strategy='delete+insert',
+        pre_hook="{{ shopify_staging_prune_tenants() }}"
     )
 }}
 
@@ -16,10 +19,27 @@
     - Excludes PII from downstream consumers via canonical layer
     - Tenant isolation via shop_domain join to _tenant_airbyte_connections
 
+    Incremental: each run reads only rows extracted since the watermark
+    (see shopify_staging_filter) and replaces them by record_sk. An order
+    version older than the one already staged (late-arriving replay) is
+    skipped, so updated_at never moves backwards.
+
     SECURITY: Tenant isolation enforced via inner join on shop_domain.
 #}
 
-with orders_extracted as (
+with tenant_mapping as (
+    select
+        tenant_id,
+        shop_domain
+    from {{ ref('_tenant_airbyte_connections') }}
+    where source_type in ('shopify', 'source-shopify')
+        and status = 'active'
+        and is_enabled = true
+        and shop_domain is not null
+        and shop_domain != ''
+),
+
+orders_extracted as (
     -- Airbyte Destinations V2: typed columns directly on the table.
     -- Cast to text where downstream normalization expects text input.
     select
@@ -46,18 +66,7 @@ with orders_extracted as (
         refunds                                              as refunds_json,
         total_shipping_price_set->'shop_money'->>'amount'    as total_shipping_price_raw
     from {{ source('raw_shopify', 'orders') }}
-),
-
-tenant_mapping as (
-    select
-        tenant_id,
-        shop_domain
-    from {{ ref('_tenant_airbyte_connections') }}
-    where source_type in ('shopify', 'source-shopify')
-        and status = 'active'
-        and is_enabled = true
-        and shop_domain is not null
-        and shop_domain != ''
+    {{ shopify_staging_filter() }}
 ),
 
 orders_normalized as (
@@ -167,17 +176,7 @@ orders_normalized as (
         airbyte_emitted_at,
 
         -- Normalized shop_domain for tenant mapping
-        lower(
-            trim(
-                trailing '/' from
-                regexp_replace(
-                    coalesce(shop_url, ''),
-                    '^https?://',
-                    '',
-                    'i'
-                )
-            )
-        ) as shop_domain
+        {{ normalize_shop_domain('shop_url') }} as shop_domain
 
     from orders_extracted
 ),
@@ -202,6 +201,21 @@ orders_deduped as (
     from orders_with_tenant
     where order_id is not null
         and trim(order_id) != ''
+),
+
+orders_latest as (
+    select *
+    from orders_deduped
+    where _row_num = 1
+    {% if is_incremental() %}
+        -- Late-arriving replay: keep the staged row if it is a newer version
+        and not exists (
+            select 1 from {{ this }} existing
+            where existing.tenant_id = orders_deduped.tenant_id
+                and existing.order_id = orders_deduped.order_id
+                and existing.updated_at > orders_deduped.updated_at
+        )
+    {% endif %}
 )
 
 select
@@ -251,5 +265,4 @@ select
     airbyte_record_id,
     airbyte_emitted_at
 
-from orders_deduped
-where _row_num = 1
+from orders_latest
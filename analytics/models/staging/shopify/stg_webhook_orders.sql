@@ -1,7 +1,9 @@
 {{
     config(
-        materialized='view',
-        schema='staging'
+        materialized='incremental',
+        schema='staging',
+        unique_key='record_sk',
+        incremental_strategy='delete+insert'
     )
 }}
 
@@ -12,6 +14,8 @@
     so downstream models (canonical, attribution) can UNION both sources.
 
     Deduplicates by (tenant_id, order_id) keeping the latest webhook event.
+    Incremental: each run reads only events received since the watermark
+    and replaces the staged order by record_sk.
     Returns empty result if source table doesn't exist yet (CI safety).
 
     SECURITY: Tenant isolation enforced via tenant_id (set at webhook ingestion time).
@@ -81,6 +85,9 @@ with webhook_orders as (
         created_at
     from {{ source('platform', 'webhook_order_events') }}
     where tenant_id is not null
+    {% if is_incremental() %}
+        and received_at >= {{ staging_watermark('airbyte_emitted_at') }}
+    {% endif %}
 ),
 
 -- Dedup: keep latest webhook event per (tenant_id, order_id)
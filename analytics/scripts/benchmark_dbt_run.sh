@@ -0,0 +1,85 @@
+#!/bin/bash
+# dbt Run-Time Benchmark
+#
+# Times a full-project dbt run for the working tree and for a baseline git
+# ref, both against the same seeded test data:
+#   1. full build   - dbt run --full-refresh (first deploy / backfill cost)
+#   2. steady state - dbt run               (scheduled run, nothing new)
+#
+# Use it to check materialization changes such as the incremental staging
+# models, e.g. against the last commit with the views:
+#   ./scripts/benchmark_dbt_run.sh <baseline_ref>
+#
+# Prerequisites:
+#   - PostgreSQL database accessible via profiles.yml (see profiles.yml.example)
+#   - dbt installed (pip install -r requirements.txt)
+#   - Test data loaded: psql $DATABASE_URL -f scripts/test_data_setup.sql
+#
+# Usage (from analytics/):
+#   ./scripts/benchmark_dbt_run.sh [baseline_ref]   # default: HEAD~1
+
+set -e
+
+cd "$(dirname "$0")/.."
+ANALYTICS_DIR="$(pwd)"
+BASELINE_REF="${1:-HEAD~1}"
+PROFILES_DIR="${DBT_PROFILES_DIR:-$ANALYTICS_DIR}"
+
+if ! command -v dbt &> /dev/null; then
+    echo "❌ dbt is not installed"
+    echo "   Install with: pip install -r requirements.txt"
+    exit 1
+fi
+
+if ! dbt debug --profiles-dir "$PROFILES_DIR" 2>&1 | grep -q "Connection test: \[OK"; then
+    echo "❌ Database connection failed"
+    echo "   Set DB_* environment variables or DATABASE_URL"
+    exit 1
+fi
+
+# Run a dbt command in a project dir, print elapsed seconds
+time_dbt() {
+    local project_dir="$1"
+    shift
+    local start end
+    start=$(date +%s.%N)
+    (cd "$project_dir" && dbt "$@" --profiles-dir "$PROFILES_DIR" > /dev/null)
+    end=$(date +%s.%N)
+    echo "$end - $start" | bc
+}
+
+# Full build then steady-state run; prints "<full_build_s> <steady_state_s>"
+benchmark_project() {
+    local project_dir="$1"
+    (cd "$project_dir" && dbt deps --profiles-dir "$PROFILES_DIR" > /dev/null)
+    (cd "$project_dir" && dbt seed --full-refresh --profiles-dir "$PROFILES_DIR" > /dev/null)
+    local full steady
+    full=$(time_dbt "$project_dir" run --full-refresh)
+    steady=$(time_dbt "$project_dir" run)
+    echo "$full $steady"
+}
+
+BASELINE_DIR="$(mktemp -d)"
+cleanup() {
+    git -C "$ANALYTICS_DIR" worktree remove --force "$BASELINE_DIR" > /dev/null 2>&1 || true
+}
+trap cleanup EXIT
+
+echo "=========================================="
+echo "dbt Run-Time Benchmark"
+echo "=========================================="
+echo ""
+
+echo "Baseline: $BASELINE_REF"
+git -C "$ANALYTICS_DIR" worktree add --detach "$BASELINE_DIR" "$BASELINE_REF" > /dev/null
+read -r BASE_FULL BASE_STEADY <<< "$(benchmark_project "$BASELINE_DIR/analytics")"
+
+echo "Current:  working tree"
+read -r CUR_FULL CUR_STEADY <<< "$(benchmark_project "$ANALYTICS_DIR")"
+
+echo ""
+printf "%-14s %12s %12s %9s\n" "run" "baseline s" "current s" "speedup"
+printf "%-14s %12.1f %12.1f %8.1fx\n" "full build" "$BASE_FULL" "$CUR_FULL" \
+    "$(echo "$BASE_FULL / $CUR_FULL" | bc -l)"
+printf "%-14s %12.1f %12.1f %8.1fx\n" "steady state" "$BASE_STEADY" "$CUR_STEADY" \
+    "$(echo "$BASE_STEADY / $CUR_STEADY" | bc -l)"
@@ -0,0 +1,166 @@
+-- Parity test: incremental attribution tables vs full recompute
+--
+-- last_click, multi_touch_linear, time_decay and multi_touch_session are
+-- incremental tables that only reprocess the attribution lookback window
+-- (var('attribution_lookback_days', 30)) on each run. This test recomputes
+-- each model in full — the same SQL the models ran as views — and compares
+-- it with the materialized table per surrogate key:
+--   - row_count:   rows per id (missing, stale or duplicated rows)
+--   - measure:     revenue credited to the id
+--   - fingerprint: campaign / status / weight assignment for the id
+--
+-- Rows older than the lookback window only drift when their source data
+-- changes after the window has passed; rebuild with --full-refresh (or a
+-- backfill over that range) if this test flags them.
+--
+-- Returns rows only when a table disagrees with the full recompute (empty = pass).
+
+with expected_last_click as (
+    select
+        id,
+        count(*) as row_count,
+        sum(revenue) as measure,
+        string_agg(
+            concat(campaign_fact_id, '|', attribution_status, '|', utm_campaign), ','
+            order by concat(campaign_fact_id, '|', attribution_status, '|', utm_campaign)
+        ) as fingerprint
+    from ({{ last_click_attribution(incremental=false) }}) full_recompute
+    group by id
+),
+
+actual_last_click as (
+    select
+        id,
+        count(*) as row_count,
+        sum(revenue) as measure,
+        string_agg(
+            concat(campaign_fact_id, '|', attribution_status, '|', utm_campaign), ','
+            order by concat(campaign_fact_id, '|', attribution_status, '|', utm_campaign)
+        ) as fingerprint
+    from {{ ref('last_click') }}
+    group by id
+),
+
+expected_multi_touch_linear as (
+    select
+        id,
+        count(*) as row_count,
+        sum(attributed_revenue) as measure,
+        string_agg(
+            concat(campaign_fact_id, '|', attribution_weight), ','
+            order by concat(campaign_fact_id, '|', attribution_weight)
+        ) as fingerprint
+    from ({{ multi_touch_linear_attribution(incremental=false) }}) full_recompute
+    group by id
+),
+
+actual_multi_touch_linear as (
+    select
+        id,
+        count(*) as row_count,
+        sum(attributed_revenue) as measure,
+        string_agg(
+            concat(campaign_fact_id, '|', attribution_weight), ','
+            order by concat(campaign_fact_id, '|', attribution_weight)
+        ) as fingerprint
+    from {{ ref('multi_touch_linear') }}
+    group by id
+),
+
+expected_time_decay as (
+    select
+        id,
+        count(*) as row_count,
+        sum(attributed_revenue) as measure,
+        string_agg(
+            concat(campaign_fact_id, '|', attribution_weight), ','
+            order by concat(campaign_fact_id, '|', attribution_weight)
+        ) as fingerprint
+    from ({{ time_decay_attribution(incremental=false) }}) full_recompute
+    group by id
+),
+
+actual_time_decay as (
+    select
+        id,
+        count(*) as row_count,
+        sum(attributed_revenue) as measure,
+        string_agg(
+            concat(campaign_fact_id, '|', attribution_weight), ','
+            order by concat(campaign_fact_id, '|', attribution_weight)
+        ) as fingerprint
+    from {{ ref('time_decay') }}
+    group by id
+),
+
+expected_multi_touch_session as (
+    select
+        id,
+        count(*) as row_count,
+        sum(attributed_revenue) as measure,
+        string_agg(
+            concat(touchpoint_role, '|', attribution_weight), ','
+            order by concat(touchpoint_role, '|', attribution_weight)
+        ) as fingerprint
+    from ({{ multi_touch_session_attribution(incremental=false) }}) full_recompute
+    group by id
+),
+
+actual_multi_touch_session as (
+    select
+        id,
+        count(*) as row_count,
+        sum(attributed_revenue) as measure,
+        string_agg(
+            concat(touchpoint_role, '|', attribution_weight), ','
+            order by concat(touchpoint_role, '|', attribution_weight)
+        ) as fingerprint
+    from {{ ref('multi_touch_session') }}
+    group by id
+),
+
+mismatches as (
+    select 'last_click' as model_name, coalesce(e.id, a.id) as id,
+        e.row_count as expected_rows, a.row_count as actual_rows,
+        e.measure as expected_measure, a.measure as actual_measure
+    from expected_last_click e
+    full outer join actual_last_click a on e.id = a.id
+    where e.row_count is distinct from a.row_count
+        or round(e.measure::numeric, 4) is distinct from round(a.measure::numeric, 4)
+        or e.fingerprint is distinct from a.fingerprint
+
+    union all
+
+    select 'multi_touch_linear' as model_name, coalesce(e.id, a.id) as id,
+        e.row_count as expected_rows, a.row_count as actual_rows,
+        e.measure as expected_measure, a.measure as actual_measure
+    from expected_multi_touch_linear e
+    full outer join actual_multi_touch_linear a on e.id = a.id
+    where e.row_count is distinct from a.row_count
+        or round(e.measure::numeric, 4) is distinct from round(a.measure::numeric, 4)
+        or e.fingerprint is distinct from a.fingerprint
+
+    union all
+
+    select 'time_decay' as model_name, coalesce(e.id, a.id) as id,
+        e.row_count as expected_rows, a.row_count as actual_rows,
+        e.measure as expected_measure, a.measure as actual_measure
+    from expected_time_decay e
+    full outer join actual_time_decay a on e.id = a.id
+    where e.row_count is distinct from a.row_count
+        or round(e.measure::numeric, 4) is distinct from round(a.measure::numeric, 4)
+        or e.fingerprint is distinct from a.fingerprint
+
+    union all
+
+    select 'multi_touch_session' as model_name, coalesce(e.id, a.id) as id,
+        e.row_count as expected_rows, a.row_count as actual_rows,
+        e.measure as expected_measure, a.measure as actual_measure
+    from expected_multi_touch_session e
+    full outer join actual_multi_touch_session a on e.id = a.id
+    where e.row_count is distinct from a.row_count
+        or round(e.measure::numeric, 4) is distinct from round(a.measure::numeric, 4)
+        or e.fingerprint is distinct from a.fingerprint
+)
+
+select * from mismatches
@@ -0,0 +1,33 @@
+"""
+Gunicorn configuration for the API container.
+
+Runs uvicorn workers forked from a preloaded parent: the master imports the
+app once (route modules, models, middleware) and loads the lazily registered
+routers, then forks WEB_CONCURRENCY workers that share those pages
+copy-on-write. Workers start serving without repeating the import work, and
+a crashed worker is replaced by a fork instead of a cold start.
+
+The master must not open database connections or other sockets before
+forking; engines and HTTP client pools are created per worker in the app
+lifespan.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '10000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = 5
+accesslog = None
+
+
+def when_ready(server):
+    """Warm the preloaded app in the master before workers are forked."""
+    import main
+    from src.platform.lazy_router import load_lazy_routers
+
+    loaded = load_lazy_routers(main.app)
+    server.log.info("Preloaded app with %d lazy routers loaded", loaded)
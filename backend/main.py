@@ -10,10 +10,6 @@ import logging
 from pathlib import Path
 from contextlib import asynccontextmanager
 
-import sentry_sdk
-from sentry_sdk.integrations.fastapi import FastApiIntegration
-from sentry_sdk.integrations.starlette import StarletteIntegration
-
 from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse, HTMLResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
@@ -24,12 +20,15 @@ from src.platform.csp_middleware import EmbedOnlyCSPMiddleware
 from src.platform.logging_config import configure_logging
 from src.middleware.audit_middleware import AuditLoggingMiddleware
 from src.middleware.request_timeout import RequestTimeoutMiddleware
+from src.integrations.openrouter.client import (
+    close_openrouter_clients,
+    get_openrouter_client,
+)
+from src.database.session import close_async_engines
 from src.api.routes import health
 from src.api.routes import debug
 from src.api.routes import billing
 from src.api.routes import webhooks_shopify
-from src.api.routes import admin_plans
-from src.api.routes import admin_backfills
 from src.api.routes import backfills_status
 from src.api.routes import sync
 from src.api.routes import data_health
@@ -44,7 +43,6 @@ from src.api.routes import actions
 from src.api.routes import llm_config
 from src.api.routes import ai_chat
 from src.api.routes import changelog
-from src.api.routes import admin_changelog
 from src.api.routes import what_changed
 from src.api.routes import shopify_ingestion
 from src.api.routes import ad_platform_ingestion
@@ -54,15 +52,9 @@ from src.api.routes import tenant_members
 from src.api.routes import user_tenants
 from src.api.routes import dashboard_bindings
 from src.api.dq import routes as sync_health
-from src.api.routes import admin_diagnostics
-from src.api.routes import admin_super_admin
-from src.api.routes import audit as audit_story_87
-from src.api.routes import templates as templates_legacy
 from src.api.routes import agency_access
 from src.api.routes import auth_refresh_jwt
 from src.api.routes import auth_provision
-from src.api.routes import audit_logs
-from src.api.routes import audit_export
 from src.api.routes import shopify_embed_entry
 from src.api.routes import agency
 from src.api.routes import datasets
@@ -79,9 +71,9 @@ from src.api.routes import alerts
 from src.api.routes import search
 from src.api.routes import notifications
 from src.api.routes import pixel_events
-from src.api.routes import pixel_admin
 from src.api.routes import settings
 from src.platform.db_readiness import REQUIRED_IDENTITY_TABLES, check_required_tables
+from src.platform.lazy_router import include_lazy_router, install_lazy_openapi
 from src.database.session import get_db_session_sync
 
 # Configure structured logging (JSON in production, colored console in dev).
@@ -265,15 +257,26 @@ async def lifespan(app: FastAPI):
         },
     )
 
+    # Shared OpenRouter connection pool for AI chat and insight enhancement
+    if os.getenv("OPENROUTER_API_KEY"):
+        get_openrouter_client()
+
     yield
 
     # Shutdown
     logger.info("Shutting down MarkInsight API")
+    await close_openrouter_clients()
+    await close_async_engines()
 
 
 # Initialize Sentry error tracking (no-op if SENTRY_DSN is not set)
 _sentry_dsn = os.getenv("SENTRY_DSN")
 if _sentry_dsn:
+    # Imported only when enabled: the SDK and its integrations are slow to load
+    import sentry_sdk
+    from sentry_sdk.integrations.fastapi import FastApiIntegration
+    from sentry_sdk.integrations.starlette import StarletteIntegration
+
     sentry_sdk.init(
         dsn=_sentry_dsn,
         environment=os.getenv("ENV", "development"),
@@ -341,6 +344,12 @@ app.middleware("http")(tenant_middleware)
 app.add_middleware(AuditLoggingMiddleware)
 
 
+# Rarely used routers (admin, audit, exports) are registered with
+# include_lazy_router: their modules are imported on the first request under
+# their prefix instead of at startup. Route order is unchanged. OpenAPI
+# generation loads them first so /docs stays complete.
+install_lazy_openapi(app)
+
 # Include health route (bypasses authentication)
 app.include_router(health.router)
 
@@ -354,11 +363,11 @@ app.include_router(billing.router)
 app.include_router(webhooks_shopify.router)
 
 # Include admin routes (requires admin role)
-app.include_router(admin_plans.router)
+include_lazy_router(app, "src.api.routes.admin_plans", "/api/admin/plans")
 
 # Include admin backfill routes (requires super admin)
 # Story 3.4 - Backfill Request API
-app.include_router(admin_backfills.router)
+include_lazy_router(app, "src.api.routes.admin_backfills", "/api/v1/admin/backfills")
 
 # Include backfill status routes (requires super admin)
 # Story 3.4 - Backfill Status API
@@ -412,7 +421,7 @@ app.include_router(changelog.router)
 
 # Include admin changelog routes (requires ADMIN_SYSTEM_CONFIG permission)
 # Story 9.7 - In-App Changelog & Release Notes
-app.include_router(admin_changelog.router)
+include_lazy_router(app, "src.api.routes.admin_changelog", "/api/admin/changelog")
 
 # Include what-changed routes (requires authentication, read-only)
 # Story 9.8 - "What Changed?" Debug Panel
@@ -448,16 +457,16 @@ app.include_router(dashboard_bindings.router)
 
 # Include admin diagnostics routes (requires admin role)
 # Story 4.2 - Data Quality Root Cause Signals
-app.include_router(admin_diagnostics.router)
+include_lazy_router(app, "src.api.routes.admin_diagnostics", "/api/admin/diagnostics")
 
 # Super-admin grant/revoke + tenant listing (database-resolved super admin only)
-app.include_router(admin_super_admin.router)
+include_lazy_router(app, "src.api.routes.admin_super_admin", "/api/admin")
 
 # Story 8.7 — tenant-scoped audit / safety APIs under /api/audit (distinct from /api/v1/audit-logs)
-app.include_router(audit_story_87.router)
+include_lazy_router(app, "src.api.routes.audit", "/api/audit")
 
 # Legacy template gallery under /api/templates (v1 templates use report_templates router)
-app.include_router(templates_legacy.router)
+include_lazy_router(app, "src.api.routes.templates", "/api/templates")
 
 # Include agency access routes (requires authentication)
 # Story 5.5.2 - Agency Access Request + Tenant Approval Workflow
@@ -470,8 +479,8 @@ app.include_router(auth_refresh_jwt.router)
 # listed in PUBLIC_PATHS so the middleware skips it).  Called by the frontend
 # when every API call returns TENANT_NOT_PROVISIONED.
 app.include_router(auth_provision.router)
-app.include_router(audit_logs.router)
-app.include_router(audit_export.router)
+include_lazy_router(app, "src.api.routes.audit_logs", "/api/v1/audit-logs")
+include_lazy_router(app, "src.api.routes.audit_export", "/api/v1/audit-logs/export")
 
 # Custom Reports & Dashboard Builder (requires authentication + custom_reports entitlement for writes)
 app.include_router(custom_dashboards.router)
@@ -513,11 +522,10 @@ app.include_router(settings.router)
 
 # Pixel event ingestion (no auth — fires from customer browser)
 app.include_router(pixel_events.router)
-app.include_router(pixel_admin.router)
+include_lazy_router(app, "src.api.routes.pixel_admin", "/api/pixel/admin")
 # Data export and warehouse export routes
-from src.api.routes import data_export, warehouse_export
-app.include_router(data_export.router)
-app.include_router(warehouse_export.router)
+include_lazy_router(app, "src.api.routes.data_export", "/api/exports")
+include_lazy_router(app, "src.api.routes.warehouse_export", "/api/warehouse")
 
 
 # ---------------------------------------------------------------------------
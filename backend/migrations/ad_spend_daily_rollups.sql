@@ -0,0 +1,47 @@
+-- Ad Spend Daily Rollups Schema
+-- Version: 1.0.0
+-- Date: 2026-10-18
+--
+-- Creates table for:
+--   - ad_spend_daily_rollups: Daily ad spend per (tenant, platform, day),
+--     refreshed from analytics.marketing_spend when synced data lands.
+--     Budget pacing reads month-to-date spend from here.
+--
+-- SECURITY:
+--   - tenant_id column for tenant isolation
+--   - RLS policies should be applied separately if needed
+
+-- =============================================================================
+-- TABLE
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS ad_spend_daily_rollups (
+    -- Tenant isolation (CRITICAL: never from client input, only from JWT)
+    tenant_id VARCHAR(255) NOT NULL,
+
+    source_platform VARCHAR(100) NOT NULL,
+    spend_date DATE NOT NULL,
+    spend NUMERIC(18, 2) NOT NULL DEFAULT 0,
+
+    -- Timestamps (from TimestampMixin)
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+
+    PRIMARY KEY (tenant_id, source_platform, spend_date)
+);
+
+-- =============================================================================
+-- INDEXES
+-- =============================================================================
+
+-- Batch pacing scans one month across all tenants
+CREATE INDEX IF NOT EXISTS ix_ad_spend_daily_rollups_spend_date
+    ON ad_spend_daily_rollups(spend_date);
+
+-- =============================================================================
+-- COMMENTS
+-- =============================================================================
+
+COMMENT ON TABLE ad_spend_daily_rollups IS 'Daily ad spend per tenant/platform. Source for Budget Pacing.';
+COMMENT ON COLUMN ad_spend_daily_rollups.tenant_id IS 'Tenant isolation key - ONLY from JWT, never client input';
+COMMENT ON COLUMN ad_spend_daily_rollups.spend IS 'Spend in dollars (decimal), as in analytics.marketing_spend';
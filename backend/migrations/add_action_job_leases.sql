@@ -0,0 +1,18 @@
+-- Migration: Add worker lease columns to action_jobs
+-- Lets several action job workers claim jobs with FOR UPDATE SKIP LOCKED.
+-- A claimed job holds a lease that the owning worker extends by heartbeat;
+-- RUNNING jobs whose lease has lapsed are returned to the queue.
+-- All columns are nullable so existing jobs are unaffected.
+
+ALTER TABLE action_jobs
+    ADD COLUMN IF NOT EXISTS lease_owner VARCHAR(255),
+    ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP WITH TIME ZONE,
+    ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMP WITH TIME ZONE;
+
+COMMENT ON COLUMN action_jobs.lease_owner IS 'Worker ID holding the lease on this job';
+COMMENT ON COLUMN action_jobs.lease_expires_at IS 'When the lease lapses and the job may be reclaimed';
+COMMENT ON COLUMN action_jobs.heartbeat_at IS 'Last lease heartbeat from the owning worker';
+
+-- Stale lease recovery scans RUNNING jobs by lease expiry
+CREATE INDEX IF NOT EXISTS ix_action_jobs_status_lease
+    ON action_jobs(status, lease_expires_at);
@@ -0,0 +1,39 @@
+-- Migration: Add worker lease columns to AI generation job tables
+-- The AI job worker claims insight, recommendation and action proposal
+-- jobs with FOR UPDATE SKIP LOCKED. A claimed job holds a lease that the
+-- owning worker extends by heartbeat; RUNNING jobs whose lease has lapsed
+-- are returned to the queue. Same columns as action_jobs.
+-- All columns are nullable so existing jobs are unaffected.
+
+ALTER TABLE insight_jobs
+    ADD COLUMN IF NOT EXISTS lease_owner VARCHAR(255),
+    ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP WITH TIME ZONE,
+    ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMP WITH TIME ZONE;
+
+ALTER TABLE recommendation_jobs
+    ADD COLUMN IF NOT EXISTS lease_owner VARCHAR(255),
+    ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP WITH TIME ZONE,
+    ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMP WITH TIME ZONE;
+
+ALTER TABLE action_proposal_jobs
+    ADD COLUMN IF NOT EXISTS lease_owner VARCHAR(255),
+    ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP WITH TIME ZONE,
+    ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMP WITH TIME ZONE;
+
+COMMENT ON COLUMN insight_jobs.lease_owner IS 'Worker ID holding the lease on this job';
+COMMENT ON COLUMN insight_jobs.lease_expires_at IS 'When the lease lapses and the job may be reclaimed';
+COMMENT ON COLUMN insight_jobs.heartbeat_at IS 'Last lease heartbeat from the owning worker';
+COMMENT ON COLUMN recommendation_jobs.lease_owner IS 'Worker ID holding the lease on this job';
+COMMENT ON COLUMN recommendation_jobs.lease_expires_at IS 'When the lease lapses and the job may be reclaimed';
+COMMENT ON COLUMN recommendation_jobs.heartbeat_at IS 'Last lease heartbeat from the owning worker';
+COMMENT ON COLUMN action_proposal_jobs.lease_owner IS 'Worker ID holding the lease on this job';
+COMMENT ON COLUMN action_proposal_jobs.lease_expires_at IS 'When the lease lapses and the job may be reclaimed';
+COMMENT ON COLUMN action_proposal_jobs.heartbeat_at IS 'Last lease heartbeat from the owning worker';
+
+-- Stale lease recovery scans RUNNING jobs by lease expiry
+CREATE INDEX IF NOT EXISTS ix_insight_jobs_status_lease
+    ON insight_jobs(status, lease_expires_at);
+CREATE INDEX IF NOT EXISTS ix_recommendation_jobs_status_lease
+    ON recommendation_jobs(status, lease_expires_at);
+CREATE INDEX IF NOT EXISTS ix_action_proposal_jobs_status_lease
+    ON action_proposal_jobs(status, lease_expires_at);
@@ -0,0 +1,9 @@
+-- Migration: Mark completion cache hits in llm_usage_log
+-- LLMRoutingService serves repeated prompts from a tenant-scoped Redis
+-- cache. Cache hits are logged with zero tokens and zero cost; this flag
+-- keeps them distinguishable from billed calls in cost reporting.
+
+ALTER TABLE llm_usage_log
+    ADD COLUMN IF NOT EXISTS was_cache_hit BOOLEAN NOT NULL DEFAULT false;
+
+COMMENT ON COLUMN llm_usage_log.was_cache_hit IS 'Whether the response was served from the completion cache (no tokens billed)';
@@ -0,0 +1,107 @@
+-- Data Change Feed Counters Schema
+-- Version: 1.0.0
+-- Date: 2026-10-18
+--
+-- Creates tables for:
+--   - data_change_daily_counts: Events per (tenant, UTC day, event type),
+--     incremented by DataChangeAggregator as events are recorded. The
+--     "What Changed?" summary sums these instead of scanning events.
+--   - data_change_feed_state: One row per tenant with the number of events
+--     ever recorded. Live subscribers poll it to detect new events.
+--
+-- Also adds data_change_events.feed_sequence, the per-tenant recording
+-- order handed out from data_change_feed_state.event_count.
+--
+-- BACKFILL:
+--   Tenants with events but no feed state yet (everyone, on first apply)
+--   get their daily counts, feed sequences (1..n in occurred_at order) and
+--   feed state built from existing events, so the summary and the live
+--   stream continue from history instead of starting at 0. Tenants that
+--   already have feed state are left alone, which keeps re-runs safe.
+--
+-- SECURITY:
+--   - tenant_id column for tenant isolation
+--   - RLS policies should be applied separately if needed
+
+-- =============================================================================
+-- TABLES
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS data_change_daily_counts (
+    -- Tenant isolation (CRITICAL: never from client input, only from JWT)
+    tenant_id VARCHAR(255) NOT NULL,
+
+    bucket_date DATE NOT NULL,
+    event_type VARCHAR(50) NOT NULL,
+    event_count INTEGER NOT NULL DEFAULT 0,
+
+    PRIMARY KEY (tenant_id, bucket_date, event_type)
+);
+
+CREATE TABLE IF NOT EXISTS data_change_feed_state (
+    -- Tenant isolation (CRITICAL: never from client input, only from JWT)
+    tenant_id VARCHAR(255) PRIMARY KEY,
+
+    event_count BIGINT NOT NULL DEFAULT 0,
+    last_event_at TIMESTAMP WITH TIME ZONE,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+ALTER TABLE data_change_events
+    ADD COLUMN IF NOT EXISTS feed_sequence BIGINT;
+
+-- =============================================================================
+-- INDEXES
+-- =============================================================================
+
+-- Live stream reads events in recording order per tenant
+CREATE INDEX IF NOT EXISTS ix_data_change_events_tenant_sequence
+    ON data_change_events(tenant_id, feed_sequence);
+
+-- =============================================================================
+-- BACKFILL
+-- =============================================================================
+
+DO $$ BEGIN
+    -- Hold off event writers so no tenant gains feed state mid-backfill
+    LOCK TABLE data_change_feed_state IN SHARE ROW EXCLUSIVE MODE;
+
+    INSERT INTO data_change_daily_counts (tenant_id, bucket_date, event_type, event_count)
+    SELECT e.tenant_id, (e.occurred_at AT TIME ZONE 'UTC')::date, e.event_type, count(*)
+    FROM data_change_events e
+    WHERE NOT EXISTS (
+        SELECT 1 FROM data_change_feed_state s WHERE s.tenant_id = e.tenant_id
+    )
+    GROUP BY 1, 2, 3
+    ON CONFLICT (tenant_id, bucket_date, event_type) DO NOTHING;
+
+    UPDATE data_change_events e
+    SET feed_sequence = numbered.seq
+    FROM (
+        SELECT id, ROW_NUMBER() OVER (PARTITION BY tenant_id ORDER BY occurred_at, id) AS seq
+        FROM data_change_events ev
+        WHERE NOT EXISTS (
+            SELECT 1 FROM data_change_feed_state s WHERE s.tenant_id = ev.tenant_id
+        )
+    ) numbered
+    WHERE e.id = numbered.id;
+
+    INSERT INTO data_change_feed_state (tenant_id, event_count, last_event_at, updated_at)
+    SELECT e.tenant_id, count(*), max(e.occurred_at), NOW()
+    FROM data_change_events e
+    WHERE NOT EXISTS (
+        SELECT 1 FROM data_change_feed_state s WHERE s.tenant_id = e.tenant_id
+    )
+    GROUP BY e.tenant_id
+    ON CONFLICT (tenant_id) DO NOTHING;
+END $$;
+
+-- =============================================================================
+-- COMMENTS
+-- =============================================================================
+
+COMMENT ON TABLE data_change_daily_counts IS 'Daily change event counts per tenant/type. Source for the What Changed summary.';
+COMMENT ON TABLE data_change_feed_state IS 'Per-tenant change feed head; event_count only grows and acts as the feed version.';
+COMMENT ON COLUMN data_change_events.feed_sequence IS 'Per-tenant sequence assigned when the event was recorded (backfilled in occurred_at order for events that predate the feed)';
+COMMENT ON COLUMN data_change_daily_counts.tenant_id IS 'Tenant isolation key - ONLY from JWT, never client input';
+COMMENT ON COLUMN data_change_feed_state.tenant_id IS 'Tenant isolation key - ONLY from JWT, never client input';
@@ -0,0 +1,50 @@
+-- Dataset Catalog Schema
+-- Version: 1.0.0
+-- Date: 2026-10-18
+--
+-- Creates table for:
+--   - dataset_catalog: Discovery metadata per semantic dataset (Superset id,
+--     description, exposed columns), written by the dbt manifest -> Superset
+--     dataset sync. The datasets API serves from here instead of Superset.
+--
+-- AFTER DEPLOY:
+--   The table starts empty. Fill it from the existing Superset datasets with
+--   `python -m scripts.warm_dataset_catalog` rather than waiting for the next
+--   dbt run to trigger a sync.
+--
+-- SECURITY:
+--   - System-scoped (no tenant_id): describes platform schema, not tenant data
+
+-- =============================================================================
+-- TABLE
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS dataset_catalog (
+    dataset_name VARCHAR(255) PRIMARY KEY,
+
+    superset_dataset_id INTEGER NOT NULL,
+    schema_name VARCHAR(255) NOT NULL DEFAULT 'semantic',
+    description TEXT NOT NULL DEFAULT '',
+    columns TEXT NOT NULL,
+    etag VARCHAR(64) NOT NULL,
+
+    -- Timestamps (from TimestampMixin)
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+-- =============================================================================
+-- INDEXES
+-- =============================================================================
+
+-- Column lookups by Superset dataset id
+CREATE INDEX IF NOT EXISTS ix_dataset_catalog_superset_dataset_id
+    ON dataset_catalog(superset_dataset_id);
+
+-- =============================================================================
+-- COMMENTS
+-- =============================================================================
+
+COMMENT ON TABLE dataset_catalog IS 'Dataset discovery catalog, populated by the dbt -> Superset dataset sync.';
+COMMENT ON COLUMN dataset_catalog.columns IS 'JSON array of exposed columns: column_name, data_type, description';
+COMMENT ON COLUMN dataset_catalog.etag IS 'SHA-256 of the entry content; workers revalidate their cached catalog against these';
@@ -0,0 +1,52 @@
+-- Notification Unread Counters Schema
+-- Version: 1.0.0
+-- Date: 2026-10-18
+-- Story: 9.1 - Notification Framework (Events → Channels)
+--
+-- Creates table for:
+--   - notification_unread_counts: Unread notifications per (tenant, user),
+--     maintained by NotificationService in the same transaction as
+--     notify / mark read / mark all read. Badge reads and the unread stream
+--     read this row instead of counting notifications.
+--
+-- Backfills counters from existing unread notifications.
+--
+-- SECURITY:
+--   - tenant_id column for tenant isolation
+--   - RLS policies should be applied separately if needed
+
+-- =============================================================================
+-- TABLE
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS notification_unread_counts (
+    -- Tenant isolation (CRITICAL: never from client input, only from JWT)
+    tenant_id VARCHAR(255) NOT NULL,
+    user_id VARCHAR(255) NOT NULL,
+
+    unread_count INTEGER NOT NULL DEFAULT 0,
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+
+    PRIMARY KEY (tenant_id, user_id)
+);
+
+-- =============================================================================
+-- BACKFILL
+-- =============================================================================
+
+INSERT INTO notification_unread_counts (tenant_id, user_id, unread_count, version)
+SELECT tenant_id, user_id, COUNT(*), 1
+FROM notifications
+WHERE user_id IS NOT NULL
+  AND status IN ('pending', 'delivered')
+GROUP BY tenant_id, user_id
+ON CONFLICT (tenant_id, user_id) DO NOTHING;
+
+-- =============================================================================
+-- COMMENTS
+-- =============================================================================
+
+COMMENT ON TABLE notification_unread_counts IS 'Unread notification count per tenant user, maintained on write.';
+COMMENT ON COLUMN notification_unread_counts.version IS 'Bumped on every counter change; the unread stream pushes when it moves';
+COMMENT ON COLUMN notification_unread_counts.tenant_id IS 'Tenant isolation key - ONLY from JWT, never client input';
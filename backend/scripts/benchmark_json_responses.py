@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Benchmark CPU per request for the fast-path JSON list routes.
+
+For each opted-in route this serves the same rows two ways from an
+in-process app and measures process CPU time per request:
+
+1. before — per-row Pydantic models returned through ``response_model``
+   (validation, ``jsonable_encoder`` and ``json.dumps``), as the route
+   used to do
+2. after  — the route's row mapper into plain dicts, returned as
+   ``FastJSONResponse`` (orjson when installed)
+
+Both sides share the HTTP stack, so the difference is the serialization
+path. Rows are synthetic; no database is needed.
+
+Usage (from backend/):
+    python scripts/benchmark_json_responses.py [--rows 200] [--requests 200]
+
+Exit codes:
+    0 — benchmark printed
+    1 — a route's fast path returned different JSON from the model path
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent  # backend/
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("ENV", "test")
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from src.api import responses  # noqa: E402
+from src.api.responses import FastJSONResponse  # noqa: E402
+from src.api.routes import attribution, datasets, notifications, orders, what_changed  # noqa: E402
+from src.models.notification import (  # noqa: E402
+    NotificationEventType,
+    NotificationImportance,
+    NotificationStatus,
+)
+
+NOW = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _order_rows(n: int) -> List[SimpleNamespace]:
+    return [
+        SimpleNamespace(
+            order_id=100000 + i, order_number=5000 + i, order_name=f"#{5000 + i}",
+            revenue=Decimal("125.50") + i, currency="USD", financial_status="paid",
+            created_at=NOW - timedelta(minutes=i),
+            utm_source="facebook", utm_medium="cpc", utm_campaign=f"campaign-{i % 12}",
+            platform="meta_ads", attribution_status="attributed",
+        )
+        for i in range(n)
+    ]
+
+
+def _notifications(n: int) -> List[SimpleNamespace]:
+    return [
+        SimpleNamespace(
+            id=f"notification-{i}", event_type=NotificationEventType.ACTION_EXECUTED,
+            importance=NotificationImportance.ROUTINE, title="Action executed",
+            message="Your scheduled action ran successfully.", action_url=f"/actions/{i}",
+            entity_type="action", entity_id=f"action-{i}", status=NotificationStatus.DELIVERED,
+            created_at=NOW - timedelta(minutes=i), read_at=None,
+        )
+        for i in range(n)
+    ]
+
+
+def _events(n: int) -> List[SimpleNamespace]:
+    return [
+        SimpleNamespace(
+            id=f"event-{i}", event_type="sync_completed", title="Shopify sync completed",
+            description="Orders refreshed from Shopify.", affected_metrics=["revenue", "orders"],
+            affected_connector_name="Shopify", impact_summary=None,
+            affected_date_start=NOW - timedelta(days=1), affected_date_end=NOW,
+            occurred_at=NOW - timedelta(minutes=i),
+        )
+        for i in range(n)
+    ]
+
+
+def _kpi_summary(n: int) -> dict:
+    metric = {"value": 1234.5, "change_pct": 12.5}
+    return {
+        "total_revenue": metric, "total_ad_spend": metric,
+        "average_roas": metric, "total_conversions": metric,
+        "revenue_by_channel": [
+            {"channel": f"channel_{i}", "revenue": 100.0 + i, "spend": 25.0 + i}
+            for i in range(min(n, 20))
+        ],
+        "active_channels": min(n, 20),
+    }
+
+
+Route = Tuple[Callable[[], object], Callable[[], object], type]
+
+
+def build_routes(n: int) -> Dict[str, Route]:
+    """Route name -> (model-path handler, fast-path handler, response model)."""
+    order_rows = _order_rows(n)
+    items = _notifications(n)
+    events = _events(n)
+    summary = _kpi_summary(n)
+
+    return {
+        "orders": (
+            lambda: orders.OrdersListResponse(
+                orders=[orders.Order(**orders._order_row(r)) for r in order_rows],
+                total=n, has_more=False,
+            ),
+            lambda: FastJSONResponse({
+                "orders": [orders._order_row(r) for r in order_rows],
+                "total": n, "has_more": False,
+            }),
+            orders.OrdersListResponse,
+        ),
+        "attribution_orders": (
+            lambda: attribution.AttributedOrdersResponse(
+                orders=[
+                    attribution.AttributedOrder(**attribution._attributed_order_row(r))
+                    for r in order_rows
+                ],
+                total=n, has_more=False,
+            ),
+            lambda: FastJSONResponse({
+                "orders": [attribution._attributed_order_row(r) for r in order_rows],
+                "total": n, "has_more": False,
+            }),
+            attribution.AttributedOrdersResponse,
+        ),
+        "kpi_summary": (
+            lambda: datasets.KpiSummaryResponse(**summary),
+            lambda: FastJSONResponse(summary),
+            datasets.KpiSummaryResponse,
+        ),
+        "notifications": (
+            lambda: notifications.NotificationListResponse(
+                notifications=[notifications._notification_to_response(x) for x in items],
+                total=n, unread_count=n,
+            ),
+            lambda: FastJSONResponse({
+                "notifications": [notifications._notification_row(x) for x in items],
+                "total": n, "unread_count": n,
+            }),
+            notifications.NotificationListResponse,
+        ),
+        "what_changed": (
+            lambda: what_changed.ChangeEventsListResponse(
+                events=[what_changed._event_to_response(e) for e in events],
+                total=n, has_more=False, next_cursor=None,
+            ),
+            lambda: FastJSONResponse({
+                "events": [what_changed._event_row(e) for e in events],
+                "total": n, "has_more": False, "next_cursor": None,
+            }),
+            what_changed.ChangeEventsListResponse,
+        ),
+    }
+
+
+def build_app(routes: Dict[str, Route]) -> FastAPI:
+    app = FastAPI()
+    for name, (before, after, model) in routes.items():
+        app.add_api_route(f"/before/{name}", before, response_model=model)
+        app.add_api_route(
+            f"/after/{name}", after, response_model=model, response_class=FastJSONResponse,
+        )
+    return app
+
+
+def cpu_ms_per_request(client: TestClient, path: str, requests: int) -> float:
+    for _ in range(min(requests, 10)):  # warm up
+        client.get(path)
+    start = time.process_time()
+    for _ in range(requests):
+        client.get(path)
+    return (time.process_time() - start) * 1000 / requests
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=200, help="Rows per response (default: 200)")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per measurement (default: 200)")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    routes = build_routes(args.rows)
+    client = TestClient(build_app(routes))
+
+    mismatched = [
+        name for name in routes
+        if client.get(f"/before/{name}").json() != client.get(f"/after/{name}").json()
+    ]
+    if mismatched:
+        print(f"FAIL: fast path JSON differs for {', '.join(mismatched)}", file=sys.stderr)
+        return 1
+
+    encoder = "orjson" if responses.orjson is not None else "json (stdlib fallback)"
+    print(f"{args.rows} rows per response, {args.requests} requests, encoder: {encoder}\n")
+    print(f"{'route':<20}{'before ms':>11}{'after ms':>10}{'speedup':>9}")
+    for name in routes:
+        before = cpu_ms_per_request(client, f"/before/{name}", args.requests)
+        after = cpu_ms_per_request(client, f"/after/{name}", args.requests)
+        print(f"{name:<20}{before:11.3f}{after:10.3f}{before / after:8.1f}x")
+    print("\nCPU time per request (process_time), including the in-process HTTP stack.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
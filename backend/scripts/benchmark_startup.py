@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark API time-to-first-request from a cold interpreter.
+
+Each run starts a fresh Python process that imports main, runs the app
+lifespan startup and serves GET /health through an in-process test client.
+It reports three phases per run:
+
+1. import  — ``import main`` (route modules, models, middleware)
+2. startup — lifespan startup (env validation, readiness probes)
+3. first request — the first /health response
+
+No database, Clerk or network is needed: DATABASE_URL points at in-memory
+SQLite and CLERK_FRONTEND_API is unset so the JWKS probe is skipped.
+
+Usage (from backend/):
+    python scripts/benchmark_startup.py [--runs 5] [--budget-ms 4000]
+
+With ``--budget-ms`` it exits 1 when the median time-to-first-request is over
+budget, so it can guard against startup regressions in CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent  # backend/
+
+_RUN_SCRIPT = r"""
+import json
+import logging
+import time
+
+t0 = time.perf_counter()
+import main
+t_import = time.perf_counter()
+
+from fastapi.testclient import TestClient
+from src.platform.lazy_router import LazyRouter
+
+logging.disable(logging.CRITICAL)
+with TestClient(main.app) as client:
+    t_startup = time.perf_counter()
+    response = client.get("/health")
+    t_first = time.perf_counter()
+
+lazy = [r for r in main.app.router.routes if isinstance(r, LazyRouter)]
+print(json.dumps({
+    "status": response.status_code,
+    "import_ms": (t_import - t0) * 1000,
+    "startup_ms": (t_startup - t_import) * 1000,
+    "first_request_ms": (t_first - t_startup) * 1000,
+    "total_ms": (t_first - t0) * 1000,
+    "lazy_routers": len(lazy),
+    "lazy_routers_loaded": sum(r.loaded for r in lazy),
+}))
+"""
+
+
+def run_once() -> dict:
+    env = dict(os.environ)
+    env["DATABASE_URL"] = "sqlite:///:memory:"
+    env["ENV"] = "test"
+    env["PYTHONPATH"] = str(ROOT)
+    env.pop("CLERK_FRONTEND_API", None)
+    env.pop("SENTRY_DSN", None)
+    result = subprocess.run(
+        [sys.executable, "-c", _RUN_SCRIPT],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        print(result.stderr[-4000:], file=sys.stderr)
+        raise SystemExit(f"FAIL: benchmark run exited with {result.returncode}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5, help="Cold starts to measure (default: 5)")
+    parser.add_argument(
+        "--budget-ms", type=float, default=None,
+        help="Fail if median time-to-first-request exceeds this many milliseconds",
+    )
+    args = parser.parse_args()
+
+    runs = [run_once() for _ in range(args.runs)]
+    if any(run["status"] != 200 for run in runs):
+        print("FAIL: /health did not return 200", file=sys.stderr)
+        return 1
+
+    print(f"{'phase':<16}{'median ms':>12}{'min ms':>10}{'max ms':>10}")
+    for phase in ("import_ms", "startup_ms", "first_request_ms", "total_ms"):
+        values = [run[phase] for run in runs]
+        print(
+            f"{phase[:-3]:<16}{statistics.median(values):12.1f}"
+            f"{min(values):10.1f}{max(values):10.1f}"
+        )
+    last = runs[-1]
+    print(
+        f"\nLazy routers: {last['lazy_routers']} registered, "
+        f"{last['lazy_routers_loaded']} loaded by the first request"
+    )
+
+    median_total = statistics.median(run["total_ms"] for run in runs)
+    if args.budget_ms is not None and median_total > args.budget_ms:
+        print(
+            f"FAIL: median time-to-first-request {median_total:.0f} ms is over "
+            f"the {args.budget_ms:.0f} ms budget",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Benchmark the diagnostics stats kernels against the pure-Python loops they
+replaced.
+
+Cases
+-----
+1. Jensen-Shannon divergence over 10k categories
+2. Top-3 movers over 10k categories
+3. Execution-time regression over 1k dbt models
+4. Median over 1k durations
+
+Each case checks the kernel agrees with the loop implementation, then
+prints mean wall time per call for both.
+
+Usage (from backend/):
+    python scripts/benchmark_stats_kernels.py [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # backend/
+
+from src.diagnostics import stats_kernels  # noqa: E402
+from src.diagnostics.transformation_regression import (  # noqa: E402
+    _detect_execution_time_regression,
+)
+from src.ingestion.dbt_artifact_parser import DbtModelResult  # noqa: E402
+
+CATEGORIES = 10_000
+MODELS = 1_000
+
+
+# ---------------------------------------------------------------------------
+# Loop implementations (as they were before the kernels)
+# ---------------------------------------------------------------------------
+
+def loop_jsd(p, q):
+    all_keys = set(p) | set(q)
+    if not all_keys:
+        return 0.0
+    epsilon = 1e-10
+    p_vec = [p.get(k, 0.0) + epsilon for k in all_keys]
+    q_vec = [q.get(k, 0.0) + epsilon for k in all_keys]
+    p_sum = sum(p_vec)
+    q_sum = sum(q_vec)
+    p_vec = [x / p_sum for x in p_vec]
+    q_vec = [x / q_sum for x in q_vec]
+    m_vec = [(pi + qi) / 2 for pi, qi in zip(p_vec, q_vec)]
+
+    def _kl(a, b):
+        return sum(ai * math.log2(ai / bi) for ai, bi in zip(a, b))
+
+    return (_kl(p_vec, m_vec) + _kl(q_vec, m_vec)) / 2
+
+
+def loop_top_movers(current, baseline, top_n=3):
+    all_keys = set(current) | set(baseline)
+    changes = [(k, current.get(k, 0.0) - baseline.get(k, 0.0)) for k in all_keys]
+    changes.sort(key=lambda x: abs(x[1]), reverse=True)
+    return [{"category": k, "change": round(v, 4)} for k, v in changes[:top_n]]
+
+
+def loop_execution_time_regression(current_models, previous_models, threshold_ratio=3.0):
+    previous_by_name = {m.model_name: m for m in previous_models}
+    regressions = []
+    for current in current_models:
+        previous = previous_by_name.get(current.model_name)
+        if (
+            previous
+            and previous.execution_time_seconds > 0
+            and current.execution_time_seconds > 0
+        ):
+            ratio = current.execution_time_seconds / previous.execution_time_seconds
+            if ratio >= threshold_ratio:
+                regressions.append({
+                    "model_name": current.model_name,
+                    "previous_seconds": round(previous.execution_time_seconds, 2),
+                    "current_seconds": round(current.execution_time_seconds, 2),
+                    "execution_time_ratio": round(ratio, 2),
+                })
+    return regressions
+
+
+def loop_median(values):
+    if not values:
+        return 0.0
+    sorted_vals = sorted(values)
+    n = len(sorted_vals)
+    if n % 2 == 1:
+        return sorted_vals[n // 2]
+    return (sorted_vals[n // 2 - 1] + sorted_vals[n // 2]) / 2.0
+
+
+# ---------------------------------------------------------------------------
+# Harness
+# ---------------------------------------------------------------------------
+
+def _time_ms(fn, args, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(*args)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def _model(name, seconds):
+    return DbtModelResult(
+        model_name=name,
+        schema_name="analytics",
+        status="pass",
+        execution_time_seconds=seconds,
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    baseline = {f"cat_{i}": rng.random() for i in range(CATEGORIES)}
+    current = {f"cat_{i}": rng.random() for i in range(CATEGORIES // 20, CATEGORIES + CATEGORIES // 20)}
+    previous_models = [_model(f"model_{i}", rng.uniform(0.5, 30)) for i in range(MODELS)]
+    current_models = [
+        _model(m.model_name, m.execution_time_seconds * rng.choice([1, 1, 1, 4]))
+        for m in previous_models
+    ]
+    durations = [rng.uniform(10, 600) for _ in range(MODELS)]
+
+    assert math.isclose(
+        loop_jsd(baseline, current),
+        stats_kernels.distribution_divergence(baseline, current),
+        rel_tol=1e-9,
+    )
+    assert (
+        {m["category"] for m in loop_top_movers(current, baseline)}
+        == {m["category"] for m in stats_kernels.top_movers(current, baseline)}
+    )
+    assert (
+        loop_execution_time_regression(current_models, previous_models)
+        == _detect_execution_time_regression(current_models, previous_models)
+    )
+    assert math.isclose(loop_median(durations), stats_kernels.median(durations))
+
+    cases = [
+        (f"jsd ({CATEGORIES} categories)", loop_jsd,
+         stats_kernels.distribution_divergence, (baseline, current)),
+        (f"top movers ({CATEGORIES} categories)", loop_top_movers,
+         stats_kernels.top_movers, (current, baseline)),
+        (f"execution time regression ({MODELS} models)", loop_execution_time_regression,
+         _detect_execution_time_regression, (current_models, previous_models)),
+        (f"median ({MODELS} values)", loop_median, stats_kernels.median, (durations,)),
+    ]
+
+    print(f"{'case':<42} {'loop ms':>10} {'kernel ms':>10} {'speedup':>8}")
+    for name, loop_fn, kernel_fn, fn_args in cases:
+        loop_ms = _time_ms(loop_fn, fn_args, args.repeat)
+        kernel_ms = _time_ms(kernel_fn, fn_args, args.repeat)
+        print(f"{name:<42} {loop_ms:>10.3f} {kernel_ms:>10.3f} {loop_ms / kernel_ms:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
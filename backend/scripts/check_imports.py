@@ -14,7 +14,9 @@ Two phases:
 
   Phase 2 (Runtime / subprocess):
     For each route module imported in main.py, spawns a subprocess that tries
-    `from src.api.routes import <module>`.  A non-zero exit means the module
+    `from src.api.routes import <module>`.  Modules registered with
+    include_lazy_router are checked too: they load on first request, so a
+    broken one would otherwise only fail in production.  A non-zero exit means the module
     raises NameError, ImportError, or similar at load time — which would crash
     main.py on startup.  The full traceback is printed so the broken import is
     immediately visible.
@@ -65,6 +67,25 @@ def _find_local_from_imports(filepath: Path) -> list[tuple[str, str, int]]:
     return results
 
 
+def _find_lazy_router_modules(filepath: Path) -> list[str]:
+    """
+    Return module paths passed to include_lazy_router(app, "<module>", ...).
+    """
+    tree = ast.parse(filepath.read_text(encoding="utf-8"), filename=str(filepath))
+    modules = []
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id == "include_lazy_router"
+            and len(node.args) >= 2
+            and isinstance(node.args[1], ast.Constant)
+            and isinstance(node.args[1].value, str)
+        ):
+            modules.append(node.args[1].value)
+    return modules
+
+
 def _import_to_candidates(module: str, name: str) -> list[Path]:
     """
     Return candidate file paths for `from {module} import {name}`.
@@ -221,6 +242,11 @@ def main() -> int:
             if stmt not in seen:
                 seen.add(stmt)
                 route_stmts.append(stmt)
+        for module in _find_lazy_router_modules(main_py):
+            stmt = f"import {module}"
+            if stmt not in seen:
+                seen.add(stmt)
+                route_stmts.append(stmt)
 
     if not route_stmts:
         print("  (no route imports found in main.py)")
@@ -4,7 +4,8 @@ Insight Worker CLI - Entry point for cron-triggered insight generation.
 
 Commands:
     dispatch    Create insight generation jobs for eligible tenants
-    process     Execute queued insight generation jobs
+    process     Run the AI job worker (claims queued insight jobs and
+                chains their recommendation/proposal stages)
 
 Usage:
     # Daily job dispatch (run at 2am UTC via cron)
@@ -14,7 +15,7 @@ Usage:
     python -m scripts.insight_worker dispatch --cadence hourly
 
     # Process queued jobs (run every 5 minutes via cron)
-    python -m scripts.insight_worker process --limit 10
+    python -m scripts.insight_worker process
 
 Cron Examples:
     # Daily dispatch at 2am UTC
@@ -24,22 +25,23 @@ Cron Examples:
     0 * * * * cd /app && python -m scripts.insight_worker dispatch --cadence hourly
 
     # Process jobs every 5 minutes
-    */5 * * * * cd /app && python -m scripts.insight_worker process --limit 10
+    */5 * * * * cd /app && python -m scripts.insight_worker process
 
 Story 8.1 - AI Insight Generation (Read-Only Analytics)
 """
 
 import argparse
+import asyncio
 import logging
 import sys
 from datetime import datetime, timezone
 
-from src.database.session import get_db_session
+from src.database.session import get_db_session, get_db_session_sync, get_session_factory
+from src.jobs.ai_job_worker import AIJobWorker
 from src.services.insight_job_dispatcher import (
     dispatch_daily_insight_jobs,
     dispatch_hourly_insight_jobs,
 )
-from src.services.insight_job_runner import run_insight_worker_cycle
 
 # Configure logging
 logging.basicConfig(
@@ -87,29 +89,27 @@ def cmd_dispatch(args) -> int:
 
 
 def cmd_process(args) -> int:
-    """Process queued insight jobs."""
-    logger.info(
-        "insight_worker.process.start",
-        extra={"limit": args.limit},
-    )
+    """Process queued insight jobs through the leased AI job worker."""
+    logger.info("insight_worker.process.start")
 
     try:
-        with get_db_session() as db:
-            result = run_insight_worker_cycle(db, limit=args.limit)
+        for db in get_db_session_sync():
+            worker = AIJobWorker(db, session_factory=get_session_factory())
+            stats = asyncio.run(worker.run())
 
         logger.info(
             "insight_worker.process.complete",
             extra={
-                "jobs_processed": result["jobs_processed"],
-                "jobs_succeeded": result["jobs_succeeded"],
-                "jobs_failed": result["jobs_failed"],
+                "jobs_processed": stats["jobs_processed"],
+                "jobs_succeeded": stats["jobs_succeeded"],
+                "jobs_failed": stats["jobs_failed"],
             },
         )
         print(
-            f"Processed {result['jobs_processed']} jobs: "
-            f"{result['jobs_succeeded']} succeeded, {result['jobs_failed']} failed"
+            f"Processed {stats['jobs_processed']} jobs: "
+            f"{stats['jobs_succeeded']} succeeded, {stats['jobs_failed']} failed"
         )
-        return 0 if result["jobs_failed"] == 0 else 1
+        return 0 if stats["jobs_failed"] == 0 else 1
 
     except Exception as e:
         logger.exception(
@@ -129,7 +129,7 @@ def main() -> int:
 Examples:
   %(prog)s dispatch --cadence daily    Dispatch daily insight jobs
   %(prog)s dispatch --cadence hourly   Dispatch hourly jobs (enterprise only)
-  %(prog)s process --limit 10          Process up to 10 queued jobs
+  %(prog)s process                    Process queued AI jobs
         """,
     )
 
@@ -153,12 +153,6 @@ Examples:
         "process",
         help="Process queued insight generation jobs",
     )
-    process_parser.add_argument(
-        "--limit",
-        type=int,
-        default=10,
-        help="Maximum number of jobs to process (default: 10)",
-    )
     process_parser.set_defaults(func=cmd_process)
 
     args = parser.parse_args()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Import-time profile of the API app (or any module), from ``-X importtime``.
+
+Why this matters
+----------------
+Every module main.py imports at module scope is paid for on each cold start
+(Render deploys, worker restarts, autoscaled instances). This script imports
+the target in a clean subprocess with ``python -X importtime`` and reports
+where that time goes, so a slow new import shows up in review instead of in
+deploy latency.
+
+What it reports
+---------------
+1. Total import time of the target module.
+2. The slowest imports by cumulative time (module plus everything it pulled in).
+3. The slowest imports by self time (the module's own top-level code).
+
+With ``--budget-ms`` it exits 1 when the total exceeds the budget, so it can
+run as a CI gate.
+
+Usage (from backend/):
+    python scripts/profile_imports.py [--module main] [--top 25]
+                                      [--first-party] [--budget-ms 2500]
+
+Exit codes:
+    0 — profile printed (and within budget, if one was given)
+    1 — import failed or budget exceeded
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent  # backend/
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+FIRST_PARTY = ("main", "src")
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+    @property
+    def first_party(self) -> bool:
+        return self.module.split(".", 1)[0] in FIRST_PARTY
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """Parse ``-X importtime`` stderr into one record per imported module."""
+    timings = []
+    for line in output.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        timings.append(ImportTiming(
+            module=module,
+            self_us=int(self_us),
+            cumulative_us=int(cumulative_us),
+            depth=(len(indent) - 1) // 2,
+        ))
+    return timings
+
+
+def run_importtime(module: str) -> str:
+    """Import the module in a fresh interpreter and return the importtime log."""
+    env = dict(os.environ)
+    # Minimal env — no real credentials needed to import the app
+    env.setdefault("DATABASE_URL", "sqlite:///:memory:")
+    env.setdefault("ENV", "test")
+    env["PYTHONPATH"] = str(ROOT)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        print(result.stderr[-4000:], file=sys.stderr)
+        raise SystemExit(f"FAIL: `import {module}` exited with {result.returncode}")
+    return result.stderr
+
+
+def _print_table(title: str, rows: List[ImportTiming], key: str) -> None:
+    print(f"\n{title}")
+    print(f"{'ms':>9}  module")
+    for row in rows:
+        print(f"{getattr(row, key) / 1000:9.1f}  {row.module}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--module", default="main", help="Module to import (default: main)")
+    parser.add_argument("--top", type=int, default=25, help="Rows per table (default: 25)")
+    parser.add_argument(
+        "--first-party", action="store_true",
+        help="Only list main and src.* modules",
+    )
+    parser.add_argument(
+        "--budget-ms", type=float, default=None,
+        help="Fail if the total import time exceeds this many milliseconds",
+    )
+    args = parser.parse_args()
+
+    timings = parse_importtime(run_importtime(args.module))
+    target = next((t for t in timings if t.module == args.module and t.depth == 0), None)
+    if target is None:
+        print(f"FAIL: no importtime record for {args.module}", file=sys.stderr)
+        return 1
+
+    listed = [t for t in timings if t.first_party] if args.first_party else timings
+    _print_table(
+        "Slowest imports (cumulative)",
+        sorted(listed, key=lambda t: t.cumulative_us, reverse=True)[:args.top],
+        "cumulative_us",
+    )
+    _print_table(
+        "Slowest imports (self)",
+        sorted(listed, key=lambda t: t.self_us, reverse=True)[:args.top],
+        "self_us",
+    )
+
+    total_ms = target.cumulative_us / 1000
+    print(f"\nTotal: `import {args.module}` took {total_ms:.1f} ms across {len(timings)} modules")
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"FAIL: over the {args.budget_ms:.0f} ms import budget", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
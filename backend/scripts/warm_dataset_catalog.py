@@ -0,0 +1,107 @@
+"""
+Dataset Catalog Warm-up Script.
+
+Fills the dataset discovery catalog from the semantic-view datasets that
+already exist in Superset. Run once after deploying the catalog table (or
+whenever it is empty); afterwards every dbt-triggered Superset sync keeps
+it current.
+
+Usage:
+    python -m scripts.warm_dataset_catalog
+    python -m scripts.warm_dataset_catalog --manifest analytics/target/manifest.json
+
+Environment variables:
+    DATABASE_URL: PostgreSQL connection string (required)
+    SUPERSET_EMBED_URL: Superset base URL (required)
+    SUPERSET_USERNAME / SUPERSET_PASSWORD: Superset API credentials (required)
+    DBT_MANIFEST_PATH: Compiled dbt manifest (default: analytics/target/manifest.json)
+"""
+
+import os
+import sys
+import logging
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.services.backfill_planner import DBT_MANIFEST_PATH
+from src.services.superset_dataset_sync import SupersetDatasetSync
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def get_database_url() -> str:
+    """Get database URL from environment."""
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        raise ValueError("DATABASE_URL environment variable is required.")
+    if database_url.startswith("postgres://"):
+        database_url = database_url.replace("postgres://", "postgresql://", 1)
+    return database_url
+
+
+def warm_dataset_catalog(database_url: str, manifest_path: str) -> int:
+    """Write catalog entries for existing Superset datasets. Returns entries written."""
+    superset_url = os.getenv("SUPERSET_EMBED_URL", "")
+    username = os.getenv("SUPERSET_USERNAME")
+    password = os.getenv("SUPERSET_PASSWORD")
+    if not superset_url or not username or not password:
+        raise ValueError(
+            "SUPERSET_EMBED_URL, SUPERSET_USERNAME and SUPERSET_PASSWORD must be set"
+        )
+
+    engine = create_engine(database_url)
+    session = sessionmaker(bind=engine)()
+    try:
+        sync = SupersetDatasetSync(
+            db=session,
+            superset_url=superset_url,
+            superset_username=username,
+            superset_password=password,
+        )
+        written = sync.warm_catalog(manifest_path)
+        session.commit()
+        logger.info("Dataset catalog warmed: %d entries written", written)
+        return written
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def main():
+    """Main entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Fill the dataset discovery catalog from existing Superset datasets",
+    )
+    parser.add_argument("--manifest", type=str, default=DBT_MANIFEST_PATH, help="dbt manifest.json path")
+    parser.add_argument("--database-url", type=str, help="Database URL override")
+
+    args = parser.parse_args()
+
+    try:
+        database_url = args.database_url or get_database_url()
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(1)
+
+    try:
+        warm_dataset_catalog(database_url, args.manifest)
+    except Exception as e:
+        logger.error("Script failed: %s", e)
+        sys.exit(1)
+
+    logger.info("Done!")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,25 +14,39 @@ The agent never calls more than MAX_ITERATIONS times, so worst-case
 latency is bounded. When the model doesn't invoke any tools (the common
 case for simple questions), it returns after a single LLM call.
 
+run() returns the final answer; run_stream() yields token deltas as the
+model produces them. Tool calls from one model turn run concurrently on a
+thread pool (one DB session per tool, per-tool timeout) when the agent is
+given a session factory. Both record timing spans per iteration.
+
+Tool results are memoized per agent (one conversation) and cached in
+Redis under the tenant's data version, so a repeated question does not
+re-read the marts until the next dbt run.
+
 SECURITY:
   - tenant_id scopes every SQL query
   - Tools are read-only (SELECT only)
   - Max 3 tool iterations prevents runaway loops
+  - Each tool is bounded by TOOL_TIMEOUT_SECONDS
 
 Tables queried (verified against dbt model final SELECTs per CLAUDE.md):
   - marts.fct_marketing_metrics  → channel/campaign hierarchy, roas, cac, ctr
-  - marts.mart_revenue_metrics   → gross_revenue, net_revenue, order_count, aov
+  - marts.rollup_daily_revenue   → gross_revenue, net_revenue, order_count (aov derived)
   - attribution.last_click       → platform, revenue, attribution_status
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import date
 from decimal import Decimal
-from typing import Optional
+from typing import Any, AsyncIterator, Callable, Optional
 
 from sqlalchemy import text
 from sqlalchemy.orm import Session
@@ -40,15 +54,44 @@ from sqlalchemy.orm import Session
 from src.integrations.openrouter.client import OpenRouterClient
 from src.integrations.openrouter.models import (
     ChatMessage,
+    StreamedCompletion,
     ToolCall,
     ToolDefinition,
 )
 from src.models.llm_routing import LLMModelRegistry, LLMResponseStatus, LLMUsageLog
+from src.services.analytics_snapshot_cache import (
+    AnalyticsSnapshotCache,
+    get_analytics_cache,
+    tool_cache_entry,
+)
+from src.services.metric_rollups import (
+    change_pct,
+    period_bounds,
+    revenue_totals_by_currency,
+)
 
 logger = logging.getLogger(__name__)
 
 MAX_ITERATIONS = 3
 
+# Tool calls from one model turn run concurrently on a shared pool
+TOOL_TIMEOUT_SECONDS = 10.0
+MAX_TOOL_WORKERS = 8
+
+_tool_executor: ThreadPoolExecutor | None = None
+_tool_executor_lock = threading.Lock()
+
+
+def _get_tool_executor() -> ThreadPoolExecutor:
+    """Process-wide pool for tool execution, created on first use."""
+    global _tool_executor
+    with _tool_executor_lock:
+        if _tool_executor is None:
+            _tool_executor = ThreadPoolExecutor(
+                max_workers=MAX_TOOL_WORKERS, thread_name_prefix="agent-tool",
+            )
+        return _tool_executor
+
 # ---------------------------------------------------------------------------
 # Tool definitions exposed to the model
 # ---------------------------------------------------------------------------
@@ -225,46 +268,32 @@ def _tool_marketing_metrics(tenant_id: str, db: Session, args: dict) -> str:
 
 def _tool_revenue_breakdown(tenant_id: str, db: Session, args: dict) -> str:
     period_type = args.get("period_type", "last_30_days")
+    current_range, prior_range = period_bounds(period_type)
 
-    row = db.execute(
-        text("""
-            SELECT
-                gross_revenue,
-                net_revenue,
-                order_count,
-                aov,
-                refund_amount,
-                gross_revenue_change_pct,
-                net_revenue_change_pct,
-                order_count_change_pct,
-                aov_change_pct,
-                currency,
-                period_start,
-                period_end
-            FROM marts.mart_revenue_metrics
-            WHERE tenant_id = :tenant_id
-              AND period_type = :period_type
-            LIMIT 1
-        """),
-        {"tenant_id": tenant_id, "period_type": period_type},
-    ).fetchone()
-
-    if not row:
+    by_currency = revenue_totals_by_currency(
+        db, tenant_id, [current_range, prior_range],
+    )
+    if not by_currency:
         return json.dumps({"result": "No revenue data available for this period."})
 
+    # Report the store's main currency (largest gross revenue this period)
+    currency, (current, prior) = max(
+        by_currency.items(), key=lambda item: item[1][0].gross_revenue,
+    )
+
     return json.dumps({
         "result": {
-            "gross_revenue": float(row.gross_revenue or 0),
-            "net_revenue": float(row.net_revenue or 0),
-            "order_count": int(row.order_count or 0),
-            "aov": round(float(row.aov or 0), 2),
-            "refund_amount": float(row.refund_amount or 0),
-            "gross_revenue_change_pct": float(row.gross_revenue_change_pct or 0),
-            "order_count_change_pct": float(row.order_count_change_pct or 0),
-            "aov_change_pct": float(row.aov_change_pct or 0),
-            "currency": row.currency,
-            "period_start": str(row.period_start) if row.period_start else None,
-            "period_end": str(row.period_end) if row.period_end else None,
+            "gross_revenue": current.gross_revenue,
+            "net_revenue": current.net_revenue,
+            "order_count": current.order_count,
+            "aov": round(current.aov, 2),
+            "refund_amount": current.refund_amount,
+            "gross_revenue_change_pct": change_pct(current.gross_revenue, prior.gross_revenue),
+            "order_count_change_pct": change_pct(current.order_count, prior.order_count),
+            "aov_change_pct": change_pct(current.aov, prior.aov),
+            "currency": currency,
+            "period_start": str(current_range.start),
+            "period_end": str(current_range.end),
         }
     })
 
@@ -306,6 +335,51 @@ def _tool_attribution_by_channel(tenant_id: str, db: Session) -> str:
 # Agent result
 # ---------------------------------------------------------------------------
 
+@dataclass
+class AgentSpan:
+    """Timing of one phase ("llm" or "tools") of an agent iteration."""
+    iteration: int
+    phase: str
+    start_ms: int      # offset from the start of the run
+    duration_ms: int
+    detail: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class _SpanRecorder:
+    """Collects AgentSpans relative to the start of a run."""
+
+    def __init__(self) -> None:
+        self.origin = time.monotonic()
+        self.spans: list[AgentSpan] = []
+
+    def elapsed_ms(self, since: float | None = None) -> int:
+        return int((time.monotonic() - (since or self.origin)) * 1000)
+
+    def record(self, iteration: int, phase: str, started: float, **detail: Any) -> AgentSpan:
+        span = AgentSpan(
+            iteration=iteration,
+            phase=phase,
+            start_ms=int((started - self.origin) * 1000),
+            duration_ms=self.elapsed_ms(started),
+            detail=detail,
+        )
+        self.spans.append(span)
+        return span
+
+
+@dataclass
+class ToolRun:
+    """Outcome of one tool call."""
+    call: ToolCall
+    result: str
+    duration_ms: int
+    timed_out: bool = False
+    cached: bool = False
+
+
 @dataclass
 class AgentResult:
     """Result returned from AnalyticsAgent.run()."""
@@ -319,6 +393,7 @@ class AgentResult:
     was_fallback: bool
     tool_calls_made: int
     fallback_reason: str | None = None
+    spans: list[AgentSpan] = field(default_factory=list)
 
 
 # ---------------------------------------------------------------------------
@@ -332,6 +407,14 @@ class AnalyticsAgent:
     Wraps the OpenRouter client to support a multi-turn tool loop.
     Falls through to a single LLM call (no extra latency) when the
     model doesn't invoke any tools.
+
+    With a session_factory, the tool calls of one model turn run in
+    parallel, each on its own session (Sessions are not thread-safe).
+    Without one they run one at a time on ``db``.
+
+    Successful tool results are reused for identical calls (same tool and
+    arguments) for the lifetime of the agent, and across requests through
+    the analytics cache until the tenant's data version changes.
     """
 
     def __init__(
@@ -341,12 +424,167 @@ class AnalyticsAgent:
         fallback_model: LLMModelRegistry | None,
         db: Session,
         tenant_id: str,
+        session_factory: Callable[[], Session] | None = None,
+        tool_timeout: float = TOOL_TIMEOUT_SECONDS,
+        cache: AnalyticsSnapshotCache | None = None,
     ) -> None:
         self._client = client
         self._primary = primary_model
         self._fallback = fallback_model
         self._db = db
         self._tenant_id = tenant_id
+        self._session_factory = session_factory
+        self._tool_timeout = tool_timeout
+        self._cache = cache if cache is not None else get_analytics_cache()
+        self._data_version: str | None = None
+        self._data_version_loaded = False
+        self._tool_memo: dict[str, str] = {}
+
+    # -- tools -------------------------------------------------------------
+
+    def _run_tool_in_own_session(self, call: ToolCall) -> str:
+        db = self._session_factory()
+        try:
+            return _execute_tool(call, self._tenant_id, db)
+        finally:
+            db.close()
+
+    def _tool_entry(self, call: ToolCall) -> str:
+        # Relative periods ("last_7_days") resolve against today
+        return f"{tool_cache_entry(call.name, call.arguments)}:{date.today().isoformat()}"
+
+    def _data_version_for_cache(self) -> str | None:
+        if not self._data_version_loaded:
+            self._data_version = self._cache.data_version(self._tenant_id)
+            self._data_version_loaded = True
+        return self._data_version
+
+    def _cached_tool_result(self, call: ToolCall) -> str | None:
+        entry = self._tool_entry(call)
+        result = self._tool_memo.get(entry)
+        if result is None:
+            hit, value = self._cache.get(self._tenant_id, self._data_version_for_cache(), entry)
+            if hit:
+                result = self._tool_memo[entry] = value
+        return result
+
+    def _remember_tool_result(self, run: ToolRun) -> None:
+        # Errors and timeouts are retried on the next call, never cached
+        if run.timed_out or "error" in json.loads(run.result):
+            return
+        entry = self._tool_entry(run.call)
+        self._tool_memo[entry] = run.result
+        self._cache.set(self._tenant_id, self._data_version_for_cache(), entry, run.result)
+
+    async def _execute_tools(self, calls: list[ToolCall]) -> list[ToolRun]:
+        """Execute one model turn's tool calls; results keep call order."""
+        runs: dict[int, ToolRun] = {}
+        pending: list[tuple[int, ToolCall]] = []
+        for i, call in enumerate(calls):
+            cached = self._cached_tool_result(call)
+            if cached is not None:
+                runs[i] = ToolRun(call, cached, 0, cached=True)
+            else:
+                pending.append((i, call))
+
+        fresh = await self._run_tools([call for _, call in pending])
+        for (i, _), run in zip(pending, fresh):
+            self._remember_tool_result(run)
+            runs[i] = run
+        return [runs[i] for i in range(len(calls))]
+
+    async def _run_tools(self, calls: list[ToolCall]) -> list[ToolRun]:
+        """Run tool calls against the marts (in parallel with a session factory)."""
+        if not calls:
+            return []
+        if self._session_factory is None:
+            runs = []
+            for call in calls:
+                started = time.monotonic()
+                result = _execute_tool(call, self._tenant_id, self._db)
+                runs.append(ToolRun(call, result, int((time.monotonic() - started) * 1000)))
+            return runs
+
+        loop = asyncio.get_running_loop()
+        executor = _get_tool_executor()
+
+        async def run_one(call: ToolCall) -> ToolRun:
+            started = time.monotonic()
+            timed_out = False
+            try:
+                result = await asyncio.wait_for(
+                    loop.run_in_executor(executor, self._run_tool_in_own_session, call),
+                    timeout=self._tool_timeout,
+                )
+            except asyncio.TimeoutError:
+                # The worker thread finishes on its own; its result is dropped
+                logger.warning(
+                    "Tool execution timed out",
+                    extra={"tool": call.name, "tenant_id": self._tenant_id},
+                )
+                result = json.dumps(
+                    {"error": f"Tool timed out after {self._tool_timeout:g}s"}
+                )
+                timed_out = True
+            except Exception as exc:
+                logger.warning(
+                    "Tool execution failed",
+                    extra={"tool": call.name, "tenant_id": self._tenant_id, "error": str(exc)},
+                )
+                result = json.dumps({"error": f"Tool failed: {exc}"})
+            return ToolRun(call, result, int((time.monotonic() - started) * 1000), timed_out)
+
+        return list(await asyncio.gather(*(run_one(call) for call in calls)))
+
+    async def _run_tool_turn(
+        self,
+        iteration: int,
+        calls: list[ToolCall],
+        content: str,
+        conversation: list[ChatMessage],
+        recorder: _SpanRecorder,
+    ) -> AgentSpan:
+        """Run a turn's tool calls and append the exchange to the conversation."""
+        # OpenRouter expects the raw tool_calls list in the assistant message
+        conversation.append(ChatMessage(role="assistant", content=content or ""))
+
+        started = time.monotonic()
+        runs = await self._execute_tools(calls)
+        for run in runs:
+            conversation.append(
+                ChatMessage(
+                    role="tool",
+                    content=run.result,
+                    tool_call_id=run.call.id,
+                    name=run.call.name,
+                )
+            )
+        return recorder.record(
+            iteration, "tools", started,
+            tools=[
+                {
+                    "name": r.call.name,
+                    "duration_ms": r.duration_ms,
+                    "timed_out": r.timed_out,
+                    "cached": r.cached,
+                }
+                for r in runs
+            ],
+        )
+
+    def _log_completion(self, model: LLMModelRegistry, recorder: _SpanRecorder, streamed: bool) -> None:
+        logger.info(
+            "Analytics agent completed",
+            extra={
+                "tenant_id": self._tenant_id,
+                "model": model.model_id,
+                "streamed": streamed,
+                "latency_ms": recorder.elapsed_ms(),
+                "spans": [span.to_dict() for span in recorder.spans],
+            },
+        )
+
+    # -- blocking ----------------------------------------------------------
 
     async def run(
         self,
@@ -361,7 +599,7 @@ class AnalyticsAgent:
         requests tool calls, executes them and loops (up to MAX_ITERATIONS).
         Returns when the model produces a final text response.
         """
-        start = time.time()
+        recorder = _SpanRecorder()
         total_input = 0
         total_output = 0
         tool_calls_made = 0
@@ -372,6 +610,7 @@ class AnalyticsAgent:
         conversation = list(messages)
 
         for iteration in range(MAX_ITERATIONS + 1):
+            started = time.monotonic()
             try:
                 response = await self._client.chat_completion(
                     messages=conversation,
@@ -401,57 +640,151 @@ class AnalyticsAgent:
 
             total_input += response.input_tokens
             total_output += response.output_tokens
+            recorder.record(
+                iteration, "llm", started,
+                model=model.model_id,
+                output_tokens=response.output_tokens,
+                tool_calls=len(response.tool_calls),
+            )
 
             # No tool calls — return the text response
             if not response.tool_calls:
-                latency_ms = int((time.time() - start) * 1000)
-                cost = model.calculate_cost(total_input, total_output)
-                return AgentResult(
-                    content=response.content,
-                    model_id=model.model_id,
-                    input_tokens=total_input,
-                    output_tokens=total_output,
-                    total_tokens=total_input + total_output,
-                    latency_ms=latency_ms,
-                    cost_usd=cost,
-                    was_fallback=was_fallback,
-                    tool_calls_made=tool_calls_made,
-                    fallback_reason=fallback_reason,
-                )
+                break
 
-            # Append assistant message (with tool_calls) to conversation
-            # OpenRouter expects the raw tool_calls list in the assistant message
-            assistant_msg = ChatMessage(
-                role="assistant",
-                content=response.content or "",
+            tool_calls_made += len(response.tool_calls)
+            await self._run_tool_turn(
+                iteration, response.tool_calls, response.content, conversation, recorder,
             )
-            conversation.append(assistant_msg)
-
-            # Execute each tool and append results
-            for tc in response.tool_calls:
-                tool_calls_made += 1
-                result_str = _execute_tool(tc, self._tenant_id, self._db)
-                conversation.append(
-                    ChatMessage(
-                        role="tool",
-                        content=result_str,
-                        tool_call_id=tc.id,
-                        name=tc.name,
-                    )
-                )
 
-        # Exhausted iterations — return whatever the last response said
-        latency_ms = int((time.time() - start) * 1000)
-        cost = model.calculate_cost(total_input, total_output)
+        # Final answer, or whatever the last response said if iterations ran out
+        self._log_completion(model, recorder, streamed=False)
         return AgentResult(
             content=response.content or "",
             model_id=model.model_id,
             input_tokens=total_input,
             output_tokens=total_output,
             total_tokens=total_input + total_output,
-            latency_ms=latency_ms,
-            cost_usd=cost,
+            latency_ms=recorder.elapsed_ms(),
+            cost_usd=model.calculate_cost(total_input, total_output),
             was_fallback=was_fallback,
             tool_calls_made=tool_calls_made,
             fallback_reason=fallback_reason,
+            spans=recorder.spans,
         )
+
+    # -- streaming ---------------------------------------------------------
+
+    async def _stream_turn(
+        self,
+        model: LLMModelRegistry,
+        conversation: list[ChatMessage],
+        completion: StreamedCompletion,
+        tools: list[ToolDefinition] | None,
+        max_tokens: int | None,
+        temperature: float,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream one LLM call into ``completion``, yielding delta events."""
+        async for chunk in self._client.stream_chat_completion(
+            messages=conversation,
+            model=model.model_id,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            tools=tools,
+        ):
+            completion.add(chunk)
+            if chunk.content:
+                yield {"type": "delta", "content": chunk.content}
+
+    async def run_stream(
+        self,
+        messages: list[ChatMessage],
+        max_tokens: int | None = None,
+        temperature: float = 0.7,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Run the agent loop, yielding events as they happen.
+
+        Events (dicts with a "type" key):
+          - delta:      {"content"} — answer text as the model produces it
+          - tool_calls: {"tools"}   — names of the tools about to run
+          - span:       AgentSpan fields — timing of each llm/tools phase
+          - done:       {"model_id", token counts, "latency_ms", "cost_usd",
+                         "tool_calls_made", "was_fallback", "fallback_reason"}
+
+        The fallback model is only tried when the primary fails before
+        producing any text; text already sent cannot be retracted.
+        """
+        recorder = _SpanRecorder()
+        total_input = 0
+        total_output = 0
+        tool_calls_made = 0
+        model = self._primary
+        was_fallback = False
+        fallback_reason = None
+
+        conversation = list(messages)
+
+        for iteration in range(MAX_ITERATIONS + 1):
+            tools = TOOLS if iteration < MAX_ITERATIONS else None
+            started = time.monotonic()
+            completion = StreamedCompletion()
+            first_token_ms = None
+            try:
+                async for event in self._stream_turn(
+                    model, conversation, completion, tools, max_tokens, temperature,
+                ):
+                    if first_token_ms is None:
+                        first_token_ms = recorder.elapsed_ms(started)
+                    yield event
+            except Exception as exc:
+                if was_fallback or not self._fallback or completion.content:
+                    raise
+                logger.warning(
+                    "Analytics agent primary model failed, trying fallback",
+                    extra={"error": str(exc), "tenant_id": self._tenant_id},
+                )
+                model = self._fallback
+                was_fallback = True
+                fallback_reason = type(exc).__name__
+                completion = StreamedCompletion()
+                async for event in self._stream_turn(
+                    model, conversation, completion, tools, max_tokens, temperature,
+                ):
+                    if first_token_ms is None:
+                        first_token_ms = recorder.elapsed_ms(started)
+                    yield event
+
+            total_input += completion.input_tokens
+            total_output += completion.output_tokens
+            span = recorder.record(
+                iteration, "llm", started,
+                model=model.model_id,
+                first_token_ms=first_token_ms,
+                output_tokens=completion.output_tokens,
+                tool_calls=len(completion.tool_calls),
+            )
+            yield {"type": "span", **span.to_dict()}
+
+            if not completion.tool_calls:
+                break
+
+            tool_calls_made += len(completion.tool_calls)
+            yield {"type": "tool_calls", "tools": [c.name for c in completion.tool_calls]}
+            span = await self._run_tool_turn(
+                iteration, completion.tool_calls, completion.content, conversation, recorder,
+            )
+            yield {"type": "span", **span.to_dict()}
+
+        self._log_completion(model, recorder, streamed=True)
+        yield {
+            "type": "done",
+            "model_id": model.model_id,
+            "input_tokens": total_input,
+            "output_tokens": total_output,
+            "total_tokens": total_input + total_output,
+            "latency_ms": recorder.elapsed_ms(),
+            "cost_usd": str(model.calculate_cost(total_input, total_output)),
+            "tool_calls_made": tool_calls_made,
+            "was_fallback": was_fallback,
+            "fallback_reason": fallback_reason,
+        }
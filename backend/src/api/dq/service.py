@@ -599,6 +599,9 @@ class DQService:
         severity_label = loader.resolve_severity_label(anomaly_score)
         severity = DQSeverity.HIGH if severity_label == "high" else DQSeverity.WARNING
 
+        # numpy-backed kernels load on first use, not at app startup
+        from src.diagnostics import stats_kernels
+
         metadata = {
             "anomaly_score": round(anomaly_score, 3),
             "severity_label": severity_label,
@@ -607,7 +610,11 @@ class DQService:
             "billing_tier": billing_tier,
             "lookback_days": len(daily_counts),
             "rolling_avg": round(avg_count, 2),
+            "median_count": round(stats_kernels.median(daily_counts), 2),
         }
+        robust_z = stats_kernels.robust_zscore(today_count, daily_counts)
+        if math.isfinite(robust_z):
+            metadata["robust_z"] = round(robust_z, 3)
 
         if is_anomaly:
             direction = "dropped" if pct_change > 0 else "spiked"
@@ -821,29 +828,9 @@ class DQService:
         Returns:
             JSD value in [0, 1]. 0 = identical, 1 = maximally different.
         """
-        all_keys = set(p) | set(q)
-        if not all_keys:
-            return 0.0
-
-        # Build aligned vectors with smoothing for missing categories
-        epsilon = 1e-10
-        p_vec = [p.get(k, 0.0) + epsilon for k in all_keys]
-        q_vec = [q.get(k, 0.0) + epsilon for k in all_keys]
-
-        # Normalize
-        p_sum = sum(p_vec)
-        q_sum = sum(q_vec)
-        p_vec = [x / p_sum for x in p_vec]
-        q_vec = [x / q_sum for x in q_vec]
-
-        # M = (P + Q) / 2
-        m_vec = [(pi + qi) / 2 for pi, qi in zip(p_vec, q_vec)]
+        from src.diagnostics import stats_kernels
 
-        # JSD = (KL(P||M) + KL(Q||M)) / 2
-        def _kl(a, b):
-            return sum(ai * math.log2(ai / bi) for ai, bi in zip(a, b))
-
-        return (_kl(p_vec, m_vec) + _kl(q_vec, m_vec)) / 2
+        return stats_kernels.distribution_divergence(p, q)
 
     def check_distribution_drift(
         self,
@@ -906,15 +893,9 @@ class DQService:
         is_anomaly = jsd >= threshold
 
         # Compute top movers (top 3 categories by absolute proportion change)
-        all_keys = set(baseline_dist) | set(current_dist)
-        changes = [
-            (k, current_dist.get(k, 0.0) - baseline_dist.get(k, 0.0))
-            for k in all_keys
-        ]
-        changes.sort(key=lambda x: abs(x[1]), reverse=True)
-        top_movers = [
-            {"category": k, "change": round(v, 4)} for k, v in changes[:3]
-        ]
+        from src.diagnostics import stats_kernels
+
+        top_movers = stats_kernels.top_movers(current_dist, baseline_dist, top_n=3)
 
         severity_label = loader.resolve_severity_label(anomaly_score)
         severity = DQSeverity.HIGH if severity_label == "high" else DQSeverity.WARNING
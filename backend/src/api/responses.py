@@ -0,0 +1,83 @@
+"""
+Fast-path JSON responses for high-volume read routes.
+
+The default FastAPI path for a route with ``response_model`` builds one
+Pydantic model per row, validates the whole response again, converts it
+with ``jsonable_encoder`` and finally runs ``json.dumps``. For list routes
+over trusted warehouse/ORM rows that is most of the CPU per request.
+
+Routes opting in build plain dicts from their rows and return
+``FastJSONResponse(content)``. FastAPI skips response-model validation and
+serialization for a returned Response, so the dicts go straight to the
+encoder. ``response_model`` stays on the decorator for the OpenAPI schema.
+
+Encoding uses orjson when installed and falls back to the stdlib ``json``
+module. Both produce the same output as the Pydantic path for the types the
+routes return: Decimal as a float, date/datetime as ISO 8601 with UTC as
+``Z``, and enums as their value.
+"""
+
+import json
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _isoformat(value) -> str:
+    """ISO 8601 as Pydantic writes it: UTC offsets become ``Z``."""
+    text = value.isoformat()
+    if text.endswith("+00:00"):
+        return text[:-6] + "Z"
+    return text
+
+
+def _default(obj: Any) -> Any:
+    """Encode the non-JSON types trusted DB rows carry."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (datetime, date, time)):
+        return _isoformat(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, timedelta):
+        return obj.total_seconds()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(
+        content,
+        default=_default,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with :func:`dumps` (orjson when available)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -1,14 +1,17 @@
 # API routes
-from src.api.routes import health
-from src.api.routes import billing
-from src.api.routes import webhooks_shopify
-from src.api.routes import admin_plans
-from src.api.routes import shopify_ingestion
-from src.api.routes import sources
-from src.api.routes import data_export
-from src.api.routes import warehouse_export
+#
+# Route modules are imported on first access (``from src.api.routes import x``
+# or ``src.api.routes.x``), not with the package, so routers main.py
+# registers lazily stay unloaded until their first request.
+import importlib
 
 __all__ = [
     "health", "billing", "webhooks_shopify", "admin_plans",
     "shopify_ingestion", "sources", "data_export", "warehouse_export",
 ]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,10 @@
 """
 AI Chat API route for conversational analytics assistant.
 
-Provides a POST endpoint that accepts a user question and returns
-an LLM-generated response using the tenant's configured model.
+Provides POST endpoints that accept a user question and return an
+LLM-generated response using the tenant's configured model, either as a
+single JSON body (/chat) or as server-sent events with tokens as they are
+generated (/chat/stream).
 
 SECURITY:
 - Requires valid tenant context from JWT
@@ -11,9 +13,11 @@ SECURITY:
 - Rate limited: 10 requests/minute per user (LLM calls are expensive)
 """
 
+import json
 import logging
 
 from fastapi import APIRouter, Request, HTTPException, status, Depends
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from src.platform.tenant_context import get_tenant_context
@@ -27,6 +31,7 @@ from src.services.analytics_context_service import (
     build_analytics_system_prompt,
 )
 from src.agents.analytics_agent import AnalyticsAgent
+from src.database.session import get_session_factory
 
 logger = logging.getLogger(__name__)
 
@@ -52,32 +57,28 @@ class AIChatResponse(BaseModel):
 
 
 # =============================================================================
-# Route
+# Helpers
 # =============================================================================
 
+SERVICE_UNAVAILABLE_DETAIL = "AI service is temporarily unavailable. Please try again."
 
-@router.post("/chat", response_model=AIChatResponse)
-async def ai_chat(
-    request: Request,
-    body: AIChatRequest,
-    db_session=Depends(check_llm_routing_entitlement),
-    _rate_limit=Depends(rate_limit_dependency("ai_chat", limit=10, window=60)),
-):
-    """
-    Send a question to the AI analytics assistant.
 
-    Requires LLM_ROUTING entitlement (Growth+ plan).
+def _build_agent(
+    tenant_id: str,
+    question: str,
+    db_session,
+) -> tuple[AnalyticsAgent, list[ChatMessage]]:
+    """
+    Resolve the tenant's models and build the agent and its messages.
 
     Fetches a 30-day analytics snapshot from the mart layer and injects it
     into the system prompt so the LLM can answer questions about real data.
     Falls back to a generic prompt when no mart data is available yet.
     """
-    tenant_ctx = get_tenant_context(request)
-
-    context = get_analytics_snapshot(tenant_ctx.tenant_id, db_session)
+    context = get_analytics_snapshot(tenant_id, db_session)
     system_prompt = build_analytics_system_prompt(context)
 
-    service = LLMRoutingService(db_session, tenant_ctx.tenant_id)
+    service = LLMRoutingService(db_session, tenant_id)
 
     try:
         primary_model = service.get_primary_model()
@@ -85,16 +86,16 @@ async def ai_chat(
     except LLMRoutingError as exc:
         logger.error(
             "AI chat model resolution failed",
-            extra={"tenant_id": tenant_ctx.tenant_id, "error": str(exc)},
+            extra={"tenant_id": tenant_id, "error": str(exc)},
         )
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="AI service is temporarily unavailable. Please try again.",
+            detail=SERVICE_UNAVAILABLE_DETAIL,
         )
 
     messages = [
         ChatMessage(role="system", content=system_prompt),
-        ChatMessage(role="user", content=body.question),
+        ChatMessage(role="user", content=question),
     ]
 
     agent = AnalyticsAgent(
@@ -102,8 +103,35 @@ async def ai_chat(
         primary_model=primary_model,
         fallback_model=fallback_model,
         db=db_session,
-        tenant_id=tenant_ctx.tenant_id,
+        tenant_id=tenant_id,
+        session_factory=get_session_factory(),
     )
+    return agent, messages
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+# =============================================================================
+# Routes
+# =============================================================================
+
+
+@router.post("/chat", response_model=AIChatResponse)
+async def ai_chat(
+    request: Request,
+    body: AIChatRequest,
+    db_session=Depends(check_llm_routing_entitlement),
+    _rate_limit=Depends(rate_limit_dependency("ai_chat", limit=10, window=60)),
+):
+    """
+    Send a question to the AI analytics assistant.
+
+    Requires LLM_ROUTING entitlement (Growth+ plan).
+    """
+    tenant_ctx = get_tenant_context(request)
+    agent, messages = _build_agent(tenant_ctx.tenant_id, body.question, db_session)
 
     try:
         result = await agent.run(messages=messages)
@@ -114,10 +142,49 @@ async def ai_chat(
         )
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="AI service is temporarily unavailable. Please try again.",
+            detail=SERVICE_UNAVAILABLE_DETAIL,
         )
 
     return AIChatResponse(
         message=result.content,
         model_id=result.model_id,
     )
+
+
+@router.post("/chat/stream")
+async def ai_chat_stream(
+    request: Request,
+    body: AIChatRequest,
+    db_session=Depends(check_llm_routing_entitlement),
+    _rate_limit=Depends(rate_limit_dependency("ai_chat", limit=10, window=60)),
+):
+    """
+    Send a question to the AI analytics assistant and stream the answer.
+
+    Same contract as /chat, returned as text/event-stream. Each event is
+    "event: <type>" plus a JSON "data:" line:
+      - delta:      {"content"} answer text as it is generated
+      - tool_calls: {"tools"} analytics tools being queried
+      - span:       per-phase timings (llm / tools)
+      - done:       model, token usage, latency and cost
+      - error:      {"detail"} the run failed; no further events follow
+    """
+    tenant_ctx = get_tenant_context(request)
+    agent, messages = _build_agent(tenant_ctx.tenant_id, body.question, db_session)
+
+    async def events():
+        try:
+            async for event in agent.run_stream(messages=messages):
+                yield _sse(event.pop("type"), event)
+        except Exception as exc:
+            logger.error(
+                "AI chat agent stream failed",
+                extra={"tenant_id": tenant_ctx.tenant_id, "error": str(exc)},
+            )
+            yield _sse("error", {"detail": SERVICE_UNAVAILABLE_DETAIL})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
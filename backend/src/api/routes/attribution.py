@@ -6,7 +6,8 @@ Provides:
   GET /api/attribution/orders   — paginated attributed orders with UTM fields
 
 No entitlement gate — available on all plans.
-Queries: attribution.last_click + marts.mart_marketing_metrics
+Queries: attribution.last_click (campaigns, orders) + marts.rollup_daily_channel
+(attribution counts, channel ROAS computed from summed revenue and spend)
 Tenant isolation: WHERE tenant_id = :tenant_id on every query.
 """
 
@@ -18,8 +19,15 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from pydantic import BaseModel
 from sqlalchemy import text
 
+from src.api.responses import FastJSONResponse
 from src.platform.tenant_context import get_tenant_context
 from src.middleware.rate_limit import rate_limit_dependency
+from src.services.metric_rollups import (
+    ChannelTotals,
+    DateRange,
+    channel_totals_by_platform,
+    period_bounds,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/attribution", tags=["attribution"])
@@ -46,8 +54,8 @@ TIMEFRAME_TO_PERIOD: dict[str, str] = {
 def _get_db(request: Request):
     """DB dependency — validates JWT/tenant then yields a session."""
     get_tenant_context(request)  # raises 401/403 if invalid
-    from src.database.session import SessionLocal
-    db = SessionLocal()
+    from src.database.session import get_read_session_factory
+    db = get_read_session_factory()()
     try:
         yield db
     finally:
@@ -103,12 +111,29 @@ class AttributedOrdersResponse(BaseModel):
     has_more: bool
 
 
+def _attributed_order_row(r) -> dict:
+    """Map a last_click row to the AttributedOrder shape without per-row validation."""
+    return {
+        "order_id": str(r.order_id),
+        "order_name": r.order_name,
+        "order_number": str(r.order_number) if r.order_number is not None else None,
+        "revenue": float(r.revenue),
+        "currency": r.currency,
+        "created_at": r.created_at.isoformat() if r.created_at else "",
+        "utm_source": r.utm_source,
+        "utm_medium": r.utm_medium,
+        "utm_campaign": r.utm_campaign,
+        "platform": r.platform,
+        "attribution_status": r.attribution_status or "unattributed_no_utm",
+    }
+
+
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
 
 @router.get("/summary", response_model=AttributionSummaryResponse)
-async def get_attribution_summary(
+def get_attribution_summary(
     request: Request,
     timeframe: str = Query("30days", description="7days|30days|90days|thisMonth|thisQuarter"),
     db=Depends(_get_db),
@@ -125,26 +150,16 @@ async def get_attribution_summary(
 
     try:
         # Attribution counts + attributed revenue
-        counts = db.execute(text("""
-            SELECT
-                COUNT(*) FILTER (WHERE attribution_status = 'attributed')
-                    AS attributed,
-                COUNT(*) FILTER (WHERE attribution_status <> 'attributed')
-                    AS unattributed,
-                COALESCE(
-                    SUM(revenue) FILTER (WHERE attribution_status = 'attributed'),
-                    0
-                ) AS attributed_revenue
-            FROM attribution.last_click
-            WHERE tenant_id = :tenant_id
-              AND order_created_at >= :start_date
-        """), {"tenant_id": tenant_ctx.tenant_id, "start_date": start_date}).fetchone()
+        window_totals = ChannelTotals()
+        for platform_totals in channel_totals_by_platform(
+            db, tenant_ctx.tenant_id, DateRange(start_date, date.today()),
+        ).values():
+            window_totals.add(platform_totals)
 
-        attributed = int(counts.attributed) if counts else 0
-        unattributed = int(counts.unattributed) if counts else 0
-        total_orders = attributed + unattributed
-        attribution_rate = round(attributed / total_orders * 100, 1) if total_orders > 0 else 0.0
-        attributed_revenue = float(counts.attributed_revenue) if counts else 0.0
+        attributed = window_totals.attributed_orders
+        unattributed = window_totals.unattributed_orders
+        attribution_rate = round(window_totals.attribution_rate, 1)
+        attributed_revenue = window_totals.attributed_revenue
 
         # Top campaigns by attributed revenue
         campaign_rows = db.execute(text("""
@@ -175,36 +190,23 @@ async def get_attribution_summary(
             for r in campaign_rows
         ]
 
-        # Channel ROAS from mart (pre-aggregated with prior period)
-        roas_rows = db.execute(text("""
-            SELECT
-                COALESCE(platform, 'organic') AS platform,
-                COALESCE(AVG(gross_roas), 0)   AS gross_roas,
-                COALESCE(SUM(gross_revenue), 0) AS revenue,
-                COALESCE(SUM(spend), 0)         AS spend
-            FROM marts.mart_marketing_metrics
-            WHERE tenant_id = :tenant_id
-              AND period_type = :period_type
-              AND period_end = (
-                  SELECT MAX(period_end)
-                  FROM marts.mart_marketing_metrics
-                  WHERE tenant_id = :tenant_id
-                    AND period_type = :period_type
-                    AND period_end <= current_date::date
-              )
-            GROUP BY platform
-            ORDER BY gross_roas DESC
-        """), {"tenant_id": tenant_ctx.tenant_id, "period_type": period_type}).fetchall()
-
-        channel_roas = [
-            ChannelRoas(
-                platform=r.platform,
-                gross_roas=float(r.gross_roas),
-                revenue=float(r.revenue),
-                spend=float(r.spend),
-            )
-            for r in roas_rows
-        ]
+        # Channel ROAS: summed revenue / summed spend over the period
+        period, _ = period_bounds(period_type)
+        by_platform = channel_totals_by_platform(db, tenant_ctx.tenant_id, period)
+        channel_roas = sorted(
+            (
+                ChannelRoas(
+                    platform=platform,
+                    gross_roas=round(totals.gross_roas, 2),
+                    revenue=totals.gross_revenue,
+                    spend=totals.spend,
+                )
+                for platform, totals in by_platform.items()
+                if totals.spend > 0 or totals.gross_revenue > 0
+            ),
+            key=lambda c: c.gross_roas,
+            reverse=True,
+        )
 
         return AttributionSummaryResponse(
             attributed_orders=attributed,
@@ -223,8 +225,8 @@ async def get_attribution_summary(
         )
 
 
-@router.get("/orders", response_model=AttributedOrdersResponse)
-async def get_attributed_orders(
+@router.get("/orders", response_model=AttributedOrdersResponse, response_class=FastJSONResponse)
+def get_attributed_orders(
     request: Request,
     timeframe: str = Query("30days"),
     platform: Optional[str] = Query(None, description="Filter by ad platform, e.g. meta_ads"),
@@ -280,28 +282,11 @@ async def get_attributed_orders(
 
         total = int(total_row.total) if total_row else 0
 
-        orders = [
-            AttributedOrder(
-                order_id=str(r.order_id),
-                order_name=r.order_name,
-                order_number=str(r.order_number) if r.order_number is not None else None,
-                revenue=float(r.revenue),
-                currency=r.currency,
-                created_at=r.created_at.isoformat() if r.created_at else "",
-                utm_source=r.utm_source,
-                utm_medium=r.utm_medium,
-                utm_campaign=r.utm_campaign,
-                platform=r.platform,
-                attribution_status=r.attribution_status or "unattributed_no_utm",
-            )
-            for r in rows
-        ]
-
-        return AttributedOrdersResponse(
-            orders=orders,
-            total=total,
-            has_more=(offset + limit) < total,
-        )
+        return FastJSONResponse({
+            "orders": [_attributed_order_row(r) for r in rows],
+            "total": total,
+            "has_more": (offset + limit) < total,
+        })
 
     except Exception as exc:
         logger.warning("Attribution orders query failed: %s", exc)
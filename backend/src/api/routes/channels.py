@@ -13,21 +13,27 @@ SECURITY:
 - All queries are scoped to tenant_id from the JWT context.
 
 Queries:
-  1. mart_marketing_metrics   — revenue, spend, gross_roas
-  2. analytics.marketing_spend — clicks, impressions, ctr, conversions
-  3. mart_marketing_metrics daily — daily revenue trend
+  marts.rollup_daily_channel — one pass over the daily rows for the
+  platform; period totals and the daily trend are both summed from it and
+  ratios (ROAS, CTR, conversion rate) are computed from the sums.
 """
 
 import logging
+from datetime import date, timedelta
 from typing import List
 
 from fastapi import APIRouter, Request, HTTPException, Query, Depends
 from pydantic import BaseModel, Field
-from sqlalchemy import text
 
 from src.platform.tenant_context import get_tenant_context
-from src.database.session import get_session_factory
+from src.database.session import get_read_session_factory
 from src.middleware.rate_limit import rate_limit_dependency
+from src.services.metric_rollups import (
+    ChannelTotals,
+    DateRange,
+    channel_daily,
+    period_bounds,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +43,8 @@ router = APIRouter(prefix="/api/channels", tags=["channels"])
 # Timeframe → period_type mapping (mirrors datasets.py)
 # ---------------------------------------------------------------------------
 
+TREND_DAYS = 90
+
 TIMEFRAME_TO_PERIOD: dict[str, str] = {
     "7days":       "last_7_days",
     "thisWeek":    "weekly",
@@ -98,7 +106,7 @@ class ChannelMetricsResponse(BaseModel):
 def _get_db_for_channels(request: Request):
     """Open a DB session after validating tenant context."""
     get_tenant_context(request)  # raises 401/403 if invalid
-    db = get_session_factory()()
+    db = get_read_session_factory()()
     try:
         yield db
     finally:
@@ -114,7 +122,7 @@ def _get_db_for_channels(request: Request):
     "/{platform}/metrics",
     response_model=ChannelMetricsResponse,
 )
-async def get_channel_metrics(
+def get_channel_metrics(
     platform: str,
     request: Request,
     timeframe: str = Query("30days", description="7days|thisWeek|30days|thisMonth|90days|thisQuarter"),
@@ -125,119 +133,47 @@ async def get_channel_metrics(
     Aggregated metrics for a single ad platform.
 
     Available on all plans — no CUSTOM_REPORTS entitlement required.
-    Queries mart_marketing_metrics (revenue/spend/ROAS) and
-    analytics.fct_marketing_spend (clicks/impressions/CTR).
+    Sums marts.rollup_daily_channel over the period for the totals and over
+    the trailing 90 days for the trend.
     """
     tenant_ctx = get_tenant_context(request)
     period_type = TIMEFRAME_TO_PERIOD.get(timeframe, "last_30_days")
     display_name = CHANNEL_DISPLAY_NAMES.get(platform, platform.replace("_", " ").title())
 
+    today = date.today()
+    period, _ = period_bounds(period_type, today)
+    trend_window = DateRange(today - timedelta(days=TREND_DAYS - 1), today)
+
     try:
-        # ── Aggregated marketing metrics for this platform ─────────────────
-        mkt = db_session.execute(text("""
-            SELECT
-                COALESCE(SUM(gross_revenue), 0)  AS revenue,
-                COALESCE(SUM(spend), 0)          AS spend,
-                COALESCE(SUM(orders), 0)         AS orders
-            FROM marts.mart_marketing_metrics
-            WHERE tenant_id   = :tenant_id
-              AND period_type = :period_type
-              AND (
-                platform = :platform
-                OR (:platform = 'organic' AND platform IS NULL)
-              )
-              AND period_end = (
-                  SELECT MAX(period_end)
-                  FROM marts.mart_marketing_metrics
-                  WHERE tenant_id   = :tenant_id
-                    AND period_type = :period_type
-                    AND period_end  <= current_date::date
-              )
-        """), {
-            "tenant_id":   tenant_ctx.tenant_id,
-            "period_type": period_type,
-            "platform":    platform,
-        }).fetchone()
-
-        # ── Click-level metrics from canonical fact table ──────────────────
-        # analytics.marketing_spend has daily rows; sum over the matching date range.
-        days_map = {
-            "last_7_days":   7,
-            "this_week":     7,
-            "last_30_days":  30,
-            "this_month":    30,
-            "last_90_days":  90,
-            "this_quarter":  90,
-        }
-        lookback_days = days_map.get(period_type, 30)
-
-        clicks_row = db_session.execute(text("""
-            SELECT
-                COALESCE(SUM(clicks), 0)       AS clicks,
-                COALESCE(SUM(impressions), 0)  AS impressions,
-                COALESCE(SUM(conversions), 0)  AS conversions
-            FROM analytics.marketing_spend
-            WHERE tenant_id       = :tenant_id
-              AND (source_platform = :platform OR (:platform = 'organic' AND source_platform IS NULL))
-              AND date >= current_date - (:lookback_days * INTERVAL '1 day')
-              AND date <= current_date
-        """), {
-            "tenant_id":     tenant_ctx.tenant_id,
-            "platform":      platform,
-            "lookback_days": lookback_days,
-        }).fetchone()
-
-        # ── Daily revenue trend (trailing 90 days, daily granularity) ──────
-        trend_rows = db_session.execute(text("""
-            SELECT
-                period_start::date              AS day,
-                COALESCE(SUM(gross_revenue), 0) AS revenue
-            FROM marts.mart_marketing_metrics
-            WHERE tenant_id   = :tenant_id
-              AND period_type = 'daily'
-              AND (
-                platform = :platform
-                OR (:platform = 'organic' AND platform IS NULL)
-              )
-              AND period_start >= current_date - INTERVAL '89 days'
-              AND period_start <= current_date
-            GROUP BY period_start::date
-            ORDER BY day ASC
-        """), {
-            "tenant_id": tenant_ctx.tenant_id,
-            "platform":  platform,
-        }).fetchall()
-
-        # ── Build response ─────────────────────────────────────────────────
-        revenue  = float(mkt.revenue)  if mkt else 0.0
-        spend    = float(mkt.spend)    if mkt else 0.0
-        roas     = revenue / spend if spend > 0 else 0.0
-        orders   = int(mkt.orders)     if mkt else 0
-
-        clicks      = int(clicks_row.clicks)         if clicks_row else 0
-        impressions = int(clicks_row.impressions)    if clicks_row else 0
-        ctr = clicks / impressions if impressions > 0 else 0.0
-        conversions = int(clicks_row.conversions)    if clicks_row else 0
-
-        ctr       = clicks / impressions if impressions > 0 else 0.0
-        conv_rate = conversions / clicks if clicks > 0 else 0.0
+        daily = channel_daily(
+            db_session,
+            tenant_ctx.tenant_id,
+            DateRange(min(period.start, trend_window.start), today),
+            platform=platform,
+        )
+
+        totals = ChannelTotals()
+        for day, day_totals in daily:
+            if day in period:
+                totals.add(day_totals)
 
         trend = [
-            ChannelTrendPoint(date=str(r.day), revenue=float(r.revenue))
-            for r in trend_rows
+            ChannelTrendPoint(date=str(day), revenue=day_totals.gross_revenue)
+            for day, day_totals in daily
+            if day in trend_window
         ]
 
         return ChannelMetricsResponse(
             platform=platform,
             display_name=display_name,
-            revenue=revenue,
-            spend=spend,
-            roas=roas,
-            orders=orders,
-            clicks=clicks,
-            impressions=impressions,
-            ctr=ctr,
-            conversion_rate=conv_rate,
+            revenue=totals.gross_revenue,
+            spend=totals.spend,
+            roas=totals.gross_roas,
+            orders=totals.orders,
+            clicks=totals.clicks,
+            impressions=totals.impressions,
+            ctr=totals.ctr,
+            conversion_rate=totals.conversion_rate,
             daily_trend=trend,
         )
 
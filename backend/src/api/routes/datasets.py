@@ -21,13 +21,15 @@ from fastapi import APIRouter, Request, HTTPException, status, Depends, Query
 from pydantic import BaseModel, Field
 from sqlalchemy import text
 
+from src.api.responses import FastJSONResponse
 from src.platform.tenant_context import get_tenant_context
 from src.api.dependencies.entitlements import check_custom_reports_entitlement
 from src.middleware.rate_limit import rate_limit_dependency
+from src.services.analytics_snapshot_cache import get_analytics_cache
 from src.services.dataset_discovery_service import (
-    DatasetDiscoveryService,
     ColumnMetadata,
     DatasetInfo,
+    get_discovery_service,
 )
 from src.services.chart_query_service import (
     ChartConfig,
@@ -135,18 +137,9 @@ class ChartPreviewResponse(BaseModel):
 # Helpers
 # =============================================================================
 
-_discovery_service: Optional[DatasetDiscoveryService] = None
 _chart_query_service: Optional[ChartQueryService] = None
 
 
-def _get_discovery_service() -> DatasetDiscoveryService:
-    """Lazy singleton for the discovery service."""
-    global _discovery_service
-    if _discovery_service is None:
-        _discovery_service = DatasetDiscoveryService()
-    return _discovery_service
-
-
 def _get_chart_query_service() -> ChartQueryService:
     """Lazy singleton for the chart query service."""
     global _chart_query_service
@@ -193,11 +186,12 @@ async def list_datasets(
     """
     List available datasets with column metadata.
 
-    Returns all datasets discoverable from Superset, with column-level
-    type information (is_metric, is_dimension, is_temporal) for the
-    chart builder to filter options per chart type.
+    Returns all datasets in the dataset catalog (synced from dbt to
+    Superset), with column-level type information (is_metric,
+    is_dimension, is_temporal) for the chart builder to filter options
+    per chart type.
 
-    If Superset is unavailable, returns cached data with stale=True.
+    If the catalog is unavailable, returns cached data with stale=True.
 
     SECURITY: Requires valid tenant context and CUSTOM_REPORTS entitlement.
     """
@@ -207,8 +201,8 @@ async def list_datasets(
         extra={"tenant_id": tenant_ctx.tenant_id},
     )
 
-    service = _get_discovery_service()
-    result = service.discover_datasets()
+    service = get_discovery_service()
+    result = service.discover_datasets(db_session)
 
     return DatasetListResponse(
         datasets=[_dataset_to_response(ds) for ds in result.datasets],
@@ -243,8 +237,8 @@ async def get_dataset_columns(
         extra={"tenant_id": tenant_ctx.tenant_id, "dataset_id": dataset_id},
     )
 
-    service = _get_discovery_service()
-    columns = service.get_dataset_columns(dataset_id)
+    service = get_discovery_service()
+    columns = service.get_dataset_columns(db_session, dataset_id)
 
     if not columns:
         raise HTTPException(
@@ -283,8 +277,8 @@ async def validate_config(
         },
     )
 
-    service = _get_discovery_service()
-    result = service.discover_datasets()
+    service = get_discovery_service()
+    result = service.discover_datasets(db_session)
 
     # Find the dataset
     target_ds = None
@@ -439,9 +433,9 @@ class KpiSummaryResponse(BaseModel):
 def _get_db_for_kpi(request: Request):
     """DB dependency without entitlement check — KPI endpoints are available on all plans."""
     from src.platform.tenant_context import get_tenant_context as _ctx
-    from src.database.session import get_session_factory
+    from src.database.session import get_read_session_factory
     _ctx(request)  # validates JWT + tenant
-    db = get_session_factory()()
+    db = get_read_session_factory()()
     try:
         yield db
     finally:
@@ -451,8 +445,9 @@ def _get_db_for_kpi(request: Request):
 @router.get(
     "/kpi-summary",
     response_model=KpiSummaryResponse,
+    response_class=FastJSONResponse,
 )
-async def get_kpi_summary(
+def get_kpi_summary(
     request: Request,
     timeframe: str = Query("30days", description="Timeframe: 7days, 30days, 90days, thisMonth, thisQuarter"),
     db_session=Depends(_get_db_for_kpi),
@@ -462,113 +457,76 @@ async def get_kpi_summary(
     Aggregated KPI metrics for the Overview dashboard.
 
     No custom_reports entitlement required — available on all plans.
-    Queries mart_marketing_metrics and mart_revenue_metrics directly.
+    A single point lookup on marts.mart_kpi_summary (pre-computed per tenant
+    and period type by dbt), cached in Redis until the next successful dbt
+    run bumps the analytics data version (src.workers.dbt_runner).
     """
     tenant_ctx = get_tenant_context(request)
     period_type = TIMEFRAME_TO_PERIOD.get(timeframe, "last_30_days")
 
+    cache = get_analytics_cache()
+    version = cache.data_version(tenant_ctx.tenant_id)
+    entry = f"kpi_summary:{period_type}"
+    hit, cached = cache.get(tenant_ctx.tenant_id, version, entry)
+    if hit:
+        return FastJSONResponse(cached)
+
     try:
-        # Marketing metrics (spend, ROAS, conversions) — from mart_marketing_metrics.
-        # Columns: spend, orders, gross_roas, prior_spend, prior_orders, prior_gross_roas.
-        # period_end subquery selects the most-recent materialized window (rolling windows
-        # refresh daily; calendar periods refresh at period boundaries).
-        mkt_row = db_session.execute(text("""
+        row = db_session.execute(text("""
             SELECT
-                COALESCE(SUM(spend), 0)           AS total_spend,
-                COALESCE(SUM(orders), 0)           AS total_conversions,
-                COALESCE(AVG(gross_roas), 0)       AS avg_roas,
-                COALESCE(SUM(prior_spend), 0)      AS prior_spend,
-                COALESCE(SUM(prior_orders), 0)     AS prior_conversions,
-                COALESCE(AVG(prior_gross_roas), 0) AS prior_roas
-            FROM marts.mart_marketing_metrics
+                total_revenue,
+                revenue_change_pct,
+                total_spend,
+                spend_change_pct,
+                average_roas,
+                roas_change_pct,
+                total_conversions,
+                conversions_change_pct,
+                revenue_by_channel,
+                active_channels
+            FROM marts.mart_kpi_summary
             WHERE tenant_id = :tenant_id
               AND period_type = :period_type
-              AND period_end = (
-                  SELECT MAX(period_end)
-                  FROM marts.mart_marketing_metrics
-                  WHERE tenant_id = :tenant_id
-                    AND period_type = :period_type
-                    AND period_end <= current_date::date
-              )
         """), {"tenant_id": tenant_ctx.tenant_id, "period_type": period_type}).fetchone()
-
-        # Revenue metrics — gross_revenue and prior_gross_revenue from mart_revenue_metrics.
-        # Wrapped in its own try/except: if the table hasn't been materialized in this
-        # environment yet, degrade gracefully to 0 rather than 503-ing the whole endpoint.
-        try:
-            rev_row = db_session.execute(text("""
-                SELECT
-                    COALESCE(SUM(gross_revenue), 0)       AS total_revenue,
-                    COALESCE(SUM(prior_gross_revenue), 0) AS prior_revenue
-                FROM marts.mart_revenue_metrics
-                WHERE tenant_id = :tenant_id
-                  AND period_type = :period_type
-                  AND period_end = (
-                      SELECT MAX(period_end)
-                      FROM marts.mart_revenue_metrics
-                      WHERE tenant_id = :tenant_id
-                        AND period_type = :period_type
-                        AND period_end <= current_date::date
-                  )
-            """), {"tenant_id": tenant_ctx.tenant_id, "period_type": period_type}).fetchone()
-        except Exception as rev_exc:
-            logger.warning("mart_revenue_metrics query failed (table may not be materialized): %s", rev_exc)
-            db_session.rollback()
-            rev_row = None
-
-        # Per-channel revenue + spend for grouped bar chart.
-        channel_rows = db_session.execute(text("""
-            SELECT
-                COALESCE(platform, 'organic') AS channel,
-                COALESCE(SUM(gross_revenue), 0) AS revenue,
-                COALESCE(SUM(spend), 0)          AS spend
-            FROM marts.mart_marketing_metrics
-            WHERE tenant_id = :tenant_id
-              AND period_type = :period_type
-              AND period_end = (
-                  SELECT MAX(period_end)
-                  FROM marts.mart_marketing_metrics
-                  WHERE tenant_id = :tenant_id
-                    AND period_type = :period_type
-                    AND period_end <= current_date::date
-              )
-            GROUP BY platform
-            ORDER BY revenue DESC
-        """), {"tenant_id": tenant_ctx.tenant_id, "period_type": period_type}).fetchall()
-
-        def _pct(current: float, prior: float) -> Optional[float]:
-            if prior and prior != 0:
-                return round((current - prior) / abs(prior) * 100, 1)
-            return None
-
-        rev = float(rev_row.total_revenue) if rev_row else 0.0
-        prior_rev = float(rev_row.prior_revenue) if rev_row else 0.0
-        spend = float(mkt_row.total_spend) if mkt_row else 0.0
-        prior_spend = float(mkt_row.prior_spend) if mkt_row else 0.0
-        roas = float(mkt_row.avg_roas) if mkt_row else 0.0
-        prior_roas = float(mkt_row.prior_roas) if mkt_row else 0.0
-        convs = float(mkt_row.total_conversions) if mkt_row else 0.0
-        prior_convs = float(mkt_row.prior_conversions) if mkt_row else 0.0
-
-        channels = [
-            ChannelBar(channel=r.channel, revenue=float(r.revenue), spend=float(r.spend))
-            for r in channel_rows
-        ]
-        active_channels = len(set(r.channel for r in channel_rows if float(r.revenue) > 0 or float(r.spend) > 0))
-
-        return KpiSummaryResponse(
-            total_revenue=KpiMetric(value=rev, change_pct=_pct(rev, prior_rev)),
-            total_ad_spend=KpiMetric(value=spend, change_pct=_pct(spend, prior_spend)),
-            average_roas=KpiMetric(value=roas, change_pct=_pct(roas, prior_roas)),
-            total_conversions=KpiMetric(value=convs, change_pct=_pct(convs, prior_convs)),
-            revenue_by_channel=channels,
-            active_channels=active_channels,
-        )
-
     except Exception as exc:
         logger.warning("KPI summary query failed: %s", exc)
         raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Analytics data unavailable")
 
+    summary = _kpi_summary_from_row(row)
+    cache.set(tenant_ctx.tenant_id, version, entry, summary)
+    return FastJSONResponse(summary)
+
+
+def _kpi_summary_from_row(row) -> dict:
+    """Build the KpiSummaryResponse shape from a mart_kpi_summary row (zeros for no row)."""
+    def metric(value, change_pct) -> dict:
+        return {
+            "value": float(value or 0),
+            "change_pct": float(change_pct) if change_pct is not None else None,
+        }
+
+    if row is None:
+        zero = metric(0, None)
+        return {
+            "total_revenue": zero,
+            "total_ad_spend": zero,
+            "average_roas": zero,
+            "total_conversions": zero,
+            "revenue_by_channel": [],
+            "active_channels": 0,
+        }
+
+    return {
+        "total_revenue": metric(row.total_revenue, row.revenue_change_pct),
+        "total_ad_spend": metric(row.total_spend, row.spend_change_pct),
+        "average_roas": metric(row.average_roas, row.roas_change_pct),
+        "total_conversions": metric(row.total_conversions, row.conversions_change_pct),
+        "revenue_by_channel": [
+            {"channel": bar["channel"], "revenue": float(bar["revenue"]), "spend": float(bar["spend"])}
+            for bar in row.revenue_by_channel or []
+        ],
+        "active_channels": int(row.active_channels or 0),
+    }
 
 
 # =============================================================================
@@ -630,7 +588,7 @@ CHANNEL_DISPLAY_NAMES: dict[str, str] = {
     "/channel-breakdown",
     response_model=ChannelBreakdownSummary,
 )
-async def get_channel_breakdown(
+def get_channel_breakdown(
     request: Request,
     metric: str = Query("revenue", description="Metric: revenue, spend, roas, conversions"),
     timeframe: str = Query("30days"),
@@ -667,11 +625,10 @@ async def get_channel_breakdown(
             WHERE tenant_id = :tenant_id
               AND period_type = :period_type
               AND period_end = (
-                  SELECT MAX(period_end)
-                  FROM marts.mart_marketing_metrics
+                  SELECT marketing_period_end
+                  FROM marts.mart_latest_periods
                   WHERE tenant_id = :tenant_id
                     AND period_type = :period_type
-                    AND period_end <= current_date::date
               )
             GROUP BY platform
             ORDER BY metric_value DESC
@@ -712,7 +669,7 @@ async def get_channel_breakdown(
     "/channel-breakdown/{channel}",
     response_model=ChannelDrilldownResponse,
 )
-async def get_channel_drilldown(
+def get_channel_drilldown(
     channel: str,
     request: Request,
     timeframe: str = Query("30days"),
@@ -738,11 +695,10 @@ async def get_channel_drilldown(
               AND period_type = :period_type
               AND (platform = :channel OR (:channel = 'organic' AND platform IS NULL))
               AND period_end = (
-                  SELECT MAX(period_end)
-                  FROM marts.mart_marketing_metrics
+                  SELECT marketing_period_end
+                  FROM marts.mart_latest_periods
                   WHERE tenant_id = :tenant_id
                     AND period_type = :period_type
-                    AND period_end <= current_date::date
               )
         """), {"tenant_id": tenant_ctx.tenant_id, "period_type": period_type, "channel": channel}).fetchone()
 
@@ -5,7 +5,8 @@ Liveness and readiness endpoints.
   It must stay fast and never 503 for transient downstream issues.
 - ``GET /api/health/readiness`` is a deep readiness probe that verifies the
   required identity tables exist and that Redis is reachable. Used by
-  operators and pre-deploy smoke tests.
+  operators and pre-deploy smoke tests. Its database component also carries
+  connection pool metrics (checked out, overflow, checkout wait) per engine.
 """
 
 import logging
@@ -16,7 +17,7 @@ from typing import Any
 import redis
 from fastapi import APIRouter, Depends, Response, status
 
-from src.database.session import get_db_session
+from src.database.session import get_db_session, get_pool_metrics
 from src.middleware.rate_limit import get_rate_limiter
 from src.platform.db_readiness import (
     REQUIRED_IDENTITY_TABLES,
@@ -70,12 +71,15 @@ async def readiness(response: Response, db=Depends(get_db_session)):
     Components:
     - ``database``: required identity tables exist (blocking — 503 if missing)
     - ``redis``: reachable via PING (non-blocking — logged but not fatal)
+
+    ``database.pool`` reports pool usage per engine (see get_pool_metrics).
     """
     db_result = check_required_tables(db, REQUIRED_IDENTITY_TABLES)
     database_component = {
         "ready": db_result.ready,
         "checked_tables": db_result.checked_tables,
         "missing_tables": db_result.missing_tables,
+        "pool": get_pool_metrics(),
     }
 
     redis_component = _check_redis_component()
@@ -3,7 +3,7 @@ Notifications API routes for Story 9.1.
 
 Provides endpoints for:
 - Listing notifications
-- Getting unread count
+- Getting unread count (one-off or as a server-sent event stream)
 - Marking notifications as read
 
 SECURITY:
@@ -15,12 +15,15 @@ Story 9.1 - Notification Framework (Events → Channels)
 """
 
 import logging
+import os
 from typing import Optional
 
 from fastapi import APIRouter, Request, HTTPException, status, Depends, Query
 
+from src.api.responses import FastJSONResponse
+from src.api.sse import polling_event_stream
 from src.platform.tenant_context import get_tenant_context
-from src.database.session import get_db_session
+from src.database.session import get_db_session, get_session_factory
 from src.middleware.rate_limit import rate_limit_dependency
 from src.models.notification import (
     Notification,
@@ -45,6 +48,11 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/notifications", tags=["notifications"])
 
+# Unread stream: how often to check the user's counter row, and how long one
+# connection stays open before the client reconnects
+UNREAD_STREAM_POLL_SECONDS = float(os.getenv("NOTIFICATION_UNREAD_STREAM_POLL_SECONDS", "5"))
+UNREAD_STREAM_MAX_SECONDS = float(os.getenv("NOTIFICATION_UNREAD_STREAM_MAX_SECONDS", "300"))
+
 
 def _notification_to_response(notification: Notification) -> NotificationResponse:
     """Convert Notification model to response model."""
@@ -63,9 +71,27 @@ def _notification_to_response(notification: Notification) -> NotificationRespons
     )
 
 
+def _notification_row(notification: Notification) -> dict:
+    """NotificationResponse shape as a plain dict, for the list fast path."""
+    return {
+        "id": notification.id,
+        "event_type": notification.event_type.value if notification.event_type else "",
+        "importance": notification.importance.value if notification.importance else "",
+        "title": notification.title,
+        "message": notification.message,
+        "action_url": notification.action_url,
+        "entity_type": notification.entity_type,
+        "entity_id": notification.entity_id,
+        "status": notification.status.value if notification.status else "",
+        "created_at": notification.created_at,
+        "read_at": notification.read_at,
+    }
+
+
 @router.get(
     "",
     response_model=NotificationListResponse,
+    response_class=FastJSONResponse,
 )
 async def list_notifications(
     request: Request,
@@ -122,11 +148,11 @@ async def list_notifications(
 
     unread_count = service.get_unread_count(tenant_ctx.user_id)
 
-    return NotificationListResponse(
-        notifications=[_notification_to_response(n) for n in notifications],
-        total=total,
-        unread_count=unread_count,
-    )
+    return FastJSONResponse({
+        "notifications": [_notification_row(n) for n in notifications],
+        "total": total,
+        "unread_count": unread_count,
+    })
 
 
 @router.get(
@@ -151,6 +177,45 @@ async def get_unread_count(
     return UnreadCountResponse(count=count)
 
 
+@router.get("/unread/stream")
+async def stream_unread_count(
+    request: Request,
+    _rate_limit=Depends(rate_limit_dependency("notifications", limit=60, window=60)),
+):
+    """
+    Stream the unread count for the current user as server-sent events.
+
+    Sends "event: unread" with the count as data on connect and whenever
+    the user's unread counter changes, with the counter version as the SSE
+    id. Each poll reads the user's single counter row.
+
+    SECURITY: Only reports the authenticated user's counter.
+    """
+    tenant_ctx = get_tenant_context(request)
+    tenant_id, user_id = tenant_ctx.tenant_id, tenant_ctx.user_id
+
+    def read_count(db, seen_version):
+        count, version = NotificationService(db, tenant_id).get_unread_state(user_id)
+        if version == seen_version:
+            return seen_version, []
+        return version, [(version, count)]
+
+    def unread_frame(item) -> str:
+        version, count = item
+        payload = UnreadCountResponse(count=count).model_dump_json()
+        return f"id: {version}\nevent: unread\ndata: {payload}\n\n"
+
+    return polling_event_stream(
+        request,
+        get_session_factory(),
+        read_count,
+        unread_frame,
+        poll_seconds=UNREAD_STREAM_POLL_SECONDS,
+        max_seconds=UNREAD_STREAM_MAX_SECONDS,
+        log_extra={"tenant_id": tenant_id, "user_id": user_id},
+    )
+
+
 @router.get(
     "/preferences",
     response_model=NotificationPreferencesResponse,
@@ -17,6 +17,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from pydantic import BaseModel
 from sqlalchemy import text
 
+from src.api.responses import FastJSONResponse
 from src.platform.tenant_context import get_tenant_context
 from src.middleware.rate_limit import rate_limit_dependency
 
@@ -36,8 +37,8 @@ TIMEFRAME_DAYS: dict[str, int] = {
 def _get_db(request: Request):
     """DB dependency — validates JWT/tenant then yields a session."""
     get_tenant_context(request)  # raises 401/403 if invalid
-    from src.database.session import SessionLocal
-    db = SessionLocal()
+    from src.database.session import get_read_session_factory
+    db = get_read_session_factory()()
     try:
         yield db
     finally:
@@ -68,12 +69,29 @@ class OrdersListResponse(BaseModel):
     has_more: bool
 
 
+def _order_row(r) -> dict:
+    """Map a query row to the Order shape without per-row model validation."""
+    return {
+        "order_id": str(r.order_id),
+        "order_number": str(r.order_number) if r.order_number is not None else None,
+        "order_name": r.order_name,
+        "revenue": float(r.revenue),
+        "currency": r.currency,
+        "financial_status": r.financial_status,
+        "created_at": r.created_at.isoformat() if r.created_at else "",
+        "utm_source": r.utm_source,
+        "utm_medium": r.utm_medium,
+        "utm_campaign": r.utm_campaign,
+        "platform": r.platform,
+    }
+
+
 # ---------------------------------------------------------------------------
 # Endpoint
 # ---------------------------------------------------------------------------
 
-@router.get("", response_model=OrdersListResponse)
-async def get_orders(
+@router.get("", response_model=OrdersListResponse, response_class=FastJSONResponse)
+def get_orders(
     request: Request,
     timeframe: str = Query("30days", description="7days|30days|90days|thisMonth|thisQuarter"),
     limit: int = Query(50, le=200),
@@ -130,28 +148,11 @@ async def get_orders(
 
         total = int(total_row.total) if total_row else 0
 
-        orders = [
-            Order(
-                order_id=str(r.order_id),
-                order_number=str(r.order_number) if r.order_number is not None else None,
-                order_name=r.order_name,
-                revenue=float(r.revenue),
-                currency=r.currency,
-                financial_status=r.financial_status,
-                created_at=r.created_at.isoformat() if r.created_at else "",
-                utm_source=r.utm_source,
-                utm_medium=r.utm_medium,
-                utm_campaign=r.utm_campaign,
-                platform=r.platform,
-            )
-            for r in rows
-        ]
-
-        return OrdersListResponse(
-            orders=orders,
-            total=total,
-            has_more=(offset + limit) < total,
-        )
+        return FastJSONResponse({
+            "orders": [_order_row(r) for r in rows],
+            "total": total,
+            "has_more": (offset + limit) < total,
+        })
 
     except Exception as exc:
         logger.warning("Orders query failed: %s", exc)
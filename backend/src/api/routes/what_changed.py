@@ -2,7 +2,8 @@
 What Changed API routes for Story 9.8.
 
 Read-only endpoints for the "What Changed?" debug panel.
-Provides merchant-safe aggregated data about recent changes.
+Provides merchant-safe aggregated data about recent changes, paged by
+keyset cursor, plus a server-sent event stream of new changes.
 
 SECURITY:
 - All endpoints are read-only (GET only)
@@ -14,13 +15,19 @@ Story 9.8 - "What Changed?" Debug Panel
 """
 
 import logging
+import os
 from typing import Optional
 
-from fastapi import APIRouter, Request, Depends, Query
+from fastapi import APIRouter, Request, Depends, Query, HTTPException, status
 
+from src.api.responses import FastJSONResponse
+from src.api.sse import polling_event_stream
 from src.platform.tenant_context import get_tenant_context
-from src.database.session import get_db_session
-from src.services.data_change_aggregator import DataChangeAggregator
+from src.database.session import get_db_session, get_session_factory
+from src.services.data_change_aggregator import (
+    DataChangeAggregator,
+    InvalidCursorError,
+)
 from src.api.schemas.what_changed import (
     DataChangeEventResponse,
     ChangeEventsListResponse,
@@ -40,6 +47,43 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/what-changed", tags=["what-changed", "debug"])
 
+# Live stream: how often to check the tenant's feed state row, and how long
+# one connection stays open before the client reconnects with Last-Event-ID
+STREAM_POLL_SECONDS = float(os.getenv("WHAT_CHANGED_STREAM_POLL_SECONDS", "5"))
+STREAM_MAX_SECONDS = float(os.getenv("WHAT_CHANGED_STREAM_MAX_SECONDS", "300"))
+STREAM_BATCH_SIZE = 100
+
+
+def _event_to_response(event) -> DataChangeEventResponse:
+    return DataChangeEventResponse(
+        id=event.id,
+        event_type=event.event_type,
+        title=event.title,
+        description=event.description,
+        affected_metrics=event.affected_metrics or [],
+        affected_connector_name=event.affected_connector_name,
+        impact_summary=event.impact_summary,
+        affected_date_start=event.affected_date_start,
+        affected_date_end=event.affected_date_end,
+        occurred_at=event.occurred_at,
+    )
+
+
+def _event_row(event) -> dict:
+    """DataChangeEventResponse shape as a plain dict, for the list fast path."""
+    return {
+        "id": event.id,
+        "event_type": event.event_type,
+        "title": event.title,
+        "description": event.description,
+        "affected_metrics": event.affected_metrics or [],
+        "affected_connector_name": event.affected_connector_name,
+        "impact_summary": event.impact_summary,
+        "affected_date_start": event.affected_date_start,
+        "affected_date_end": event.affected_date_end,
+        "occurred_at": event.occurred_at,
+    }
+
 
 # =============================================================================
 # What Changed Debug Panel Routes (read-only)
@@ -49,6 +93,7 @@ router = APIRouter(prefix="/api/what-changed", tags=["what-changed", "debug"])
 @router.get(
     "",
     response_model=ChangeEventsListResponse,
+    response_class=FastJSONResponse,
 )
 async def list_change_events(
     request: Request,
@@ -68,11 +113,17 @@ async def list_change_events(
     days: int = Query(7, ge=1, le=30, description="Number of days to look back"),
     limit: int = Query(50, le=100, description="Maximum events to return"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: Optional[str] = Query(
+        None,
+        description="next_cursor from the previous page (replaces offset)"
+    ),
 ):
     """
     List aggregated data change events.
 
     Returns merchant-safe summaries of changes that may affect metrics.
+    The first page includes the total; follow next_cursor for further
+    pages, which skip the count.
     """
     tenant_ctx = get_tenant_context(request)
 
@@ -81,6 +132,28 @@ async def list_change_events(
         tenant_id=tenant_ctx.tenant_id,
     )
 
+    if cursor:
+        try:
+            events, next_cursor = aggregator.get_change_events_page(
+                cursor=cursor,
+                event_type=event_type,
+                connector_id=connector_id,
+                metric=metric,
+                days=days,
+                limit=limit,
+            )
+        except InvalidCursorError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
+        return FastJSONResponse({
+            "events": [_event_row(event) for event in events],
+            "total": None,
+            "has_more": next_cursor is not None,
+            "next_cursor": next_cursor,
+        })
+
     events, total = aggregator.get_change_events(
         event_type=event_type,
         connector_id=connector_id,
@@ -92,24 +165,64 @@ async def list_change_events(
 
     has_more = offset + len(events) < total
 
-    return ChangeEventsListResponse(
-        events=[
-            DataChangeEventResponse(
-                id=event.id,
-                event_type=event.event_type,
-                title=event.title,
-                description=event.description,
-                affected_metrics=event.affected_metrics or [],
-                affected_connector_name=event.affected_connector_name,
-                impact_summary=event.impact_summary,
-                affected_date_start=event.affected_date_start,
-                affected_date_end=event.affected_date_end,
-                occurred_at=event.occurred_at,
+    return FastJSONResponse({
+        "events": [_event_row(event) for event in events],
+        "total": total,
+        "has_more": has_more,
+        "next_cursor": aggregator.cursor_for(events[-1]) if has_more and events else None,
+    })
+
+
+@router.get("/stream")
+async def stream_change_events(request: Request):
+    """
+    Stream new change events as server-sent events.
+
+    Each new event is sent as "event: change" with the event JSON as data
+    and its feed sequence as the SSE id. Reconnecting with the
+    Last-Event-ID header resumes after that event. Each poll reads the
+    tenant's feed state row and fetches events only when it has moved.
+    """
+    tenant_id = get_tenant_context(request).tenant_id
+
+    last_event_id = request.headers.get("last-event-id")
+    resume_after = None
+    if last_event_id:
+        try:
+            resume_after = int(last_event_id)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid Last-Event-ID",
             )
-            for event in events
-        ],
-        total=total,
-        has_more=has_more,
+
+    def read_feed(db, seen: Optional[int]):
+        """Return (last sequence seen, new events) for the tenant."""
+        aggregator = DataChangeAggregator(db, tenant_id)
+        version = aggregator.get_feed_version()
+        if seen is None:
+            return version, []
+        if version <= seen:
+            return seen, []
+        events = aggregator.get_events_recorded_after(seen, limit=STREAM_BATCH_SIZE)
+        if events:
+            seen = events[-1].feed_sequence
+        return seen, [(e.feed_sequence, _event_to_response(e)) for e in events]
+
+    def change_frame(item) -> str:
+        sequence, change = item
+        return f"id: {sequence}\nevent: change\ndata: {change.model_dump_json()}\n\n"
+
+    # New subscribers start at the head of the feed; resuming ones catch up
+    return polling_event_stream(
+        request,
+        get_session_factory(),
+        read_feed,
+        change_frame,
+        poll_seconds=STREAM_POLL_SECONDS,
+        max_seconds=STREAM_MAX_SECONDS,
+        initial_state=resume_after,
+        log_extra={"tenant_id": tenant_id},
     )
 
 
@@ -34,8 +34,9 @@ class ChangeEventsListResponse(BaseModel):
     """Response for change events list queries."""
 
     events: List[DataChangeEventResponse]
-    total: int
+    total: Optional[int] = None  # Omitted on cursor pages
     has_more: bool
+    next_cursor: Optional[str] = None
 
 
 class ConnectorFreshnessStatus(BaseModel):
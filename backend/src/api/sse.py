@@ -0,0 +1,82 @@
+"""
+Server-sent event streams fed by polling the database.
+
+A stream polls a read callback every poll_seconds, each time in a worker
+thread on a fresh session, so an open connection holds neither a pooled
+connection nor the event loop between polls. Every item the read returns
+becomes one frame; a poll with nothing new sends a keepalive comment so
+proxies keep the connection open. Streams end after max_seconds or when
+the client goes away, and clients reconnect as usual for SSE.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+KEEPALIVE_FRAME = ": keepalive\n\n"
+
+
+def polling_event_stream(
+    request: Request,
+    session_factory: Callable[[], Session],
+    read: Callable[[Session, Any], Tuple[Any, List[Any]]],
+    format_frame: Callable[[Any], str],
+    poll_seconds: float,
+    max_seconds: float,
+    initial_state: Any = None,
+    log_extra: Optional[Dict[str, Any]] = None,
+) -> StreamingResponse:
+    """
+    Build a text/event-stream response that polls read until it closes.
+
+    Args:
+        request: Incoming request, checked for disconnects before each poll
+        session_factory: Creates the session for one poll
+        read: (session, state) -> (new state, items to send)
+        format_frame: Renders one item as a complete SSE frame
+        poll_seconds: Delay between polls
+        max_seconds: Connection lifetime
+        initial_state: State passed to the first read
+        log_extra: Context logged if the stream fails
+
+    Returns:
+        StreamingResponse with the SSE media type and no-buffering headers
+    """
+
+    def poll(state: Any) -> Tuple[Any, List[Any]]:
+        db = session_factory()
+        try:
+            return read(db, state)
+        finally:
+            db.close()
+
+    async def frames() -> AsyncIterator[str]:
+        state = initial_state
+        deadline = time.monotonic() + max_seconds
+        try:
+            while time.monotonic() < deadline and not await request.is_disconnected():
+                state, items = await asyncio.to_thread(poll, state)
+                for item in items:
+                    yield format_frame(item)
+                if not items:
+                    yield KEEPALIVE_FRAME
+                await asyncio.sleep(poll_seconds)
+        except Exception as exc:
+            logger.error(
+                "Server-sent event stream failed",
+                extra={**(log_extra or {}), "error": str(exc)},
+            )
+
+    return StreamingResponse(
+        frames(),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
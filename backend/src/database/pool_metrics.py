@@ -0,0 +1,136 @@
+"""
+Connection pool instrumentation.
+
+SQLAlchemy's QueuePool reports its size, checked-out connections and
+overflow, but not how long callers waited to get a connection. Under load,
+that wait is the first sign the pool has become the bottleneck. The pool
+classes here time every checkout, including ones that hit pool_timeout,
+less any time spent opening a new connection (that is connect latency, not
+pool contention). pool_metrics() reports those timings next to the pool's
+own counters.
+
+Usage:
+    engine = create_engine(url, poolclass=InstrumentedQueuePool, ...)
+    pool_metrics(engine)
+    # {"pool_class": "InstrumentedQueuePool", "size": 20, "checked_out": 3,
+    #  "overflow": 0, "checkouts": 1520, "timeouts": 0, "avg_wait_ms": 0.04, ...}
+"""
+
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolWaitStats:
+    """Running totals of connection checkout waits (thread-safe)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.total_wait_seconds = 0.0
+            self.max_wait_seconds = 0.0
+
+    def record(self, wait_seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait_seconds += wait_seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "total_wait_ms": round(self.total_wait_seconds * 1000, 3),
+                "avg_wait_ms": round(self.total_wait_seconds * 1000 / attempts, 3) if attempts else 0.0,
+                "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+            }
+
+
+# Connection setup time spent inside the current checkout. A context variable,
+# so concurrent checkouts (threads, or greenlets in the async pool) never mix.
+_connect_seconds: ContextVar[Optional[List[float]]] = ContextVar(
+    "pool_connect_seconds", default=None
+)
+
+
+class _WaitTimingMixin:
+    """Times QueuePool._do_get, where callers block for a free connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def recreate(self):
+        # engine.dispose() and invalidation swap in a fresh pool; keep the totals
+        pool = super().recreate()
+        pool.wait_stats = self.wait_stats
+        return pool
+
+    def _do_get(self):
+        connect_seconds = [0.0]
+        token = _connect_seconds.set(connect_seconds)
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except sa_exc.TimeoutError:
+            self.wait_stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        finally:
+            _connect_seconds.reset(token)
+        self.wait_stats.record(time.perf_counter() - start - connect_seconds[0])
+        return connection
+
+    def _create_connection(self):
+        # Called from _do_get when the pool has room for a new connection
+        start = time.perf_counter()
+        try:
+            return super()._create_connection()
+        finally:
+            connect_seconds = _connect_seconds.get()
+            if connect_seconds is not None:
+                connect_seconds[0] += time.perf_counter() - start
+
+
+class InstrumentedQueuePool(_WaitTimingMixin, QueuePool):
+    """QueuePool that records checkout wait times."""
+
+
+class InstrumentedAsyncQueuePool(_WaitTimingMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout wait times."""
+
+
+def pool_metrics(engine) -> Dict[str, Any]:
+    """
+    Current pool counters and checkout wait totals for an engine.
+
+    Works for sync and async engines. Wait totals are present only for the
+    instrumented pool classes.
+    """
+    pool = engine.pool
+    metrics: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        metrics.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            # QueuePool counts overflow from -size; only positive values are extra connections
+            overflow=max(pool.overflow(), 0),
+        )
+    wait_stats = getattr(pool, "wait_stats", None)
+    if wait_stats is not None:
+        metrics.update(wait_stats.snapshot())
+    return metrics
@@ -1,31 +1,60 @@
 """
 Database session management with connection pooling.
 
-Provides a shared FastAPI dependency for database sessions across all routes.
+Provides shared FastAPI dependencies for database sessions across all routes.
 Uses SQLAlchemy with connection pooling for production workloads.
 
+- get_db_session: sync session on the primary. It is a plain generator, so
+  FastAPI opens and closes it in the threadpool, not on the event loop.
+- get_read_db_session: sync session for read-only analytics queries (marts,
+  canonical, attribution). It uses DATABASE_REPLICA_URL when set and the
+  primary otherwise. Routes that use it are plain `def` handlers, so their
+  queries run in the threadpool too.
+- get_async_db_session: AsyncSession (asyncpg) on the primary, for async
+  routes that await the database.
+
+Every pool records checkout wait times; get_pool_metrics() reports them with
+checked-out and overflow counts per engine.
+
 Usage:
     from src.database.session import get_db_session
 
     @router.get("/items")
-    async def get_items(db: Session = Depends(get_db_session)):
+    def get_items(db: Session = Depends(get_db_session)):
         return db.query(Item).all()
 """
 
 import os
 import logging
-from typing import Generator
+from typing import Any, AsyncGenerator, Dict, Generator, Optional
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import QueuePool
 from fastapi import HTTPException, status
 
+from src.database.pool_metrics import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    pool_metrics,
+)
+
 logger = logging.getLogger(__name__)
 
-# Module-level engine singleton
+# Module-level engine singletons
 _engine = None
 _SessionLocal = None
+_replica_engine = None
+_ReadSessionLocal = None
+_async_engine = None
+_AsyncSessionLocal = None
+
+
+def _normalize_url(database_url: str) -> str:
+    """Handle Render's postgres:// URL format (SQLAlchemy requires postgresql://)."""
+    if database_url.startswith("postgres://"):
+        database_url = database_url.replace("postgres://", "postgresql://", 1)
+    return database_url
 
 
 def _get_database_url() -> str:
@@ -38,13 +67,49 @@ def _get_database_url() -> str:
     if not database_url:
         raise ValueError("DATABASE_URL environment variable is not set")
 
-    # Handle Render's postgres:// URL format (SQLAlchemy requires postgresql://)
-    if database_url.startswith("postgres://"):
-        database_url = database_url.replace("postgres://", "postgresql://", 1)
+    return _normalize_url(database_url)
+
 
+def _get_replica_url() -> Optional[str]:
+    """Read replica URL from DATABASE_REPLICA_URL, or None to read from the primary."""
+    replica_url = os.getenv("DATABASE_REPLICA_URL")
+    return _normalize_url(replica_url) if replica_url else None
+
+
+def _async_url(database_url: str) -> str:
+    """Point a postgresql:// URL at the asyncpg driver."""
+    for prefix in ("postgresql+psycopg2://", "postgresql://"):
+        if database_url.startswith(prefix):
+            return "postgresql+asyncpg://" + database_url[len(prefix):]
     return database_url
 
 
+def _pool_options(prefix: str) -> Dict[str, Any]:
+    """
+    Pool settings for one engine.
+
+    {prefix}_POOL_SIZE and {prefix}_POOL_MAX_OVERFLOW override the primary's
+    DB_POOL_SIZE / DB_POOL_MAX_OVERFLOW, so the replica and async pools can be
+    sized on their own.
+    """
+    pool_size = os.getenv("DB_POOL_SIZE", "20")
+    max_overflow = os.getenv("DB_POOL_MAX_OVERFLOW", "40")
+    return {
+        "pool_size": int(os.getenv(f"{prefix}_POOL_SIZE", pool_size)),
+        "max_overflow": int(os.getenv(f"{prefix}_POOL_MAX_OVERFLOW", max_overflow)),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        "pool_pre_ping": True,  # Verify connection health
+        "pool_recycle": 1800,   # Recycle connections after 30 minutes
+    }
+
+
+def _read_only_connect_args(database_url: str) -> Dict[str, Any]:
+    """Make replica sessions read-only, so a replica DSN that points at a primary cannot write."""
+    if not database_url.startswith("postgresql"):
+        return {}
+    return {"options": "-c default_transaction_read_only=on"}
+
+
 def get_engine():
     """
     Get or create the database engine singleton.
@@ -52,6 +117,7 @@ def get_engine():
     Uses connection pooling configured via environment variables:
     - DB_POOL_SIZE: base connections kept open (default 20)
     - DB_POOL_MAX_OVERFLOW: extra connections allowed under spike load (default 40)
+    - DB_POOL_TIMEOUT: seconds to wait for a free connection (default 30)
     - pool_pre_ping: Verify connections before use
 
     TenantContextMiddleware opens 2 sessions per request, so at N concurrent users
@@ -62,19 +128,15 @@ def get_engine():
     if _engine is None:
         try:
             database_url = _get_database_url()
-            pool_size = int(os.getenv("DB_POOL_SIZE", "20"))
-            max_overflow = int(os.getenv("DB_POOL_MAX_OVERFLOW", "40"))
+            options = _pool_options("DB")
             _engine = create_engine(
                 database_url,
-                poolclass=QueuePool,
-                pool_size=pool_size,
-                max_overflow=max_overflow,
-                pool_pre_ping=True,  # Verify connection health
-                pool_recycle=1800,   # Recycle connections after 30 minutes
+                poolclass=InstrumentedQueuePool,
+                **options,
             )
             logger.info(
                 "Database engine created with connection pooling",
-                extra={"pool_size": pool_size, "max_overflow": max_overflow},
+                extra={"pool_size": options["pool_size"], "max_overflow": options["max_overflow"]},
             )
         except ValueError as e:
             logger.error("Failed to create database engine", extra={"error": str(e)})
@@ -95,16 +157,113 @@ def get_session_factory() -> sessionmaker:
     return _SessionLocal
 
 
-async def get_db_session() -> Generator[Session, None, None]:
+def get_read_engine():
+    """
+    Get the engine for read-only analytics queries.
+
+    Uses DATABASE_REPLICA_URL when set (pool sized by DB_REPLICA_POOL_SIZE /
+    DB_REPLICA_POOL_MAX_OVERFLOW), otherwise the primary engine. Replica
+    connections default to read-only transactions. Reads can lag the primary
+    by the replication delay, so only route data written by dbt/ingestion
+    (marts, canonical, attribution), never read-your-own-write paths.
+    """
+    global _replica_engine
+    replica_url = _get_replica_url()
+    if not replica_url:
+        return get_engine()
+    if _replica_engine is None:
+        options = _pool_options("DB_REPLICA")
+        _replica_engine = create_engine(
+            replica_url,
+            poolclass=InstrumentedQueuePool,
+            connect_args=_read_only_connect_args(replica_url),
+            **options,
+        )
+        logger.info(
+            "Read replica engine created with connection pooling",
+            extra={"pool_size": options["pool_size"], "max_overflow": options["max_overflow"]},
+        )
+    return _replica_engine
+
+
+def get_read_session_factory() -> sessionmaker:
+    """Get or create the session factory for read-only analytics queries."""
+    global _ReadSessionLocal
+    if _ReadSessionLocal is None:
+        _ReadSessionLocal = sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            bind=get_read_engine(),
+        )
+    return _ReadSessionLocal
+
+
+def get_async_engine():
+    """
+    Get or create the async (asyncpg) engine for the primary database.
+
+    Pool sized by DB_ASYNC_POOL_SIZE / DB_ASYNC_POOL_MAX_OVERFLOW, falling
+    back to the DB_POOL_* settings. The engine is created on first use, so
+    processes that never await the database open no extra connections.
+    """
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            _async_url(_get_database_url()),
+            poolclass=InstrumentedAsyncQueuePool,
+            **_pool_options("DB_ASYNC"),
+        )
+        logger.info("Async database engine created with connection pooling")
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """Get or create the AsyncSession factory for the primary database."""
+    global _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        _AsyncSessionLocal = async_sessionmaker(
+            bind=get_async_engine(),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _AsyncSessionLocal
+
+
+def get_pool_metrics() -> Dict[str, Dict[str, Any]]:
+    """
+    Pool metrics for every engine created so far.
+
+    Keys are primary, replica and async_primary. Engines that have not been
+    created yet are left out. See pool_metrics() for the fields.
+    """
+    engines = {
+        "primary": _engine,
+        "replica": _replica_engine,
+        "async_primary": _async_engine,
+    }
+    return {name: pool_metrics(engine) for name, engine in engines.items() if engine is not None}
+
+
+async def close_async_engines() -> None:
+    """Dispose the async engine (app shutdown)."""
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _AsyncSessionLocal = None
+
+
+def get_db_session() -> Generator[Session, None, None]:
     """
     FastAPI dependency for database sessions.
 
     Creates a new session for each request and ensures proper cleanup.
-    Raises HTTP 503 if database is not configured.
+    Raises HTTP 503 if database is not configured. A plain (sync) generator,
+    so FastAPI runs session setup and teardown in its threadpool.
 
     Usage:
         @router.get("/items")
-        async def get_items(db: Session = Depends(get_db_session)):
+        def get_items(db: Session = Depends(get_db_session)):
             return db.query(Item).all()
     """
     try:
@@ -122,6 +281,52 @@ async def get_db_session() -> Generator[Session, None, None]:
         session.close()
 
 
+def get_read_db_session() -> Generator[Session, None, None]:
+    """
+    FastAPI dependency for read-only analytics sessions (replica when configured).
+
+    Raises HTTP 503 if database is not configured.
+    """
+    try:
+        ReadSessionLocal = get_read_session_factory()
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database not configured"
+        )
+
+    session = ReadSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _async_session_factory(factory_getter) -> async_sessionmaker:
+    try:
+        return factory_getter()
+    except (ValueError, ImportError) as e:
+        # ImportError: the asyncpg driver is not installed
+        logger.error("Async database unavailable", extra={"error": str(e)})
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database not configured"
+        )
+
+
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency for AsyncSession on the primary database.
+
+    Usage:
+        @router.get("/items")
+        async def get_items(db: AsyncSession = Depends(get_async_db_session)):
+            return (await db.execute(select(Item))).scalars().all()
+    """
+    async with _async_session_factory(get_async_session_factory)() as session:
+        yield session
+
+
 def get_db_session_sync() -> Generator[Session, None, None]:
     """
     Synchronous version of get_db_session for non-async contexts.
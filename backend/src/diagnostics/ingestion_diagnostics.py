@@ -13,6 +13,7 @@ SECURITY: All queries are tenant-scoped via tenant_id from JWT.
 """
 
 import logging
+import math
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from typing import Any, Dict, List, Optional
@@ -20,6 +21,7 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 
+from src.diagnostics import stats_kernels
 from src.ingestion.jobs.models import IngestionJob, JobStatus
 from src.models.airbyte_connection import TenantAirbyteConnection
 from src.models.dq_models import SyncRun, SyncRunStatus
@@ -95,15 +97,44 @@ def _get_recent_sync_runs(
     )
 
 
+@dataclass
+class IngestionInputs:
+    """Connector state read by the ingestion diagnosis.
+
+    Loaded once per connector so correlated anomalies can share it.
+    """
+    connector: Optional[TenantAirbyteConnection] = None
+    failed_jobs: List[IngestionJob] = field(default_factory=list)
+    running_jobs: List[IngestionJob] = field(default_factory=list)
+    recent_sync_runs: List[SyncRun] = field(default_factory=list)
+
+
+def load_ingestion_inputs(
+    db_session: Session,
+    tenant_id: str,
+    connector_id: str,
+    since: datetime,
+) -> IngestionInputs:
+    """Load connector, job and sync run state for one connector."""
+    connector = (
+        db_session.query(TenantAirbyteConnection)
+        .filter(
+            TenantAirbyteConnection.tenant_id == tenant_id,
+            TenantAirbyteConnection.id == connector_id,
+        )
+        .first()
+    )
+    return IngestionInputs(
+        connector=connector,
+        failed_jobs=_get_recent_failed_jobs(db_session, tenant_id, connector_id, since),
+        running_jobs=_get_running_jobs(db_session, tenant_id, connector_id),
+        recent_sync_runs=_get_recent_sync_runs(db_session, tenant_id, connector_id),
+    )
+
+
 def _compute_median(values: List[float]) -> float:
     """Compute median of a list of floats."""
-    if not values:
-        return 0.0
-    sorted_vals = sorted(values)
-    n = len(sorted_vals)
-    if n % 2 == 1:
-        return sorted_vals[n // 2]
-    return (sorted_vals[n // 2 - 1] + sorted_vals[n // 2]) / 2.0
+    return stats_kernels.median(values)
 
 
 def diagnose_ingestion_failure(
@@ -113,6 +144,7 @@ def diagnose_ingestion_failure(
     dataset: str,
     anomaly_detected_at: datetime,
     lookback_hours: int = 48,
+    inputs: Optional[IngestionInputs] = None,
 ) -> IngestionDiagnosticResult:
     """
     Detect ingestion-related root causes for a data quality anomaly.
@@ -130,6 +162,7 @@ def diagnose_ingestion_failure(
         dataset: Dataset name for context
         anomaly_detected_at: When the anomaly was detected
         lookback_hours: How far back to search for evidence
+        inputs: Pre-loaded connector state (loaded here if omitted)
 
     Returns:
         IngestionDiagnosticResult with detection status and evidence
@@ -137,22 +170,15 @@ def diagnose_ingestion_failure(
     if not tenant_id or not connector_id:
         return IngestionDiagnosticResult(detected=False)
 
-    since = anomaly_detected_at - timedelta(hours=lookback_hours)
-
-    # Get connector info
-    connector = (
-        db_session.query(TenantAirbyteConnection)
-        .filter(
-            TenantAirbyteConnection.tenant_id == tenant_id,
-            TenantAirbyteConnection.id == connector_id,
-        )
-        .first()
-    )
+    if inputs is None:
+        since = anomaly_detected_at - timedelta(hours=lookback_hours)
+        inputs = load_ingestion_inputs(db_session, tenant_id, connector_id, since)
 
+    connector = inputs.connector
     last_sync_at = connector.last_sync_at if connector else None
 
     # --- Signal 1: Sync failures ---
-    failed_jobs = _get_recent_failed_jobs(db_session, tenant_id, connector_id, since)
+    failed_jobs = inputs.failed_jobs
     if failed_jobs:
         job = failed_jobs[0]  # Most recent failure
         confidence = 0.85
@@ -185,9 +211,9 @@ def diagnose_ingestion_failure(
         )
 
     # --- Signal 2: Long-running syncs ---
-    running_jobs = _get_running_jobs(db_session, tenant_id, connector_id)
+    running_jobs = inputs.running_jobs
+    recent_runs = inputs.recent_sync_runs
     if running_jobs:
-        recent_runs = _get_recent_sync_runs(db_session, tenant_id, connector_id)
         durations = [
             float(r.duration_seconds)
             for r in recent_runs
@@ -204,6 +230,7 @@ def diagnose_ingestion_failure(
                 running_seconds = (now - started).total_seconds()
 
                 if median_duration > 0 and running_seconds > median_duration * 2:
+                    robust_z = stats_kernels.robust_zscore(running_seconds, durations)
                     return IngestionDiagnosticResult(
                         detected=True,
                         confidence_score=0.60,
@@ -215,6 +242,9 @@ def diagnose_ingestion_failure(
                             "duration_ratio": round(
                                 running_seconds / median_duration, 2
                             ),
+                            "duration_robust_z": (
+                                round(robust_z, 2) if math.isfinite(robust_z) else None
+                            ),
                             "last_successful_sync_at": (
                                 last_sync_at.isoformat() if last_sync_at else None
                             ),
@@ -227,7 +257,6 @@ def diagnose_ingestion_failure(
                     )
 
     # --- Signal 3: Partial sync ---
-    recent_runs = _get_recent_sync_runs(db_session, tenant_id, connector_id)
     if len(recent_runs) >= 2:
         latest_run = recent_runs[0]
         baseline_runs = recent_runs[1:]
@@ -0,0 +1,185 @@
+"""
+Columnar statistics kernels for root cause diagnostics and DQ checks.
+
+Distribution, cardinality and timing comparisons are evaluated over
+aligned NumPy arrays instead of per-key Python loops:
+- align: map two {key: value} dicts onto one shared key order
+- jensen_shannon_divergence: JSD between categorical distributions
+- top_movers: top-k categories by absolute change (argpartition)
+- median / rolling_median: point and windowed medians
+- robust_zscore: (x - median) / scaled MAD against a baseline
+- ratio_regressions: aligned current/previous ratio thresholding
+
+Every kernel accepts arrays; the dict helpers exist so callers holding
+{category: value} maps do one alignment pass and no further Python loops.
+
+Story 4.2 - Data Quality Root Cause Signals
+"""
+
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+
+# Smoothing added to every bin so empty categories do not produce log(0)
+JSD_EPSILON = 1e-10
+
+# MAD -> standard deviation scale factor for normally distributed data
+MAD_SCALE = 1.4826
+
+
+def align(
+    current: Mapping[str, float],
+    baseline: Mapping[str, float],
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    Align two keyed value maps on the union of their keys.
+
+    Keys keep first-seen order (current, then keys only in baseline);
+    missing values are 0.
+
+    Returns:
+        (keys, current_values, baseline_values)
+    """
+    keys = list(current)
+    keys.extend(k for k in baseline if k not in current)
+    n = len(keys)
+    current_values = np.fromiter(
+        (current.get(k, 0.0) for k in keys), dtype=np.float64, count=n
+    )
+    baseline_values = np.fromiter(
+        (baseline.get(k, 0.0) for k in keys), dtype=np.float64, count=n
+    )
+    return keys, current_values, baseline_values
+
+
+def jensen_shannon_divergence(p: np.ndarray, q: np.ndarray) -> float:
+    """
+    Jensen-Shannon divergence (base 2) between two aligned distributions.
+
+    Inputs need not be normalized; both are smoothed by JSD_EPSILON and
+    rescaled to sum to 1.
+
+    Returns a value in [0, 1]. 0 = identical, 1 = maximally different.
+    """
+    p = np.asarray(p, dtype=np.float64)
+    q = np.asarray(q, dtype=np.float64)
+    if p.size == 0:
+        return 0.0
+
+    p = p + JSD_EPSILON
+    q = q + JSD_EPSILON
+    p /= p.sum()
+    q /= q.sum()
+    m = (p + q) / 2
+
+    kl_pm = np.dot(p, np.log2(p / m))
+    kl_qm = np.dot(q, np.log2(q / m))
+    return float((kl_pm + kl_qm) / 2)
+
+
+def distribution_divergence(
+    p: Mapping[str, float],
+    q: Mapping[str, float],
+) -> float:
+    """JSD between two {category: proportion} maps."""
+    _, p_values, q_values = align(p, q)
+    return jensen_shannon_divergence(p_values, q_values)
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k largest scores, largest first.
+
+    Uses argpartition (O(n)) and only sorts the selected k; ties keep
+    index order.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    n = scores.size
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.intp)
+    if k < n:
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(n)
+    order = np.lexsort((candidates, -scores[candidates]))
+    return candidates[order]
+
+
+def top_movers(
+    current: Mapping[str, float],
+    baseline: Mapping[str, float],
+    top_n: int = 3,
+) -> List[Dict[str, Any]]:
+    """Top N categories by absolute proportion change (current - baseline)."""
+    keys, current_values, baseline_values = align(current, baseline)
+    changes = current_values - baseline_values
+    return [
+        {"category": keys[i], "change": round(float(changes[i]), 4)}
+        for i in top_k_indices(np.abs(changes), top_n)
+    ]
+
+
+def median(values: Sequence[float]) -> float:
+    """Median of values (0.0 if empty)."""
+    if len(values) == 0:
+        return 0.0
+    return float(np.median(np.asarray(values, dtype=np.float64)))
+
+
+def rolling_median(values: Sequence[float], window: int) -> np.ndarray:
+    """
+    Trailing median over each full window of values.
+
+    Returns len(values) - window + 1 medians (empty if fewer than window
+    values); element i is the median of values[i:i + window].
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if window <= 0 or values.size < window:
+        return np.empty(0, dtype=np.float64)
+    windows = np.lib.stride_tricks.sliding_window_view(values, window)
+    return np.median(windows, axis=1)
+
+
+def robust_zscore(values: Any, baseline: Sequence[float]) -> Any:
+    """
+    Robust z-score of values against a baseline sample.
+
+    z = (x - median(baseline)) / (MAD_SCALE * MAD(baseline)). When the
+    baseline has no spread (MAD = 0), deviations score +/-inf and exact
+    matches score 0. Returns a float for scalar input, else an array.
+    """
+    baseline = np.asarray(baseline, dtype=np.float64)
+    x = np.asarray(values, dtype=np.float64)
+    if baseline.size == 0:
+        z = np.zeros_like(x)
+    else:
+        center = np.median(baseline)
+        spread = MAD_SCALE * np.median(np.abs(baseline - center))
+        deviation = x - center
+        if spread > 0:
+            z = deviation / spread
+        else:
+            z = np.where(deviation == 0, 0.0, np.copysign(np.inf, deviation))
+    return float(z) if z.ndim == 0 else z
+
+
+def ratio_regressions(
+    current: np.ndarray,
+    previous: np.ndarray,
+    threshold_ratio: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Positions where current / previous >= threshold_ratio.
+
+    Pairs where either side is non-positive are never flagged.
+
+    Returns:
+        (indices, ratios) for the flagged positions, in input order
+    """
+    current = np.asarray(current, dtype=np.float64)
+    previous = np.asarray(previous, dtype=np.float64)
+    valid = (current > 0) & (previous > 0)
+    ratios = np.divide(current, previous, out=np.zeros_like(current), where=valid)
+    indices = np.flatnonzero(valid & (ratios >= threshold_ratio))
+    return indices, ratios[indices]
@@ -17,8 +17,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 from sqlalchemy.orm import Session
 
+from src.diagnostics import stats_kernels
 from src.ingestion.dbt_artifact_parser import (
     DbtModelResult,
     DbtRunSummary,
@@ -87,26 +89,30 @@ def _detect_execution_time_regression(
     threshold_ratio: float = 3.0,
 ) -> List[Dict[str, Any]]:
     """Detect models with execution time significantly exceeding historical."""
-    previous_by_name = {m.model_name: m for m in previous_models}
-    regressions = []
-
-    for current in current_models:
-        previous = previous_by_name.get(current.model_name)
-        if (
-            previous
-            and previous.execution_time_seconds > 0
-            and current.execution_time_seconds > 0
-        ):
-            ratio = current.execution_time_seconds / previous.execution_time_seconds
-            if ratio >= threshold_ratio:
-                regressions.append({
-                    "model_name": current.model_name,
-                    "previous_seconds": round(previous.execution_time_seconds, 2),
-                    "current_seconds": round(current.execution_time_seconds, 2),
-                    "execution_time_ratio": round(ratio, 2),
-                })
+    # Models without a previous run align to 0 and are never flagged
+    previous_seconds = {
+        m.model_name: m.execution_time_seconds for m in previous_models
+    }
+    n = len(current_models)
+    current = np.fromiter(
+        (m.execution_time_seconds for m in current_models), dtype=np.float64, count=n
+    )
+    previous = np.fromiter(
+        (previous_seconds.get(m.model_name, 0.0) for m in current_models),
+        dtype=np.float64,
+        count=n,
+    )
+    indices, ratios = stats_kernels.ratio_regressions(current, previous, threshold_ratio)
 
-    return regressions
+    return [
+        {
+            "model_name": current_models[i].model_name,
+            "previous_seconds": round(float(previous[i]), 2),
+            "current_seconds": round(float(current[i]), 2),
+            "execution_time_ratio": round(float(ratio), 2),
+        }
+        for i, ratio in zip(indices, ratios)
+    ]
 
 
 def diagnose_transformation_regression(
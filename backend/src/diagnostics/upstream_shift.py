@@ -15,7 +15,6 @@ SECURITY: All queries are tenant-scoped via tenant_id from JWT.
 """
 
 import logging
-import math
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
@@ -23,6 +22,7 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 
+from src.diagnostics import stats_kernels
 from src.models.dq_models import DQResult, SyncRun, SyncRunStatus
 
 logger = logging.getLogger(__name__)
@@ -48,25 +48,7 @@ def _jensen_shannon_divergence(
 
     Returns a value in [0, 1]. 0 = identical, 1 = maximally different.
     """
-    all_keys = set(p) | set(q)
-    if not all_keys:
-        return 0.0
-
-    epsilon = 1e-10
-    p_vec = [p.get(k, 0.0) + epsilon for k in all_keys]
-    q_vec = [q.get(k, 0.0) + epsilon for k in all_keys]
-
-    p_sum = sum(p_vec)
-    q_sum = sum(q_vec)
-    p_vec = [x / p_sum for x in p_vec]
-    q_vec = [x / q_sum for x in q_vec]
-
-    m_vec = [(pi + qi) / 2 for pi, qi in zip(p_vec, q_vec)]
-
-    def _kl(a: List[float], b: List[float]) -> float:
-        return sum(ai * math.log2(ai / bi) for ai, bi in zip(a, b))
-
-    return (_kl(p_vec, m_vec) + _kl(q_vec, m_vec)) / 2
+    return stats_kernels.distribution_divergence(p, q)
 
 
 def _compute_top_movers(
@@ -75,15 +57,7 @@ def _compute_top_movers(
     top_n: int = 3,
 ) -> List[Dict[str, Any]]:
     """Compute top N categories by absolute proportion change."""
-    all_keys = set(current) | set(baseline)
-    changes = [
-        (k, current.get(k, 0.0) - baseline.get(k, 0.0))
-        for k in all_keys
-    ]
-    changes.sort(key=lambda x: abs(x[1]), reverse=True)
-    return [
-        {"category": k, "change": round(v, 4)} for k, v in changes[:top_n]
-    ]
+    return stats_kernels.top_movers(current, baseline, top_n)
 
 
 def _check_ingestion_healthy(
@@ -142,6 +116,33 @@ def _get_recent_drift_results(
     )
 
 
+@dataclass
+class UpstreamInputs:
+    """Connector-level evidence read by the upstream shift diagnosis.
+
+    Loaded once per connector so correlated anomalies can share it.
+    """
+    ingestion_healthy: bool = True
+    drift_results: List[DQResult] = field(default_factory=list)
+
+
+def load_upstream_inputs(
+    db_session: Session,
+    tenant_id: str,
+    connector_id: Optional[str],
+    since: datetime,
+) -> UpstreamInputs:
+    """Load ingestion health and recent failed DQ results for a connector."""
+    return UpstreamInputs(
+        ingestion_healthy=_check_ingestion_healthy(
+            db_session, tenant_id, connector_id, since,
+        ),
+        drift_results=_get_recent_drift_results(
+            db_session, tenant_id, connector_id, since,
+        ),
+    )
+
+
 def diagnose_upstream_shift(
     db_session: Session,
     tenant_id: str,
@@ -153,6 +154,7 @@ def diagnose_upstream_shift(
     current_cardinality: Optional[Dict[str, int]] = None,
     baseline_cardinality: Optional[Dict[str, int]] = None,
     lookback_days: int = 30,
+    inputs: Optional[UpstreamInputs] = None,
 ) -> UpstreamShiftResult:
     """
     Detect upstream behavioral data shifts as a root cause.
@@ -172,14 +174,18 @@ def diagnose_upstream_shift(
         current_cardinality: Current distinct counts {dimension: count}
         baseline_cardinality: Baseline distinct counts {dimension: count}
         lookback_days: Days to look back for DQ results
+        inputs: Pre-loaded connector evidence (queried here if omitted)
 
     Returns:
         UpstreamShiftResult with detection status and evidence
     """
     since = anomaly_detected_at - timedelta(days=lookback_days)
-    ingestion_healthy = _check_ingestion_healthy(
-        db_session, tenant_id, connector_id, since,
-    )
+    if inputs is not None:
+        ingestion_healthy = inputs.ingestion_healthy
+    else:
+        ingestion_healthy = _check_ingestion_healthy(
+            db_session, tenant_id, connector_id, since,
+        )
 
     # --- Signal 1: Direct distribution drift ---
     if current_distribution and baseline_distribution:
@@ -264,9 +270,12 @@ def diagnose_upstream_shift(
                 )
 
     # --- Signal 3: Recent DQ drift results as evidence ---
-    recent_results = _get_recent_drift_results(
-        db_session, tenant_id, connector_id, since,
-    )
+    if inputs is not None:
+        recent_results = inputs.drift_results
+    else:
+        recent_results = _get_recent_drift_results(
+            db_session, tenant_id, connector_id, since,
+        )
 
     drift_results = [
         r for r in recent_results
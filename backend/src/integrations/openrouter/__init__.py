@@ -6,6 +6,7 @@ Provides unified access to multiple LLM providers via OpenRouter API.
 
 from src.integrations.openrouter.client import (
     OpenRouterClient,
+    close_openrouter_clients,
     get_openrouter_client,
 )
 from src.integrations.openrouter.exceptions import (
@@ -31,6 +32,7 @@ __all__ = [
     # Client
     "OpenRouterClient",
     "get_openrouter_client",
+    "close_openrouter_clients",
     # Exceptions
     "OpenRouterError",
     "OpenRouterAuthenticationError",
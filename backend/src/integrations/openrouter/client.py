@@ -2,9 +2,12 @@
 OpenRouter API client for LLM routing.
 
 This client handles:
-- Chat completions via OpenRouter's unified API
+- Chat completions via OpenRouter's unified API (blocking or streamed)
 - Model availability checks
 - Rate limiting and error handling
+- Connection reuse: get_openrouter_client() returns a shared client per
+  event loop (keep-alive pool, HTTP/2 when h2 is installed) that the app
+  closes on shutdown via close_openrouter_clients()
 
 Documentation: https://openrouter.ai/docs
 
@@ -13,10 +16,16 @@ SECURITY:
 - No sensitive data in request metadata
 """
 
+import asyncio
+import importlib.util
+import json
 import logging
 import os
+import threading
 import time
-from typing import Optional, List, Dict, Any
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
 
 import httpx
 
@@ -31,6 +40,7 @@ from src.integrations.openrouter.exceptions import (
 )
 from src.integrations.openrouter.models import (
     ChatMessage,
+    ChatCompletionChunk,
     ChatCompletionResponse,
     ToolDefinition,
     ModelInfo,
@@ -43,6 +53,26 @@ DEFAULT_BASE_URL = "https://openrouter.ai/api/v1"
 DEFAULT_TIMEOUT_SECONDS = 60.0
 DEFAULT_CONNECT_TIMEOUT_SECONDS = 10.0
 
+# Connection pool (per process). Keep-alive connections skip the TCP/TLS
+# handshake on every chat turn; HTTP/2 multiplexes concurrent requests over
+# one connection when the h2 package is installed (httpx[http2]).
+OPENROUTER_MAX_CONNECTIONS = int(os.getenv("OPENROUTER_MAX_CONNECTIONS", "100"))
+OPENROUTER_MAX_KEEPALIVE_CONNECTIONS = int(
+    os.getenv("OPENROUTER_MAX_KEEPALIVE_CONNECTIONS", "20")
+)
+OPENROUTER_KEEPALIVE_EXPIRY_SECONDS = float(
+    os.getenv("OPENROUTER_KEEPALIVE_EXPIRY_SECONDS", "60")
+)
+OPENROUTER_HTTP2 = os.getenv("OPENROUTER_HTTP2", "true").lower() == "true"
+
+# Max in-flight requests per upstream model (0 = unbounded). Excess calls
+# wait for a slot instead of piling onto a model that is already slow.
+OPENROUTER_MODEL_CONCURRENCY = int(os.getenv("OPENROUTER_MODEL_CONCURRENCY", "16"))
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
 
 class OpenRouterClient:
     """
@@ -63,6 +93,9 @@ class OpenRouterClient:
         connect_timeout: float = DEFAULT_CONNECT_TIMEOUT_SECONDS,
         app_name: Optional[str] = None,
         site_url: Optional[str] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        max_in_flight_per_model: int = 0,
     ):
         """
         Initialize OpenRouter client.
@@ -74,6 +107,10 @@ class OpenRouterClient:
             connect_timeout: Connection timeout in seconds
             app_name: Application name for OpenRouter headers
             site_url: Site URL for OpenRouter headers
+            limits: Connection pool limits (default: httpx defaults)
+            http2: Use HTTP/2 (ignored when the h2 package is not installed)
+            max_in_flight_per_model: Cap on concurrent chat completions per
+                model; 0 means unbounded
         """
         self.base_url = (
             base_url or os.getenv("OPENROUTER_BASE_URL") or DEFAULT_BASE_URL
@@ -95,21 +132,129 @@ class OpenRouterClient:
             "X-Title": self.app_name,
         }
 
+        if http2 and not _http2_available():
+            logger.info("h2 not installed, OpenRouter client using HTTP/1.1")
+            http2 = False
+        self.http2 = http2
+
+        client_kwargs: Dict[str, Any] = {}
+        if limits is not None:
+            client_kwargs["limits"] = limits
+
         self._client = httpx.AsyncClient(
             timeout=httpx.Timeout(timeout, connect=connect_timeout),
             headers=headers,
+            http2=http2,
+            **client_kwargs,
         )
 
+        self.max_in_flight_per_model = max_in_flight_per_model
+        # Semaphores are bound to the loop that first waits on them, so each
+        # event loop using this client gets its own set
+        self._model_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
     async def close(self) -> None:
         """Close the HTTP client."""
         await self._client.aclose()
 
+    @asynccontextmanager
+    async def _model_slot(self, model: str) -> AsyncIterator[None]:
+        """Hold one of the model's in-flight slots (no-op when unbounded)."""
+        if self.max_in_flight_per_model <= 0:
+            yield
+            return
+        semaphores = self._model_semaphores.setdefault(asyncio.get_running_loop(), {})
+        semaphore = semaphores.get(model)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_in_flight_per_model)
+            semaphores[model] = semaphore
+        async with semaphore:
+            yield
+
     async def __aenter__(self) -> "OpenRouterClient":
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         await self.close()
 
+    def _raise_for_status(self, response: httpx.Response, endpoint: str) -> None:
+        """
+        Map an error response to the matching OpenRouterError.
+
+        The response body must already be read (streamed responses: call
+        ``aread()`` first).
+
+        Raises:
+            OpenRouterError: On any 4xx/5xx status
+        """
+        if response.status_code == 401:
+            logger.error(
+                "OpenRouter API authentication failed",
+                extra={"status_code": 401, "endpoint": endpoint},
+            )
+            raise OpenRouterAuthenticationError()
+
+        if response.status_code == 403:
+            logger.error(
+                "OpenRouter API authorization failed",
+                extra={"status_code": 403, "endpoint": endpoint},
+            )
+            raise OpenRouterAuthenticationError(
+                message="Authorization failed - API key may lack required permissions",
+                status_code=403,
+            )
+
+        if response.status_code == 404:
+            raise OpenRouterModelUnavailableError(
+                message=f"Resource not found: {endpoint}",
+            )
+
+        if response.status_code == 429:
+            retry_after = response.headers.get("Retry-After")
+            logger.warning(
+                "OpenRouter API rate limited",
+                extra={
+                    "endpoint": endpoint,
+                    "retry_after": retry_after,
+                },
+            )
+            raise OpenRouterRateLimitError(
+                retry_after=int(retry_after) if retry_after else None
+            )
+
+        if response.status_code >= 400:
+            error_body = {}
+            try:
+                error_body = response.json()
+            except Exception:
+                pass
+
+            error_message = error_body.get("error", {}).get("message", "")
+            error_code = error_body.get("error", {}).get("code", "")
+
+            # Check for content filter
+            if error_code == "content_filter" or "content" in error_message.lower():
+                raise OpenRouterContentFilterError(
+                    message=error_message or "Content blocked by filter",
+                    response=error_body,
+                )
+
+            logger.error(
+                "OpenRouter API error",
+                extra={
+                    "status_code": response.status_code,
+                    "endpoint": endpoint,
+                    "error_code": error_code,
+                    "response": str(error_body)[:500],
+                },
+            )
+            raise OpenRouterError(
+                message=f"OpenRouter API error: {response.status_code} - {error_message}",
+                status_code=response.status_code,
+                code=error_code,
+                response=error_body,
+            )
+
     async def _request(
         self,
         method: str,
@@ -142,73 +287,7 @@ class OpenRouterClient:
                 params=params,
             )
 
-            if response.status_code == 401:
-                logger.error(
-                    "OpenRouter API authentication failed",
-                    extra={"status_code": 401, "endpoint": endpoint},
-                )
-                raise OpenRouterAuthenticationError()
-
-            if response.status_code == 403:
-                logger.error(
-                    "OpenRouter API authorization failed",
-                    extra={"status_code": 403, "endpoint": endpoint},
-                )
-                raise OpenRouterAuthenticationError(
-                    message="Authorization failed - API key may lack required permissions",
-                    status_code=403,
-                )
-
-            if response.status_code == 404:
-                raise OpenRouterModelUnavailableError(
-                    message=f"Resource not found: {endpoint}",
-                )
-
-            if response.status_code == 429:
-                retry_after = response.headers.get("Retry-After")
-                logger.warning(
-                    "OpenRouter API rate limited",
-                    extra={
-                        "endpoint": endpoint,
-                        "retry_after": retry_after,
-                    },
-                )
-                raise OpenRouterRateLimitError(
-                    retry_after=int(retry_after) if retry_after else None
-                )
-
-            if response.status_code >= 400:
-                error_body = {}
-                try:
-                    error_body = response.json()
-                except Exception:
-                    pass
-
-                error_message = error_body.get("error", {}).get("message", "")
-                error_code = error_body.get("error", {}).get("code", "")
-
-                # Check for content filter
-                if error_code == "content_filter" or "content" in error_message.lower():
-                    raise OpenRouterContentFilterError(
-                        message=error_message or "Content blocked by filter",
-                        response=error_body,
-                    )
-
-                logger.error(
-                    "OpenRouter API error",
-                    extra={
-                        "status_code": response.status_code,
-                        "endpoint": endpoint,
-                        "error_code": error_code,
-                        "response": str(error_body)[:500],
-                    },
-                )
-                raise OpenRouterError(
-                    message=f"OpenRouter API error: {response.status_code} - {error_message}",
-                    status_code=response.status_code,
-                    code=error_code,
-                    response=error_body,
-                )
+            self._raise_for_status(response, endpoint)
 
             if response.status_code == 204:
                 return {}
@@ -258,25 +337,14 @@ class OpenRouterClient:
         Raises:
             OpenRouterError: On API errors
         """
-        request_body: Dict[str, Any] = {
-            "model": model,
-            "messages": [m.to_dict() for m in messages],
-            "temperature": temperature,
-        }
-
-        if max_tokens is not None:
-            request_body["max_tokens"] = max_tokens
-        if top_p is not None:
-            request_body["top_p"] = top_p
-        if stop:
-            request_body["stop"] = stop
-        if tools:
-            request_body["tools"] = [t.to_dict() for t in tools]
-            request_body["tool_choice"] = tool_choice
+        request_body = _chat_request_body(
+            messages, model, max_tokens, temperature, top_p, stop, tools, tool_choice,
+        )
 
         start_time = time.time()
 
-        data = await self._request("POST", "/chat/completions", json=request_body)
+        async with self._model_slot(model):
+            data = await self._request("POST", "/chat/completions", json=request_body)
 
         latency_ms = int((time.time() - start_time) * 1000)
 
@@ -294,6 +362,99 @@ class OpenRouterClient:
 
         return response
 
+    async def stream_chat_completion(
+        self,
+        messages: List[ChatMessage],
+        model: str,
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.7,
+        top_p: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        tools: Optional[List[ToolDefinition]] = None,
+        tool_choice: str = "auto",
+    ) -> AsyncIterator[ChatCompletionChunk]:
+        """
+        Create a chat completion and yield it as it is generated.
+
+        Takes the same arguments as chat_completion. Yields one chunk per
+        server-sent event: content deltas, tool call fragments and, last,
+        token usage. Accumulate with StreamedCompletion to get the full
+        response.
+
+        Raises:
+            OpenRouterError: On API errors, before the first chunk or when
+                the provider reports an error mid-stream
+        """
+        endpoint = "/chat/completions"
+        request_body = _chat_request_body(
+            messages, model, max_tokens, temperature, top_p, stop, tools, tool_choice,
+        )
+        request_body["stream"] = True
+        request_body["stream_options"] = {"include_usage": True}
+
+        start_time = time.time()
+        first_token_ms: Optional[int] = None
+        usage = None
+
+        try:
+            async with self._model_slot(model):
+                request = self._client.build_request(
+                    "POST", f"{self.base_url}{endpoint}", json=request_body,
+                )
+                response = await self._client.send(request, stream=True)
+                try:
+                    if response.status_code >= 400:
+                        await response.aread()
+                        self._raise_for_status(response, endpoint)
+
+                    async for line in response.aiter_lines():
+                        # SSE: skip blank separators and ": keep-alive" comments
+                        if not line.startswith("data:"):
+                            continue
+                        payload = line[len("data:"):].strip()
+                        if payload == "[DONE]":
+                            break
+
+                        data = json.loads(payload)
+                        if data.get("error"):
+                            raise OpenRouterError(
+                                message=f"OpenRouter stream error: {data['error'].get('message', '')}",
+                                code=data["error"].get("code", ""),
+                                response=data,
+                            )
+
+                        chunk = ChatCompletionChunk.from_dict(data)
+                        if first_token_ms is None and (chunk.content or chunk.tool_calls):
+                            first_token_ms = int((time.time() - start_time) * 1000)
+                        usage = chunk.usage or usage
+                        yield chunk
+                finally:
+                    await response.aclose()
+
+        except httpx.TimeoutException as e:
+            logger.error(
+                "OpenRouter API timeout",
+                extra={"endpoint": endpoint, "error": str(e)},
+            )
+            raise OpenRouterTimeoutError(f"Request timeout: {e}")
+        except httpx.RequestError as e:
+            logger.error(
+                "OpenRouter API connection error",
+                extra={"endpoint": endpoint, "error": str(e)},
+            )
+            raise OpenRouterConnectionError(f"Connection error: {e}")
+
+        logger.info(
+            "OpenRouter chat completion stream finished",
+            extra={
+                "model": model,
+                "input_tokens": usage.prompt_tokens if usage else 0,
+                "output_tokens": usage.completion_tokens if usage else 0,
+                "first_token_ms": first_token_ms,
+                "latency_ms": int((time.time() - start_time) * 1000),
+            },
+        )
+
     async def list_models(self) -> List[ModelInfo]:
         """
         List available models.
@@ -334,12 +495,78 @@ class OpenRouterClient:
             return False
 
 
+def _chat_request_body(
+    messages: List[ChatMessage],
+    model: str,
+    max_tokens: Optional[int],
+    temperature: float,
+    top_p: Optional[float],
+    stop: Optional[List[str]],
+    tools: Optional[List[ToolDefinition]],
+    tool_choice: str,
+) -> Dict[str, Any]:
+    """Build the /chat/completions request body."""
+    request_body: Dict[str, Any] = {
+        "model": model,
+        "messages": [m.to_dict() for m in messages],
+        "temperature": temperature,
+    }
+
+    if max_tokens is not None:
+        request_body["max_tokens"] = max_tokens
+    if top_p is not None:
+        request_body["top_p"] = top_p
+    if stop:
+        request_body["stop"] = stop
+    if tools:
+        request_body["tools"] = [t.to_dict() for t in tools]
+        request_body["tool_choice"] = tool_choice
+
+    return request_body
+
+
+# Shared clients, keyed by (api_key, base_url, event loop). An httpx pool
+# belongs to the loop that opened its connections, so the app's loop and
+# each worker asyncio.run() get their own client. Clients whose loop has
+# closed are closed and dropped on the next lookup; the app's clients are
+# closed by close_openrouter_clients() on shutdown.
+_ClientKey = Tuple[str, str, Optional[asyncio.AbstractEventLoop]]
+_clients: Dict[_ClientKey, OpenRouterClient] = {}
+_clients_lock = threading.Lock()
+# Close tasks for dropped clients, referenced until they finish
+_closing: Set[asyncio.Task] = set()
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _drop_clients_of_closed_loops(current: Optional[asyncio.AbstractEventLoop]) -> None:
+    """Remove clients whose event loop has closed (call with _clients_lock held)."""
+    stale = [key for key in _clients if key[2] is not None and key[2].is_closed()]
+    for key in stale:
+        client = _clients.pop(key)
+        if current is not None:
+            task = current.create_task(client.close())
+            _closing.add(task)
+            task.add_done_callback(_closing.discard)
+
+
 def get_openrouter_client(
     api_key: Optional[str] = None,
     base_url: Optional[str] = None,
 ) -> OpenRouterClient:
     """
-    Factory function to create an OpenRouterClient.
+    Get the shared OpenRouterClient for an API key and base URL.
+
+    Returns the same pooled client on every call from the same event loop,
+    so chat turns and insight enhancements reuse warm connections instead
+    of opening a new pool (and TLS handshake) per request. Callers on
+    another loop (e.g. a worker's asyncio.run()) get a client of their
+    own. Callers must not close it.
 
     Args:
         api_key: Override API key
@@ -347,8 +574,60 @@ def get_openrouter_client(
 
     Returns:
         Configured OpenRouterClient instance
+
+    Raises:
+        ValueError: If no API key is configured
     """
-    return OpenRouterClient(
-        api_key=api_key,
-        base_url=base_url,
-    )
+    resolved_key = api_key or os.getenv("OPENROUTER_API_KEY") or ""
+    resolved_url = (
+        base_url or os.getenv("OPENROUTER_BASE_URL") or DEFAULT_BASE_URL
+    ).rstrip("/")
+    loop = _running_loop()
+    key = (resolved_key, resolved_url, loop)
+
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _clients_lock:
+        _drop_clients_of_closed_loops(loop)
+        client = _clients.get(key)
+        if client is None:
+            client = OpenRouterClient(
+                api_key=resolved_key or None,
+                base_url=resolved_url,
+                limits=httpx.Limits(
+                    max_connections=OPENROUTER_MAX_CONNECTIONS,
+                    max_keepalive_connections=OPENROUTER_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=OPENROUTER_KEEPALIVE_EXPIRY_SECONDS,
+                ),
+                http2=OPENROUTER_HTTP2,
+                max_in_flight_per_model=OPENROUTER_MODEL_CONCURRENCY,
+            )
+            _clients[key] = client
+            logger.info(
+                "OpenRouter client pool created",
+                extra={"base_url": resolved_url, "http2": client.http2},
+            )
+    return client
+
+
+async def close_openrouter_clients() -> None:
+    """
+    Close the shared clients of the running loop (app shutdown).
+
+    Clients of loops that have already closed are closed too; clients of
+    other loops that are still running are left to them.
+    """
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        owned = [
+            key for key in _clients
+            if key[2] is None or key[2] is loop or key[2].is_closed()
+        ]
+        clients = [_clients.pop(key) for key in owned]
+    for client in clients:
+        try:
+            await client.close()
+        except Exception as e:
+            logger.warning("Failed to close OpenRouter client", extra={"error": str(e)})
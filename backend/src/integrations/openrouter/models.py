@@ -158,6 +158,100 @@ class ChatCompletionResponse:
         return self.usage.completion_tokens
 
 
+@dataclass
+class ToolCallDelta:
+    """A fragment of a tool call in a streamed completion.
+
+    The first fragment for an index carries id and name; arguments arrive
+    as JSON text split across fragments.
+    """
+    index: int
+    id: Optional[str] = None
+    name: Optional[str] = None
+    arguments: str = ""
+
+
+@dataclass
+class ChatCompletionChunk:
+    """One server-sent event of a streamed chat completion."""
+    content: str = ""
+    tool_calls: List[ToolCallDelta] = field(default_factory=list)
+    finish_reason: Optional[str] = None
+    usage: Optional[TokenUsage] = None
+    model: str = ""
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ChatCompletionChunk":
+        choices = data.get("choices") or []
+        choice = choices[0] if choices else {}
+        delta = choice.get("delta") or {}
+        return cls(
+            content=delta.get("content") or "",
+            tool_calls=[
+                ToolCallDelta(
+                    index=tc.get("index", 0),
+                    id=tc.get("id"),
+                    name=(tc.get("function") or {}).get("name"),
+                    arguments=(tc.get("function") or {}).get("arguments") or "",
+                )
+                for tc in delta.get("tool_calls") or []
+            ],
+            finish_reason=choice.get("finish_reason"),
+            usage=TokenUsage.from_dict(data["usage"]) if data.get("usage") else None,
+            model=data.get("model", ""),
+        )
+
+
+@dataclass
+class StreamedCompletion:
+    """
+    Accumulates streamed chunks into a complete response.
+
+    Exposes the same content / tool_calls / token properties as
+    ChatCompletionResponse so callers can treat both alike.
+    """
+    model: str = ""
+    finish_reason: Optional[str] = None
+    usage: TokenUsage = field(default_factory=TokenUsage)
+    _content: List[str] = field(default_factory=list)
+    _tool_calls: Dict[int, ToolCall] = field(default_factory=dict)
+
+    def add(self, chunk: ChatCompletionChunk) -> None:
+        if chunk.content:
+            self._content.append(chunk.content)
+        for delta in chunk.tool_calls:
+            call = self._tool_calls.setdefault(
+                delta.index, ToolCall(id="", name="", arguments=""),
+            )
+            call.id = delta.id or call.id
+            call.name = delta.name or call.name
+            call.arguments += delta.arguments
+        if chunk.finish_reason:
+            self.finish_reason = chunk.finish_reason
+        if chunk.usage:
+            self.usage = chunk.usage
+        self.model = chunk.model or self.model
+
+    @property
+    def content(self) -> str:
+        return "".join(self._content)
+
+    @property
+    def tool_calls(self) -> List[ToolCall]:
+        return [
+            ToolCall(id=c.id, name=c.name, arguments=c.arguments or "{}")
+            for _, c in sorted(self._tool_calls.items())
+        ]
+
+    @property
+    def input_tokens(self) -> int:
+        return self.usage.prompt_tokens
+
+    @property
+    def output_tokens(self) -> int:
+        return self.usage.completion_tokens
+
+
 @dataclass
 class ModelInfo:
     """Information about an available model."""
@@ -10,9 +10,22 @@ Background worker that processes queued action jobs:
 Run as a cron job or background worker:
     python -m src.jobs.action_job_worker
 
+Several worker replicas can run concurrently. Jobs are claimed with
+FOR UPDATE SKIP LOCKED and held under a lease that the owning worker
+extends with a heartbeat. RUNNING jobs whose lease has lapsed (worker
+crashed or was killed) are returned to the queue by the next worker run.
+Actions already executed by the dead worker are not re-run: the
+execution service only executes actions that are still approved/queued.
+A worker whose heartbeat finds the lease lost aborts the job: its session
+refuses any further flush or commit, so no later action reaches the
+platform and nothing the worker did after losing the lease is recorded.
+
 Configuration:
-- ACTION_JOB_BATCH_SIZE: Number of tenants to process per batch (default: 50)
-- ACTION_JOB_MAX_CONCURRENT: Max concurrent actions per job (default: 5)
+- ACTION_JOB_BATCH_SIZE: Max jobs claimed per run (default: 50)
+- ACTION_JOB_MAX_CONCURRENT: Max jobs executed concurrently per worker (default: 5)
+- ACTION_JOB_PLATFORM_CONCURRENCY: Per-platform job limits (default: meta=4,google=4,shopify=2)
+- ACTION_JOB_LEASE_SECONDS: Lease duration without a heartbeat (default: 300)
+- ACTION_JOB_HEARTBEAT_SECONDS: Lease heartbeat interval (default: 60)
 
 SECURITY:
 - All operations are tenant-scoped
@@ -29,19 +42,23 @@ Story 8.5 - Action Execution (Scoped & Reversible)
 
 import os
 import sys
+import socket
 import logging
 import asyncio
-from datetime import datetime, timezone
-from typing import Dict, List
+from contextlib import AsyncExitStack
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional
 import uuid
 
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 # Add the backend directory to the path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.database.session import get_db_session_sync
+from src.database.session import get_db_session_sync, get_session_factory
 from src.models.action_job import ActionJob, ActionJobStatus
+from src.models.ai_action import AIAction
 from src.services.action_job_runner import ActionJobRunner
 from src.services.action_job_dispatcher import dispatch_action_jobs
 from src.jobs.job_entitlements import (
@@ -59,63 +76,256 @@ logger = logging.getLogger(__name__)
 
 # Configuration
 ACTION_JOB_BATCH_SIZE = int(os.getenv("ACTION_JOB_BATCH_SIZE", "50"))
+ACTION_JOB_MAX_CONCURRENT = int(os.getenv("ACTION_JOB_MAX_CONCURRENT", "5"))
+ACTION_JOB_PLATFORM_CONCURRENCY = os.getenv(
+    "ACTION_JOB_PLATFORM_CONCURRENCY", "meta=4,google=4,shopify=2"
+)
+ACTION_JOB_LEASE_SECONDS = int(os.getenv("ACTION_JOB_LEASE_SECONDS", "300"))
+ACTION_JOB_HEARTBEAT_SECONDS = int(os.getenv("ACTION_JOB_HEARTBEAT_SECONDS", "60"))
+
+
+class ActionJobLeaseLostError(RuntimeError):
+    """A job's lease lapsed or was taken over while its actions were running."""
+
+
+def parse_platform_concurrency(spec: str) -> Dict[str, int]:
+    """
+    Parse a per-platform concurrency spec like "meta=4,google=4,shopify=2".
+
+    Malformed or non-positive entries are ignored.
+    """
+    limits: Dict[str, int] = {}
+    for entry in (spec or "").split(","):
+        name, sep, value = entry.partition("=")
+        name = name.strip().lower()
+        if not sep or not name:
+            continue
+        try:
+            limit = int(value)
+        except ValueError:
+            logger.warning(
+                "Ignoring invalid platform concurrency entry",
+                extra={"entry": entry},
+            )
+            continue
+        if limit > 0:
+            limits[name] = limit
+    return limits
 
 
 class ActionJobWorker:
     """
     Background worker for processing action jobs.
 
-    Processes queued jobs for all tenants, executing actions
-    against external platforms with full audit logging.
+    Claims queued jobs for all tenants under a lease and executes them
+    concurrently (bounded per platform), with full audit logging.
     """
 
-    def __init__(self, db_session: Session):
+    def __init__(
+        self,
+        db_session: Session,
+        session_factory: Optional[Callable[[], Session]] = None,
+        worker_id: Optional[str] = None,
+    ):
         """
         Initialize action job worker.
 
         Args:
-            db_session: Database session
+            db_session: Database session for dispatch, claiming and recovery
+            session_factory: Creates a session per concurrently executed job.
+                Without it, claimed jobs run one at a time on db_session.
+            worker_id: Lease owner identifier (default: host:pid:run)
         """
         self.db = db_session
+        self.session_factory = session_factory
         self.run_id = str(uuid.uuid4())
+        self.worker_id = worker_id or (
+            f"{socket.gethostname()}:{os.getpid()}:{self.run_id[:8]}"
+        )
+        self.platform_limits = parse_platform_concurrency(
+            ACTION_JOB_PLATFORM_CONCURRENCY
+        )
+        self._platform_semaphores: Dict[str, asyncio.Semaphore] = {}
         self.stats = {
             "jobs_processed": 0,
             "jobs_succeeded": 0,
             "jobs_failed": 0,
             "jobs_partial": 0,
+            "jobs_claimed": 0,
+            "leases_recovered": 0,
             "actions_executed": 0,
             "actions_succeeded": 0,
             "actions_failed": 0,
             "tenants_processed": 0,
             "jobs_dispatched": 0,
+            "jobs_aborted": 0,
             "errors": 0,
         }
 
-    def _get_queued_jobs(self, limit: int = 100) -> List[ActionJob]:
-        """Get queued jobs across all tenants."""
-        return (
+    # =========================================================================
+    # Leasing
+    # =========================================================================
+
+    def recover_expired_leases(self) -> int:
+        """
+        Return RUNNING jobs whose lease has lapsed to the queue.
+
+        Rows still locked by a live worker transaction are skipped.
+
+        Returns number of jobs requeued.
+        """
+        now = datetime.now(timezone.utc)
+        expired = (
+            self.db.query(ActionJob)
+            .filter(
+                ActionJob.status == ActionJobStatus.RUNNING,
+                ActionJob.lease_expires_at.isnot(None),
+                ActionJob.lease_expires_at < now,
+            )
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+
+        for job in expired:
+            logger.warning(
+                "Requeuing action job with expired lease",
+                extra={
+                    "run_id": self.run_id,
+                    "tenant_id": job.tenant_id,
+                    "job_id": job.job_id,
+                    "lease_owner": job.lease_owner,
+                },
+            )
+            job.requeue()
+
+        self.db.commit()
+        self.stats["leases_recovered"] += len(expired)
+        return len(expired)
+
+    def claim_jobs(self, limit: int = ACTION_JOB_BATCH_SIZE) -> List[str]:
+        """
+        Claim queued jobs for this worker.
+
+        Uses FOR UPDATE SKIP LOCKED so concurrent workers never claim the
+        same job. Claimed jobs are committed as RUNNING with a lease.
+
+        Returns IDs of the claimed jobs.
+        """
+        jobs = (
             self.db.query(ActionJob)
             .filter(ActionJob.status == ActionJobStatus.QUEUED)
             .order_by(ActionJob.created_at.asc())
             .limit(limit)
+            .with_for_update(skip_locked=True)
             .all()
         )
 
-    def _check_entitlement(self, tenant_id: str) -> JobEntitlementResult:
+        for job in jobs:
+            job.claim(self.worker_id, ACTION_JOB_LEASE_SECONDS)
+
+        self.db.commit()
+        self.stats["jobs_claimed"] += len(jobs)
+        return [job.job_id for job in jobs]
+
+    def _extend_lease(self, job_id: str) -> bool:
+        """
+        Extend the lease on a job this worker still owns.
+
+        Runs in its own session so it never waits on the job's transaction.
+        Returns False if the lease was lost (job requeued or finished).
+        """
+        session = self.session_factory()
+        try:
+            now = datetime.now(timezone.utc)
+            updated = (
+                session.query(ActionJob)
+                .filter(
+                    ActionJob.job_id == job_id,
+                    ActionJob.lease_owner == self.worker_id,
+                    ActionJob.status == ActionJobStatus.RUNNING,
+                )
+                .update(
+                    {
+                        ActionJob.lease_expires_at: now + timedelta(
+                            seconds=ACTION_JOB_LEASE_SECONDS
+                        ),
+                        ActionJob.heartbeat_at: now,
+                    },
+                    synchronize_session=False,
+                )
+            )
+            session.commit()
+            return updated > 0
+        finally:
+            session.close()
+
+    async def _heartbeat(self, job_id: str, lease: Dict[str, bool]) -> None:
+        """Extend the job lease periodically until cancelled."""
+        while True:
+            await asyncio.sleep(ACTION_JOB_HEARTBEAT_SECONDS)
+            try:
+                still_owned = await asyncio.to_thread(self._extend_lease, job_id)
+            except Exception as e:
+                logger.warning(
+                    "Action job lease heartbeat failed",
+                    extra={"run_id": self.run_id, "job_id": job_id, "error": str(e)},
+                )
+                continue
+            if not still_owned:
+                # The job may already be requeued for another worker; stop
+                # this job from writing anything further
+                lease["lost"] = True
+                logger.warning(
+                    "Action job lease lost, aborting job",
+                    extra={"run_id": self.run_id, "job_id": job_id},
+                )
+                return
+
+    # =========================================================================
+    # Execution
+    # =========================================================================
+
+    def _check_entitlement(self, db: Session, tenant_id: str) -> JobEntitlementResult:
         """Check if tenant is entitled to AI actions."""
-        checker = JobEntitlementChecker(self.db)
+        checker = JobEntitlementChecker(db)
         return checker.check_job_entitlement(tenant_id, JobType.AI_ACTION)
 
-    async def process_job(self, job: ActionJob) -> bool:
+    def _get_job_platforms(self, db: Session, job: ActionJob) -> List[str]:
+        """Get the distinct platforms targeted by a job's actions (sorted)."""
+        if not job.action_ids:
+            return []
+        rows = (
+            db.query(AIAction.platform)
+            .filter(
+                AIAction.tenant_id == job.tenant_id,
+                AIAction.id.in_(job.action_ids),
+            )
+            .distinct()
+            .all()
+        )
+        return sorted({(row[0] or "").lower() for row in rows if row[0]})
+
+    def _platform_semaphore(self, platform: str) -> Optional[asyncio.Semaphore]:
+        """Get the concurrency limiter for a platform (None if unbounded)."""
+        limit = self.platform_limits.get(platform)
+        if limit is None:
+            return None
+        if platform not in self._platform_semaphores:
+            self._platform_semaphores[platform] = asyncio.Semaphore(limit)
+        return self._platform_semaphores[platform]
+
+    async def process_job(self, job: ActionJob, db: Optional[Session] = None) -> bool:
         """
-        Process a single action job.
+        Process a single claimed action job.
 
         Args:
             job: ActionJob to process
+            db: Session the job is bound to (default: the worker session)
 
         Returns:
             True if job completed successfully, False otherwise
         """
+        db = db or self.db
         tenant_id = job.tenant_id
         job_id = job.job_id
 
@@ -131,7 +341,7 @@ class ActionJobWorker:
 
         try:
             # Check entitlement
-            entitlement = self._check_entitlement(tenant_id)
+            entitlement = self._check_entitlement(db, tenant_id)
             if not entitlement.is_allowed:
                 logger.warning(
                     "Job skipped due to entitlement",
@@ -142,33 +352,38 @@ class ActionJobWorker:
                     },
                 )
                 # Mark job as failed due to entitlement
-                job.status = ActionJobStatus.FAILED
-                job.error_message = f"Entitlement check failed: {entitlement.reason}"
-                job.completed_at = datetime.now(timezone.utc)
-                self.db.flush()
+                job.mark_failed(
+                    error_summary={
+                        "error": f"Entitlement check failed: {entitlement.reason}"
+                    },
+                    metadata={"reason": "entitlement"},
+                )
+                db.flush()
                 self.stats["jobs_failed"] += 1
                 return False
 
             # Create job runner and process
-            runner = ActionJobRunner(self.db, tenant_id)
-            await runner.process_job(job)
+            runner = ActionJobRunner(db)
+            result = await runner.execute_job(job)
 
-            # Update stats based on job status
+            # Update stats based on job result
             self.stats["jobs_processed"] += 1
-            self.stats["actions_executed"] += (job.succeeded_count or 0) + (job.failed_count or 0)
-            self.stats["actions_succeeded"] += job.succeeded_count or 0
-            self.stats["actions_failed"] += job.failed_count or 0
+            self.stats["actions_executed"] += result.actions_attempted
+            self.stats["actions_succeeded"] += result.actions_succeeded
+            self.stats["actions_failed"] += result.actions_failed
 
-            if job.status == ActionJobStatus.SUCCEEDED:
+            if result.status == ActionJobStatus.SUCCEEDED:
                 self.stats["jobs_succeeded"] += 1
                 return True
-            elif job.status == ActionJobStatus.PARTIAL_SUCCESS:
+            elif result.status == ActionJobStatus.PARTIALLY_SUCCEEDED:
                 self.stats["jobs_partial"] += 1
                 return True  # Partial success is still a "success" for the worker
             else:
                 self.stats["jobs_failed"] += 1
                 return False
 
+        except ActionJobLeaseLostError:
+            raise
         except Exception as e:
             logger.error(
                 "Error processing action job",
@@ -184,13 +399,81 @@ class ActionJobWorker:
             self.stats["jobs_failed"] += 1
 
             # Mark job as failed
-            job.status = ActionJobStatus.FAILED
-            job.error_message = f"Worker error: {str(e)}"
-            job.completed_at = datetime.now(timezone.utc)
-            self.db.flush()
+            job.mark_failed(
+                error_summary={"error": f"Worker error: {str(e)}"},
+                metadata={"exception_type": type(e).__name__},
+            )
+            db.flush()
 
             return False
 
+    async def _run_claimed_job(self, job_id: str, db: Session) -> Optional[str]:
+        """
+        Execute one claimed job under its platform limits and lease heartbeat.
+
+        Once the heartbeat reports the lease lost, every further flush or
+        commit on the session raises ActionJobLeaseLostError: the action in
+        flight is not recorded, later actions fail before reaching their
+        platform, and the job is rolled back.
+
+        Returns the job's tenant_id, or None if the job is no longer ours.
+        """
+        job = db.query(ActionJob).filter(ActionJob.job_id == job_id).first()
+        if job is None or job.lease_owner != self.worker_id:
+            return None
+
+        platforms = self._get_job_platforms(db, job)
+        tenant_id = job.tenant_id
+        lease = {"lost": False}
+
+        def _abort_if_lease_lost(session: Session, *args) -> None:
+            if lease["lost"]:
+                raise ActionJobLeaseLostError(f"Lease lost on action job {job_id}")
+
+        heartbeat = None
+        if self.session_factory is not None:
+            heartbeat = asyncio.create_task(self._heartbeat(job_id, lease))
+            event.listen(db, "before_flush", _abort_if_lease_lost)
+            event.listen(db, "before_commit", _abort_if_lease_lost)
+
+        try:
+            async with AsyncExitStack() as stack:
+                # Acquire in sorted order so multi-platform jobs cannot deadlock
+                for platform in platforms:
+                    semaphore = self._platform_semaphore(platform)
+                    if semaphore is not None:
+                        await stack.enter_async_context(semaphore)
+                await self.process_job(job, db)
+
+            job.release_lease()
+            db.commit()
+        except ActionJobLeaseLostError:
+            db.rollback()
+            self.stats["jobs_aborted"] += 1
+            logger.warning(
+                "Action job aborted after losing its lease",
+                extra={"run_id": self.run_id, "tenant_id": tenant_id, "job_id": job_id},
+            )
+            return None
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            if heartbeat is not None:
+                heartbeat.cancel()
+                event.remove(db, "before_flush", _abort_if_lease_lost)
+                event.remove(db, "before_commit", _abort_if_lease_lost)
+
+        return job.tenant_id
+
+    async def _run_claimed_job_in_session(self, job_id: str) -> Optional[str]:
+        """Execute one claimed job in its own session."""
+        db = self.session_factory()
+        try:
+            return await self._run_claimed_job(job_id, db)
+        finally:
+            db.close()
+
     async def dispatch_new_jobs(self) -> int:
         """
         Dispatch new jobs for approved actions.
@@ -227,39 +510,63 @@ class ActionJobWorker:
         """
         Run the action job worker.
 
-        Processes all queued jobs and dispatches new ones.
+        Dispatches new jobs, requeues jobs with expired leases, then claims
+        and executes queued jobs.
 
         Returns run statistics.
         """
         start_time = datetime.now(timezone.utc)
         logger.info(
             "Starting action job worker",
-            extra={"run_id": self.run_id},
+            extra={"run_id": self.run_id, "worker_id": self.worker_id},
         )
 
         try:
             # First, dispatch new jobs for approved actions
             await self.dispatch_new_jobs()
 
-            # Get all queued jobs
-            jobs = self._get_queued_jobs(limit=ACTION_JOB_BATCH_SIZE)
+            # Reclaim jobs abandoned by dead workers
+            self.recover_expired_leases()
+
+            job_ids = self.claim_jobs(limit=ACTION_JOB_BATCH_SIZE)
             logger.info(
-                f"Found {len(jobs)} queued jobs to process",
-                extra={"run_id": self.run_id},
+                f"Claimed {len(job_ids)} queued jobs to process",
+                extra={"run_id": self.run_id, "worker_id": self.worker_id},
             )
 
-            # Track unique tenants
-            tenants_seen = set()
-
-            # Process jobs
-            for job in jobs:
-                tenants_seen.add(job.tenant_id)
-                await self.process_job(job)
+            if self.session_factory is None:
+                tenant_ids = []
+                for job_id in job_ids:
+                    tenant_ids.append(await self._run_claimed_job(job_id, self.db))
+            else:
+                pool = asyncio.Semaphore(max(1, ACTION_JOB_MAX_CONCURRENT))
 
-                # Commit after each job
-                self.db.commit()
+                async def _bounded(job_id: str) -> Optional[str]:
+                    async with pool:
+                        return await self._run_claimed_job_in_session(job_id)
 
-            self.stats["tenants_processed"] = len(tenants_seen)
+                outcomes = await asyncio.gather(
+                    *(_bounded(job_id) for job_id in job_ids),
+                    return_exceptions=True,
+                )
+                tenant_ids = []
+                for job_id, outcome in zip(job_ids, outcomes):
+                    if isinstance(outcome, Exception):
+                        self.stats["errors"] += 1
+                        logger.error(
+                            "Action job execution failed",
+                            extra={
+                                "run_id": self.run_id,
+                                "job_id": job_id,
+                                "error": str(outcome),
+                            },
+                        )
+                    else:
+                        tenant_ids.append(outcome)
+
+            self.stats["tenants_processed"] = len(
+                {tenant_id for tenant_id in tenant_ids if tenant_id}
+            )
 
         except Exception as e:
             self.stats["errors"] += 1
@@ -296,7 +603,9 @@ async def main():
 
     try:
         for session in get_db_session_sync():
-            worker = ActionJobWorker(session)
+            worker = ActionJobWorker(
+                session, session_factory=get_session_factory()
+            )
             stats = await worker.run()
             logger.info("Action Job Worker stats", extra=stats)
     except Exception as e:
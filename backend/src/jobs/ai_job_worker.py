@@ -0,0 +1,601 @@
+"""
+AI Job Worker for Stories 8.1, 8.3 and 8.4.
+
+Background worker that runs the AI generation pipeline through one
+leased worker pool:
+- Claims QUEUED insight, recommendation and action proposal jobs with
+  FOR UPDATE SKIP LOCKED, under a lease the worker extends by heartbeat
+- Requeues RUNNING jobs whose lease has lapsed (worker crashed or killed),
+  and aborts a job whose lease this worker lost before it committed
+- Executes claimed jobs concurrently, each in its own session on a worker
+  thread (generation is DB-bound; LLM enhancement within a job already
+  runs its calls concurrently on an event loop)
+- Chains stages in-process: when a tenant's insight job succeeds, a
+  recommendation job is dispatched and run immediately, then an action
+  proposal job, instead of waiting for the next cron tick of each stage
+
+Fairness: claimed jobs are interleaved round-robin across tenants, and at
+most AI_JOB_TENANT_CONCURRENCY jobs (chains) per tenant run at once, so a
+tenant with work queued in every stage cannot fill the pool.
+
+Run as a cron job or background worker:
+    python -m src.jobs.ai_job_worker
+
+Configuration:
+- AI_JOB_BATCH_SIZE: Max jobs claimed per stage per run (default: 50)
+- AI_JOB_MAX_CONCURRENT: Max jobs executed concurrently per worker (default: 8)
+- AI_JOB_TENANT_CONCURRENCY: Max concurrent jobs per tenant (default: 1)
+- AI_JOB_LEASE_SECONDS: Lease duration without a heartbeat (default: 600)
+- AI_JOB_HEARTBEAT_SECONDS: Lease heartbeat interval (default: 60)
+
+SECURITY:
+- All operations are tenant-scoped (tenant_id from the job row)
+- Entitlements are enforced by the stage dispatchers
+
+Story 8.1 / 8.3 / 8.4 - AI Insights, Recommendations and Action Proposals
+"""
+
+import os
+import sys
+import socket
+import logging
+import asyncio
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import uuid
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# Add the backend directory to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.database.session import get_db_session_sync, get_session_factory
+from src.models.action_proposal_job import (
+    ActionProposalJob,
+    ActionProposalJobCadence,
+    ActionProposalJobStatus,
+)
+from src.models.insight_job import InsightJob, InsightJobStatus
+from src.models.recommendation_job import (
+    RecommendationJob,
+    RecommendationJobCadence,
+)
+from src.services.action_proposal_job_dispatcher import ActionProposalJobDispatcher
+from src.services.action_proposal_job_runner import ActionProposalJobRunner
+from src.services.insight_generation_service import DEFAULT_PERIOD_TYPES
+from src.services.insight_job_runner import InsightJobRunner
+from src.services.insight_metric_frame import TenantMetrics, load_tenant_metrics
+from src.services.recommendation_job_dispatcher import RecommendationJobDispatcher
+from src.services.recommendation_job_runner import RecommendationJobRunner
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Configuration
+AI_JOB_BATCH_SIZE = int(os.getenv("AI_JOB_BATCH_SIZE", "50"))
+AI_JOB_MAX_CONCURRENT = int(os.getenv("AI_JOB_MAX_CONCURRENT", "8"))
+AI_JOB_TENANT_CONCURRENCY = int(os.getenv("AI_JOB_TENANT_CONCURRENCY", "1"))
+AI_JOB_LEASE_SECONDS = int(os.getenv("AI_JOB_LEASE_SECONDS", "600"))
+AI_JOB_HEARTBEAT_SECONDS = int(os.getenv("AI_JOB_HEARTBEAT_SECONDS", "60"))
+
+
+class AIJobLeaseLostError(RuntimeError):
+    """A job's lease lapsed or was taken over before its results were committed."""
+
+
+@dataclass(frozen=True)
+class AIJobStage:
+    """One stage of the AI pipeline."""
+
+    name: str
+    model: type
+    next_stage: Optional[str] = None
+
+
+STAGES: Dict[str, AIJobStage] = {
+    "insight": AIJobStage("insight", InsightJob, next_stage="recommendation"),
+    "recommendation": AIJobStage("recommendation", RecommendationJob, next_stage="proposal"),
+    "proposal": AIJobStage("proposal", ActionProposalJob),
+}
+
+
+def _status(model: type, name: str):
+    """Member of a job model's status enum by name (e.g. QUEUED)."""
+    return model.__table__.c.status.type.enum_class[name]
+
+
+def interleave_by_tenant(claims: List[Tuple[str, str, str]]) -> List[Tuple[str, str, str]]:
+    """
+    Order (stage, job_id, tenant_id) claims round-robin across tenants.
+
+    Each tenant's first job comes before any tenant's second job; claim
+    order is otherwise preserved.
+    """
+    per_tenant: Dict[str, List[Tuple[str, str, str]]] = {}
+    for claim in claims:
+        per_tenant.setdefault(claim[2], []).append(claim)
+
+    ordered = []
+    queues = list(per_tenant.values())
+    depth = 0
+    while len(ordered) < len(claims):
+        for queue in queues:
+            if depth < len(queue):
+                ordered.append(queue[depth])
+        depth += 1
+    return ordered
+
+
+class AIJobWorker:
+    """
+    Background worker for insight, recommendation and proposal jobs.
+
+    Claims queued jobs of every stage under a lease, executes them in a
+    bounded pool with per-tenant limits and chains follow-on stages.
+    """
+
+    def __init__(
+        self,
+        db_session: Session,
+        session_factory: Optional[Callable[[], Session]] = None,
+        worker_id: Optional[str] = None,
+    ):
+        """
+        Initialize AI job worker.
+
+        Args:
+            db_session: Database session for claiming and recovery
+            session_factory: Creates a session per concurrently executed job.
+                Without it, claimed jobs run one at a time on db_session.
+            worker_id: Lease owner identifier (default: host:pid:run)
+        """
+        self.db = db_session
+        self.session_factory = session_factory
+        self.run_id = str(uuid.uuid4())
+        self.worker_id = worker_id or (
+            f"{socket.gethostname()}:{os.getpid()}:{self.run_id[:8]}"
+        )
+        self._tenant_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._insight_metrics: Dict[str, TenantMetrics] = {}
+        self._stats_lock = threading.Lock()
+        self.stats = {
+            "jobs_claimed": 0,
+            "jobs_processed": 0,
+            "jobs_succeeded": 0,
+            "jobs_failed": 0,
+            "jobs_chained": 0,
+            "jobs_aborted": 0,
+            "leases_recovered": 0,
+            "tenants_processed": 0,
+            "errors": 0,
+        }
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    # =========================================================================
+    # Leasing
+    # =========================================================================
+
+    def recover_expired_leases(self) -> int:
+        """
+        Return RUNNING jobs of every stage whose lease has lapsed to the queue.
+
+        Rows still locked by a live worker transaction are skipped.
+
+        Returns number of jobs requeued.
+        """
+        now = datetime.now(timezone.utc)
+        recovered = 0
+        for stage in STAGES.values():
+            model = stage.model
+            expired = (
+                self.db.query(model)
+                .filter(
+                    model.status == _status(model, "RUNNING"),
+                    model.lease_expires_at.isnot(None),
+                    model.lease_expires_at < now,
+                )
+                .with_for_update(skip_locked=True)
+                .all()
+            )
+            for job in expired:
+                logger.warning(
+                    "Requeuing AI job with expired lease",
+                    extra={
+                        "run_id": self.run_id,
+                        "stage": stage.name,
+                        "tenant_id": job.tenant_id,
+                        "job_id": job.job_id,
+                        "lease_owner": job.lease_owner,
+                    },
+                )
+                job.requeue()
+            recovered += len(expired)
+
+        self.db.commit()
+        self._count("leases_recovered", recovered)
+        return recovered
+
+    def _claim(self, db: Session, stage: AIJobStage, limit: int, job_id: Optional[str] = None) -> list:
+        """Claim up to limit queued jobs of a stage (or one specific job)."""
+        model = stage.model
+        query = db.query(model).filter(
+            model.status == _status(model, "QUEUED")
+        )
+        if job_id is not None:
+            query = query.filter(model.job_id == job_id)
+        jobs = (
+            query.order_by(model.created_at.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        for job in jobs:
+            job.claim(self.worker_id, AI_JOB_LEASE_SECONDS)
+        db.commit()
+        self._count("jobs_claimed", len(jobs))
+        return jobs
+
+    def claim_jobs(self, limit: int = AI_JOB_BATCH_SIZE) -> List[Tuple[str, str, str]]:
+        """
+        Claim queued jobs of every stage for this worker.
+
+        Returns (stage, job_id, tenant_id) for the claimed jobs, interleaved
+        across tenants.
+        """
+        claims = []
+        for stage in STAGES.values():
+            for job in self._claim(self.db, stage, limit):
+                claims.append((stage.name, job.job_id, job.tenant_id))
+        return interleave_by_tenant(claims)
+
+    def _extend_lease(self, stage_name: str, job_id: str) -> bool:
+        """
+        Extend the lease on a job this worker still owns.
+
+        Runs in its own session so it never waits on the job's transaction.
+        Returns False if the lease was lost (job requeued or finished).
+        """
+        model = STAGES[stage_name].model
+        session = self.session_factory()
+        try:
+            now = datetime.now(timezone.utc)
+            updated = (
+                session.query(model)
+                .filter(
+                    model.job_id == job_id,
+                    model.lease_owner == self.worker_id,
+                    model.status == _status(model, "RUNNING"),
+                )
+                .update(
+                    {
+                        model.lease_expires_at: now + timedelta(seconds=AI_JOB_LEASE_SECONDS),
+                        model.heartbeat_at: now,
+                    },
+                    synchronize_session=False,
+                )
+            )
+            session.commit()
+            return updated > 0
+        finally:
+            session.close()
+
+    async def _heartbeat(self, current: Dict[str, Any]) -> None:
+        """Extend the lease of the chain's current job until cancelled or lost."""
+        while True:
+            await asyncio.sleep(AI_JOB_HEARTBEAT_SECONDS)
+            stage_name, job_id = current["stage"], current["job_id"]
+            try:
+                still_owned = await asyncio.to_thread(self._extend_lease, stage_name, job_id)
+            except Exception as e:
+                logger.warning(
+                    "AI job lease heartbeat failed",
+                    extra={"run_id": self.run_id, "job_id": job_id, "error": str(e)},
+                )
+                continue
+            if not still_owned:
+                # The job may already be requeued for another worker; stop
+                # this chain from committing anything further
+                current["lease_lost"] = True
+                logger.warning(
+                    "AI job lease lost, aborting job",
+                    extra={"run_id": self.run_id, "stage": stage_name, "job_id": job_id},
+                )
+                return
+
+    # =========================================================================
+    # Stages
+    # =========================================================================
+
+    def _load_insight_metrics(self, claims: List[Tuple[str, str, str]]) -> None:
+        """Load mart frames for all claimed insight jobs in one batch."""
+        tenant_ids = [tenant_id for stage, _, tenant_id in claims if stage == "insight"]
+        if not tenant_ids:
+            return
+        try:
+            self._insight_metrics = load_tenant_metrics(self.db, tenant_ids, DEFAULT_PERIOD_TYPES)
+        except Exception as e:
+            logger.warning(
+                "Batch metric load failed, loading per job",
+                extra={"run_id": self.run_id, "error": str(e)},
+            )
+            self.db.rollback()
+            self._insight_metrics = {}
+
+    def _execute_stage(self, db: Session, stage: AIJobStage, job) -> bool:
+        """Run one claimed job; True if it succeeded."""
+        if stage.name == "insight":
+            InsightJobRunner(db).execute_job(job, metrics=self._insight_metrics.get(job.tenant_id))
+            return job.status == InsightJobStatus.SUCCESS
+        if stage.name == "recommendation":
+            return RecommendationJobRunner(db).execute_job(job)
+        ActionProposalJobRunner(db, job.tenant_id).execute_job(job)
+        return job.status == ActionProposalJobStatus.SUCCESS
+
+    def _dispatch_next(self, db: Session, stage: AIJobStage, job) -> Optional[Any]:
+        """Dispatch the follow-on job for the tenant, if there is new work."""
+        if stage.name == "insight":
+            if not job.insights_generated:
+                return None
+            return RecommendationJobDispatcher(db, job.tenant_id).dispatch(
+                RecommendationJobCadence(job.cadence.value)
+            )
+        if stage.name == "recommendation":
+            if not job.recommendations_generated:
+                return None
+            next_job = ActionProposalJobDispatcher(db, job.tenant_id).dispatch_if_needed(
+                ActionProposalJobCadence(job.cadence.value)
+            )
+            db.commit()
+            return next_job
+        return None
+
+    def _run_claimed_job(
+        self,
+        db: Session,
+        stage: AIJobStage,
+        job_id: str,
+    ) -> Optional[Tuple[AIJobStage, str]]:
+        """
+        Execute one claimed job and chain its follow-on stage.
+
+        Returns the (stage, job_id) of the claimed follow-on job, if any.
+        """
+        model = stage.model
+        job = db.query(model).filter(model.job_id == job_id).first()
+        if job is None or job.lease_owner != self.worker_id:
+            return None
+
+        try:
+            succeeded = self._execute_stage(db, stage, job)
+            job.release_lease()
+            db.commit()
+        except AIJobLeaseLostError:
+            db.rollback()
+            self._count("jobs_aborted")
+            logger.warning(
+                "AI job aborted after losing its lease",
+                extra={
+                    "run_id": self.run_id,
+                    "stage": stage.name,
+                    "tenant_id": job.tenant_id,
+                    "job_id": job_id,
+                },
+            )
+            return None
+        except Exception as e:
+            db.rollback()
+            self._count("errors")
+            logger.error(
+                "AI job execution failed",
+                extra={
+                    "run_id": self.run_id,
+                    "stage": stage.name,
+                    "tenant_id": job.tenant_id,
+                    "job_id": job_id,
+                    "error": str(e),
+                },
+                exc_info=True,
+            )
+            return None
+
+        self._count("jobs_processed")
+        self._count("jobs_succeeded" if succeeded else "jobs_failed")
+        if not succeeded or stage.next_stage is None:
+            return None
+
+        next_stage = STAGES[stage.next_stage]
+        try:
+            next_job = self._dispatch_next(db, stage, job)
+            if next_job is None:
+                return None
+            claimed = self._claim(db, next_stage, 1, job_id=next_job.job_id)
+        except Exception as e:
+            db.rollback()
+            self._count("errors")
+            logger.error(
+                "Failed to chain AI job",
+                extra={
+                    "run_id": self.run_id,
+                    "stage": next_stage.name,
+                    "tenant_id": job.tenant_id,
+                    "error": str(e),
+                },
+                exc_info=True,
+            )
+            return None
+
+        if not claimed:
+            # Another worker picked it up first
+            return None
+
+        self._count("jobs_chained")
+        logger.info(
+            "AI job chained",
+            extra={
+                "run_id": self.run_id,
+                "tenant_id": job.tenant_id,
+                "from_stage": stage.name,
+                "to_stage": next_stage.name,
+                "job_id": claimed[0].job_id,
+            },
+        )
+        return next_stage, claimed[0].job_id
+
+    def _run_chain(self, db: Session, stage_name: str, job_id: str, current: Dict[str, str]) -> None:
+        """Run a claimed job and every stage it chains into on one session."""
+        step: Optional[Tuple[AIJobStage, str]] = (STAGES[stage_name], job_id)
+        while step is not None:
+            current["stage"], current["job_id"] = step[0].name, step[1]
+            step = self._run_claimed_job(db, *step)
+
+    def _run_chain_in_session(self, stage_name: str, job_id: str, current: Dict[str, Any]) -> None:
+        """
+        Run a chain in its own session (worker thread).
+
+        Once the heartbeat reports the lease lost, every further commit on
+        the session raises AIJobLeaseLostError, so the job's results are
+        rolled back and the chain stops.
+        """
+        db = self.session_factory()
+
+        def _abort_if_lease_lost(session: Session) -> None:
+            if current.get("lease_lost"):
+                raise AIJobLeaseLostError(
+                    f"Lease lost on {current['stage']} job {current['job_id']}"
+                )
+
+        event.listen(db, "before_commit", _abort_if_lease_lost)
+        try:
+            self._run_chain(db, stage_name, job_id, current)
+        finally:
+            event.remove(db, "before_commit", _abort_if_lease_lost)
+            db.close()
+
+    def _tenant_semaphore(self, tenant_id: str) -> asyncio.Semaphore:
+        if tenant_id not in self._tenant_semaphores:
+            self._tenant_semaphores[tenant_id] = asyncio.Semaphore(
+                max(1, AI_JOB_TENANT_CONCURRENCY)
+            )
+        return self._tenant_semaphores[tenant_id]
+
+    async def run(self) -> Dict:
+        """
+        Run the AI job worker.
+
+        Requeues jobs with expired leases, then claims and executes queued
+        jobs of every stage, chaining follow-on stages per tenant.
+
+        Returns run statistics.
+        """
+        start_time = datetime.now(timezone.utc)
+        logger.info(
+            "Starting AI job worker",
+            extra={"run_id": self.run_id, "worker_id": self.worker_id},
+        )
+
+        try:
+            # Reclaim jobs abandoned by dead workers
+            self.recover_expired_leases()
+
+            claims = self.claim_jobs(limit=AI_JOB_BATCH_SIZE)
+            logger.info(
+                f"Claimed {len(claims)} queued AI jobs to process",
+                extra={"run_id": self.run_id, "worker_id": self.worker_id},
+            )
+            self._load_insight_metrics(claims)
+
+            if self.session_factory is None:
+                for stage_name, job_id, _ in claims:
+                    self._run_chain(self.db, stage_name, job_id, {})
+            else:
+                pool = asyncio.Semaphore(max(1, AI_JOB_MAX_CONCURRENT))
+
+                async def _bounded(stage_name: str, job_id: str, tenant_id: str) -> None:
+                    async with self._tenant_semaphore(tenant_id), pool:
+                        current = {"stage": stage_name, "job_id": job_id}
+                        heartbeat = asyncio.create_task(self._heartbeat(current))
+                        try:
+                            await asyncio.to_thread(
+                                self._run_chain_in_session, stage_name, job_id, current
+                            )
+                        finally:
+                            heartbeat.cancel()
+
+                outcomes = await asyncio.gather(
+                    *(_bounded(*claim) for claim in claims),
+                    return_exceptions=True,
+                )
+                for (stage_name, job_id, _), outcome in zip(claims, outcomes):
+                    if isinstance(outcome, Exception):
+                        self._count("errors")
+                        logger.error(
+                            "AI job chain failed",
+                            extra={
+                                "run_id": self.run_id,
+                                "stage": stage_name,
+                                "job_id": job_id,
+                                "error": str(outcome),
+                            },
+                        )
+
+            self.stats["tenants_processed"] = len({tenant_id for _, _, tenant_id in claims})
+
+        except Exception as e:
+            self._count("errors")
+            logger.error(
+                "AI job worker failed",
+                extra={
+                    "run_id": self.run_id,
+                    "error": str(e),
+                },
+                exc_info=True,
+            )
+
+        end_time = datetime.now(timezone.utc)
+        duration = (end_time - start_time).total_seconds()
+
+        self.stats["duration_seconds"] = duration
+        self.stats["run_id"] = self.run_id
+
+        logger.info(
+            "AI job worker completed",
+            extra={
+                "run_id": self.run_id,
+                "duration_seconds": duration,
+                **self.stats,
+            },
+        )
+
+        return self.stats
+
+
+async def main():
+    """Main entry point for AI job worker."""
+    logger.info("AI Job Worker starting")
+
+    try:
+        for session in get_db_session_sync():
+            worker = AIJobWorker(
+                session, session_factory=get_session_factory()
+            )
+            stats = await worker.run()
+            logger.info("AI Job Worker stats", extra=stats)
+    except Exception as e:
+        logger.error("AI Job Worker failed", extra={"error": str(e)}, exc_info=True)
+        sys.exit(1)
+
+    logger.info("AI Job Worker finished")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
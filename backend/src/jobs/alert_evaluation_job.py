@@ -8,6 +8,7 @@ Per-tenant error isolation — one tenant's failure doesn't block others.
 import logging
 from sqlalchemy import text
 from src.services.alert_rule_service import AlertRuleService
+from src.services.budget_pacing_service import get_pacing_for_tenants
 
 logger = logging.getLogger(__name__)
 
@@ -29,11 +30,24 @@ class AlertEvaluationWorker:
             logger.error("Failed to query tenant list for alert evaluation: %s", exc)
             return stats
 
+        # Budget pacing for every tenant in one pass (budget_pace_ratio rules)
+        try:
+            pacing_by_tenant = get_pacing_for_tenants(
+                self.db, [row.tenant_id for row in tenant_rows]
+            )
+        except Exception as exc:
+            logger.warning("Failed to compute batch budget pacing: %s", exc)
+            pacing_by_tenant = None
+
         for row in tenant_rows:
             tenant_id = row.tenant_id
             stats["tenants"] += 1
             try:
-                svc = AlertRuleService(self.db, tenant_id)
+                pacing = (
+                    pacing_by_tenant.get(tenant_id, [])
+                    if pacing_by_tenant is not None else None
+                )
+                svc = AlertRuleService(self.db, tenant_id, pacing=pacing)
                 result = svc.evaluate_rules()
                 stats["evaluated"] += result.get("evaluated", 0)
                 stats["triggered"] += result.get("triggered", 0)
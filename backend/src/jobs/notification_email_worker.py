@@ -3,7 +3,9 @@ Notification Email Worker for Story 9.1.
 
 Background worker that processes queued notification emails:
 - Picks up notifications with email_queued_at set but email_sent_at null
-- Sends emails via configured email provider
+- Groups them per recipient; bursts (e.g. connector failure storms) are
+  coalesced into one digest email
+- Sends emails via configured email provider, several recipients at a time
 - Records success/failure status
 
 Run as a cron job or background worker:
@@ -11,6 +13,9 @@ Run as a cron job or background worker:
 
 Configuration:
 - NOTIFICATION_EMAIL_BATCH_SIZE: Number of emails to process per batch (default: 50)
+- NOTIFICATION_EMAIL_CONCURRENCY: Recipients sent to concurrently (default: 10)
+- NOTIFICATION_EMAIL_DIGEST_THRESHOLD: Pending emails for one recipient at which
+  they are sent as a single digest (default: 3)
 - NOTIFICATION_EMAIL_PROVIDER: Email provider (sendgrid, smtp, mock)
 
 SECURITY:
@@ -25,7 +30,7 @@ import sys
 import logging
 import asyncio
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import uuid
 
 import httpx
@@ -49,6 +54,8 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 NOTIFICATION_EMAIL_BATCH_SIZE = int(os.getenv("NOTIFICATION_EMAIL_BATCH_SIZE", "50"))
+NOTIFICATION_EMAIL_CONCURRENCY = int(os.getenv("NOTIFICATION_EMAIL_CONCURRENCY", "10"))
+NOTIFICATION_EMAIL_DIGEST_THRESHOLD = int(os.getenv("NOTIFICATION_EMAIL_DIGEST_THRESHOLD", "3"))
 
 
 def validate_worker_environment() -> None:
@@ -67,17 +74,19 @@ EMAIL_SUBJECTS = {
 }
 
 
-def _build_email_html(notification: Notification) -> str:
-    """Build HTML email body from notification."""
-    action_link = ""
-    if notification.action_url:
-        base_url = os.getenv("APP_BASE_URL", "")
-        if not base_url:
-            logger.warning("APP_BASE_URL not set — email links will be broken")
-            base_url = "https://app.example.com"
-        full_url = f"{base_url}{notification.action_url}"
-        action_link = f'<p><a href="{full_url}" style="display: inline-block; padding: 10px 20px; background-color: #4CAF50; color: white; text-decoration: none; border-radius: 4px;">View Details</a></p>'
+def _action_link_url(notification: Notification) -> Optional[str]:
+    """Absolute URL for the notification's action link, if it has one."""
+    if not notification.action_url:
+        return None
+    base_url = os.getenv("APP_BASE_URL", "")
+    if not base_url:
+        logger.warning("APP_BASE_URL not set — email links will be broken")
+        base_url = "https://app.example.com"
+    return f"{base_url}{notification.action_url}"
+
 
+def _wrap_email_html(heading: str, content: str) -> str:
+    """Wrap body content in the shared notification email layout."""
     return f"""
     <!DOCTYPE html>
     <html>
@@ -94,11 +103,10 @@ def _build_email_html(notification: Notification) -> str:
     <body>
         <div class="container">
             <div class="header">
-                <h2 style="margin: 0; color: #212529;">{notification.title}</h2>
+                <h2 style="margin: 0; color: #212529;">{heading}</h2>
             </div>
             <div class="content">
-                <p>{notification.message}</p>
-                {action_link}
+                {content}
             </div>
             <div class="footer">
                 <p>This is an automated notification from Shopify Analytics.</p>
@@ -110,23 +118,79 @@ def _build_email_html(notification: Notification) -> str:
     """
 
 
+def _build_email_html(notification: Notification) -> str:
+    """Build HTML email body from notification."""
+    action_link = ""
+    full_url = _action_link_url(notification)
+    if full_url:
+        action_link = f'<p><a href="{full_url}" style="display: inline-block; padding: 10px 20px; background-color: #4CAF50; color: white; text-decoration: none; border-radius: 4px;">View Details</a></p>'
+
+    return _wrap_email_html(
+        notification.title,
+        f"""<p>{notification.message}</p>
+                {action_link}""",
+    )
+
+
 def _build_email_text(notification: Notification) -> str:
     """Build plain text email body from notification."""
     text = f"{notification.title}\n\n{notification.message}"
-    if notification.action_url:
-        base_url = os.getenv("APP_BASE_URL", "")
-        if not base_url:
-            logger.warning("APP_BASE_URL not set — email links will be broken")
-            base_url = "https://app.example.com"
-        text += f"\n\nView details: {base_url}{notification.action_url}"
+    full_url = _action_link_url(notification)
+    if full_url:
+        text += f"\n\nView details: {full_url}"
     return text
 
 
+def _digest_subject(notifications: List[Notification]) -> str:
+    """Subject for a digest: the event's subject when all share one type."""
+    event_types = {n.event_type for n in notifications}
+    if len(event_types) == 1:
+        subject = EMAIL_SUBJECTS.get(
+            notifications[0].event_type,
+            "Notifications from Shopify Analytics",
+        )
+    else:
+        subject = "Notifications from Shopify Analytics"
+    return f"{subject} ({len(notifications)} updates)"
+
+
+def _build_digest_html(notifications: List[Notification]) -> str:
+    """Build HTML digest body listing each notification."""
+    items = []
+    for notification in notifications:
+        full_url = _action_link_url(notification)
+        link = f' <a href="{full_url}">View details</a>' if full_url else ""
+        items.append(
+            f"<li><strong>{notification.title}</strong><br>{notification.message}{link}</li>"
+        )
+    return _wrap_email_html(
+        f"You have {len(notifications)} new notifications",
+        f"<ul>{''.join(items)}</ul>",
+    )
+
+
+def _build_digest_text(notifications: List[Notification]) -> str:
+    """Build plain text digest body listing each notification."""
+    sections = [f"You have {len(notifications)} new notifications"]
+    for notification in notifications:
+        section = f"- {notification.title}\n  {notification.message}"
+        full_url = _action_link_url(notification)
+        if full_url:
+            section += f"\n  View details: {full_url}"
+        sections.append(section)
+    return "\n\n".join(sections)
+
+
 class NotificationEmailWorker:
     """
     Background worker for processing notification emails.
 
-    Processes queued emails across all tenants.
+    Processes queued emails across all tenants. Pending emails are grouped
+    per recipient; a recipient with NOTIFICATION_EMAIL_DIGEST_THRESHOLD or
+    more gets one digest instead of one email each. Up to
+    NOTIFICATION_EMAIL_CONCURRENCY recipients are handled at once, and each
+    such wave is committed before the next starts, so a crash re-sends at
+    most one wave.
     """
 
     def __init__(
@@ -146,6 +210,9 @@ class NotificationEmailWorker:
         self.clerk_secret_key = os.getenv("CLERK_SECRET_KEY", "").strip()
         self.clerk_api_base_url = os.getenv("CLERK_API_BASE_URL", "https://api.clerk.com").rstrip("/")
         self.missing_email_policy = os.getenv("NOTIFICATION_MISSING_EMAIL_POLICY", "fail").lower()
+        self._owns_email_sender = email_sender is None
+        self._clerk_client: Optional[httpx.Client] = None
+        self._user_emails: Dict[str, Optional[str]] = {}
         self.run_id = str(uuid.uuid4())
         self.stats = {
             "processed": 0,
@@ -153,8 +220,23 @@ class NotificationEmailWorker:
             "failed": 0,
             "skipped": 0,
             "errors": 0,
+            "digests": 0,
         }
 
+    def _get_clerk_client(self) -> httpx.Client:
+        """Pooled Clerk API client, reused for every lookup in the run."""
+        if self._clerk_client is None:
+            self._clerk_client = httpx.Client(timeout=10.0)
+        return self._clerk_client
+
+    async def close(self) -> None:
+        """Close pooled connections held by the worker."""
+        if self._clerk_client is not None:
+            self._clerk_client.close()
+            self._clerk_client = None
+        if self._owns_email_sender:
+            await self.email_sender.aclose()
+
     def _get_pending_emails(self, limit: int = 50) -> List[Notification]:
         """Get notifications pending email delivery."""
         return (
@@ -186,8 +268,7 @@ class NotificationEmailWorker:
         headers = {"Authorization": f"Bearer {self.clerk_secret_key}"}
 
         try:
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(user_url, headers=headers)
+            response = self._get_clerk_client().get(user_url, headers=headers)
 
             if response.status_code == 404:
                 logger.warning(
@@ -256,31 +337,10 @@ class NotificationEmailWorker:
             return False
 
         # Get user email from Clerk Users API
-        user_email = self._get_user_email(notification.user_id)
+        user_email = await self._lookup_user_email(notification.user_id)
 
         if not user_email:
-            if self.missing_email_policy == "skip":
-                logger.warning(
-                    "User email not found; skipping email delivery per policy",
-                    extra={
-                        "notification_id": notification.id,
-                        "user_id": notification.user_id,
-                        "policy": self.missing_email_policy,
-                    },
-                )
-                self.stats["skipped"] += 1
-                return False
-
-            logger.warning(
-                "User email not found; marking delivery as failed",
-                extra={
-                    "notification_id": notification.id,
-                    "user_id": notification.user_id,
-                    "policy": self.missing_email_policy,
-                },
-            )
-            notification.mark_email_failed("User email not found or not verified in Clerk")
-            self.stats["failed"] += 1
+            self._handle_missing_email([notification])
             return False
 
         try:
@@ -333,6 +393,108 @@ class NotificationEmailWorker:
             )
             return False
 
+    async def _lookup_user_email(self, user_id: str) -> Optional[str]:
+        """Resolve a user's email once per run, off the event loop."""
+        if user_id not in self._user_emails:
+            self._user_emails[user_id] = await asyncio.to_thread(self._get_user_email, user_id)
+        return self._user_emails[user_id]
+
+    def _handle_missing_email(self, notifications: List[Notification]) -> None:
+        """Apply NOTIFICATION_MISSING_EMAIL_POLICY to notifications with no recipient email."""
+        extra = {
+            "notification_ids": [n.id for n in notifications],
+            "user_id": notifications[0].user_id,
+            "policy": self.missing_email_policy,
+        }
+        if self.missing_email_policy == "skip":
+            logger.warning(
+                "User email not found; skipping email delivery per policy",
+                extra=extra,
+            )
+            self.stats["skipped"] += len(notifications)
+            return
+
+        logger.warning(
+            "User email not found; marking delivery as failed",
+            extra=extra,
+        )
+        for notification in notifications:
+            notification.mark_email_failed("User email not found or not verified in Clerk")
+        self.stats["failed"] += len(notifications)
+
+    async def process_digest(self, notifications: List[Notification]) -> bool:
+        """
+        Send several notifications for one recipient as a single digest email.
+
+        Args:
+            notifications: Pending notifications sharing tenant and user_id
+
+        Returns:
+            True if the digest was sent, False otherwise
+        """
+        self.stats["processed"] += len(notifications)
+        first = notifications[0]
+
+        user_email = await self._lookup_user_email(first.user_id)
+        if not user_email:
+            self._handle_missing_email(notifications)
+            return False
+
+        error = "Email send returned False"
+        try:
+            message = EmailMessage(
+                to_email=user_email,
+                to_name=None,
+                subject=_digest_subject(notifications),
+                html_body=_build_digest_html(notifications),
+                text_body=_build_digest_text(notifications),
+                tags=[
+                    "notification:digest",
+                    f"tenant:{first.tenant_id}",
+                ],
+            )
+            success = await self.email_sender.send(message)
+        except Exception as e:
+            success = False
+            error = str(e)
+            self.stats["errors"] += 1
+            logger.error(
+                "Failed to send notification digest",
+                extra={"tenant_id": first.tenant_id, "error": error},
+                exc_info=True,
+            )
+
+        if not success:
+            for notification in notifications:
+                notification.mark_email_failed(error)
+            self.stats["failed"] += len(notifications)
+            return False
+
+        for notification in notifications:
+            notification.mark_email_sent()
+        self.stats["sent"] += len(notifications)
+        self.stats["digests"] += 1
+        logger.info(
+            "Notification digest sent",
+            extra={
+                "tenant_id": first.tenant_id,
+                "notification_count": len(notifications),
+            },
+        )
+        return True
+
+    async def _process_recipient(
+        self,
+        user_id: Optional[str],
+        notifications: List[Notification],
+    ) -> None:
+        """Send one recipient's pending emails, as a digest when there are enough."""
+        if user_id and len(notifications) >= NOTIFICATION_EMAIL_DIGEST_THRESHOLD:
+            await self.process_digest(notifications)
+            return
+        for notification in notifications:
+            await self.process_notification(notification)
+
     async def run(self) -> Dict:
         """
         Run the notification email worker.
@@ -355,8 +517,26 @@ class NotificationEmailWorker:
                 extra={"run_id": self.run_id},
             )
 
+            # Group per recipient, keeping queue order within and across groups
+            recipients: Dict[Tuple[str, Optional[str]], List[Notification]] = {}
             for notification in pending:
-                await self.process_notification(notification)
+                key = (notification.tenant_id, notification.user_id)
+                recipients.setdefault(key, []).append(notification)
+
+            groups = list(recipients.items())
+            for start in range(0, len(groups), NOTIFICATION_EMAIL_CONCURRENCY):
+                wave = groups[start:start + NOTIFICATION_EMAIL_CONCURRENCY]
+                results = await asyncio.gather(
+                    *(self._process_recipient(user_id, batch) for (_, user_id), batch in wave),
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        self.stats["errors"] += 1
+                        logger.error(
+                            "Notification email recipient failed",
+                            extra={"run_id": self.run_id, "error": str(result)},
+                        )
                 self.db.commit()
 
         except Exception as e:
@@ -396,7 +576,10 @@ async def main():
         validate_worker_environment()
         for session in get_db_session_sync():
             worker = NotificationEmailWorker(session)
-            stats = await worker.run()
+            try:
+                stats = await worker.run()
+            finally:
+                await worker.close()
             logger.info("Notification Email Worker stats", extra=stats)
     except Exception as e:
         logger.error("Notification Email Worker failed", extra={"error": str(e)}, exc_info=True)
@@ -70,6 +70,7 @@ from src.models.notification import (
     NotificationEventType,
     NotificationImportance,
     NotificationStatus,
+    NotificationUnreadCount,
     EVENT_IMPORTANCE_MAP,
 )
 from src.models.notification_preference import NotificationPreference
@@ -89,6 +90,8 @@ from src.models.changelog_read_status import ChangelogReadStatus
 from src.models.data_change_event import (
     DataChangeEvent,
     DataChangeEventType,
+    DataChangeDailyCount,
+    DataChangeFeedState,
     AFFECTED_METRICS,
 )
 from src.models.dashboard_metric_binding import DashboardMetricBinding
@@ -108,6 +111,7 @@ from src.models.dataset_version import (
     DatasetVersion,
     DatasetVersionStatus,
 )
+from src.models.dataset_catalog import DatasetCatalogEntry
 from src.models.dataset_metrics import (
     DatasetMetrics,
     DatasetSyncStatus,
@@ -215,6 +219,7 @@ __all__ = [
     "NotificationEventType",
     "NotificationImportance",
     "NotificationStatus",
+    "NotificationUnreadCount",
     "EVENT_IMPORTANCE_MAP",
     "NotificationPreference",
     # LLM Routing models (Story 8.8)
@@ -231,6 +236,8 @@ __all__ = [
     # Data Change Event models (Story 9.8)
     "DataChangeEvent",
     "DataChangeEventType",
+    "DataChangeDailyCount",
+    "DataChangeFeedState",
     "AFFECTED_METRICS",
     # Dashboard Metric Binding models (Story 2.3)
     "DashboardMetricBinding",
@@ -244,6 +251,7 @@ __all__ = [
     # Dataset Versioning & Observability (Story 5.2)
     "DatasetVersion",
     "DatasetVersionStatus",
+    "DatasetCatalogEntry",
     "DatasetMetrics",
     "DatasetSyncStatus",
     "ExploreGuardrailException",
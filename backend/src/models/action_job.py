@@ -6,6 +6,7 @@ Tracks AI action execution job processing with:
 - Status tracking (queued|running|succeeded|failed|partially_succeeded)
 - Results tracking (attempted, succeeded, failed counts)
 - Error summary for batch failures
+- Worker leases (owner, expiry, heartbeat) for concurrent workers
 
 Follows the same pattern as InsightJob but for action execution.
 
@@ -31,7 +32,7 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import JSONB
 
 from src.db_base import Base
-from src.models.base import TimestampMixin, TenantScopedMixin
+from src.models.base import JobLeaseMixin, TimestampMixin, TenantScopedMixin
 
 
 # Use JSONB for PostgreSQL, JSON for other databases (testing)
@@ -52,7 +53,7 @@ class ActionJobStatus(str, enum.Enum):
     PARTIALLY_SUCCEEDED = "partially_succeeded"  # Some actions succeeded, some failed
 
 
-class ActionJob(Base, TimestampMixin, TenantScopedMixin):
+class ActionJob(Base, TimestampMixin, TenantScopedMixin, JobLeaseMixin):
     """
     Tracks action execution job processing.
 
@@ -155,6 +156,8 @@ class ActionJob(Base, TimestampMixin, TenantScopedMixin):
             "created_at",
             postgresql_ops={"created_at": "DESC"}
         ),
+        # Index for stale lease recovery
+        Index("ix_action_jobs_status_lease", "status", "lease_expires_at"),
         # Partial unique index: only ONE queued/running job per tenant
         Index(
             "ix_action_jobs_active_unique",
@@ -0,0 +1,37 @@
+"""
+Ad spend daily rollup model for budget pacing.
+
+One row per (tenant, platform, day) holding that day's ad spend, copied
+from analytics.marketing_spend when synced data lands. Budget pacing reads
+month-to-date spend from these rows instead of aggregating
+marketing_spend on every request.
+
+SECURITY: Tenant isolation via TenantScopedMixin + RLS policy.
+"""
+
+from sqlalchemy import Column, String, Date, Numeric, PrimaryKeyConstraint
+
+from src.db_base import Base
+from src.models.base import TimestampMixin, TenantScopedMixin
+
+
+class AdSpendDailyRollup(Base, TimestampMixin, TenantScopedMixin):
+    """Daily ad spend per tenant and platform."""
+
+    __tablename__ = "ad_spend_daily_rollups"
+
+    source_platform = Column(String(100), nullable=False)
+    spend_date = Column(Date, nullable=False)
+    # Dollars (decimal), matching analytics.marketing_spend.spend
+    spend = Column(Numeric(18, 2), nullable=False, default=0)
+
+    __table_args__ = (
+        PrimaryKeyConstraint("tenant_id", "source_platform", "spend_date"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<AdSpendDailyRollup(tenant={self.tenant_id}, "
+            f"platform={self.source_platform}, date={self.spend_date}, "
+            f"spend=${self.spend})>"
+        )
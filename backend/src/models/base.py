@@ -4,11 +4,14 @@ Base mixins for database models.
 Provides common functionality:
 - TimestampMixin: created_at, updated_at timestamps
 - TenantScopedMixin: tenant_id for multi-tenant isolation
+- JobLeaseMixin: worker lease columns for concurrently claimed jobs
 - generate_uuid: UUID generation for primary keys
 - GUID: Cross-database compatible UUID type
 """
 
 import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional
 
 from sqlalchemy import Column, String, DateTime, func, TypeDecorator
 from sqlalchemy.types import CHAR
@@ -80,3 +83,67 @@ class TenantScopedMixin:
             index=True,
             comment="Tenant identifier from JWT org_id. NEVER from client input."
         )
+
+
+class JobLeaseMixin:
+    """
+    Mixin that adds a worker lease to a job table.
+
+    Workers claim QUEUED jobs with FOR UPDATE SKIP LOCKED and hold them
+    under a lease extended by heartbeat. RUNNING jobs whose lease lapsed
+    are requeued by the next worker. The model must define a status enum
+    column with QUEUED and a mark_running() method.
+    """
+
+    lease_owner = Column(
+        String(255),
+        nullable=True,
+        comment="Worker ID holding the lease on this job"
+    )
+
+    lease_expires_at = Column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="When the lease lapses and the job may be reclaimed"
+    )
+
+    heartbeat_at = Column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Last lease heartbeat from the owning worker"
+    )
+
+    def is_lease_expired(self, now: Optional[datetime] = None) -> bool:
+        """Check if a running job's lease has lapsed."""
+        if self.lease_expires_at is None:
+            return False
+        now = now or datetime.now(timezone.utc)
+        expires_at = self.lease_expires_at
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return expires_at <= now
+
+    def claim(self, worker_id: str, lease_seconds: int) -> None:
+        """
+        Claim the job for a worker and mark it running.
+
+        Args:
+            worker_id: Identifier of the claiming worker
+            lease_seconds: How long the lease lasts without a heartbeat
+        """
+        now = datetime.now(timezone.utc)
+        self.mark_running()
+        self.lease_owner = worker_id
+        self.lease_expires_at = now + timedelta(seconds=lease_seconds)
+        self.heartbeat_at = now
+
+    def release_lease(self) -> None:
+        """Clear the worker lease (job finished or requeued)."""
+        self.lease_owner = None
+        self.lease_expires_at = None
+
+    def requeue(self) -> None:
+        """Return a job with a lapsed lease to the queue."""
+        self.status = self.__table__.c.status.type.enum_class.QUEUED
+        self.started_at = None
+        self.release_lease()
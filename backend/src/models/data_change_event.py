@@ -14,8 +14,8 @@ SECURITY:
 from enum import Enum
 
 from sqlalchemy import (
-    Column, String, Text, DateTime,
-    Index, func
+    BigInteger, Column, Date, Integer, String, Text, DateTime,
+    Index, PrimaryKeyConstraint, func
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy import JSON
@@ -97,6 +97,7 @@ class DataChangeEvent(Base, TimestampMixin, TenantScopedMixin):
         affected_date_end: End of affected date range
         source_entity_type: Type of source entity (for linking)
         source_entity_id: ID of source entity (for linking)
+        feed_sequence: Per-tenant recording order (for live subscribers)
         occurred_at: When the event occurred
     """
     __tablename__ = "data_change_events"
@@ -176,6 +177,13 @@ class DataChangeEvent(Base, TimestampMixin, TenantScopedMixin):
         comment="ID of source entity for detailed view"
     )
 
+    # Position in the tenant's change feed (recording order)
+    feed_sequence = Column(
+        BigInteger,
+        nullable=True,
+        comment="Per-tenant sequence assigned when the event was recorded"
+    )
+
     # Event timestamp (when the change occurred)
     occurred_at = Column(
         DateTime(timezone=True),
@@ -194,6 +202,10 @@ class DataChangeEvent(Base, TimestampMixin, TenantScopedMixin):
             "ix_data_change_events_tenant_type",
             "tenant_id", "event_type"
         ),
+        Index(
+            "ix_data_change_events_tenant_sequence",
+            "tenant_id", "feed_sequence"
+        ),
         Index(
             "ix_data_change_events_connector",
             "tenant_id", "affected_connector_id",
@@ -203,3 +215,52 @@ class DataChangeEvent(Base, TimestampMixin, TenantScopedMixin):
 
     def __repr__(self) -> str:
         return f"<DataChangeEvent(id={self.id}, type={self.event_type}, title={self.title[:30]}...)>"
+
+
+class DataChangeDailyCount(Base, TenantScopedMixin):
+    """
+    Events recorded per tenant, UTC day and event type.
+
+    Incremented by DataChangeAggregator whenever it records an event, so
+    windowed counts for the debug panel sum at most days x types rows
+    instead of scanning data_change_events.
+    """
+    __tablename__ = "data_change_daily_counts"
+
+    bucket_date = Column(Date, nullable=False, comment="UTC day the events occurred")
+    event_type = Column(String(50), nullable=False, comment="Type of change event")
+    event_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        PrimaryKeyConstraint("tenant_id", "bucket_date", "event_type"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<DataChangeDailyCount(tenant={self.tenant_id}, date={self.bucket_date}, "
+            f"type={self.event_type}, count={self.event_count})>"
+        )
+
+
+class DataChangeFeedState(Base):
+    """
+    Per-tenant head of the change feed.
+
+    event_count only ever grows and is handed out as each new event's
+    feed_sequence, so it doubles as the feed version: live subscribers
+    poll this single row and read data_change_events only when it has
+    moved.
+    """
+    __tablename__ = "data_change_feed_state"
+
+    tenant_id = Column(
+        String(255),
+        primary_key=True,
+        comment="Tenant identifier from JWT org_id. NEVER from client input."
+    )
+    event_count = Column(BigInteger, nullable=False, default=0)
+    last_event_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    def __repr__(self) -> str:
+        return f"<DataChangeFeedState(tenant={self.tenant_id}, events={self.event_count})>"
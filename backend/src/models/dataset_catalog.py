@@ -0,0 +1,68 @@
+"""
+Dataset catalog model for dataset discovery.
+
+One row per semantic dataset, written by the dbt manifest -> Superset
+dataset sync. Holds everything the chart builder needs (Superset dataset
+id, description, exposed columns) so discovery never calls Superset on
+the request path.
+
+Each row carries an etag (hash of its content). The catalog's overall
+ETag is derived from the row etags; API workers compare it against their
+in-process copy and reload only when it changes.
+
+SECURITY: The catalog is system-scoped (no tenant_id). It describes
+platform-level schema, not per-tenant data.
+"""
+
+from sqlalchemy import Column, Integer, String, Text
+
+from src.db_base import Base
+from src.models.base import TimestampMixin
+
+
+class DatasetCatalogEntry(Base, TimestampMixin):
+    """Current discovery metadata for one semantic dataset."""
+
+    __tablename__ = "dataset_catalog"
+
+    dataset_name = Column(
+        String(255),
+        primary_key=True,
+        comment="Canonical dataset name (e.g. fact_orders_current)",
+    )
+    superset_dataset_id = Column(
+        Integer,
+        nullable=False,
+        comment="Superset dataset id (used by chart preview and column lookups)",
+    )
+    schema_name = Column(
+        String(255),
+        nullable=False,
+        default="semantic",
+        comment="Database schema containing the dataset",
+    )
+    description = Column(
+        Text,
+        nullable=False,
+        default="",
+        comment="Dataset description from the dbt manifest",
+    )
+    columns = Column(
+        Text,
+        nullable=False,
+        comment="JSON array of exposed columns: column_name, data_type, description",
+    )
+    etag = Column(
+        String(64),
+        nullable=False,
+        comment="SHA-256 of the entry content; changes whenever the entry changes",
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<DatasetCatalogEntry("
+            f"dataset_name={self.dataset_name}, "
+            f"superset_dataset_id={self.superset_dataset_id}, "
+            f"etag={self.etag[:8] if self.etag else None}"
+            f")>"
+        )
@@ -32,7 +32,7 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import JSONB
 
 from src.db_base import Base
-from src.models.base import TimestampMixin, TenantScopedMixin
+from src.models.base import JobLeaseMixin, TimestampMixin, TenantScopedMixin
 
 
 # Use JSONB for PostgreSQL, JSON for other databases (testing)
@@ -54,7 +54,7 @@ class InsightJobCadence(str, enum.Enum):
     HOURLY = "hourly"
 
 
-class InsightJob(Base, TimestampMixin, TenantScopedMixin):
+class InsightJob(Base, TimestampMixin, TenantScopedMixin, JobLeaseMixin):
     """
     Tracks insight generation job execution.
 
@@ -129,6 +129,8 @@ class InsightJob(Base, TimestampMixin, TenantScopedMixin):
 
     # Table constraints and indexes
     __table_args__ = (
+        # Index for stale lease recovery
+        Index("ix_insight_jobs_status_lease", "status", "lease_expires_at"),
         # Composite index for tenant-scoped status queries
         Index("ix_insight_jobs_tenant_status", "tenant_id", "status"),
         # Index for finding recent jobs by tenant
@@ -439,6 +439,13 @@ class LLMUsageLog(Base):
         comment="Reason for fallback, if applicable"
     )
 
+    was_cache_hit = Column(
+        Boolean,
+        nullable=False,
+        default=False,
+        comment="Whether the response was served from the completion cache (no tokens billed)"
+    )
+
     request_metadata = Column(
         JSONType,
         nullable=False,
@@ -16,7 +16,19 @@ import uuid
 from datetime import datetime, timezone, date
 from typing import Optional
 
-from sqlalchemy import Column, String, Text, Enum, DateTime, Index, JSON
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    Enum,
+    Index,
+    Integer,
+    JSON,
+    PrimaryKeyConstraint,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 
 from src.db_base import Base
@@ -213,3 +225,32 @@ class Notification(Base, TimestampMixin, TenantScopedMixin):
             idempotency_key=idempotency_key,
             event_metadata=event_metadata or {},
         )
+
+
+class NotificationUnreadCount(Base, TenantScopedMixin):
+    """
+    Unread notification counter per tenant user.
+
+    Maintained by NotificationService in the same transaction as the
+    notification writes (notify, mark_as_read, mark_all_as_read), so badge
+    reads and the unread stream hit one row instead of counting
+    notifications. version grows on every change, letting subscribers
+    detect new notifications even when the count itself ends up equal.
+    """
+
+    __tablename__ = "notification_unread_counts"
+
+    user_id = Column(String(255), nullable=False)
+    unread_count = Column(Integer, nullable=False, default=0)
+    version = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        PrimaryKeyConstraint("tenant_id", "user_id"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<NotificationUnreadCount(tenant_id={self.tenant_id}, user_id={self.user_id}, "
+            f"unread={self.unread_count}, version={self.version})>"
+        )
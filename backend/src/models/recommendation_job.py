@@ -16,12 +16,12 @@ import uuid
 from datetime import datetime, timezone
 from typing import Any
 
-from sqlalchemy import Column, String, Integer, Enum, DateTime, Text
+from sqlalchemy import Column, String, Integer, Enum, DateTime, Text, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy import JSON
 
 from src.db_base import Base
-from src.models.base import TimestampMixin, TenantScopedMixin
+from src.models.base import JobLeaseMixin, TimestampMixin, TenantScopedMixin
 
 
 # Use JSONB for PostgreSQL, JSON for other databases (testing)
@@ -43,7 +43,7 @@ class RecommendationJobCadence(str, enum.Enum):
     HOURLY = "hourly"  # Enterprise only
 
 
-class RecommendationJob(Base, TimestampMixin, TenantScopedMixin):
+class RecommendationJob(Base, TimestampMixin, TenantScopedMixin, JobLeaseMixin):
     """
     Tracks recommendation generation job execution.
 
@@ -127,6 +127,11 @@ class RecommendationJob(Base, TimestampMixin, TenantScopedMixin):
         comment="Additional job metadata"
     )
 
+    __table_args__ = (
+        # Index for stale lease recovery
+        Index("ix_recommendation_jobs_status_lease", "status", "lease_expires_at"),
+    )
+
     def __repr__(self) -> str:
         return (
             f"<RecommendationJob("
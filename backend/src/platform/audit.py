@@ -578,6 +578,70 @@ def write_audit_log_sync(
         return None
 
 
+def write_audit_logs_sync(
+    db: Session,
+    events: list[AuditEvent],
+) -> int:
+    """
+    Write several audit events in one transaction (synchronous version).
+
+    Same append-only and never-crash guarantees as write_audit_log_sync;
+    if the commit fails, every event goes to the fallback logger.
+
+    Args:
+        db: SQLAlchemy Session
+        events: The audit events to write
+
+    Returns:
+        Number of events written to the database (0 if fallback was used)
+
+    Story 10.1 - Audit Event Schema & Logging Foundation
+    """
+    if not events:
+        return 0
+
+    audit_ids = [str(uuid.uuid4()) for _ in events]
+    try:
+        db.add_all([
+            AuditLog(id=audit_id, **event.to_dict())
+            for audit_id, event in zip(audit_ids, events)
+        ])
+        db.commit()
+    except Exception as e:
+        try:
+            db.rollback()
+        except Exception:
+            pass
+
+        for audit_id, event in zip(audit_ids, events):
+            _write_fallback_log(event, audit_id, str(e))
+        return 0
+
+    metrics = get_audit_metrics()
+    for audit_id, event in zip(audit_ids, events):
+        action_str = event.action.value if isinstance(event.action, AuditAction) else event.action
+        outcome_str = event.outcome.value if isinstance(event.outcome, AuditOutcome) else event.outcome
+        logger.info(
+            "Audit event recorded",
+            extra={
+                "audit_id": audit_id,
+                "tenant_id": event.tenant_id,
+                "user_id": event.user_id,
+                "action": action_str,
+                "correlation_id": event.correlation_id,
+                "source": event.source,
+                "outcome": outcome_str,
+            }
+        )
+        metrics.record_event(
+            action=action_str,
+            outcome=outcome_str,
+            tenant_id=event.tenant_id,
+            source=event.source,
+        )
+    return len(events)
+
+
 def _write_fallback_log(event: AuditEvent, audit_id: str, error_reason: str) -> None:
     """Write audit event to fallback logger when primary DB fails."""
     fallback_entry = {
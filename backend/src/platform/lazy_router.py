@@ -0,0 +1,167 @@
+"""
+Lazy route registration for rarely used routers.
+
+FastAPI builds a route (and its dependency graph) for every endpoint at
+include_router time, which means importing the route module and everything
+it imports. For surfaces only a handful of requests ever touch (admin,
+audit, exports), that cost lands on every cold start.
+
+include_lazy_router() registers a placeholder at the router's position in
+the app instead. The first request whose path starts with one of the
+declared prefixes imports the module and builds its routes; after that the
+placeholder delegates matching and handling to them. Route order, and with
+it match precedence, is the same as an eager include_router.
+
+load_lazy_routers() swaps every placeholder for its real routes. It runs
+before the OpenAPI schema is built and can be called to warm a process
+before it forks workers.
+"""
+
+import importlib
+import logging
+from typing import List, Optional, Sequence, Tuple
+
+from fastapi import APIRouter, FastAPI
+from starlette.routing import BaseRoute, Match, NoMatchFound
+from starlette.types import Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class LazyRouter(BaseRoute):
+    """Placeholder route that imports its router module on first match."""
+
+    def __init__(self, app: FastAPI, module_path: str, prefixes: Sequence[str]):
+        self.app = app
+        self.module_path = module_path
+        self.prefixes: Tuple[str, ...] = tuple(prefixes)
+        # Route prefix convention checks read .path
+        self.path = self.prefixes[0]
+        self._routes: Optional[List[BaseRoute]] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._routes is not None
+
+    @property
+    def routes(self) -> List[BaseRoute]:
+        """The router's real routes, importing the module on first access."""
+        if self._routes is None:
+            self._routes = self._load()
+        return self._routes
+
+    def _load(self) -> List[BaseRoute]:
+        module = importlib.import_module(self.module_path)
+        # Mirror app.include_router: app-level dependencies, response class and
+        # dependency overrides apply to these routes as if included eagerly
+        router = APIRouter(
+            dependencies=self.app.router.dependencies,
+            default_response_class=self.app.router.default_response_class,
+            dependency_overrides_provider=self.app,
+            generate_unique_id_function=self.app.router.generate_unique_id_function,
+        )
+        router.include_router(module.router)
+        logger.info(
+            "Lazy router loaded",
+            extra={"router_module": self.module_path, "routes": len(router.routes)},
+        )
+        return router.routes
+
+    def _covers(self, scope: Scope) -> bool:
+        return (
+            scope["type"] in ("http", "websocket")
+            and scope["path"].startswith(self.prefixes)
+        )
+
+    def matches(self, scope: Scope) -> Tuple[Match, Scope]:
+        if not self._covers(scope):
+            return Match.NONE, {}
+        partial: Optional[Scope] = None
+        for route in self.routes:
+            match, child_scope = route.matches(scope)
+            if match == Match.FULL:
+                return match, child_scope
+            if match == Match.PARTIAL and partial is None:
+                partial = child_scope
+        if partial is not None:
+            return Match.PARTIAL, partial
+        return Match.NONE, {}
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Re-resolve the route the Router matched (it only keeps child scope)
+        partial = None
+        for route in self.routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                await route.handle(scope, receive, send)
+                return
+            if match == Match.PARTIAL and partial is None:
+                partial = route
+        if partial is not None:
+            await partial.handle(scope, receive, send)
+
+    def url_path_for(self, __name: str, **path_params):
+        for route in self.routes:
+            try:
+                return route.url_path_for(__name, **path_params)
+            except NoMatchFound:
+                continue
+        raise NoMatchFound(__name, path_params)
+
+    def __repr__(self) -> str:
+        return (
+            f"LazyRouter(module={self.module_path!r}, prefixes={self.prefixes!r}, "
+            f"loaded={self.loaded})"
+        )
+
+
+def include_lazy_router(app: FastAPI, module_path: str, *prefixes: str) -> LazyRouter:
+    """
+    Register a router module to be imported on its first request.
+
+    Args:
+        app: Application to register with
+        module_path: Dotted path of a module exposing ``router``
+        prefixes: Path prefixes covering every route in that router
+
+    Returns:
+        The placeholder route
+    """
+    if not prefixes:
+        raise ValueError("include_lazy_router needs at least one path prefix")
+    placeholder = LazyRouter(app, module_path, prefixes)
+    app.router.routes.append(placeholder)
+    return placeholder
+
+
+def load_lazy_routers(app: FastAPI) -> int:
+    """
+    Replace every lazy placeholder in the app with its real routes.
+
+    Returns:
+        Number of placeholders replaced
+    """
+    routes = app.router.routes
+    expanded: List[BaseRoute] = []
+    replaced = 0
+    for route in routes:
+        if isinstance(route, LazyRouter):
+            expanded.extend(route.routes)
+            replaced += 1
+        else:
+            expanded.append(route)
+    if replaced:
+        routes[:] = expanded
+    return replaced
+
+
+def install_lazy_openapi(app: FastAPI) -> None:
+    """Load lazy routers before the OpenAPI schema is first generated."""
+    build_openapi = app.openapi
+
+    def openapi():
+        if app.openapi_schema is None:
+            load_lazy_routers(app)
+        return build_openapi()
+
+    app.openapi = openapi
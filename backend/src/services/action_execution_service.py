@@ -29,6 +29,7 @@ Story 8.5 - Action Execution (Scoped & Reversible)
 """
 
 import logging
+import time
 from dataclasses import dataclass
 from typing import Optional
 
@@ -53,6 +54,10 @@ from src.platform.feature_flags import is_kill_switch_active, FeatureFlag
 
 logger = logging.getLogger(__name__)
 
+# Before-states fetched up front by execute_batch are only used if the
+# action runs within this window; otherwise state is re-read live.
+PREFETCHED_STATE_MAX_AGE_SECONDS = 30.0
+
 
 @dataclass
 class ActionExecutionResult:
@@ -121,6 +126,14 @@ class ActionExecutionService:
         # Credentials service (lazy or provided)
         self._credentials_service = credentials_service
 
+        # Executors are reused across actions for the same platform so a
+        # batch shares one credential lookup and the gateway's connection pool
+        self._executors: dict[str, BasePlatformExecutor] = {}
+
+        # Before-states batch-read by execute_batch, keyed by
+        # (platform, entity_type, entity_id) -> (monotonic time, capture)
+        self._prefetched_states: dict[tuple[str, str, str], tuple[float, StateCapture]] = {}
+
         # Safety service for rate limiting and cooldowns (Story 8.6)
         self._safety_service = ActionSafetyService(
             db_session=db_session,
@@ -425,10 +438,14 @@ class ActionExecutionService:
         )
 
     async def _get_executor(self, action: AIAction) -> BasePlatformExecutor:
-        """Get platform executor for action."""
+        """Get platform executor for action (reused per platform)."""
         platform = Platform(action.platform.lower())
 
-        executor = self.credentials_service.get_executor_for_platform(
+        cached = self._executors.get(platform.value)
+        if cached is not None:
+            return cached
+
+        executor = await self.credentials_service.get_executor_for_platform(
             tenant_id=self.tenant_id,
             platform=platform,
             retry_config=self.retry_config,
@@ -448,6 +465,7 @@ class ActionExecutionService:
                 action_id=action.id,
             )
 
+        self._executors[platform.value] = executor
         return executor
 
     async def _capture_before_state(
@@ -456,6 +474,17 @@ class ActionExecutionService:
         executor: BasePlatformExecutor,
     ) -> StateCapture:
         """Capture entity state before execution."""
+        key = (
+            action.platform.lower(),
+            action.target_entity_type.value,
+            action.target_entity_id,
+        )
+        prefetched = self._prefetched_states.pop(key, None)
+        if prefetched is not None:
+            captured_at, capture = prefetched
+            if time.monotonic() - captured_at <= PREFETCHED_STATE_MAX_AGE_SECONDS:
+                return capture
+
         return await executor.capture_before_state(
             entity_id=action.target_entity_id,
             entity_type=action.target_entity_type.value,
@@ -527,8 +556,11 @@ class ActionExecutionService:
         """
         Execute multiple actions.
 
-        Actions are executed sequentially (not in parallel) to avoid
-        rate limiting issues with external platforms.
+        Actions are executed sequentially (they share this service's
+        database session). Before-states are read up front with one batched
+        call per platform, executors are reused per platform, and every
+        request draws from the shared per-account rate budget, so large
+        batches are paced instead of tripping platform throttling.
 
         Args:
             action_ids: List of action IDs to execute
@@ -536,30 +568,94 @@ class ActionExecutionService:
         Returns:
             List of execution results
         """
+        await self._prefetch_before_states(action_ids)
+
         results = []
 
-        for action_id in action_ids:
+        try:
+            for action_id in action_ids:
+                try:
+                    result = await self.execute_action(action_id)
+                    results.append(result)
+                except ActionExecutionError as e:
+                    results.append(ActionExecutionResult(
+                        success=False,
+                        action_id=action_id,
+                        status=ActionStatus.FAILED,
+                        message=str(e),
+                        error_code=e.code,
+                    ))
+                except Exception as e:
+                    results.append(ActionExecutionResult(
+                        success=False,
+                        action_id=action_id,
+                        status=ActionStatus.FAILED,
+                        message=str(e),
+                        error_code="UNEXPECTED_ERROR",
+                    ))
+        finally:
+            self._prefetched_states.clear()
+
+        return results
+
+    async def _prefetch_before_states(self, action_ids: list[str]) -> None:
+        """
+        Batch-read before-states for the executable actions in a batch.
+
+        Entities targeted by more than one action are skipped, since the
+        earlier action changes the state the later one must capture.
+        Failures are logged and the affected actions fall back to a live
+        read in execute_action.
+        """
+        if len(action_ids) < 2:
+            return
+
+        actions = (
+            self.db.query(AIAction)
+            .filter(
+                AIAction.id.in_(action_ids),
+                AIAction.tenant_id == self.tenant_id,
+            )
+            .all()
+        )
+
+        targets: dict[tuple[str, str, str], list[AIAction]] = {}
+        for action in actions:
+            if not action.can_be_executed:
+                continue
+            key = (
+                action.platform.lower(),
+                action.target_entity_type.value,
+                action.target_entity_id,
+            )
+            targets.setdefault(key, []).append(action)
+
+        by_platform: dict[str, list[tuple[str, str, str]]] = {}
+        for key, key_actions in targets.items():
+            if len(key_actions) == 1:
+                by_platform.setdefault(key[0], []).append(key)
+
+        for platform, keys in by_platform.items():
             try:
-                result = await self.execute_action(action_id)
-                results.append(result)
-            except ActionExecutionError as e:
-                results.append(ActionExecutionResult(
-                    success=False,
-                    action_id=action_id,
-                    status=ActionStatus.FAILED,
-                    message=str(e),
-                    error_code=e.code,
-                ))
+                executor = await self._get_executor(targets[keys[0]][0])
+                captures = await executor.capture_before_states(
+                    [(entity_id, entity_type) for _, entity_type, entity_id in keys]
+                )
             except Exception as e:
-                results.append(ActionExecutionResult(
-                    success=False,
-                    action_id=action_id,
-                    status=ActionStatus.FAILED,
-                    message=str(e),
-                    error_code="UNEXPECTED_ERROR",
-                ))
+                logger.warning(
+                    "Batched before-state read failed; falling back to per-action reads",
+                    extra={
+                        "tenant_id": self.tenant_id,
+                        "platform": platform,
+                        "entity_count": len(keys),
+                        "error": str(e),
+                    },
+                )
+                continue
 
-        return results
+            captured_at = time.monotonic()
+            for key, capture in zip(keys, captures):
+                self._prefetched_states[key] = (captured_at, capture)
 
     # =========================================================================
     # Query Methods
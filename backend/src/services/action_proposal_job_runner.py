@@ -17,7 +17,6 @@ import logging
 from typing import TYPE_CHECKING
 
 from sqlalchemy.orm import Session
-from sqlalchemy import text
 
 from src.models.action_proposal_job import (
     ActionProposalJob,
@@ -56,23 +55,6 @@ class ActionProposalJobRunner:
         self.db = db_session
         self.tenant_id = tenant_id
 
-    def get_next_job(self) -> ActionProposalJob | None:
-        """
-        Get the next queued job for this tenant.
-
-        Returns:
-            Next queued job or None
-        """
-        return (
-            self.db.query(ActionProposalJob)
-            .filter(
-                ActionProposalJob.tenant_id == self.tenant_id,
-                ActionProposalJob.status == ActionProposalJobStatus.QUEUED,
-            )
-            .order_by(ActionProposalJob.created_at.asc())
-            .first()
-        )
-
     def run_job(self, job: ActionProposalJob) -> None:
         """
         Execute a single job.
@@ -86,6 +68,21 @@ class ActionProposalJobRunner:
         if job.status != ActionProposalJobStatus.QUEUED:
             raise ValueError(f"Job is not queued: {job.status.value}")
 
+        # Mark as running
+        job.mark_running()
+        self.db.flush()
+
+        self.execute_job(job)
+
+    def execute_job(self, job: ActionProposalJob) -> None:
+        """
+        Generate proposals for a job already marked running.
+
+        Used directly by workers that claim jobs under a lease.
+
+        Args:
+            job: The running job to execute
+        """
         logger.info(
             "Starting action proposal job",
             extra={
@@ -94,10 +91,6 @@ class ActionProposalJobRunner:
             },
         )
 
-        # Mark as running
-        job.mark_running()
-        self.db.flush()
-
         try:
             # Create generation service
             generation_service = ActionProposalGenerationService(
@@ -143,76 +136,3 @@ class ActionProposalJobRunner:
 
         finally:
             self.db.flush()
-
-    def run_next_job(self) -> ActionProposalJob | None:
-        """
-        Run the next queued job for this tenant.
-
-        Returns:
-            The job that was run, or None if no jobs
-        """
-        job = self.get_next_job()
-        if not job:
-            return None
-
-        self.run_job(job)
-        return job
-
-
-def run_action_proposal_worker_cycle(db_session: Session) -> dict:
-    """
-    Run one cycle of the action proposal worker.
-
-    Finds tenants with queued jobs and runs them.
-
-    Args:
-        db_session: Database session
-
-    Returns:
-        Statistics about the worker cycle
-    """
-    stats = {
-        "jobs_processed": 0,
-        "proposals_generated": 0,
-        "failures": 0,
-    }
-
-    # Find tenants with queued jobs
-    query = text("""
-        SELECT DISTINCT tenant_id
-        FROM action_proposal_jobs
-        WHERE status = 'queued'
-        ORDER BY created_at ASC
-        LIMIT 10
-    """)
-
-    result = db_session.execute(query)
-    tenant_ids = [row[0] for row in result.fetchall()]
-
-    for tenant_id in tenant_ids:
-        try:
-            runner = ActionProposalJobRunner(db_session, tenant_id)
-            job = runner.run_next_job()
-
-            if job:
-                stats["jobs_processed"] += 1
-                if job.status == ActionProposalJobStatus.SUCCESS:
-                    stats["proposals_generated"] += job.proposals_generated
-                elif job.status == ActionProposalJobStatus.FAILED:
-                    stats["failures"] += 1
-
-                db_session.commit()
-
-        except Exception as e:
-            logger.error(
-                "Error in worker cycle",
-                extra={
-                    "tenant_id": tenant_id,
-                    "error": str(e),
-                },
-                exc_info=True,
-            )
-            db_session.rollback()
-            stats["failures"] += 1
-
-    return stats
@@ -314,7 +314,7 @@ class ActionRollbackService:
         """Get platform executor for action."""
         platform = Platform(action.platform.lower())
 
-        executor = self.credentials_service.get_executor_for_platform(
+        executor = await self.credentials_service.get_executor_for_platform(
             tenant_id=self.tenant_id,
             platform=platform,
             retry_config=self.retry_config,
@@ -15,9 +15,11 @@ logger = logging.getLogger(__name__)
 
 class AlertRuleService:
 
-    def __init__(self, db: Session, tenant_id: str):
+    def __init__(self, db: Session, tenant_id: str, pacing: Optional[List[dict]] = None):
         self.db = db
         self.tenant_id = tenant_id
+        # Precomputed budget pacing rows (batch alerting path)
+        self._pacing = pacing
 
     def list_rules(self) -> List[AlertRule]:
         return (
@@ -177,12 +179,14 @@ class AlertRuleService:
         """Query the latest value for a named metric over the rule's evaluation period.
 
         Args:
-            metric_name: Which metric to fetch (roas, spend, revenue).
+            metric_name: Which metric to fetch (roas, spend, revenue,
+                budget_pace_ratio).
             evaluation_period: The rule's configured period (daily, weekly, monthly).
 
         Verified against dbt models:
           - marts.mart_marketing_metrics: gross_roas, spend columns (uses period_type)
           - analytics.orders: revenue_gross column (uses interval)
+          - budget_pace_ratio: highest month-to-date pace ratio across budgets
         """
         mart_period = self._PERIOD_TO_MART_TYPE.get(evaluation_period, "daily")
         interval = self._PERIOD_TO_INTERVAL.get(evaluation_period, "1 day")
@@ -219,6 +223,13 @@ class AlertRuleService:
                 """), {"tenant_id": self.tenant_id}).fetchone()
                 return float(row.total_revenue) if row and row.total_revenue else None
 
+            elif metric_name == "budget_pace_ratio":
+                pacing = self._pacing
+                if pacing is None:
+                    from src.services.budget_pacing_service import BudgetPacingService
+                    pacing = BudgetPacingService(self.db, self.tenant_id).get_pacing()
+                return max((float(p["pace_ratio"]) for p in pacing), default=None)
+
         except Exception as exc:
             logger.warning("Failed to get metric '%s' (period=%s): %s", metric_name, evaluation_period, exc)
 
@@ -10,6 +10,9 @@ SECURITY:
 - Queries only aggregated marts (no raw PII)
 - Returns None on any failure (graceful degradation — chat still works)
 
+Snapshots are cached per tenant data version (see analytics_snapshot_cache),
+so the marts are read once per dbt run rather than once per chat message.
+
 Tables queried (verified against dbt model final SELECTs per CLAUDE.md):
 - marts.mart_revenue_metrics   → period_type, gross_revenue, net_revenue,
                                   order_count, aov, *_change_pct columns
@@ -25,28 +28,47 @@ from typing import Optional
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from src.services.analytics_snapshot_cache import (
+    SNAPSHOT_ENTRY,
+    AnalyticsSnapshotCache,
+    get_analytics_cache,
+)
+
 logger = logging.getLogger(__name__)
 
 
-def get_analytics_snapshot(tenant_id: str, db: Session) -> Optional[dict]:
+def get_analytics_snapshot(
+    tenant_id: str,
+    db: Session,
+    cache: Optional[AnalyticsSnapshotCache] = None,
+) -> Optional[dict]:
     """
     Return a last-30-day analytics snapshot from the dbt mart layer.
 
     Returns a structured dict for LLM prompt injection, or None when
     data is unavailable (new tenant, no synced sources, mart query error).
     Never raises — degrades gracefully so chat still works without data.
+
+    "No data" is cached too; query errors are not.
     """
+    cache = cache if cache is not None else get_analytics_cache()
+    version = cache.data_version(tenant_id)
+    hit, snapshot = cache.get(tenant_id, version, SNAPSHOT_ENTRY)
+    if hit:
+        return snapshot
+
     try:
         revenue = _fetch_revenue_metrics(tenant_id, db)
         channels = _fetch_channel_metrics(tenant_id, db)
 
-        if not revenue and not channels:
-            return None
-
-        return {
-            "revenue": revenue,
-            "channels": channels,
-        }
+        snapshot = None
+        if revenue or channels:
+            snapshot = {
+                "revenue": revenue,
+                "channels": channels,
+            }
+        cache.set(tenant_id, version, SNAPSHOT_ENTRY, snapshot)
+        return snapshot
     except Exception:
         logger.warning(
             "Failed to fetch analytics snapshot for AI chat — falling back to generic prompt",
@@ -0,0 +1,184 @@
+"""
+Analytics snapshot cache for AI chat.
+
+The mart rows behind the chat system prompt and the agent's tools only
+change when dbt runs. This cache stores the prompt snapshot and tool
+results per tenant under the tenant's data version, so repeated chat
+messages read Redis instead of re-querying the marts.
+
+Storage is Redis:
+- analytics:data_version                      -> global counter, bumped after each
+                                                 successful dbt run
+- analytics:data_version:{tenant_id}          -> per-tenant counter, bumped when one
+                                                 tenant's data is rebuilt (backfills)
+- analytics:cache:{tenant_id}:{version}:{name} -> cached JSON (with TTL)
+
+A tenant's data version is "{global}.{tenant}". Bumping either counter
+moves readers to new keys; old entries simply expire.
+
+Graceful degradation: without REDIS_URL, or on any Redis error, the cache
+behaves as a miss and callers query the marts as before.
+
+SECURITY:
+- Keys are tenant-scoped; a tenant can never read another tenant's entries
+- Only aggregated mart metrics are stored (no raw PII)
+"""
+
+import hashlib
+import json
+import logging
+import os
+from threading import Lock
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+ANALYTICS_CACHE_ENABLED = os.getenv("ANALYTICS_CACHE_ENABLED", "true").lower() == "true"
+# Safety net only: entries are normally superseded by a data version bump
+ANALYTICS_CACHE_TTL_SECONDS = int(os.getenv("ANALYTICS_CACHE_TTL_SECONDS", "43200"))
+
+KEY_PREFIX = "analytics"
+SNAPSHOT_ENTRY = "snapshot"
+
+
+def tool_cache_entry(name: str, arguments: Optional[str]) -> str:
+    """
+    Cache entry name for a tool call: tool name plus a hash of its
+    canonicalized JSON arguments (key order and whitespace ignored).
+    """
+    try:
+        args = json.loads(arguments or "{}")
+    except json.JSONDecodeError:
+        args = {}
+    canonical = json.dumps(args, sort_keys=True, separators=(",", ":"))
+    return f"tool:{name}:{hashlib.sha256(canonical.encode()).hexdigest()[:16]}"
+
+
+class AnalyticsSnapshotCache:
+    """Tenant-scoped Redis cache of mart reads, keyed by data version."""
+
+    def __init__(
+        self,
+        redis_client=None,
+        ttl_seconds: int = ANALYTICS_CACHE_TTL_SECONDS,
+    ):
+        self._redis = redis_client
+        self.ttl_seconds = ttl_seconds
+
+    @property
+    def available(self) -> bool:
+        return self._redis is not None
+
+    def _version_key(self, tenant_id: Optional[str] = None) -> str:
+        if tenant_id is None:
+            return f"{KEY_PREFIX}:data_version"
+        return f"{KEY_PREFIX}:data_version:{tenant_id}"
+
+    def _entry_key(self, tenant_id: str, version: str, name: str) -> str:
+        return f"{KEY_PREFIX}:cache:{tenant_id}:{version}:{name}"
+
+    def data_version(self, tenant_id: str) -> Optional[str]:
+        """Current data version for a tenant, or None when the cache is unavailable."""
+        if not self.available:
+            return None
+        try:
+            global_version, tenant_version = self._redis.mget(
+                self._version_key(), self._version_key(tenant_id),
+            )
+            return f"{global_version or 0}.{tenant_version or 0}"
+        except Exception as e:
+            logger.warning(
+                "Analytics cache version read failed",
+                extra={"tenant_id": tenant_id, "error": str(e)},
+            )
+            return None
+
+    def bump_data_version(self, tenant_id: Optional[str] = None) -> bool:
+        """
+        Invalidate cached reads: for every tenant (after a dbt run) or for
+        one tenant (after its data was rebuilt).
+        """
+        if not self.available:
+            return False
+        try:
+            self._redis.incr(self._version_key(tenant_id))
+            return True
+        except Exception as e:
+            logger.warning(
+                "Analytics cache version bump failed",
+                extra={"tenant_id": tenant_id, "error": str(e)},
+            )
+            return False
+
+    def get(self, tenant_id: str, version: Optional[str], name: str) -> tuple[bool, Any]:
+        """
+        Look up a cached value.
+
+        Returns:
+            (hit, value) — value may legitimately be None (e.g. "no data yet")
+        """
+        if not self.available or version is None:
+            return False, None
+        try:
+            raw = self._redis.get(self._entry_key(tenant_id, version, name))
+            if raw is None:
+                return False, None
+            return True, json.loads(raw)
+        except Exception as e:
+            logger.warning(
+                "Analytics cache GET failed",
+                extra={"tenant_id": tenant_id, "entry": name, "error": str(e)},
+            )
+            return False, None
+
+    def set(self, tenant_id: str, version: Optional[str], name: str, value: Any) -> bool:
+        """Store a JSON-serializable value under the tenant's data version."""
+        if not self.available or version is None:
+            return False
+        try:
+            self._redis.setex(
+                self._entry_key(tenant_id, version, name),
+                self.ttl_seconds,
+                json.dumps(value),
+            )
+            return True
+        except Exception as e:
+            logger.warning(
+                "Analytics cache SET failed",
+                extra={"tenant_id": tenant_id, "entry": name, "error": str(e)},
+            )
+            return False
+
+
+_cache: Optional[AnalyticsSnapshotCache] = None
+_cache_lock = Lock()
+
+
+def get_analytics_cache() -> AnalyticsSnapshotCache:
+    """Process-wide analytics cache (disabled when Redis is not configured)."""
+    global _cache
+    if _cache is not None:
+        return _cache
+
+    with _cache_lock:
+        if _cache is not None:
+            return _cache
+
+        client = None
+        redis_url = os.getenv("REDIS_URL")
+        if ANALYTICS_CACHE_ENABLED and redis_url:
+            try:
+                import redis
+
+                client = redis.from_url(
+                    redis_url,
+                    decode_responses=True,
+                    socket_timeout=1.0,
+                    socket_connect_timeout=1.0,
+                )
+                client.ping()
+            except Exception as e:
+                logger.warning(f"Redis connection failed: {e} - analytics cache disabled")
+                client = None
+        _cache = AnalyticsSnapshotCache(redis_client=client)
+        return _cache
@@ -20,6 +20,7 @@ Story 4.1 - Data Quality Rules
 """
 
 import logging
+import uuid
 from datetime import datetime, timezone
 from typing import Any
 
@@ -379,6 +380,56 @@ def emit_root_cause_signal_generated(
         )
 
 
+def emit_root_cause_signals_generated(
+    db: Session,
+    tenant_id: str,
+    signals: list[dict[str, Any]],
+) -> None:
+    """Emit data.quality.root_cause_generated for many signals in one write.
+
+    Each signal dict carries dataset, anomaly_type, signal_id,
+    top_cause_type, hypothesis_count, detected_at and correlation_id.
+
+    Story 4.2 - Data Quality Root Cause Signals
+    """
+    try:
+        from src.platform.audit import (
+            AuditAction,
+            AuditEvent,
+            AuditOutcome,
+            write_audit_logs_sync,
+        )
+
+        events = [
+            AuditEvent(
+                tenant_id=tenant_id,
+                action=AuditAction.ROOT_CAUSE_SIGNAL_GENERATED,
+                resource_type="root_cause_signal",
+                resource_id=signal["signal_id"],
+                metadata={
+                    "tenant_id": tenant_id,
+                    "dataset": signal["dataset"],
+                    "anomaly_type": signal["anomaly_type"],
+                    "signal_id": signal["signal_id"],
+                    "top_cause_type": signal["top_cause_type"] or "none",
+                    "hypothesis_count": signal["hypothesis_count"],
+                    "detected_at": signal["detected_at"],
+                },
+                correlation_id=signal.get("correlation_id") or str(uuid.uuid4()),
+                source="system",
+                outcome=AuditOutcome.SUCCESS,
+            )
+            for signal in signals
+        ]
+        write_audit_logs_sync(db, events)
+    except Exception:
+        logger.warning(
+            "audit_logger.emit_root_cause_signals_generated_failed",
+            extra={"tenant_id": tenant_id, "signal_count": len(signals)},
+            exc_info=True,
+        )
+
+
 def emit_root_cause_signal_updated(
     db: Session,
     tenant_id: str,
@@ -5,21 +5,35 @@ Splits approved HistoricalBackfillRequests into 7-day BackfillJobs,
 executes them via BackfillService, handles retry with exponential
 backoff, and supports pause/resume/cancel.
 
+Chunks of one request run as a pipeline over the dbt model graph: each
+(chunk, model) runs once its upstream models for that chunk succeed and
+the same model has finished for the previous chunk. Independent models
+and chunks run concurrently, bounded by warehouse capacity, so chunk N's
+marts overlap with chunk N+1's staging. Completed models are checkpointed
+per chunk, so a retried chunk resumes mid-graph. Each dbt invocation gets
+its own target directory, and mid-pipeline job updates are written in
+short sessions of their own rather than committing the shared session.
+
 CONSTRAINTS:
-- One active backfill job per tenant (rate limit)
-- Progress persisted after each chunk (survives restarts)
+- One active backfill pipeline per tenant (rate limit)
+- Progress persisted after each model (survives restarts)
 - Exponential backoff on failure: 60s × 2^attempt + jitter
 
 Story 3.4 - Backfill Execution
 """
 
+import asyncio
 import logging
+import os
 import random
+import shutil
+import tempfile
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
-from typing import Optional
+from typing import Callable, Optional
 
 from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
 from src.models.backfill_job import (
     BackfillJob,
@@ -29,7 +43,7 @@ from src.models.historical_backfill import (
     HistoricalBackfillRequest,
     HistoricalBackfillStatus,
 )
-from src.services.backfill_planner import BackfillPlanner
+from src.services.backfill_planner import BackfillPlan, BackfillPlanner
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +58,12 @@ JITTER_FACTOR = 0.25
 # Stale job recovery — jobs RUNNING longer than this are assumed crashed
 STALE_JOB_MINUTES = 30
 
+# Max concurrent dbt invocations per pipeline (warehouse capacity)
+WAREHOUSE_CONCURRENCY = int(os.getenv("BACKFILL_WAREHOUSE_CONCURRENCY", "4"))
+
+# Chunks of one request executed together as a pipeline
+PIPELINE_CHUNKS = int(os.getenv("BACKFILL_PIPELINE_CHUNKS", "3"))
+
 
 def calculate_backoff(attempt: int) -> float:
     """Exponential backoff with jitter: base * 2^attempt ± jitter, capped."""
@@ -64,6 +84,18 @@ def compute_chunks(start_date: date, end_date: date) -> list[tuple[date, date]]:
     return chunks
 
 
+@dataclass
+class _ChunkRun:
+    """In-flight state of one chunk job within a pipeline."""
+    job: BackfillJob
+    plan: BackfillPlan
+    completed: set[str]
+    rows_affected: int = 0
+    errors: dict[str, str] = field(default_factory=dict)
+    skipped: set[str] = field(default_factory=set)
+    started: bool = False
+
+
 class BackfillExecutor:
     """
     Orchestrates backfill execution: chunking, job management,
@@ -72,9 +104,22 @@ class BackfillExecutor:
     Used by the backfill worker to process approved requests.
     """
 
-    def __init__(self, db_session: Session):
+    def __init__(
+        self,
+        db_session: Session,
+        session_factory: Optional[Callable[[], Session]] = None,
+    ):
+        """
+        Args:
+            db_session: Database session
+            session_factory: Creates the short sessions that persist job
+                progress while a pipeline runs (default: bound like db_session)
+        """
         self.db = db_session
-        self._planner = BackfillPlanner()
+        self._session_factory = session_factory or sessionmaker(
+            bind=db_session.get_bind(), autoflush=False
+        )
+        self._planner = BackfillPlanner.from_manifest()
 
     def _get_request(
         self, request_id: str
@@ -195,81 +240,260 @@ class BackfillExecutor:
             .first()
         )
 
+    def pick_next_jobs(
+        self,
+        exclude_tenant_ids: Optional[set[str]] = None,
+        limit: int = PIPELINE_CHUNKS,
+    ) -> list[BackfillJob]:
+        """
+        Pick the next ready job plus following ready chunks of its request.
+
+        Returns up to *limit* jobs, ordered by chunk, to run as one pipeline.
+        """
+        first = self.pick_next_job(exclude_tenant_ids=exclude_tenant_ids)
+        if not first:
+            return []
+        if limit <= 1:
+            return [first]
+
+        now = datetime.now(timezone.utc)
+        following = (
+            self.db.query(BackfillJob)
+            .filter(
+                BackfillJob.backfill_request_id == first.backfill_request_id,
+                BackfillJob.status == BackfillJobStatus.QUEUED,
+                BackfillJob.id != first.id,
+                or_(
+                    BackfillJob.next_retry_at.is_(None),
+                    BackfillJob.next_retry_at <= now,
+                ),
+            )
+            .order_by(BackfillJob.chunk_index.asc())
+            .limit(limit - 1)
+            .all()
+        )
+        return [first, *following]
+
     # ------------------------------------------------------------------
     # Execution
     # ------------------------------------------------------------------
 
     async def execute_job(self, job: BackfillJob) -> None:
         """Execute a single chunk job via BackfillService."""
-        job.mark_running()
-        self.db.commit()
+        await self.execute_jobs([job])
+
+    async def execute_jobs(self, jobs: list[BackfillJob]) -> None:
+        """
+        Execute chunk jobs as one pipelined model DAG via BackfillService.
+
+        Models already checkpointed for a chunk (previous attempt) are
+        skipped. A job is marked RUNNING when its first model starts, not
+        while it waits behind earlier chunks, so stale-job recovery only
+        sees chunks that are actually executing. Each job is finalized
+        (success, or failed with retry) once all of its models have settled.
+        """
+        if not jobs:
+            return
 
         start_time = datetime.now(timezone.utc)
+        runs: list[_ChunkRun] = []
 
-        try:
-            plan = self._planner.plan(
-                tenant_id=job.tenant_id,
-                source_system=job.source_system,
-                start_date=job.chunk_start_date,
-                end_date=job.chunk_end_date,
-            )
+        for job in jobs:
+            try:
+                plan = self._planner.plan(
+                    tenant_id=job.tenant_id,
+                    source_system=job.source_system,
+                    start_date=job.chunk_start_date,
+                    end_date=job.chunk_end_date,
+                )
+            except Exception as e:
+                job.mark_running()
+                job.mark_failed(str(e))
+                self._maybe_schedule_retry(job)
+                logger.exception(
+                    "backfill_executor.plan_error",
+                    extra={"job_id": job.id, "tenant_id": job.tenant_id},
+                )
+                continue
 
-            if not plan.affected_models:
-                job.mark_success(rows_affected=0, duration=0.0)
-                self.db.commit()
-                self._update_parent_status(job.backfill_request_id)
-                return
+            completed = set((job.job_metadata or {}).get("completed_models", []))
+            runs.append(_ChunkRun(job=job, plan=plan, completed=completed))
 
-            model_selector = " ".join(plan.affected_models)
+        await self._run_pipeline(runs)
 
-            from src.services.backfill_service import BackfillService
+        for run in runs:
+            self._finalize_chunk(run, start_time)
+        self.db.commit()
 
-            service = BackfillService(
-                db_session=self.db,
-                tenant_id=job.tenant_id,
-            )
+        for request_id in dict.fromkeys(job.backfill_request_id for job in jobs):
+            self._update_parent_status(request_id)
+
+    async def _run_pipeline(self, runs: list[_ChunkRun]) -> None:
+        """Run every pending (chunk, model) node once its prerequisites settle."""
+        semaphore = asyncio.Semaphore(max(1, WAREHOUSE_CONCURRENCY))
+        events: dict[tuple[int, str], asyncio.Event] = {}
+        succeeded: dict[tuple[int, str], bool] = {}
+        last_chunk_for_model: dict[str, int] = {}
+        nodes = []
+
+        for idx, run in enumerate(runs):
+            affected = set(run.plan.affected_models)
+            for step in run.plan.execution_steps:
+                name = step.model_name
+                if name in run.completed:
+                    continue
+                events[(idx, name)] = asyncio.Event()
+                upstream = [
+                    (idx, dep) for dep in step.depends_on
+                    if dep in affected and dep not in run.completed
+                ]
+                # Same model, previous chunk: never write one table concurrently
+                previous = last_chunk_for_model.get(name)
+                serialize = [(previous, name)] if previous is not None else []
+                last_chunk_for_model[name] = idx
+                nodes.append((run, idx, name, upstream, serialize))
+
+        await asyncio.gather(*(
+            self._run_model_node(run, idx, name, upstream, serialize, events, succeeded, semaphore)
+            for run, idx, name, upstream, serialize in nodes
+        ))
+
+    async def _run_model_node(
+        self,
+        run: _ChunkRun,
+        idx: int,
+        model_name: str,
+        upstream: list[tuple[int, str]],
+        serialize: list[tuple[int, str]],
+        events: dict[tuple[int, str], asyncio.Event],
+        succeeded: dict[tuple[int, str], bool],
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        node = (idx, model_name)
+        job = run.job
+        try:
+            for dep in upstream + serialize:
+                await events[dep].wait()
 
-            result = await service.execute_backfill(
-                model_selector=model_selector,
-                start_date=job.chunk_start_date.isoformat(),
-                end_date=job.chunk_end_date.isoformat(),
-                backfill_id=job.id,
-            )
+            if not all(succeeded[dep] for dep in upstream):
+                run.skipped.add(model_name)
+                return
 
-            duration = (
-                datetime.now(timezone.utc) - start_time
-            ).total_seconds()
+            async with semaphore:
+                self._start_chunk(run)
+                result = await self._execute_model(job, model_name)
 
             if result and result.is_successful:
-                job.mark_success(
-                    rows_affected=result.rows_affected or 0,
-                    duration=duration,
-                )
+                run.rows_affected += result.rows_affected or 0
+                run.completed.add(model_name)
+                succeeded[node] = True
+                self._checkpoint(run)
             else:
-                error = (
+                run.errors[model_name] = (
                     result.error_message if result else "No result returned"
-                )
-                job.mark_failed(error)
-                self._maybe_schedule_retry(job)
+                ) or "Unknown error"
 
         except Exception as e:
-            duration = (
-                datetime.now(timezone.utc) - start_time
-            ).total_seconds()
-            job.mark_failed(str(e))
-            job.duration_seconds = duration
-            self._maybe_schedule_retry(job)
+            run.errors[model_name] = str(e)
             logger.exception(
-                "backfill_executor.job_error",
+                "backfill_executor.model_error",
                 extra={
                     "job_id": job.id,
                     "tenant_id": job.tenant_id,
                     "chunk_index": job.chunk_index,
+                    "model": model_name,
                 },
             )
+        finally:
+            succeeded.setdefault(node, False)
+            events[node].set()
 
-        self.db.commit()
-        self._update_parent_status(job.backfill_request_id)
+    async def _execute_model(self, job: BackfillJob, model_name: str):
+        """Run dbt for one model over the job's chunk, in its own target dir."""
+        from src.services.backfill_service import BackfillService
+
+        session = self._session_factory()
+        try:
+            service = BackfillService(
+                db_session=session,
+                tenant_id=job.tenant_id,
+            )
+            with tempfile.TemporaryDirectory(prefix="dbt-backfill-") as target_path:
+                # Reuse the project's parse so each invocation skips a full re-parse
+                partial_parse = service.analytics_dir / "target" / "partial_parse.msgpack"
+                if partial_parse.exists():
+                    shutil.copy2(partial_parse, target_path)
+                return await service.execute_backfill(
+                    model_selector=model_name,
+                    start_date=job.chunk_start_date.isoformat(),
+                    end_date=job.chunk_end_date.isoformat(),
+                    backfill_id=job.id,
+                    target_path=target_path,
+                )
+        finally:
+            session.close()
+
+    def _persist(self, job: BackfillJob, *columns: str) -> None:
+        """
+        Write the job's current values for columns in a session of its own.
+
+        Model tasks run concurrently; committing the shared session here
+        would also commit whatever the other tasks have pending on it.
+        """
+        session = self._session_factory()
+        try:
+            session.query(BackfillJob).filter(BackfillJob.id == job.id).update(
+                {getattr(BackfillJob, column): getattr(job, column) for column in columns},
+                synchronize_session=False,
+            )
+            session.commit()
+        finally:
+            session.close()
+
+    def _start_chunk(self, run: _ChunkRun) -> None:
+        """Mark the chunk RUNNING as its first model starts."""
+        if run.started:
+            return
+        run.started = True
+        run.job.mark_running()
+        self._persist(run.job, "status", "started_at", "attempt")
+
+    def _checkpoint(self, run: _ChunkRun) -> None:
+        """Persist the chunk's completed models so a retry resumes mid-graph."""
+        run.job.job_metadata = {
+            **(run.job.job_metadata or {}),
+            "completed_models": sorted(run.completed),
+        }
+        self._persist(run.job, "job_metadata")
+
+    def _finalize_chunk(self, run: _ChunkRun, start_time: datetime) -> None:
+        job = run.job
+        duration = (datetime.now(timezone.utc) - start_time).total_seconds()
+        if not run.started:
+            # Every model was checkpointed by an earlier attempt
+            job.mark_running()
+
+        if not run.errors and not run.skipped:
+            job.mark_success(rows_affected=run.rows_affected, duration=duration)
+            return
+
+        failed_model, error = next(
+            iter(run.errors.items()), (None, "Upstream model failed")
+        )
+        job.mark_failed(f"{failed_model}: {error}" if failed_model else error)
+        job.duration_seconds = duration
+        self._maybe_schedule_retry(job)
+        logger.warning(
+            "backfill_executor.chunk_failed",
+            extra={
+                "job_id": job.id,
+                "tenant_id": job.tenant_id,
+                "chunk_index": job.chunk_index,
+                "failed_models": sorted(run.errors),
+                "skipped_models": sorted(run.skipped),
+                "completed_models": len(run.completed),
+            },
+        )
 
     # ------------------------------------------------------------------
     # Retry
@@ -340,6 +564,12 @@ class BackfillExecutor:
 
         self.db.commit()
 
+        if all_success:
+            # Rebuilt marts: drop the tenant's cached AI chat reads
+            from src.services.analytics_snapshot_cache import get_analytics_cache
+
+            get_analytics_cache().bump_data_version(request.tenant_id)
+
         # Emit audit events for terminal transitions
         if all_success or all_cancelled:
             from src.services.audit_logger import emit_backfill_completed
@@ -5,18 +5,34 @@ tenant, source system, and date range.
 Understands the full dbt dependency chain:
     raw → staging → canonical → semantic → metrics/marts
 
-Produces an ordered execution plan with cost estimates.
+The graph is derived from the dbt manifest.json when one is available
+(BackfillPlanner.from_manifest), falling back to the MODEL_REGISTRY below.
+
+Produces an ordered execution plan with cost estimates, plus dependency
+waves (models within a wave are independent) for parallel execution.
 
 Story 3.4 - Backfill Planning
 """
 
+import heapq
 import logging
+import os
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
+from pathlib import Path
+from typing import Optional
+
+from src.services.dbt_manifest_index import load_manifest_index
 
 logger = logging.getLogger(__name__)
 
+# Compiled dbt manifest (written by `dbt compile` / `dbt run`)
+DBT_MANIFEST_PATH = os.getenv(
+    "DBT_MANIFEST_PATH",
+    str(Path(__file__).parent.parent.parent.parent / "analytics" / "target" / "manifest.json"),
+)
+
 
 # =============================================================================
 # Layer definitions
@@ -101,10 +117,10 @@ SOURCE_TO_STAGING: dict[str, list[str]] = {
 MODEL_REGISTRY: dict[str, DbtModel] = {
     # --- Staging (Layer 2) ---
     "stg_shopify_orders": DbtModel(
-        "stg_shopify_orders", ModelLayer.STAGING, "view",
+        "stg_shopify_orders", ModelLayer.STAGING, "incremental",
     ),
     "stg_shopify_customers": DbtModel(
-        "stg_shopify_customers", ModelLayer.STAGING, "view",
+        "stg_shopify_customers", ModelLayer.STAGING, "incremental",
     ),
     "stg_facebook_ads_performance": DbtModel(
         "stg_facebook_ads_performance", ModelLayer.STAGING, "view",
@@ -181,7 +197,7 @@ MODEL_REGISTRY: dict[str, DbtModel] = {
     ),
     # --- Attribution (Layer 4) ---
     "last_click": DbtModel(
-        "last_click", ModelLayer.ATTRIBUTION, "view",
+        "last_click", ModelLayer.ATTRIBUTION, "incremental",
         depends_on=("orders", "campaign_performance"),
     ),
     # --- Semantic (Layer 5) ---
@@ -253,22 +269,134 @@ MODEL_REGISTRY: dict[str, DbtModel] = {
         tags=("governed",),
     ),
     # --- Marts (Layer 7) ---
+    "rollup_daily_revenue": DbtModel(
+        "rollup_daily_revenue", ModelLayer.MARTS, "table",
+        depends_on=("fct_revenue",),
+        tags=("rollups",),
+    ),
+    "rollup_daily_channel": DbtModel(
+        "rollup_daily_channel", ModelLayer.MARTS, "table",
+        depends_on=("fct_roas", "fct_cac", "marketing_spend", "last_click"),
+        tags=("rollups",),
+    ),
     "mart_revenue_metrics": DbtModel(
         "mart_revenue_metrics", ModelLayer.MARTS, "table",
-        depends_on=("fct_revenue",),
+        depends_on=("rollup_daily_revenue",),
     ),
     "mart_marketing_metrics": DbtModel(
         "mart_marketing_metrics", ModelLayer.MARTS, "table",
-        depends_on=("fct_roas", "fct_cac"),
+        depends_on=("rollup_daily_channel",),
+    ),
+    "mart_latest_periods": DbtModel(
+        "mart_latest_periods", ModelLayer.MARTS, "table",
+        depends_on=("mart_marketing_metrics", "mart_revenue_metrics"),
+    ),
+    "mart_kpi_summary": DbtModel(
+        "mart_kpi_summary", ModelLayer.MARTS, "table",
+        depends_on=("mart_latest_periods", "mart_marketing_metrics", "mart_revenue_metrics"),
     ),
 }
 
 
+def _build_dependents(registry: dict[str, DbtModel]) -> dict[str, set[str]]:
+    """Build the reverse dependency index for a registry."""
+    dependents: dict[str, set[str]] = {}
+    for model_name, model in registry.items():
+        for dep in model.depends_on:
+            dependents.setdefault(dep, set()).add(model_name)
+    return dependents
+
+
 # Build reverse dependency index once at import time.
-_DEPENDENTS: dict[str, set[str]] = {}
-for _model_name, _model in MODEL_REGISTRY.items():
-    for _dep in _model.depends_on:
-        _DEPENDENTS.setdefault(_dep, set()).add(_model_name)
+_DEPENDENTS: dict[str, set[str]] = _build_dependents(MODEL_REGISTRY)
+
+
+# =============================================================================
+# Manifest-derived registry
+# =============================================================================
+
+
+# Top-level folder under analytics/models → pipeline layer.
+_FOLDER_LAYERS: dict[str, ModelLayer] = {
+    "raw_sources": ModelLayer.RAW,
+    "staging": ModelLayer.STAGING,
+    "canonical": ModelLayer.CANONICAL,
+    "attribution": ModelLayer.ATTRIBUTION,
+    "semantic_views": ModelLayer.SEMANTIC,
+    "metrics": ModelLayer.METRICS,
+    "cohorts": ModelLayer.METRICS,
+    "marts": ModelLayer.MARTS,
+}
+
+
+def registry_from_manifest(manifest: dict) -> dict[str, DbtModel]:
+    """
+    Build a model registry from a parsed dbt manifest.
+
+    Layers come from the model's top-level folder; models in other folders
+    inherit the highest layer among their dependencies.
+    """
+    nodes = manifest.get("nodes", {}) or {}
+    models = {
+        node_id: node
+        for node_id, node in nodes.items()
+        if node.get("resource_type") == "model"
+    }
+    id_to_name = {node_id: node["name"] for node_id, node in models.items()}
+
+    deps: dict[str, tuple[str, ...]] = {}
+    folder_layer: dict[str, Optional[ModelLayer]] = {}
+    for node in models.values():
+        name = node["name"]
+        upstream = (node.get("depends_on", {}) or {}).get("nodes", []) or []
+        deps[name] = tuple(sorted({id_to_name[u] for u in upstream if u in id_to_name}))
+        fqn = node.get("fqn") or []
+        folder_layer[name] = _FOLDER_LAYERS.get(fqn[1]) if len(fqn) > 2 else None
+
+    resolved: dict[str, ModelLayer] = {}
+
+    def _layer(name: str, path: frozenset) -> ModelLayer:
+        if name in resolved:
+            return resolved[name]
+        layer = folder_layer.get(name)
+        if layer is None:
+            upstream = [_layer(d, path | {name}) for d in deps.get(name, ()) if d not in path]
+            layer = max(upstream, key=lambda l: l.order, default=ModelLayer.STAGING)
+        resolved[name] = layer
+        return layer
+
+    registry: dict[str, DbtModel] = {}
+    for node in models.values():
+        name = node["name"]
+        registry[name] = DbtModel(
+            name=name,
+            layer=_layer(name, frozenset()),
+            materialization=(node.get("config", {}) or {}).get("materialized", "view"),
+            depends_on=deps[name],
+            tags=tuple(node.get("tags", []) or ()),
+        )
+    return registry
+
+
+def load_manifest_registry(path: Optional[str] = None) -> Optional[dict[str, DbtModel]]:
+    """
+    Load the registry derived from manifest.json.
+
+    Built once per manifest version on the shared manifest index.
+    Returns None if the manifest is missing or unreadable.
+    """
+    manifest_path = path or DBT_MANIFEST_PATH
+    try:
+        index = load_manifest_index(manifest_path)
+        return index.derive("backfill_registry", registry_from_manifest)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(
+            "backfill_planner.manifest_unreadable",
+            extra={"manifest_path": str(manifest_path), "error": str(e)},
+        )
+        return None
 
 
 # =============================================================================
@@ -312,6 +440,7 @@ class BackfillStep:
     materialization: str
     dbt_selector: str
     depends_on: list[str] = field(default_factory=list)
+    wave: int = 0  # dependency depth within the plan; same wave = independent
 
 
 @dataclass
@@ -336,6 +465,7 @@ class BackfillPlan:
     cost_estimate: BackfillCostEstimate
     is_partial: bool
     dbt_run_command: str
+    execution_waves: list[list[str]] = field(default_factory=list)
 
 
 # =============================================================================
@@ -351,6 +481,24 @@ class BackfillPlanner:
     to find all affected downstream models, then produces an ordered plan.
     """
 
+    def __init__(self, registry: Optional[dict[str, DbtModel]] = None):
+        self.registry = registry if registry is not None else MODEL_REGISTRY
+        self._dependents = (
+            _DEPENDENTS if self.registry is MODEL_REGISTRY
+            else _build_dependents(self.registry)
+        )
+
+    @classmethod
+    def from_manifest(cls, path: Optional[str] = None) -> "BackfillPlanner":
+        """Planner over the manifest graph, or MODEL_REGISTRY if unavailable."""
+        registry = load_manifest_registry(path)
+        if registry is None:
+            logger.info(
+                "backfill_planner.manifest_unavailable",
+                extra={"manifest_path": path or DBT_MANIFEST_PATH},
+            )
+        return cls(registry)
+
     def plan(
         self,
         tenant_id: str,
@@ -374,17 +522,12 @@ class BackfillPlanner:
         # Walk the graph forward from seed staging models.
         affected = self._resolve_downstream(seed_models)
 
-        # Sort by layer order, then alphabetically within a layer.
-        affected_sorted = sorted(
-            affected,
-            key=lambda name: (
-                MODEL_REGISTRY[name].layer.order,
-                name,
-            ),
-        )
+        # Topological order, preferring lower layers then name.
+        affected_sorted = self._topological_order(affected)
+        waves = self._compute_waves(affected_sorted)
 
         # Build ordered execution steps.
-        steps = self._build_steps(affected_sorted)
+        steps = self._build_steps(affected_sorted, waves)
 
         # Estimate cost.
         cost = self._estimate_cost(
@@ -401,7 +544,7 @@ class BackfillPlanner:
         dbt_cmd = f"dbt run --select {model_selector} --vars '{dbt_vars}'"
 
         # Check if this is a partial rebuild (not all models in the graph).
-        is_partial = len(affected_sorted) < len(MODEL_REGISTRY)
+        is_partial = len(affected_sorted) < len(self.registry)
 
         plan = BackfillPlan(
             tenant_id=tenant_id,
@@ -414,6 +557,7 @@ class BackfillPlanner:
             cost_estimate=cost,
             is_partial=is_partial,
             dbt_run_command=dbt_cmd,
+            execution_waves=self._group_waves(affected_sorted, waves),
         )
 
         logger.info(
@@ -433,8 +577,7 @@ class BackfillPlanner:
     # Internal helpers
     # --------------------------------------------------------------------- #
 
-    @staticmethod
-    def _resolve_downstream(seed_models: list[str]) -> set[str]:
+    def _resolve_downstream(self, seed_models: list[str]) -> set[str]:
         """
         BFS forward through the dependency graph starting from *seed_models*.
 
@@ -447,21 +590,76 @@ class BackfillPlanner:
             current = queue.pop(0)
             if current in visited:
                 continue
-            if current not in MODEL_REGISTRY:
+            if current not in self.registry:
                 continue
             visited.add(current)
-            for dependent in _DEPENDENTS.get(current, set()):
+            for dependent in self._dependents.get(current, set()):
                 if dependent not in visited:
                     queue.append(dependent)
 
         return visited
 
+    def _topological_order(self, affected: set[str]) -> list[str]:
+        """
+        Order affected models so every model follows its dependencies.
+
+        Among ready models, lower layers (then names) go first, so the result
+        is layer-sorted whenever the graph allows it.
+        """
+        def key(name: str) -> tuple[int, str]:
+            return (self.registry[name].layer.order, name)
+
+        remaining = {
+            name: {d for d in self.registry[name].depends_on if d in affected}
+            for name in affected
+        }
+        ready = [key(name) for name, deps in remaining.items() if not deps]
+        heapq.heapify(ready)
+
+        ordered: list[str] = []
+        while ready:
+            _, name = heapq.heappop(ready)
+            ordered.append(name)
+            for dependent in self._dependents.get(name, set()):
+                deps = remaining.get(dependent)
+                if deps is None or name not in deps:
+                    continue
+                deps.discard(name)
+                if not deps:
+                    heapq.heappush(ready, key(dependent))
+
+        if len(ordered) < len(affected):
+            # Dependency cycle (should not happen in dbt) — append the rest.
+            ordered.extend(sorted(set(affected) - set(ordered), key=key))
+        return ordered
+
+    def _compute_waves(self, ordered: list[str]) -> dict[str, int]:
+        """Dependency depth of each model within the affected set."""
+        waves: dict[str, int] = {}
+        for name in ordered:
+            upstream = [waves[d] for d in self.registry[name].depends_on if d in waves]
+            waves[name] = max(upstream) + 1 if upstream else 0
+        return waves
+
     @staticmethod
-    def _build_steps(models_sorted: list[str]) -> list[BackfillStep]:
+    def _group_waves(ordered: list[str], waves: dict[str, int]) -> list[list[str]]:
+        grouped: list[list[str]] = []
+        for name in ordered:
+            wave = waves[name]
+            while len(grouped) <= wave:
+                grouped.append([])
+            grouped[wave].append(name)
+        return grouped
+
+    def _build_steps(
+        self,
+        models_sorted: list[str],
+        waves: Optional[dict[str, int]] = None,
+    ) -> list[BackfillStep]:
         """Convert sorted model list into execution steps."""
         steps: list[BackfillStep] = []
         for idx, name in enumerate(models_sorted, start=1):
-            model = MODEL_REGISTRY[name]
+            model = self.registry[name]
             steps.append(BackfillStep(
                 order=idx,
                 layer=model.layer.value,
@@ -469,11 +667,12 @@ class BackfillPlanner:
                 materialization=model.materialization,
                 dbt_selector=name,
                 depends_on=list(model.depends_on),
+                wave=(waves or {}).get(name, 0),
             ))
         return steps
 
-    @staticmethod
     def _estimate_cost(
+        self,
         source_system: str,
         start_date: date,
         end_date: date,
@@ -488,7 +687,7 @@ class BackfillPlanner:
         total_rows = raw_rows
         total_seconds = 0.0
         for name in affected_models:
-            model = MODEL_REGISTRY[name]
+            model = self.registry[name]
             sec_per_k = _SECONDS_PER_1K_ROWS.get(
                 model.materialization, 1.0
             )
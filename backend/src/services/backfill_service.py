@@ -107,6 +107,7 @@ class BackfillService:
         start_date: str,
         end_date: str,
         backfill_id: Optional[str] = None,
+        target_path: Optional[str] = None,
     ) -> Optional[BackfillResult]:
         """
         Execute a dbt backfill for the specified date range.
@@ -116,6 +117,8 @@ class BackfillService:
             start_date: Start date for backfill (YYYY-MM-DD or YYYY-MM-DD HH:MI:SS)
             end_date: End date for backfill (YYYY-MM-DD or YYYY-MM-DD HH:MI:SS)
             backfill_id: Optional backfill ID for tracking (generated if not provided)
+            target_path: Optional dbt target directory for this invocation. Concurrent
+                runs must each use their own, or they overwrite one another's artifacts.
 
         Returns:
             BackfillResult with execution details, or None if skipped due to entitlements
@@ -206,6 +209,8 @@ class BackfillService:
             "--profiles-dir", str(self.analytics_dir),
             "--project-dir", str(self.analytics_dir),
         ]
+        if target_path:
+            cmd += ["--target-path", target_path]
 
         logger.info(
             "Executing dbt command",
@@ -1,18 +1,232 @@
-"""Budget pacing service — CRUD for budgets + spend pacing calculations."""
+"""Budget pacing service — CRUD for budgets + spend pacing calculations.
+
+Month-to-date spend is read from ad_spend_daily_rollups, one row per
+(tenant, platform, day). refresh_spend_rollups() runs after each successful
+dbt run (src.workers.dbt_runner) and re-aggregates only the days dbt changed
+in analytics.marketing_spend, so pacing reads are O(days) instead of
+scanning marketing_spend on every request.
+"""
 
 import calendar
 import logging
+import os
 import uuid
-from datetime import date
-from typing import List, Optional
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 from sqlalchemy.orm import Session
 
 from src.models.ad_budget import AdBudget
 
 logger = logging.getLogger(__name__)
 
+# First refresh (no rollups yet) builds from the first of the month
+# containing today - SPEND_ROLLUP_LOOKBACK_DAYS.
+SPEND_ROLLUP_LOOKBACK_DAYS = int(os.getenv("SPEND_ROLLUP_LOOKBACK_DAYS", "3"))
+# Incremental refreshes re-read marketing_spend rows updated up to this long
+# before the last refresh, so rows committed by an overlapping dbt run are
+# not missed.
+SPEND_ROLLUP_OVERLAP_MINUTES = int(os.getenv("SPEND_ROLLUP_OVERLAP_MINUTES", "60"))
+
+# (tenant, day) pairs to rebuild; {changed_filter} narrows marketing_spend rows
+_CHANGED_DAYS_CTE = """
+    WITH changed AS (
+        SELECT DISTINCT tenant_id, date
+        FROM analytics.marketing_spend
+        WHERE {changed_filter}
+          {tenant_filter}
+    )
+"""
+
+
+def refresh_spend_rollups(
+    db: Session,
+    since: Optional[date] = None,
+    tenant_id: Optional[str] = None,
+) -> int:
+    """Rebuild daily spend rollups from analytics.marketing_spend.
+
+    By default the refresh is incremental: only (tenant, day) pairs with
+    marketing_spend rows that dbt updated since the last refresh are
+    rebuilt. With since, every day >= since is rebuilt instead. Either way
+    all tenants are covered unless tenant_id is given.
+
+    The first refresh, with no rollups yet, rebuilds from the first of the
+    month containing today - SPEND_ROLLUP_LOOKBACK_DAYS.
+
+    Returns the number of rollup rows written.
+    """
+    params: dict = {}
+    tenant_filter = ""
+    if tenant_id is not None:
+        tenant_filter = "AND tenant_id = :tenant_id"
+        params["tenant_id"] = tenant_id
+
+    try:
+        if since is None:
+            last_refresh_sql = "SELECT MAX(updated_at) FROM ad_spend_daily_rollups"
+            if tenant_id is not None:
+                last_refresh_sql += " WHERE tenant_id = :tenant_id"
+            last_refresh = db.execute(text(last_refresh_sql), params).scalar()
+            if last_refresh is None:
+                since = (date.today() - timedelta(days=SPEND_ROLLUP_LOOKBACK_DAYS)).replace(day=1)
+
+        if since is not None:
+            params["since"] = since
+            changed = _CHANGED_DAYS_CTE.format(changed_filter="date >= :since", tenant_filter=tenant_filter)
+            db.execute(text(f"""
+                DELETE FROM ad_spend_daily_rollups
+                WHERE spend_date >= :since
+                  {tenant_filter}
+            """), params)
+        else:
+            params["updated_after"] = last_refresh - timedelta(minutes=SPEND_ROLLUP_OVERLAP_MINUTES)
+            changed = _CHANGED_DAYS_CTE.format(
+                changed_filter="dbt_updated_at > :updated_after", tenant_filter=tenant_filter,
+            )
+            db.execute(text(f"""
+                {changed}
+                DELETE FROM ad_spend_daily_rollups r
+                USING changed c
+                WHERE r.tenant_id = c.tenant_id
+                  AND r.spend_date = c.date
+            """), params)
+        result = db.execute(text(f"""
+            INSERT INTO ad_spend_daily_rollups
+                (tenant_id, source_platform, spend_date, spend, created_at, updated_at)
+            {changed}
+            SELECT m.tenant_id, m.source_platform, m.date, SUM(m.spend),
+                   CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+            FROM analytics.marketing_spend m
+            JOIN changed c ON c.tenant_id = m.tenant_id AND c.date = m.date
+            GROUP BY m.tenant_id, m.source_platform, m.date
+        """), params)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    logger.info(
+        "Spend rollups refreshed",
+        extra={
+            "since": since.isoformat() if since else None,
+            "updated_after": params.get("updated_after"),
+            "tenant_id": tenant_id,
+            "rows": result.rowcount,
+        },
+    )
+    return result.rowcount
+
+
+def _month_progress(today: date) -> tuple[date, float]:
+    """Return (first day of month, fraction of month elapsed)."""
+    days_in_month = calendar.monthrange(today.year, today.month)[1]
+    return today.replace(day=1), round(today.day / days_in_month, 4)
+
+
+def _build_pacing(budget: AdBudget, spent: int, pct_time: float) -> dict:
+    """Compute pacing figures and status for one budget."""
+    pct_spent = round(spent / budget.budget_monthly_cents, 4) if budget.budget_monthly_cents > 0 else 0
+    pace_ratio = round(pct_spent / pct_time, 2) if pct_time > 0 else 0
+    projected = int(spent / pct_time) if pct_time > 0 else 0
+
+    if pace_ratio <= 1.1:
+        pacing_status = "on_pace"
+    elif pace_ratio <= 1.3:
+        pacing_status = "slightly_over"
+    else:
+        pacing_status = "over_budget"
+
+    return {
+        "platform": budget.source_platform,
+        "budget_cents": budget.budget_monthly_cents,
+        "spent_cents": spent,
+        "pct_spent": pct_spent,
+        "pct_time": pct_time,
+        "pace_ratio": pace_ratio,
+        "projected_total_cents": projected,
+        "status": pacing_status,
+        "budget_id": budget.id,
+    }
+
+
+def _to_cents(total_spend) -> int:
+    # marketing_spend / rollup spend is in dollars (decimal), budgets are cents
+    return int(float(total_spend or 0) * 100)
+
+
+_BATCH_ROLLUP_SPEND = text("""
+    SELECT tenant_id, source_platform, SUM(spend) AS total_spend
+    FROM ad_spend_daily_rollups
+    WHERE spend_date >= :month_start
+      AND spend_date <= :today
+      AND tenant_id IN :tenant_ids
+    GROUP BY tenant_id, source_platform
+""").bindparams(bindparam("tenant_ids", expanding=True))
+
+_BATCH_MARKETING_SPEND = text("""
+    SELECT tenant_id, source_platform, SUM(spend) AS total_spend
+    FROM analytics.marketing_spend
+    WHERE date >= :month_start
+      AND date <= :today
+      AND tenant_id IN :tenant_ids
+    GROUP BY tenant_id, source_platform
+""").bindparams(bindparam("tenant_ids", expanding=True))
+
+
+def get_pacing_for_tenants(
+    db: Session,
+    tenant_ids: Optional[Iterable[str]] = None,
+) -> Dict[str, List[dict]]:
+    """Compute current month pacing for many tenants in at most three queries.
+
+    Used by the alerting path. Reads spend from the rollups; like
+    get_pacing(), tenants with no rollups this month fall back to
+    aggregating analytics.marketing_spend (one query for all of them).
+
+    Args:
+        db: Database session
+        tenant_ids: Tenants to include (default: all with enabled budgets)
+
+    Returns:
+        Mapping of tenant_id to the same rows get_pacing() returns
+    """
+    ids = list(tenant_ids) if tenant_ids is not None else None
+    if ids is not None and not ids:
+        return {}
+
+    query = db.query(AdBudget).filter(AdBudget.enabled == True)  # noqa: E712
+    if ids is not None:
+        query = query.filter(AdBudget.tenant_id.in_(ids))
+    budgets = query.order_by(AdBudget.tenant_id, AdBudget.source_platform).all()
+    if not budgets:
+        return {}
+
+    today = date.today()
+    month_start, pct_time = _month_progress(today)
+
+    budget_tenants = {b.tenant_id for b in budgets}
+    params = {"month_start": month_start, "today": today}
+    spend: Dict[tuple, int] = {}
+    # Rollups first; tenants without any this month fall back to marketing_spend
+    for stmt, label in ((_BATCH_ROLLUP_SPEND, "spend rollups"), (_BATCH_MARKETING_SPEND, "marketing spend")):
+        tenants = sorted(budget_tenants - {tenant for tenant, _ in spend})
+        if not tenants:
+            break
+        try:
+            rows = db.execute(stmt, {**params, "tenant_ids": tenants}).fetchall()
+        except Exception as exc:
+            logger.warning("Failed to query %s: %s", label, exc)
+            continue
+        spend.update({(r.tenant_id, r.source_platform): _to_cents(r.total_spend) for r in rows})
+
+    results: Dict[str, List[dict]] = {}
+    for b in budgets:
+        spent = spend.get((b.tenant_id, b.source_platform), 0)
+        results.setdefault(b.tenant_id, []).append(_build_pacing(b, spent, pct_time))
+    return results
+
 
 class BudgetPacingService:
 
@@ -72,65 +286,51 @@ class BudgetPacingService:
         self.db.commit()
         return True
 
-    def get_pacing(self) -> list[dict]:
-        """Get current month pacing data per platform.
+    def _get_mtd_spend_cents(self, month_start: date, today: date) -> dict:
+        """Month-to-date spend in cents per platform.
 
-        Queries analytics.marketing_spend which has columns:
-          tenant_id, date, source_platform, spend (decimal, NOT cents)
+        Reads the daily rollups; falls back to aggregating
+        analytics.marketing_spend (columns: tenant_id, date,
+        source_platform, spend in dollars) when the tenant has none yet.
         """
-        budgets = self.list_budgets()
-        if not budgets:
-            return []
-
-        # Query MTD spend per platform from marketing_spend
-        # NOTE: marketing_spend.spend is in dollars (decimal), not cents
+        params = {"tenant_id": self.tenant_id, "month_start": month_start, "today": today}
         try:
             rows = self.db.execute(text("""
                 SELECT source_platform, SUM(spend) as total_spend
-                FROM analytics.marketing_spend
+                FROM ad_spend_daily_rollups
                 WHERE tenant_id = :tenant_id
-                  AND date >= date_trunc('month', current_date)::date
-                  AND date <= current_date
+                  AND spend_date >= :month_start
+                  AND spend_date <= :today
                 GROUP BY source_platform
-            """), {"tenant_id": self.tenant_id}).fetchall()
+            """), params).fetchall()
+
+            if not rows:
+                rows = self.db.execute(text("""
+                    SELECT source_platform, SUM(spend) as total_spend
+                    FROM analytics.marketing_spend
+                    WHERE tenant_id = :tenant_id
+                      AND date >= :month_start
+                      AND date <= :today
+                    GROUP BY source_platform
+                """), params).fetchall()
 
-            # Convert spend (dollars) to cents for comparison with budget_monthly_cents
-            spend_by_platform = {r.source_platform: int(float(r.total_spend) * 100) for r in rows}
+            return {r.source_platform: _to_cents(r.total_spend) for r in rows}
         except Exception as exc:
-            logger.warning("Failed to query marketing_spend: %s", exc)
-            spend_by_platform = {}
+            logger.warning("Failed to query marketing spend: %s", exc)
+            return {}
+
+    def get_pacing(self) -> list[dict]:
+        """Get current month pacing data per platform."""
+        budgets = self.list_budgets()
+        if not budgets:
+            return []
 
         today = date.today()
-        day_of_month = today.day
-        days_in_month = calendar.monthrange(today.year, today.month)[1]
-        pct_time = round(day_of_month / days_in_month, 4)
-
-        results = []
-        for b in budgets:
-            if not b.enabled:
-                continue
-            spent = spend_by_platform.get(b.source_platform, 0)
-            pct_spent = round(spent / b.budget_monthly_cents, 4) if b.budget_monthly_cents > 0 else 0
-            pace_ratio = round(pct_spent / pct_time, 2) if pct_time > 0 else 0
-            projected = int(spent / pct_time) if pct_time > 0 else 0
-
-            if pace_ratio <= 1.1:
-                pacing_status = "on_pace"
-            elif pace_ratio <= 1.3:
-                pacing_status = "slightly_over"
-            else:
-                pacing_status = "over_budget"
-
-            results.append({
-                "platform": b.source_platform,
-                "budget_cents": b.budget_monthly_cents,
-                "spent_cents": spent,
-                "pct_spent": pct_spent,
-                "pct_time": pct_time,
-                "pace_ratio": pace_ratio,
-                "projected_total_cents": projected,
-                "status": pacing_status,
-                "budget_id": b.id,
-            })
-
-        return results
+        month_start, pct_time = _month_progress(today)
+        spend_by_platform = self._get_mtd_spend_cents(month_start, today)
+
+        return [
+            _build_pacing(b, spend_by_platform.get(b.source_platform, 0), pct_time)
+            for b in budgets
+            if b.enabled
+        ]
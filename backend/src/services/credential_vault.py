@@ -26,10 +26,15 @@ Usage:
 
 import json
 import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from threading import Lock
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.orm import Session
 
 from src.models.connector_credential import (
@@ -42,6 +47,15 @@ from src.platform.secrets import encrypt_secret, decrypt_secret
 
 logger = logging.getLogger(__name__)
 
+# Decrypted payload cache (per process). Kept deliberately short-lived so a
+# credential changed by another process is never served for long.
+PAYLOAD_CACHE_TTL_SECONDS = float(
+    os.getenv("CREDENTIAL_CACHE_TTL_SECONDS", "30")
+)
+PAYLOAD_CACHE_MAX_ENTRIES = int(
+    os.getenv("CREDENTIAL_CACHE_MAX_ENTRIES", "256")
+)
+
 
 class CredentialVaultError(Exception):
     """Base error for credential vault operations."""
@@ -58,6 +72,196 @@ class CredentialNotRestorableError(CredentialVaultError):
     pass
 
 
+@dataclass
+class PayloadCacheStats:
+    """Hit/miss counters for the decrypted payload cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+    @property
+    def decrypts_saved(self) -> int:
+        """Each hit is one decrypt_secret call (and DB read) avoided."""
+        return self.hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": self.size,
+            "decrypts_saved": self.decrypts_saved,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class _CachedPayload:
+    """
+    Plaintext credential JSON held in a mutable buffer.
+
+    The buffer is overwritten with zeros on eviction so the plaintext does
+    not linger in the cache's memory. __repr__ never exposes the payload.
+    """
+
+    __slots__ = ("_buffer", "expires_at")
+
+    def __init__(self, plaintext: str, expires_at: float):
+        self._buffer = bytearray(plaintext.encode("utf-8"))
+        self.expires_at = expires_at
+
+    def load(self) -> dict:
+        """Return a fresh dict so callers cannot mutate the cached copy."""
+        return json.loads(bytes(self._buffer))
+
+    def zeroize(self) -> None:
+        for i in range(len(self._buffer)):
+            self._buffer[i] = 0
+        self._buffer = bytearray()
+
+    def __repr__(self) -> str:
+        return f"<_CachedPayload [REDACTED] expires_at={self.expires_at:.0f}>"
+
+
+class _DecryptedPayloadCache:
+    """
+    Bounded TTL cache of decrypted credential payloads.
+
+    Keyed by (tenant_id, credential_id). Evicts the least recently used
+    entry when full, and zeroizes every entry it drops.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = PAYLOAD_CACHE_MAX_ENTRIES,
+        ttl: float = PAYLOAD_CACHE_TTL_SECONDS,
+    ):
+        self._store: OrderedDict[tuple[str, str], _CachedPayload] = OrderedDict()
+        self._lock = Lock()
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._stats = PayloadCacheStats()
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0 and self._max_entries > 0
+
+    def get(self, tenant_id: str, credential_id: str) -> Optional[dict]:
+        key = (tenant_id, credential_id)
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._store.move_to_end(key)
+            self._stats.hits += 1
+            return entry.load()
+
+    def set(self, tenant_id: str, credential_id: str, plaintext: str) -> None:
+        if not self.enabled:
+            return
+        key = (tenant_id, credential_id)
+        with self._lock:
+            if key in self._store:
+                self._drop(key)
+            self._store[key] = _CachedPayload(
+                plaintext, time.monotonic() + self._ttl
+            )
+            while len(self._store) > self._max_entries:
+                self._drop(next(iter(self._store)))
+
+    def evict(self, tenant_id: str, credential_id: str) -> bool:
+        with self._lock:
+            return self._drop((tenant_id, credential_id))
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._store):
+                self._drop(key)
+
+    def stats(self) -> PayloadCacheStats:
+        with self._lock:
+            return PayloadCacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                size=len(self._store),
+            )
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats = PayloadCacheStats()
+
+    def _drop(self, key: tuple[str, str]) -> bool:
+        entry = self._store.pop(key, None)
+        if entry is None:
+            return False
+        entry.zeroize()
+        self._stats.evictions += 1
+        return True
+
+    def __repr__(self) -> str:
+        return f"<_DecryptedPayloadCache entries={len(self._store)}>"
+
+
+_payload_cache = _DecryptedPayloadCache()
+
+
+_PENDING_EVICTIONS_KEY = "credential_vault.pending_evictions"
+
+
+def evict_cached_payload(tenant_id: str, credential_id: str) -> None:
+    """
+    Drop a credential from the decrypted payload cache now.
+
+    Use after the change is committed. For changes still pending in a
+    session, use evict_cached_payload_on_commit().
+    """
+    _payload_cache.evict(tenant_id, credential_id)
+
+
+def evict_cached_payload_on_commit(
+    db_session: Session, tenant_id: str, credential_id: str
+) -> None:
+    """
+    Drop a credential from the payload cache once db_session commits.
+
+    Evicting before the commit would let another session read the old row
+    in the meantime and cache it again. Call this from any code path that
+    changes a credential's payload or status without committing itself
+    (e.g. TokenManager refresh/revoke).
+    """
+    db_session.info.setdefault(_PENDING_EVICTIONS_KEY, set()).add(
+        (tenant_id, credential_id)
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_pending_payloads(session: Session) -> None:
+    for tenant_id, credential_id in session.info.pop(_PENDING_EVICTIONS_KEY, ()):
+        _payload_cache.evict(tenant_id, credential_id)
+
+
+def get_payload_cache_stats() -> PayloadCacheStats:
+    """Snapshot of the decrypted payload cache counters for this process."""
+    return _payload_cache.stats()
+
+
+def reset_payload_cache() -> None:
+    """Zeroize all cached payloads and reset counters (tests, shutdown)."""
+    _payload_cache.clear()
+    _payload_cache.reset_stats()
+
+
 class CredentialVault:
     """
     Secure credential vault for connector credentials.
@@ -67,7 +271,9 @@ class CredentialVault:
 
     SECURITY:
     - Encrypted payloads are never logged or returned in list operations
-    - Decryption only occurs in get_decrypted_payload()
+    - Decryption only occurs in get_decrypted_payload() / decrypt_credential()
+    - Decrypted payloads are cached per process for a short TTL only, and
+      evicted (zeroized) on rotate, status change and soft delete
     - Soft delete preserves data for 5-day restore window
     - Hard delete permanently wipes encrypted_payload after 20 days
     """
@@ -205,6 +411,9 @@ class CredentialVault:
         SECURITY: Only call this when credentials are needed for an API call.
         NEVER log, cache, or return the result to an end user.
 
+        Results are held in a short-lived per-process cache so repeated
+        calls within one job skip the DB read and decrypt_secret.
+
         Args:
             credential_id: The credential UUID
 
@@ -214,10 +423,49 @@ class CredentialVault:
         Raises:
             CredentialVaultError: If decryption fails
         """
+        cached = _payload_cache.get(self.tenant_id, credential_id)
+        if cached is not None:
+            return cached
+
         credential = self._get_active_credential(credential_id)
         if credential is None:
             return None
 
+        return await self._decrypt(credential)
+
+    async def decrypt_credential(
+        self, credential: ConnectorCredential
+    ) -> Optional[dict]:
+        """
+        Decrypt the payload of a credential the caller already loaded.
+
+        For services that select credentials themselves (token refresh,
+        platform executors). Shares the payload cache with
+        get_decrypted_payload().
+
+        Args:
+            credential: A ConnectorCredential of this vault's tenant
+
+        Returns:
+            Decrypted credential dict, or None if the payload was wiped
+
+        Raises:
+            CredentialVaultError: If the credential belongs to another
+                tenant or decryption fails
+        """
+        if credential.tenant_id != self.tenant_id:
+            raise CredentialVaultError("Credential belongs to another tenant")
+
+        cached = _payload_cache.get(self.tenant_id, credential.id)
+        if cached is not None:
+            return cached
+
+        return await self._decrypt(credential)
+
+    async def _decrypt(self, credential: ConnectorCredential) -> Optional[dict]:
+        """Decrypt a credential's payload and cache the plaintext."""
+        credential_id = credential.id
+
         if credential.is_payload_wiped:
             logger.warning(
                 "Attempted to decrypt wiped credential",
@@ -242,6 +490,8 @@ class CredentialVault:
             )
             raise CredentialVaultError("Decryption failed") from exc
 
+        _payload_cache.set(self.tenant_id, credential_id, plaintext)
+
         logger.info(
             "Credential payload decrypted",
             extra={
@@ -302,6 +552,7 @@ class CredentialVault:
         credential.encrypted_payload = encrypted
         credential.status = CredentialStatus.ACTIVE
         self.db.commit()
+        _payload_cache.evict(self.tenant_id, credential_id)
 
         logger.info(
             "Credential rotated",
@@ -337,6 +588,7 @@ class CredentialVault:
 
         credential.status = new_status
         self.db.commit()
+        _payload_cache.evict(self.tenant_id, credential_id)
 
         logger.info(
             "Credential status updated",
@@ -379,6 +631,7 @@ class CredentialVault:
         )
         credential.status = CredentialStatus.REVOKED
         self.db.commit()
+        _payload_cache.evict(self.tenant_id, credential_id)
 
         logger.info(
             "Credential soft-deleted",
@@ -476,10 +729,12 @@ class CredentialVault:
             return 0
 
         purged_count = 0
+        purged_keys = []
         for credential in expired:
             # Step 1: Wipe encrypted payload to NULL (defense in depth)
             credential.encrypted_payload = None
             db_session.flush()
+            purged_keys.append((credential.tenant_id, credential.id))
 
             # Step 2: Delete the row entirely
             db_session.delete(credential)
@@ -495,6 +750,8 @@ class CredentialVault:
             )
 
         db_session.commit()
+        for tenant_id, credential_id in purged_keys:
+            _payload_cache.evict(tenant_id, credential_id)
 
         logger.info(
             "Credential purge completed",
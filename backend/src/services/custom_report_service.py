@@ -21,7 +21,7 @@ from src.services.custom_dashboard_service import (
     CustomDashboardService,
     DashboardNotFoundError,
 )
-from src.services.dataset_discovery_service import DatasetDiscoveryService
+from src.services.dataset_discovery_service import get_discovery_service
 
 logger = logging.getLogger(__name__)
 
@@ -253,10 +253,9 @@ class CustomReportService:
     # =========================================================================
 
     def _validate_dataset_access(self, dataset_name: str) -> None:
-        """Verify the dataset exists in Superset's discoverable datasets."""
+        """Verify the dataset exists in the dataset catalog."""
         try:
-            discovery = DatasetDiscoveryService()
-            result = discovery.discover_datasets()
+            result = get_discovery_service().discover_datasets(self.db)
             known_names = {ds.dataset_name for ds in result.datasets}
             if dataset_name not in known_names:
                 raise DatasetNotFoundError(
@@ -266,8 +265,8 @@ class CustomReportService:
         except DatasetNotFoundError:
             raise
         except Exception as exc:
-            # If Superset is unreachable, allow the operation but log a warning.
-            # This avoids blocking dashboard creation when Superset is temporarily down.
+            # If the catalog is unreadable, allow the operation but log a warning.
+            # This avoids blocking dashboard creation when it is temporarily down.
             logger.warning(
                 "custom_report.dataset_validation_skipped",
                 extra={"dataset_name": dataset_name, "error": str(exc)},
@@ -11,14 +11,20 @@ SECURITY:
 - Read-only operations
 """
 
+import base64
 import logging
 from datetime import datetime, timezone, timedelta
 from typing import Optional, List, Tuple
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import and_, func, or_, select, text
 
-from src.models.data_change_event import DataChangeEvent, DataChangeEventType
+from src.models.data_change_event import (
+    DataChangeDailyCount,
+    DataChangeEvent,
+    DataChangeEventType,
+    DataChangeFeedState,
+)
 from src.models.dq_models import (
     SyncRun, DQIncident, DQIncidentStatus,
     BackfillJob
@@ -35,6 +41,56 @@ logger = logging.getLogger(__name__)
 SYNC_AFFECTED_METRICS = ["revenue", "orders", "sessions", "ad_spend"]
 AI_ACTION_AFFECTED_METRICS = ["ad_spend", "roas", "cac"]
 
+# Event types counted as metric-affecting changes in the summary
+METRIC_CHANGE_EVENT_TYPES = [
+    DataChangeEventType.SYNC_COMPLETED.value,
+    DataChangeEventType.BACKFILL_COMPLETED.value,
+    DataChangeEventType.AI_ACTION_EXECUTED.value,
+]
+
+_INCREMENT_DAILY_COUNT = text("""
+    INSERT INTO data_change_daily_counts (tenant_id, bucket_date, event_type, event_count)
+    VALUES (:tenant_id, :bucket_date, :event_type, 1)
+    ON CONFLICT (tenant_id, bucket_date, event_type)
+    DO UPDATE SET event_count = data_change_daily_counts.event_count + 1
+""")
+
+_ADVANCE_FEED_STATE = text("""
+    INSERT INTO data_change_feed_state (tenant_id, event_count, last_event_at, updated_at)
+    VALUES (:tenant_id, 1, :occurred_at, CURRENT_TIMESTAMP)
+    ON CONFLICT (tenant_id)
+    DO UPDATE SET
+        event_count = data_change_feed_state.event_count + 1,
+        last_event_at = CASE
+            WHEN data_change_feed_state.last_event_at IS NULL
+              OR excluded.last_event_at > data_change_feed_state.last_event_at
+            THEN excluded.last_event_at
+            ELSE data_change_feed_state.last_event_at
+        END,
+        updated_at = CURRENT_TIMESTAMP
+    RETURNING event_count
+""")
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a change feed cursor cannot be decoded."""
+
+
+def encode_cursor(timestamp: datetime, event_id: str) -> str:
+    """Opaque keyset cursor for a (timestamp, id) position in the feed."""
+    raw = f"{timestamp.isoformat()}|{event_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Inverse of encode_cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        timestamp, event_id = raw.split("|", 1)
+        return datetime.fromisoformat(timestamp), event_id
+    except (ValueError, UnicodeDecodeError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
 
 class DataChangeAggregator:
     """
@@ -102,8 +158,7 @@ class DataChangeAggregator:
             occurred_at=sync_run.completed_at or datetime.now(timezone.utc),
         )
 
-        self.db.add(event)
-        self.db.flush()
+        self._record(event)
 
         logger.info(
             "Recorded sync completed event",
@@ -148,8 +203,7 @@ class DataChangeAggregator:
             occurred_at=sync_run.completed_at or datetime.now(timezone.utc),
         )
 
-        self.db.add(event)
-        self.db.flush()
+        self._record(event)
 
         logger.info(
             "Recorded sync failed event",
@@ -195,8 +249,7 @@ class DataChangeAggregator:
             occurred_at=backfill.completed_at or datetime.now(timezone.utc),
         )
 
-        self.db.add(event)
-        self.db.flush()
+        self._record(event)
 
         return event
 
@@ -231,8 +284,7 @@ class DataChangeAggregator:
             occurred_at=audit.performed_at,
         )
 
-        self.db.add(event)
-        self.db.flush()
+        self._record(event)
 
         return event
 
@@ -265,8 +317,7 @@ class DataChangeAggregator:
             occurred_at=datetime.now(timezone.utc),
         )
 
-        self.db.add(event)
-        self.db.flush()
+        self._record(event)
 
         return event
 
@@ -304,8 +355,7 @@ class DataChangeAggregator:
             occurred_at=audit.performed_at,
         )
 
-        self.db.add(event)
-        self.db.flush()
+        self._record(event)
 
         return event
 
@@ -345,8 +395,7 @@ class DataChangeAggregator:
             occurred_at=datetime.now(timezone.utc),
         )
 
-        self.db.add(event)
-        self.db.flush()
+        self._record(event)
 
         return event
 
@@ -379,8 +428,7 @@ class DataChangeAggregator:
             occurred_at=incident.opened_at,
         )
 
-        self.db.add(event)
-        self.db.flush()
+        self._record(event)
 
         return event
 
@@ -413,8 +461,7 @@ class DataChangeAggregator:
             occurred_at=incident.resolved_at or datetime.now(timezone.utc),
         )
 
-        self.db.add(event)
-        self.db.flush()
+        self._record(event)
 
         return event
 
@@ -422,6 +469,31 @@ class DataChangeAggregator:
     # Query Methods (for the debug panel API)
     # =========================================================================
 
+    def _change_events_query(
+        self,
+        event_type: Optional[str],
+        connector_id: Optional[str],
+        metric: Optional[str],
+        days: int,
+    ):
+        since = datetime.now(timezone.utc) - timedelta(days=days)
+
+        query = self.db.query(DataChangeEvent).filter(
+            DataChangeEvent.tenant_id == self.tenant_id,
+            DataChangeEvent.occurred_at >= since,
+        )
+
+        if event_type:
+            query = query.filter(DataChangeEvent.event_type == event_type)
+
+        if connector_id:
+            query = query.filter(DataChangeEvent.affected_connector_id == connector_id)
+
+        if metric:
+            query = query.filter(DataChangeEvent.affected_metrics.contains([metric]))
+
+        return query
+
     def get_change_events(
         self,
         event_type: Optional[str] = None,
@@ -445,27 +517,13 @@ class DataChangeAggregator:
         Returns:
             Tuple of (events, total_count)
         """
-        since = datetime.now(timezone.utc) - timedelta(days=days)
-
-        query = self.db.query(DataChangeEvent).filter(
-            DataChangeEvent.tenant_id == self.tenant_id,
-            DataChangeEvent.occurred_at >= since,
-        )
-
-        if event_type:
-            query = query.filter(DataChangeEvent.event_type == event_type)
-
-        if connector_id:
-            query = query.filter(DataChangeEvent.affected_connector_id == connector_id)
-
-        if metric:
-            query = query.filter(DataChangeEvent.affected_metrics.contains([metric]))
+        query = self._change_events_query(event_type, connector_id, metric, days)
 
         total = query.count()
 
         events = (
             query
-            .order_by(DataChangeEvent.occurred_at.desc())
+            .order_by(DataChangeEvent.occurred_at.desc(), DataChangeEvent.id.desc())
             .offset(offset)
             .limit(limit)
             .all()
@@ -473,6 +531,106 @@ class DataChangeAggregator:
 
         return events, total
 
+    def get_change_events_page(
+        self,
+        cursor: str,
+        event_type: Optional[str] = None,
+        connector_id: Optional[str] = None,
+        metric: Optional[str] = None,
+        days: int = 7,
+        limit: int = 50,
+    ) -> Tuple[List[DataChangeEvent], Optional[str]]:
+        """
+        Get the page of change events after a keyset cursor.
+
+        Seeks past the cursor on the (occurred_at, id) index instead of
+        counting and skipping rows, so deep pages cost the same as the first.
+
+        Args:
+            cursor: Cursor returned with the previous page
+            event_type: Filter by event type (optional)
+            connector_id: Filter by connector (optional)
+            metric: Filter by affected metric (optional)
+            days: Number of days to look back
+            limit: Maximum results
+
+        Returns:
+            Tuple of (events, next_cursor); next_cursor is None on the last page
+
+        Raises:
+            InvalidCursorError: If the cursor cannot be decoded
+        """
+        occurred_at, event_id = decode_cursor(cursor)
+
+        events = (
+            self._change_events_query(event_type, connector_id, metric, days)
+            .filter(or_(
+                DataChangeEvent.occurred_at < occurred_at,
+                and_(
+                    DataChangeEvent.occurred_at == occurred_at,
+                    DataChangeEvent.id < event_id,
+                ),
+            ))
+            .order_by(DataChangeEvent.occurred_at.desc(), DataChangeEvent.id.desc())
+            .limit(limit + 1)
+            .all()
+        )
+
+        next_cursor = None
+        if len(events) > limit:
+            events = events[:limit]
+            next_cursor = self.cursor_for(events[-1])
+        return events, next_cursor
+
+    @staticmethod
+    def cursor_for(event: DataChangeEvent) -> str:
+        """Keyset cursor positioned after the given event (newest-first order)."""
+        return encode_cursor(event.occurred_at, event.id)
+
+    def get_feed_version(self) -> int:
+        """
+        Sequence of the tenant's most recently recorded event (0 if none).
+
+        Reads the single feed state row; it changes exactly when a new
+        event is recorded.
+        """
+        version = (
+            self.db.query(DataChangeFeedState.event_count)
+            .filter(DataChangeFeedState.tenant_id == self.tenant_id)
+            .scalar()
+        )
+        return version or 0
+
+    def get_events_recorded_after(
+        self,
+        sequence: int,
+        limit: int = 100,
+    ) -> List[DataChangeEvent]:
+        """
+        Get events recorded after a feed sequence, oldest first.
+
+        Ordered by when events were recorded rather than when they
+        occurred, so late-arriving events with an older occurred_at are
+        still delivered to live subscribers.
+
+        Args:
+            sequence: Last feed_sequence the caller has seen
+            limit: Maximum results
+
+        Returns:
+            List of DataChangeEvent in recording order
+        """
+        return (
+            self.db.query(DataChangeEvent)
+            .filter(
+                DataChangeEvent.tenant_id == self.tenant_id,
+                DataChangeEvent.feed_sequence > sequence,
+            )
+            .order_by(DataChangeEvent.feed_sequence.asc())
+            .limit(limit)
+            .all()
+        )
+
     def get_freshness_status(self) -> dict:
         """
         Get overall data freshness status.
@@ -717,20 +875,20 @@ class DataChangeAggregator:
         # Get freshness status
         freshness = self.get_freshness_status()
 
-        # Count recent syncs
+        # Recent syncs and AI actions, open incidents and metric-affecting
+        # changes in one round trip. Metric changes sum the precomputed
+        # daily counts (whole UTC days) instead of scanning events.
         syncs_count = (
-            self.db.query(func.count(SyncRun.run_id))
-            .filter(
+            select(func.count(SyncRun.run_id))
+            .where(
                 SyncRun.tenant_id == self.tenant_id,
                 SyncRun.started_at >= since,
             )
-            .scalar()
-        ) or 0
-
-        # Count recent AI actions
+            .scalar_subquery()
+        )
         ai_actions_count = (
-            self.db.query(func.count(ActionApprovalAudit.id))
-            .filter(
+            select(func.count(ActionApprovalAudit.id))
+            .where(
                 ActionApprovalAudit.tenant_id == self.tenant_id,
                 ActionApprovalAudit.performed_at >= since,
                 ActionApprovalAudit.action.in_([
@@ -738,43 +896,38 @@ class DataChangeAggregator:
                     AuditAction.REJECTED,
                 ]),
             )
-            .scalar()
-        ) or 0
-
-        # Count open incidents
+            .scalar_subquery()
+        )
         open_incidents_count = (
-            self.db.query(func.count(DQIncident.id))
-            .filter(
+            select(func.count(DQIncident.id))
+            .where(
                 DQIncident.tenant_id == self.tenant_id,
                 DQIncident.status.in_([
                     DQIncidentStatus.OPEN.value,
                     DQIncidentStatus.ACKNOWLEDGED.value,
                 ]),
             )
-            .scalar()
-        ) or 0
-
-        # Count metric-affecting change events
+            .scalar_subquery()
+        )
         metric_changes_count = (
-            self.db.query(func.count(DataChangeEvent.id))
-            .filter(
-                DataChangeEvent.tenant_id == self.tenant_id,
-                DataChangeEvent.occurred_at >= since,
-                DataChangeEvent.event_type.in_([
-                    DataChangeEventType.SYNC_COMPLETED.value,
-                    DataChangeEventType.BACKFILL_COMPLETED.value,
-                    DataChangeEventType.AI_ACTION_EXECUTED.value,
-                ]),
+            select(func.coalesce(func.sum(DataChangeDailyCount.event_count), 0))
+            .where(
+                DataChangeDailyCount.tenant_id == self.tenant_id,
+                DataChangeDailyCount.bucket_date >= since.date(),
+                DataChangeDailyCount.event_type.in_(METRIC_CHANGE_EVENT_TYPES),
             )
-            .scalar()
-        ) or 0
+            .scalar_subquery()
+        )
+        counts = self.db.execute(select(
+            syncs_count, ai_actions_count, open_incidents_count, metric_changes_count,
+        )).one()
 
         return {
             "data_freshness": freshness,
-            "recent_syncs_count": syncs_count,
-            "recent_ai_actions_count": ai_actions_count,
-            "open_incidents_count": open_incidents_count,
-            "metric_changes_count": metric_changes_count,
+            "recent_syncs_count": counts[0] or 0,
+            "recent_ai_actions_count": counts[1] or 0,
+            "open_incidents_count": counts[2] or 0,
+            "metric_changes_count": int(counts[3] or 0),
             "last_updated": datetime.now(timezone.utc),
         }
 
@@ -782,6 +935,35 @@ class DataChangeAggregator:
     # Helper Methods
     # =========================================================================
 
+    def _record(self, event: DataChangeEvent) -> None:
+        """
+        Persist an event and advance the tenant's precomputed counters.
+
+        The feed state upsert hands out the event's feed_sequence. Its row
+        lock serializes concurrent writers per tenant, so sequences commit
+        in order. All writes run in the caller's transaction and commit
+        (or roll back) with the event itself.
+        """
+        if event.occurred_at is None:
+            event.occurred_at = datetime.now(timezone.utc)
+
+        event.feed_sequence = self.db.execute(_ADVANCE_FEED_STATE, {
+            "tenant_id": self.tenant_id,
+            "occurred_at": event.occurred_at,
+        }).scalar()
+
+        self.db.add(event)
+        self.db.flush()
+
+        occurred_at = event.occurred_at
+        if occurred_at.tzinfo is not None:
+            occurred_at = occurred_at.astimezone(timezone.utc)
+        self.db.execute(_INCREMENT_DAILY_COUNT, {
+            "tenant_id": self.tenant_id,
+            "bucket_date": occurred_at.date(),
+            "event_type": event.event_type,
+        })
+
     def _sanitize_error_message(self, message: Optional[str]) -> Optional[str]:
         """
         Sanitize error message to remove sensitive data.
@@ -921,8 +1103,7 @@ class DataChangeAggregator:
             occurred_at=datetime.now(timezone.utc),
         )
 
-        self.db.add(event)
-        self.db.flush()
+        self._record(event)
 
         logger.info(
             "Recorded sync completed event (simple)",
@@ -973,8 +1154,7 @@ class DataChangeAggregator:
             occurred_at=datetime.now(timezone.utc),
         )
 
-        self.db.add(event)
-        self.db.flush()
+        self._record(event)
 
         logger.info(
             "Recorded sync failed event (simple)",
@@ -1034,8 +1214,7 @@ class DataChangeAggregator:
             occurred_at=datetime.now(timezone.utc),
         )
 
-        self.db.add(event)
-        self.db.flush()
+        self._record(event)
 
         logger.info(
             "Recorded AI action executed event (simple)",
@@ -1,28 +1,40 @@
 """
 Dataset Discovery Service.
 
-Queries Superset API for available datasets and their column metadata.
-Caches results with 5-minute TTL and bounded cache size.
-Returns column-level metadata including is_metric, is_dimension, and
-data_type for frontend chart builder filtering.
-
-Handles Superset unavailability by returning stale cached data with a
+Serves available datasets and their column metadata from the dataset
+catalog (dataset_catalog table), which the dbt manifest -> Superset
+dataset sync keeps up to date. Returns column-level metadata including
+is_metric, is_dimension, and data_type for frontend chart builder
+filtering. Superset is never called on the request path.
+
+Caching is two-level:
+- L1: each worker keeps the whole catalog in memory, tagged with the
+  catalog ETag it was loaded at
+- L2: the catalog in Postgres, shared by every worker
+
+After CATALOG_REVALIDATE_SECONDS a worker re-reads the catalog ETag and
+reloads the rows only when it changed, so a sync is picked up by every
+worker without any of them cold-starting against Superset.
+
+If the catalog cannot be read, the last loaded copy is returned with a
 stale flag. Validates existing report configs against current schema
 and returns warnings for missing columns.
 
 Phase 2A - Dataset Discovery API
 """
 
+import hashlib
 import json
 import logging
 import os
 import time
-from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-import httpx
+from sqlalchemy.orm import Session
+
+from src.models.dataset_catalog import DatasetCatalogEntry
 
 logger = logging.getLogger(__name__)
 
@@ -39,9 +51,9 @@ DATETIME_DATA_TYPES = frozenset({
     "TIMESTAMP WITHOUT TIME ZONE", "TIMESTAMPTZ",
 })
 
-CACHE_TTL_SECONDS = 300  # 5 minutes
-MAX_CACHE_ENTRIES = 200  # Bound cache memory
-MAX_PAGINATION_PAGES = 50  # Guard against runaway pagination loops
+# How long a worker serves its in-process catalog before re-checking the
+# catalog ETag in Postgres (one small query; a full reload only on change)
+CATALOG_REVALIDATE_SECONDS = int(os.getenv("DATASET_CATALOG_REVALIDATE_SECONDS", "30"))
 
 
 @dataclass
@@ -105,160 +117,200 @@ def classify_column(column_name: str, data_type: str) -> ColumnMetadata:
     )
 
 
-class _BoundedCache:
-    """TTL cache with bounded size. Evicts oldest entries when full."""
+# =============================================================================
+# Dataset catalog (L2)
+# =============================================================================
 
-    def __init__(self, max_entries: int = MAX_CACHE_ENTRIES, ttl: int = CACHE_TTL_SECONDS):
-        self._store: OrderedDict[str, tuple[float, Any]] = OrderedDict()
-        self._max_entries = max_entries
-        self._ttl = ttl
 
-    def get(self, key: str) -> Optional[tuple[bool, float, Any]]:
-        """Return (is_stale, cached_at_timestamp, data) or None."""
-        entry = self._store.get(key)
-        if entry is None:
-            return None
-        cached_at, data = entry
-        is_stale = (time.time() - cached_at) > self._ttl
-        return is_stale, cached_at, data
+def catalog_entry_etag(
+    superset_dataset_id: int,
+    schema_name: str,
+    description: str,
+    columns: list[dict[str, Any]],
+) -> str:
+    """Content hash of one catalog entry."""
+    payload = json.dumps(
+        [superset_dataset_id, schema_name, description, columns],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _catalog_etag(entry_etags: list[tuple[str, str]]) -> Optional[str]:
+    """Catalog ETag from (dataset_name, etag) pairs; None for an empty catalog."""
+    if not entry_etags:
+        return None
+    digest = hashlib.sha256()
+    for dataset_name, etag in sorted(entry_etags):
+        digest.update(f"{dataset_name}:{etag}\n".encode())
+    return digest.hexdigest()[:32]
+
+
+def upsert_catalog_entry(
+    db: Session,
+    dataset_name: str,
+    superset_dataset_id: int,
+    schema_name: str,
+    description: str,
+    columns: list[dict[str, Any]],
+) -> bool:
+    """
+    Write one dataset's discovery metadata to the catalog.
+
+    Columns are the dataset's exposed columns as
+    {column_name, data_type, description} dicts. An unchanged entry is
+    left untouched so the catalog ETag (and every worker's L1) survives
+    no-op syncs.
+
+    Returns:
+        True if the entry was created or changed
+    """
+    etag = catalog_entry_etag(superset_dataset_id, schema_name, description, columns)
+    entry = db.get(DatasetCatalogEntry, dataset_name)
+    if entry is not None and entry.etag == etag:
+        return False
+
+    if entry is None:
+        entry = DatasetCatalogEntry(dataset_name=dataset_name)
+        db.add(entry)
+    entry.superset_dataset_id = superset_dataset_id
+    entry.schema_name = schema_name
+    entry.description = description
+    entry.columns = json.dumps(columns, default=str)
+    entry.etag = etag
+    db.flush()
+    return True
+
+
+def read_catalog_etag(db: Session) -> Optional[str]:
+    """Current catalog ETag (reads only dataset names and entry etags)."""
+    rows = db.query(DatasetCatalogEntry.dataset_name, DatasetCatalogEntry.etag).all()
+    return _catalog_etag([(row[0], row[1]) for row in rows])
+
+
+def _dataset_from_entry(entry: DatasetCatalogEntry) -> DatasetInfo:
+    columns: list[ColumnMetadata] = []
+    for col in json.loads(entry.columns or "[]"):
+        meta = classify_column(col.get("column_name", ""), col.get("data_type") or "VARCHAR")
+        meta.description = col.get("description", "") or ""
+        columns.append(meta)
+    return DatasetInfo(
+        dataset_name=entry.dataset_name,
+        dataset_id=entry.superset_dataset_id,
+        schema=entry.schema_name or "",
+        description=entry.description or "",
+        columns=columns,
+    )
+
+
+def load_catalog(db: Session) -> tuple[Optional[str], list[DatasetInfo]]:
+    """Read the full catalog. Returns (catalog ETag, datasets)."""
+    entries = (
+        db.query(DatasetCatalogEntry)
+        .order_by(DatasetCatalogEntry.dataset_name)
+        .all()
+    )
+    etag = _catalog_etag([(e.dataset_name, e.etag) for e in entries])
+    return etag, [_dataset_from_entry(e) for e in entries]
+
+
+# =============================================================================
+# Discovery service (L1)
+# =============================================================================
 
-    def set(self, key: str, data: Any) -> None:
-        """Set cache entry, evicting oldest if at capacity."""
-        if key in self._store:
-            self._store.move_to_end(key)
-        self._store[key] = (time.time(), data)
-        while len(self._store) > self._max_entries:
-            self._store.popitem(last=False)
+
+@dataclass(frozen=True)
+class _CatalogSnapshot:
+    """One worker's in-process copy of the catalog. Replaced, never mutated."""
+
+    etag: Optional[str]
+    datasets: list[DatasetInfo]
+    by_id: dict[int, DatasetInfo]
+    loaded_at: float
+    checked_at: float
 
 
 class DatasetDiscoveryService:
-    """Discovers datasets and columns from Superset with caching."""
+    """Serves datasets and columns from the dataset catalog with an in-process cache."""
 
-    def __init__(
-        self,
-        superset_url: Optional[str] = None,
-        superset_username: Optional[str] = None,
-        superset_password: Optional[str] = None,
-        timeout_seconds: int = 10,
-    ):
-        self._superset_url = (superset_url or os.getenv("SUPERSET_EMBED_URL", "")).rstrip("/")
-        self._username = superset_username or os.getenv("SUPERSET_USERNAME")
-        self._password = superset_password or os.getenv("SUPERSET_PASSWORD")
-        if not self._username or not self._password:
-            raise ValueError("SUPERSET_USERNAME and SUPERSET_PASSWORD must be set")
-        self._timeout = timeout_seconds
-        self._token: Optional[str] = None
-        self._csrf: Optional[str] = None
-        self._token_obtained_at: float = 0.0
-        self._cache = _BoundedCache()
-
-    def _clear_auth(self) -> None:
-        """Clear cached auth tokens to force re-authentication."""
-        self._token = None
-        self._csrf = None
-        self._token_obtained_at = 0.0
-
-    def _ensure_auth(self, client: httpx.Client) -> None:
-        """Authenticate with Superset. Re-authenticates if token is older than 30 minutes."""
-        token_age = time.time() - self._token_obtained_at
-        if self._token and token_age < 1800:  # 30 minute token lifetime
-            return
-        # Clear stale token and re-authenticate
-        self._clear_auth()
-        resp = client.post(
-            f"{self._superset_url}/api/v1/security/login",
-            json={
-                "username": self._username,
-                "password": self._password,
-                "provider": "db",
-            },
-            timeout=self._timeout,
-        )
-        resp.raise_for_status()
-        self._token = resp.json()["access_token"]
-        self._token_obtained_at = time.time()
-
-        csrf_resp = client.get(
-            f"{self._superset_url}/api/v1/security/csrf_token/",
-            headers={"Authorization": f"Bearer {self._token}"},
-            timeout=self._timeout,
-        )
-        csrf_resp.raise_for_status()
-        self._csrf = csrf_resp.json().get("result", "")
-
-    def _auth_headers(self) -> dict[str, str]:
-        return {
-            "Authorization": f"Bearer {self._token}",
-            "X-CSRFToken": self._csrf or "",
-            "Content-Type": "application/json",
-        }
-
-    def _handle_401(self, resp: httpx.Response) -> None:
-        """Clear auth on 401 so next call re-authenticates."""
-        if resp.status_code == 401:
-            logger.warning("dataset_discovery.superset_401_clearing_token")
-            self._clear_auth()
-
-    def discover_datasets(self) -> DatasetDiscoveryResult:
-        """
-        Fetch all available datasets and their columns from Superset.
+    def __init__(self, revalidate_seconds: int = CATALOG_REVALIDATE_SECONDS):
+        self._revalidate_seconds = revalidate_seconds
+        self._snapshot: Optional[_CatalogSnapshot] = None
 
-        Returns cached data with stale=True if Superset is unavailable.
+    def _revalidate(self, db: Session) -> Optional[str]:
         """
-        cache_key = "all_datasets"
-        cached = self._cache.get(cache_key)
+        Bring the in-process catalog up to date if it is due for a check.
 
-        # Return fresh cache immediately
-        if cached is not None:
-            is_stale, _, _ = cached
-            if not is_stale:
-                _, cached_at, data = cached
-                return DatasetDiscoveryResult(datasets=data)
+        Returns:
+            An error message if the catalog could not be read, else None
+        """
+        snapshot = self._snapshot
+        now = time.monotonic()
+        if snapshot is not None and now - snapshot.checked_at < self._revalidate_seconds:
+            return None
 
         try:
-            datasets = self._fetch_datasets_from_superset()
-            self._cache.set(cache_key, datasets)
-            return DatasetDiscoveryResult(datasets=datasets)
+            etag = read_catalog_etag(db)
+            if snapshot is not None and etag == snapshot.etag:
+                self._snapshot = _CatalogSnapshot(
+                    snapshot.etag, snapshot.datasets, snapshot.by_id,
+                    snapshot.loaded_at, now,
+                )
+                return None
+
+            etag, datasets = load_catalog(db)
         except Exception as exc:
             logger.warning(
-                "dataset_discovery.superset_unavailable",
+                "dataset_discovery.catalog_unavailable",
                 extra={"error": str(exc)},
             )
-            if cached is not None:
-                _, cached_at, data = cached
-                return DatasetDiscoveryResult(
-                    datasets=data,
-                    stale=True,
-                    cached_at=datetime.fromtimestamp(cached_at, tz=timezone.utc).isoformat(),
-                    error="Superset temporarily unavailable, showing cached data",
-                )
-            return DatasetDiscoveryResult(
-                error="Superset unavailable and no cached data available",
-            )
+            return str(exc)
+
+        self._snapshot = _CatalogSnapshot(
+            etag=etag,
+            datasets=datasets,
+            by_id={ds.dataset_id: ds for ds in datasets},
+            loaded_at=time.time(),
+            checked_at=now,
+        )
+        logger.info(
+            "dataset_discovery.catalog_loaded",
+            extra={"etag": etag, "dataset_count": len(datasets)},
+        )
+        return None
 
-    def get_dataset_columns(self, dataset_id: int) -> list[ColumnMetadata]:
-        """Fetch columns for a specific dataset by Superset dataset ID."""
-        cache_key = f"dataset_columns_{dataset_id}"
-        cached = self._cache.get(cache_key)
+    def discover_datasets(self, db: Session) -> DatasetDiscoveryResult:
+        """
+        Return all available datasets and their columns.
 
-        if cached is not None:
-            is_stale, _, data = cached
-            if not is_stale:
-                return data
+        Returns the last loaded catalog with stale=True if the catalog
+        cannot be read.
+        """
+        error = self._revalidate(db)
+        snapshot = self._snapshot
 
-        try:
-            columns = self._fetch_columns_from_superset(dataset_id)
-            self._cache.set(cache_key, columns)
-            return columns
-        except Exception as exc:
-            logger.warning(
-                "dataset_discovery.columns_fetch_failed",
-                extra={"dataset_id": dataset_id, "error": str(exc)},
+        if error is None:
+            return DatasetDiscoveryResult(datasets=snapshot.datasets)
+        if snapshot is not None:
+            return DatasetDiscoveryResult(
+                datasets=snapshot.datasets,
+                stale=True,
+                cached_at=datetime.fromtimestamp(snapshot.loaded_at, tz=timezone.utc).isoformat(),
+                error="Dataset catalog temporarily unavailable, showing cached data",
             )
-            if cached is not None:
-                _, _, data = cached
-                return data
+        return DatasetDiscoveryResult(
+            error="Dataset catalog unavailable and no cached data available",
+        )
+
+    def get_dataset_columns(self, db: Session, dataset_id: int) -> list[ColumnMetadata]:
+        """Return columns for a specific dataset by Superset dataset ID."""
+        self._revalidate(db)
+        snapshot = self._snapshot
+        if snapshot is None:
             return []
+        dataset = snapshot.by_id.get(dataset_id)
+        return dataset.columns if dataset is not None else []
 
     def validate_config_columns(
         self,
@@ -282,81 +334,13 @@ class DatasetDiscoveryService:
                 ))
         return warnings
 
-    def _fetch_datasets_from_superset(self) -> list[DatasetInfo]:
-        """Query Superset API for all available datasets with columns."""
-        datasets: list[DatasetInfo] = []
-        with httpx.Client(timeout=self._timeout) as client:
-            self._ensure_auth(client)
-            page = 0
-            page_size = 100
-            while page < MAX_PAGINATION_PAGES:
-                resp = client.get(
-                    f"{self._superset_url}/api/v1/dataset/",
-                    headers=self._auth_headers(),
-                    params={
-                        "q": json.dumps({
-                            "page": page,
-                            "page_size": page_size,
-                            "columns": [
-                                "id", "table_name", "schema",
-                                "description",
-                            ],
-                        })
-                    },
-                )
-                self._handle_401(resp)
-                resp.raise_for_status()
-                result = resp.json().get("result", [])
-                if not result:
-                    break
-
-                for ds in result:
-                    ds_id = ds.get("id")
-                    columns = self._fetch_columns_from_superset(
-                        ds_id, client=client,
-                    )
-                    datasets.append(DatasetInfo(
-                        dataset_name=ds.get("table_name", ""),
-                        dataset_id=ds_id,
-                        schema=ds.get("schema", ""),
-                        description=ds.get("description", "") or "",
-                        columns=columns,
-                    ))
-
-                if len(result) < page_size:
-                    break
-                page += 1
-
-        return datasets
-
-    def _fetch_columns_from_superset(
-        self,
-        dataset_id: int,
-        client: Optional[httpx.Client] = None,
-    ) -> list[ColumnMetadata]:
-        """Fetch and classify columns for a single dataset."""
-        def _do_fetch(c: httpx.Client) -> list[ColumnMetadata]:
-            resp = c.get(
-                f"{self._superset_url}/api/v1/dataset/{dataset_id}",
-                headers=self._auth_headers(),
-            )
-            self._handle_401(resp)
-            resp.raise_for_status()
-            ds_data = resp.json().get("result", {})
-            raw_columns = ds_data.get("columns", [])
-            columns: list[ColumnMetadata] = []
-            for col in raw_columns:
-                col_name = col.get("column_name", "")
-                data_type = col.get("type", "VARCHAR") or "VARCHAR"
-                description = col.get("description", "") or col.get("verbose_name", "") or ""
-                meta = classify_column(col_name, data_type)
-                meta.description = description
-                columns.append(meta)
-            return columns
-
-        if client is not None:
-            return _do_fetch(client)
-
-        with httpx.Client(timeout=self._timeout) as new_client:
-            self._ensure_auth(new_client)
-            return _do_fetch(new_client)
+
+_discovery_service: Optional[DatasetDiscoveryService] = None
+
+
+def get_discovery_service() -> DatasetDiscoveryService:
+    """Process-wide discovery service, so every caller shares one L1 catalog."""
+    global _discovery_service
+    if _discovery_service is None:
+        _discovery_service = DatasetDiscoveryService()
+    return _discovery_service
@@ -0,0 +1,232 @@
+"""
+Shared, cached index over the dbt manifest.json.
+
+Post-run processing (dbt run listener, Superset dataset sync, schema
+compatibility checks, backfill planning) all read the same manifest. This
+module parses it once per file version and exposes the lookups those
+consumers need:
+
+- nodes_by_name: model name -> manifest node
+- semantic_exposed_columns: semantic view -> superset_expose columns
+- parents / children: node_id adjacency (dbt parent_map / child_map)
+- content_hash: sha256 of the manifest bytes
+
+The file is memory-mapped, hashed and parsed in one pass (orjson when
+installed, stdlib json otherwise). Indexes are cached per path until the
+file's mtime or size changes; consumers can memoise their own derived
+structures on the index via ManifestIndex.derive().
+
+The parsed manifest is shared between consumers and must be treated as
+read-only.
+
+Story 5.2 — Prompt 5.2.4
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def is_semantic_view(name: str) -> bool:
+    """True if the model is a semantic view (fact_*_current alias or sem_*_v1)."""
+    if name.endswith("_current") and name.startswith("fact_"):
+        return True
+    if name.startswith("sem_") and "_v1" in name:
+        return True
+    return False
+
+
+def semantic_exposed_columns(manifest: dict[str, Any]) -> dict[str, list[dict]]:
+    """Extract semantic view name -> list of {column_name, description, data_type} for exposed only."""
+    nodes = manifest.get("nodes", {}) or {}
+    result: dict[str, list[dict]] = {}
+
+    for node_id, node in nodes.items():
+        if not node_id.startswith("model."):
+            continue
+        name = node.get("name", "")
+        if not is_semantic_view(name):
+            continue
+
+        columns = []
+        for col_name, col_info in (node.get("columns", {}) or {}).items():
+            if not isinstance(col_info, dict):
+                continue
+            meta = col_info.get("meta", {}) or {}
+            if not meta.get("superset_expose", False):
+                continue
+            columns.append({
+                "column_name": col_name,
+                "description": col_info.get("description", ""),
+                "data_type": col_info.get("data_type", "VARCHAR"),
+            })
+        result[name] = columns
+
+    return result
+
+
+def _build_adjacency(
+    manifest: dict[str, Any],
+) -> tuple[dict[str, tuple[str, ...]], dict[str, tuple[str, ...]]]:
+    """Parent/child maps, preferring the ones dbt already wrote to the manifest."""
+    parent_map = manifest.get("parent_map")
+    child_map = manifest.get("child_map")
+    if isinstance(parent_map, dict) and isinstance(child_map, dict):
+        return (
+            {k: tuple(v) for k, v in parent_map.items()},
+            {k: tuple(v) for k, v in child_map.items()},
+        )
+
+    parents: dict[str, tuple[str, ...]] = {}
+    children: dict[str, list[str]] = {}
+    for node_id, node in (manifest.get("nodes", {}) or {}).items():
+        upstream = (node.get("depends_on", {}) or {}).get("nodes", []) or []
+        parents[node_id] = tuple(upstream)
+        children.setdefault(node_id, [])
+        for parent in upstream:
+            children.setdefault(parent, []).append(node_id)
+    return parents, {k: tuple(v) for k, v in children.items()}
+
+
+@dataclass
+class ManifestIndex:
+    """Parsed manifest plus lookups shared by all post-run consumers."""
+
+    path: str
+    manifest: dict[str, Any]
+    content_hash: str
+    nodes_by_name: dict[str, dict[str, Any]]
+    semantic_exposed_columns: dict[str, list[dict]]
+    parents: dict[str, tuple[str, ...]]
+    children: dict[str, tuple[str, ...]]
+    _derived: dict[str, Any] = field(default_factory=dict, repr=False)
+    _derived_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @classmethod
+    def from_manifest(
+        cls,
+        manifest: dict[str, Any],
+        path: str = "",
+        content_hash: str | None = None,
+    ) -> "ManifestIndex":
+        """Build an index from an already-parsed manifest."""
+        if content_hash is None:
+            content_hash = hashlib.sha256(
+                json.dumps(manifest, sort_keys=True).encode()
+            ).hexdigest()
+        nodes_by_name = {
+            node["name"]: node
+            for node_id, node in (manifest.get("nodes", {}) or {}).items()
+            if node_id.startswith("model.") and "name" in node
+        }
+        parents, children = _build_adjacency(manifest)
+        return cls(
+            path=path,
+            manifest=manifest,
+            content_hash=content_hash,
+            nodes_by_name=nodes_by_name,
+            semantic_exposed_columns=semantic_exposed_columns(manifest),
+            parents=parents,
+            children=children,
+        )
+
+    def node(self, name: str) -> dict[str, Any] | None:
+        """Model node by name."""
+        return self.nodes_by_name.get(name)
+
+    def derive(self, key: str, builder: Callable[[dict[str, Any]], T]) -> T:
+        """
+        Build (once) and return a consumer-specific structure for this manifest.
+
+        Args:
+            key: Cache key, unique per consumer/structure
+            builder: Called with the parsed manifest on first use
+        """
+        with self._derived_lock:
+            if key not in self._derived:
+                self._derived[key] = builder(self.manifest)
+            return self._derived[key]
+
+
+def _loads(buf: memoryview) -> Any:
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf.tobytes())
+
+
+def _read_manifest(path: Path) -> tuple[dict[str, Any], str, tuple[int, int]]:
+    """Memory-map the file, hash it and parse it in one pass."""
+    with open(path, "rb") as f:
+        stat = os.fstat(f.fileno())
+        if stat.st_size == 0:
+            raise ValueError(f"Manifest is empty: {path}")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                content_hash = hashlib.sha256(view).hexdigest()
+                manifest = _loads(view)
+    if not isinstance(manifest, dict):
+        raise ValueError(f"Manifest is not a JSON object: {path}")
+    return manifest, content_hash, (stat.st_mtime_ns, stat.st_size)
+
+
+_index_lock = threading.Lock()
+_index_cache: dict[str, tuple[tuple[int, int], ManifestIndex]] = {}
+
+
+def load_manifest_index(manifest_path: str | Path) -> ManifestIndex:
+    """
+    Return the (cached) index for a manifest file.
+
+    Re-parses only when the file's mtime or size changed since the last load.
+
+    Raises:
+        FileNotFoundError: If the manifest does not exist
+        ValueError: If the manifest is empty or not valid JSON
+    """
+    path = Path(manifest_path)
+    key = str(path.resolve())
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Manifest not found: {path}") from None
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    with _index_lock:
+        cached = _index_cache.get(key)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        manifest, content_hash, signature = _read_manifest(path)
+        index = ManifestIndex.from_manifest(manifest, path=key, content_hash=content_hash)
+        _index_cache[key] = (signature, index)
+
+    logger.info(
+        "dbt_manifest_index.loaded",
+        extra={
+            "manifest_path": key,
+            "models": len(index.nodes_by_name),
+            "content_hash": content_hash,
+        },
+    )
+    return index
+
+
+def clear_manifest_index_cache() -> None:
+    """Drop all cached indexes (tests, or after replacing target/)."""
+    with _index_lock:
+        _index_cache.clear()
@@ -8,13 +8,12 @@ and calls on_dbt_run_complete() with the manifest path and run results.
 Story 5.2 — Prompt 5.2.4
 """
 
-import json
 import logging
-from pathlib import Path
 from typing import Any
 
 from sqlalchemy.orm import Session
 
+from src.services.dbt_manifest_index import load_manifest_index
 from src.services.schema_compatibility_checker import (
     SchemaCompatibilityChecker,
     build_snapshot_from_db,
@@ -72,19 +71,18 @@ class DbtRunListener:
                     errors=[{"stage": "dbt_tests", "error": f"{len(failures)} test(s) failed"}],
                 )
 
-        path = Path(manifest_path)
-        if not path.exists():
+        # Parsed once here; the sync below reuses the cached index
+        try:
+            manifest_index = load_manifest_index(manifest_path)
+        except FileNotFoundError as e:
             logger.error("dbt_run_listener.manifest_not_found", extra={"manifest_path": manifest_path})
             return SyncResult(
                 success=False,
-                errors=[{"stage": "load_manifest", "error": f"Manifest not found: {path}"}],
+                errors=[{"stage": "load_manifest", "error": str(e)}],
             )
-
-        with open(path) as f:
-            manifest = json.load(f)
         current_state = build_snapshot_from_db(self.db)
 
-        compat = self.checker.validate(current_state, manifest)
+        compat = self.checker.validate(current_state, manifest_index)
         if not compat.compatibility_passed:
             logger.warning(
                 "dbt_run_listener.sync_blocked",
@@ -9,6 +9,7 @@ Supports multiple providers:
 Story 9.1 - Notification Framework (Events → Channels)
 """
 
+import asyncio
 import os
 import logging
 from abc import ABC, abstractmethod
@@ -17,6 +18,10 @@ from typing import Optional, List
 
 logger = logging.getLogger(__name__)
 
+SENDGRID_SEND_URL = "https://api.sendgrid.com/v3/mail/send"
+SENDGRID_TIMEOUT_SECONDS = 30.0
+SENDGRID_MAX_CONNECTIONS = int(os.getenv("SENDGRID_MAX_CONNECTIONS", "20"))
+
 
 @dataclass
 class EmailMessage:
@@ -61,6 +66,15 @@ class EmailSender(ABC):
         """
         pass
 
+    async def aclose(self) -> None:
+        """
+        Release any pooled connections.
+
+        Senders that hold HTTP clients override this; the default is a
+        no-op so callers can close any sender unconditionally.
+        """
+        return None
+
 
 class SendGridEmailSender(EmailSender):
     """SendGrid email sender implementation."""
@@ -96,88 +110,138 @@ class SendGridEmailSender(EmailSender):
         if not self.api_key:
             logger.warning("SendGrid API key not configured")
 
+        self._async_client = None
+        self._sync_client = None
+
     async def send(self, message: EmailMessage) -> bool:
-        """Send email via SendGrid API."""
-        return self._send_impl(message)
+        """Send email via SendGrid API over the sender's pooled async client."""
+        if not self.api_key:
+            logger.error("Cannot send email: SendGrid API key not configured")
+            return False
+
+        try:
+            response = await self._get_async_client().post(
+                SENDGRID_SEND_URL,
+                headers=self._headers(),
+                json=self._build_payload(message),
+            )
+            return self._handle_response(response, message)
+        except Exception as e:
+            return self._handle_error(e, message)
 
     def send_sync(self, message: EmailMessage) -> bool:
         """Send email synchronously via SendGrid API."""
-        return self._send_impl(message)
-
-    def _send_impl(self, message: EmailMessage) -> bool:
-        """Internal send implementation."""
         if not self.api_key:
             logger.error("Cannot send email: SendGrid API key not configured")
             return False
 
         try:
+            response = self._get_sync_client().post(
+                SENDGRID_SEND_URL,
+                headers=self._headers(),
+                json=self._build_payload(message),
+            )
+            return self._handle_response(response, message)
+        except Exception as e:
+            return self._handle_error(e, message)
+
+    async def aclose(self) -> None:
+        """Close pooled HTTP connections."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        if self._sync_client is not None:
+            self._sync_client.close()
+            self._sync_client = None
+
+    def _get_async_client(self):
+        """Pooled async client, reused across sends so connections stay warm."""
+        if self._async_client is None:
             import httpx
 
-            from_email = message.from_email or self.from_email
-            from_name = message.from_name or self.from_name
-
-            payload = {
-                "personalizations": [
-                    {
-                        "to": [{"email": message.to_email, "name": message.to_name or ""}],
-                    }
-                ],
-                "from": {"email": from_email, "name": from_name},
-                "subject": message.subject,
-                "content": [
-                    {"type": "text/html", "value": message.html_body},
-                ],
-            }
-
-            if message.text_body:
-                payload["content"].insert(0, {"type": "text/plain", "value": message.text_body})
-
-            if message.reply_to:
-                payload["reply_to"] = {"email": message.reply_to}
-
-            if message.tags:
-                payload["categories"] = message.tags
-
-            with httpx.Client(timeout=30.0) as client:
-                response = client.post(
-                    "https://api.sendgrid.com/v3/mail/send",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json=payload,
-                )
+            self._async_client = httpx.AsyncClient(
+                timeout=SENDGRID_TIMEOUT_SECONDS,
+                limits=httpx.Limits(max_connections=SENDGRID_MAX_CONNECTIONS),
+            )
+        return self._async_client
 
-            if response.status_code in (200, 202):
-                logger.info(
-                    "Email sent successfully",
-                    extra={
-                        "to_email": message.to_email,
-                        "subject": message.subject,
-                    },
-                )
-                return True
-            else:
-                logger.error(
-                    "SendGrid API error",
-                    extra={
-                        "status_code": response.status_code,
-                        "response": response.text,
-                        "to_email": message.to_email,
-                    },
-                )
-                return False
+    def _get_sync_client(self):
+        """Pooled sync client for send_sync."""
+        if self._sync_client is None:
+            import httpx
 
-        except Exception as e:
-            logger.error(
-                "Failed to send email via SendGrid",
+            self._sync_client = httpx.Client(
+                timeout=SENDGRID_TIMEOUT_SECONDS,
+                limits=httpx.Limits(max_connections=SENDGRID_MAX_CONNECTIONS),
+            )
+        return self._sync_client
+
+    def _headers(self) -> dict:
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+
+    def _build_payload(self, message: EmailMessage) -> dict:
+        """Build the SendGrid v3 mail/send payload."""
+        from_email = message.from_email or self.from_email
+        from_name = message.from_name or self.from_name
+
+        payload = {
+            "personalizations": [
+                {
+                    "to": [{"email": message.to_email, "name": message.to_name or ""}],
+                }
+            ],
+            "from": {"email": from_email, "name": from_name},
+            "subject": message.subject,
+            "content": [
+                {"type": "text/html", "value": message.html_body},
+            ],
+        }
+
+        if message.text_body:
+            payload["content"].insert(0, {"type": "text/plain", "value": message.text_body})
+
+        if message.reply_to:
+            payload["reply_to"] = {"email": message.reply_to}
+
+        if message.tags:
+            payload["categories"] = message.tags
+
+        return payload
+
+    def _handle_response(self, response, message: EmailMessage) -> bool:
+        if response.status_code in (200, 202):
+            logger.info(
+                "Email sent successfully",
                 extra={
                     "to_email": message.to_email,
-                    "error": str(e),
+                    "subject": message.subject,
                 },
-                exc_info=True,
             )
-            return False
+            return True
+
+        logger.error(
+            "SendGrid API error",
+            extra={
+                "status_code": response.status_code,
+                "response": response.text,
+                "to_email": message.to_email,
+            },
+        )
+        return False
+
+    def _handle_error(self, error: Exception, message: EmailMessage) -> bool:
+        logger.error(
+            "Failed to send email via SendGrid",
+            extra={
+                "to_email": message.to_email,
+                "error": str(error),
+            },
+            exc_info=True,
+        )
+        return False
 
 
 class SMTPEmailSender(EmailSender):
@@ -218,8 +282,8 @@ class SMTPEmailSender(EmailSender):
         )
 
     async def send(self, message: EmailMessage) -> bool:
-        """Send email via SMTP."""
-        return self._send_impl(message)
+        """Send email via SMTP on a worker thread so concurrent sends overlap."""
+        return await asyncio.to_thread(self._send_impl, message)
 
     def send_sync(self, message: EmailMessage) -> bool:
         """Send email synchronously via SMTP."""
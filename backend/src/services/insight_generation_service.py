@@ -4,6 +4,9 @@ AI Insight Generation Service.
 Generates insights from aggregated dbt mart data using configurable
 threshold-based detection. All outputs are deterministic.
 
+Mart rows for all period types are loaded into columnar frames (see
+insight_metric_frame) and each detector is a vectorized pass over them.
+
 SECURITY:
 - Tenant isolation via tenant_id in all queries
 - No raw data access - only aggregated marts
@@ -20,13 +23,14 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any
 
-from sqlalchemy import text
+import numpy as np
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 from src.models.ai_insight import AIInsight, InsightType, InsightSeverity
+from src.services.insight_metric_frame import MetricFrame, TenantMetrics, load_tenant_metrics
 from src.services.insight_thresholds import InsightThresholds, DEFAULT_THRESHOLDS
 
 
@@ -73,6 +77,83 @@ class DetectedInsight:
     confidence_score: float = 0.0
 
 
+DEFAULT_PERIOD_TYPES = ("weekly", "last_30_days")
+
+# Order in which detector results are reported within a period
+_DETECTOR_ORDER = (
+    InsightType.SPEND_ANOMALY,
+    InsightType.ROAS_CHANGE,
+    InsightType.REVENUE_VS_SPEND_DIVERGENCE,
+    InsightType.CAC_ANOMALY,
+    InsightType.AOV_CHANGE,
+)
+
+_SEVERITIES = (InsightSeverity.INFO, InsightSeverity.WARNING, InsightSeverity.CRITICAL)
+
+
+@dataclass(frozen=True)
+class _ChangeRule:
+    """Columns a single-metric change detector reads."""
+
+    insight_type: InsightType
+    metric_name: str
+    value_column: str
+    prior_column: str
+    delta_column: str
+    change_pct_column: str
+    per_campaign: bool = True
+
+
+_SPEND_RULE = _ChangeRule(
+    InsightType.SPEND_ANOMALY, "spend",
+    "spend", "prior_spend", "spend_change", "spend_change_pct",
+)
+_ROAS_RULE = _ChangeRule(
+    InsightType.ROAS_CHANGE, "gross_roas",
+    "gross_roas", "prior_gross_roas", "gross_roas_change", "gross_roas_change_pct",
+)
+_CAC_RULE = _ChangeRule(
+    InsightType.CAC_ANOMALY, "cac",
+    "cac", "prior_cac", "cac_change", "cac_change_pct",
+)
+_AOV_RULE = _ChangeRule(
+    InsightType.AOV_CHANGE, "aov",
+    "aov", "prior_aov", "aov_change", "aov_change_pct",
+    per_campaign=False,
+)
+
+
+def _severity_codes(
+    abs_change: np.ndarray,
+    warning_threshold: float,
+    critical_threshold: float,
+) -> np.ndarray:
+    """Severity per row by change magnitude, as indexes into _SEVERITIES."""
+    return np.select(
+        [abs_change >= critical_threshold, abs_change >= warning_threshold],
+        [2, 1],
+        default=0,
+    )
+
+
+def _confidence_scores(
+    change_pct: np.ndarray,
+    current_value: np.ndarray,
+    prior_value: np.ndarray,
+) -> np.ndarray:
+    """
+    Confidence per row: higher for larger relative changes, and 0.5 when
+    both values are too small (under 100) to be meaningful.
+    """
+    abs_change = np.abs(change_pct)
+    scores = np.select(
+        [abs_change > 50, abs_change > 30, abs_change > 15],
+        [0.95, 0.85, 0.75],
+        default=0.65,
+    )
+    return np.where((current_value < 100) & (prior_value < 100), 0.5, scores)
+
+
 class InsightGenerationService:
     """
     Service for generating AI insights from dbt mart data.
@@ -97,6 +178,7 @@ class InsightGenerationService:
         self,
         job_id: str,
         period_types: list[str] | None = None,
+        metrics: TenantMetrics | None = None,
     ) -> list[AIInsight]:
         """
         Generate all insights for the tenant.
@@ -104,45 +186,22 @@ class InsightGenerationService:
         Args:
             job_id: ID of the InsightJob triggering generation
             period_types: Period types to analyze (default: weekly, last_30_days)
+            metrics: Preloaded mart frames (see load_tenant_metrics); loaded
+                for this tenant if not provided
 
         Returns:
             List of generated AIInsight objects
         """
         if period_types is None:
-            period_types = ["weekly", "last_30_days"]
-
-        all_detected: list[DetectedInsight] = []
+            period_types = list(DEFAULT_PERIOD_TYPES)
 
-        for period_type in period_types:
-            # Fetch data from marts
-            marketing_data = self._fetch_marketing_metrics(period_type)
-            revenue_data = self._fetch_revenue_metrics(period_type)
-
-            # Detect insights
-            all_detected.extend(
-                self._detect_spend_anomalies(marketing_data, period_type)
-            )
-            all_detected.extend(
-                self._detect_roas_changes(marketing_data, period_type)
-            )
-            all_detected.extend(
-                self._detect_revenue_spend_divergence(
-                    marketing_data, revenue_data, period_type
-                )
-            )
-            all_detected.extend(
-                self._detect_cac_anomalies(marketing_data, period_type)
-            )
-            all_detected.extend(
-                self._detect_aov_changes(revenue_data, period_type)
-            )
+        if metrics is None:
+            metrics = load_tenant_metrics(
+                self.db, [self.tenant_id], period_types
+            )[self.tenant_id]
 
-        # Persist insights
-        persisted = []
-        for detected in all_detected:
-            insight = self._persist_insight(detected, job_id)
-            if insight:
-                persisted.append(insight)
+        all_detected = self._detect_all(metrics, period_types)
+        persisted = self._persist_insights(all_detected, job_id)
 
         logger.info(
             "Insights generated",
@@ -156,458 +215,235 @@ class InsightGenerationService:
 
         return persisted
 
-    def _fetch_marketing_metrics(self, period_type: str) -> list[dict[str, Any]]:
-        """Fetch marketing metrics from mart_marketing_metrics."""
-        query = text("""
-            SELECT
-                platform,
-                currency,
-                campaign_id,
-                period_type,
-                period_start,
-                period_end,
-                comparison_type,
-                spend,
-                prior_spend,
-                spend_change,
-                spend_change_pct,
-                gross_roas,
-                prior_gross_roas,
-                gross_roas_change,
-                gross_roas_change_pct,
-                net_roas,
-                prior_net_roas,
-                net_roas_change_pct,
-                cac,
-                prior_cac,
-                cac_change,
-                cac_change_pct,
-                new_customers,
-                prior_new_customers,
-                orders,
-                prior_orders
-            FROM marts.mart_marketing_metrics
-            WHERE tenant_id = :tenant_id
-              AND period_type = :period_type
-              AND period_end = (
-                  SELECT MAX(period_end)
-                  FROM marts.mart_marketing_metrics
-                  WHERE tenant_id = :tenant_id
-                    AND period_type = :period_type
-              )
-        """)
-
-        result = self.db.execute(
-            query, {"tenant_id": self.tenant_id, "period_type": period_type}
-        )
+    def _detect_all(
+        self,
+        metrics: TenantMetrics,
+        period_types: list[str],
+    ) -> list[DetectedInsight]:
+        """
+        Run every detector over all periods at once.
 
-        return [dict(row._mapping) for row in result.fetchall()]
-
-    def _fetch_revenue_metrics(self, period_type: str) -> list[dict[str, Any]]:
-        """Fetch revenue metrics from mart_revenue_metrics."""
-        query = text("""
-            SELECT
-                currency,
-                period_type,
-                period_start,
-                period_end,
-                comparison_type,
-                gross_revenue,
-                prior_gross_revenue,
-                gross_revenue_change,
-                gross_revenue_change_pct,
-                net_revenue,
-                prior_net_revenue,
-                net_revenue_change,
-                net_revenue_change_pct,
-                order_count,
-                prior_order_count,
-                order_count_change_pct,
-                aov,
-                prior_aov,
-                aov_change,
-                aov_change_pct
-            FROM marts.mart_revenue_metrics
-            WHERE tenant_id = :tenant_id
-              AND period_type = :period_type
-              AND period_end = (
-                  SELECT MAX(period_end)
-                  FROM marts.mart_revenue_metrics
-                  WHERE tenant_id = :tenant_id
-                    AND period_type = :period_type
-              )
-        """)
-
-        result = self.db.execute(
-            query, {"tenant_id": self.tenant_id, "period_type": period_type}
+        Results are ordered by period type (as requested), then detector,
+        then row.
+        """
+        detected = (
+            self._detect_spend_anomalies(metrics.marketing)
+            + self._detect_roas_changes(metrics.marketing)
+            + self._detect_revenue_spend_divergence(metrics.marketing, metrics.revenue)
+            + self._detect_cac_anomalies(metrics.marketing)
+            + self._detect_aov_changes(metrics.revenue)
+        )
+        detector_rank = {insight_type: i for i, insight_type in enumerate(_DETECTOR_ORDER)}
+        period_rank = {period_type: i for i, period_type in enumerate(period_types)}
+        return sorted(
+            (d for d in detected if d.period_type in period_rank),
+            key=lambda d: (period_rank[d.period_type], detector_rank[d.insight_type]),
         )
 
-        return [dict(row._mapping) for row in result.fetchall()]
-
-    def _detect_spend_anomalies(
+    def _collect_changes(
         self,
-        marketing_data: list[dict],
-        period_type: str,
+        frame: MetricFrame,
+        flagged: np.ndarray,
+        severity_codes: np.ndarray,
+        rule: _ChangeRule,
     ) -> list[DetectedInsight]:
-        """Detect significant spend changes."""
-        insights = []
+        """Materialize DetectedInsights for the flagged rows of a frame."""
+        rows = np.flatnonzero(flagged)
+        if not rows.size:
+            return []
 
-        for row in marketing_data:
-            spend = float(row.get("spend") or 0)
-            prior_spend = float(row.get("prior_spend") or 0)
-            change_pct = float(row.get("spend_change_pct") or 0)
-
-            # Skip if below minimum threshold
-            if spend < self.thresholds.min_spend_for_analysis and \
-               prior_spend < self.thresholds.min_spend_for_analysis:
-                continue
-
-            if abs(change_pct) >= self.thresholds.spend_anomaly_pct:
-                severity = self._calculate_severity(
-                    abs(change_pct),
-                    self.thresholds.spend_anomaly_pct,
-                    self.thresholds.spend_critical_pct,
-                )
+        current = frame[rule.value_column][rows]
+        prior = frame[rule.prior_column][rows]
+        delta = frame[rule.delta_column][rows]
+        change_pct = frame[rule.change_pct_column][rows]
+        confidence = _confidence_scores(change_pct, current, prior)
 
-                metrics = [
-                    MetricChange(
-                        metric_name="spend",
-                        current_value=Decimal(str(spend)),
-                        prior_value=Decimal(str(prior_spend)),
-                        delta=Decimal(str(row.get("spend_change") or 0)),
-                        delta_pct=change_pct,
-                        timeframe=row.get("comparison_type") or "period_over_period",
-                    )
-                ]
-
-                insights.append(
-                    DetectedInsight(
-                        insight_type=InsightType.SPEND_ANOMALY,
-                        severity=severity,
-                        metrics=metrics,
-                        period_type=period_type,
-                        period_start=row["period_start"],
-                        period_end=row["period_end"],
-                        comparison_type=row.get("comparison_type") or "",
-                        platform=row.get("platform"),
-                        campaign_id=row.get("campaign_id"),
-                        currency=row.get("currency"),
-                        confidence_score=self._calculate_confidence(
-                            change_pct, spend, prior_spend
-                        ),
-                    )
+        insights = []
+        for i, row in enumerate(rows.tolist()):
+            comparison_type = frame["comparison_type"][row]
+            insights.append(
+                DetectedInsight(
+                    insight_type=rule.insight_type,
+                    severity=_SEVERITIES[severity_codes[row]],
+                    metrics=[
+                        MetricChange(
+                            metric_name=rule.metric_name,
+                            current_value=Decimal(str(float(current[i]))),
+                            prior_value=Decimal(str(float(prior[i]))),
+                            delta=Decimal(str(float(delta[i]))),
+                            delta_pct=float(change_pct[i]),
+                            timeframe=comparison_type or "period_over_period",
+                        )
+                    ],
+                    period_type=frame["period_type"][row],
+                    period_start=frame["period_start"][row],
+                    period_end=frame["period_end"][row],
+                    comparison_type=comparison_type or "",
+                    platform=frame["platform"][row] if rule.per_campaign else None,
+                    campaign_id=frame["campaign_id"][row] if rule.per_campaign else None,
+                    currency=frame["currency"][row],
+                    confidence_score=float(confidence[i]),
                 )
-
+            )
         return insights
 
-    def _detect_roas_changes(
-        self,
-        marketing_data: list[dict],
-        period_type: str,
-    ) -> list[DetectedInsight]:
-        """Detect significant ROAS changes."""
-        insights = []
-
-        for row in marketing_data:
-            roas = float(row.get("gross_roas") or 0)
-            prior_roas = float(row.get("prior_gross_roas") or 0)
-            change_pct = float(row.get("gross_roas_change_pct") or 0)
-
-            # Skip if no meaningful ROAS data
-            if roas == 0 and prior_roas == 0:
-                continue
+    def _detect_spend_anomalies(self, marketing: MetricFrame) -> list[DetectedInsight]:
+        """Detect significant spend changes."""
+        spend = marketing["spend"]
+        prior_spend = marketing["prior_spend"]
+        abs_change = np.abs(marketing["spend_change_pct"])
+
+        # Skip if below minimum threshold
+        min_spend = self.thresholds.min_spend_for_analysis
+        analyzable = (spend >= min_spend) | (prior_spend >= min_spend)
+        flagged = analyzable & (abs_change >= self.thresholds.spend_anomaly_pct)
+
+        severity = _severity_codes(
+            abs_change,
+            self.thresholds.spend_anomaly_pct,
+            self.thresholds.spend_critical_pct,
+        )
+        return self._collect_changes(marketing, flagged, severity, _SPEND_RULE)
 
-            if abs(change_pct) >= self.thresholds.roas_change_pct:
-                severity = self._calculate_severity(
-                    abs(change_pct),
-                    self.thresholds.roas_change_pct,
-                    self.thresholds.roas_critical_pct,
-                )
+    def _detect_roas_changes(self, marketing: MetricFrame) -> list[DetectedInsight]:
+        """Detect significant ROAS changes."""
+        abs_change = np.abs(marketing["gross_roas_change_pct"])
 
-                metrics = [
-                    MetricChange(
-                        metric_name="gross_roas",
-                        current_value=Decimal(str(roas)),
-                        prior_value=Decimal(str(prior_roas)),
-                        delta=Decimal(str(row.get("gross_roas_change") or 0)),
-                        delta_pct=change_pct,
-                        timeframe=row.get("comparison_type") or "period_over_period",
-                    )
-                ]
-
-                insights.append(
-                    DetectedInsight(
-                        insight_type=InsightType.ROAS_CHANGE,
-                        severity=severity,
-                        metrics=metrics,
-                        period_type=period_type,
-                        period_start=row["period_start"],
-                        period_end=row["period_end"],
-                        comparison_type=row.get("comparison_type") or "",
-                        platform=row.get("platform"),
-                        campaign_id=row.get("campaign_id"),
-                        currency=row.get("currency"),
-                        confidence_score=self._calculate_confidence(
-                            change_pct, roas, prior_roas
-                        ),
-                    )
-                )
+        # Skip if no meaningful ROAS data
+        has_data = (marketing["gross_roas"] != 0) | (marketing["prior_gross_roas"] != 0)
+        flagged = has_data & (abs_change >= self.thresholds.roas_change_pct)
 
-        return insights
+        severity = _severity_codes(
+            abs_change,
+            self.thresholds.roas_change_pct,
+            self.thresholds.roas_critical_pct,
+        )
+        return self._collect_changes(marketing, flagged, severity, _ROAS_RULE)
 
     def _detect_revenue_spend_divergence(
         self,
-        marketing_data: list[dict],
-        revenue_data: list[dict],
-        period_type: str,
+        marketing: MetricFrame,
+        revenue: MetricFrame,
     ) -> list[DetectedInsight]:
         """Detect when revenue and spend move in opposite directions."""
-        insights = []
-
-        # Aggregate marketing spend by currency
-        spend_by_currency: dict[str, dict] = {}
-        for row in marketing_data:
-            currency = row.get("currency") or "USD"
-            if currency not in spend_by_currency:
-                spend_by_currency[currency] = {
-                    "spend": 0,
-                    "prior_spend": 0,
-                    "spend_change_pct": 0,
-                    "period_start": row["period_start"],
-                    "period_end": row["period_end"],
-                    "comparison_type": row.get("comparison_type") or "",
-                }
-            spend_by_currency[currency]["spend"] += float(row.get("spend") or 0)
-            spend_by_currency[currency]["prior_spend"] += float(
-                row.get("prior_spend") or 0
-            )
+        if not len(marketing) or not len(revenue):
+            return []
+
+        # Aggregate marketing spend by period type and currency
+        groups: dict[tuple, int] = {}
+        first_rows: list[int] = []
+        group_index = np.empty(len(marketing), dtype=np.intp)
+        for i, key in enumerate(zip(marketing["period_type"], marketing["currency"])):
+            key = (key[0], key[1] or "USD")
+            if key not in groups:
+                groups[key] = len(groups)
+                first_rows.append(i)
+            group_index[i] = groups[key]
+
+        group_spend = np.bincount(group_index, weights=marketing["spend"], minlength=len(groups))
+        group_prior = np.bincount(group_index, weights=marketing["prior_spend"], minlength=len(groups))
 
         # Recalculate percentage after aggregation
-        for currency, data in spend_by_currency.items():
-            if data["prior_spend"] > 0:
-                data["spend_change_pct"] = (
-                    (data["spend"] - data["prior_spend"]) / data["prior_spend"] * 100
-                )
-
-        for rev_row in revenue_data:
-            currency = rev_row.get("currency") or "USD"
-            revenue_change_pct = float(rev_row.get("net_revenue_change_pct") or 0)
-            net_revenue = float(rev_row.get("net_revenue") or 0)
-            prior_net_revenue = float(rev_row.get("prior_net_revenue") or 0)
-
-            if currency not in spend_by_currency:
-                continue
+        group_change_pct = np.zeros(len(groups))
+        np.divide(group_spend - group_prior, group_prior, out=group_change_pct, where=group_prior > 0)
+        group_change_pct *= 100
+
+        currencies = [c or "USD" for c in revenue["currency"]]
+        revenue_group = np.fromiter(
+            (groups.get(key, -1) for key in zip(revenue["period_type"], currencies)),
+            dtype=np.intp,
+            count=len(revenue),
+        )
+        has_spend = revenue_group >= 0
+        spend_change_pct = np.where(has_spend, group_change_pct[revenue_group], 0.0)
+        revenue_change_pct = revenue["net_revenue_change_pct"]
+        net_revenue = revenue["net_revenue"]
+        prior_net_revenue = revenue["prior_net_revenue"]
+
+        # Check for divergence: opposite directions with significant magnitude
+        threshold = self.thresholds.divergence_pct
+        is_divergent = (
+            ((revenue_change_pct < -threshold) & (spend_change_pct > threshold))
+            | ((revenue_change_pct > threshold) & (spend_change_pct < -threshold))
+        )
 
-            spend_data = spend_by_currency[currency]
-            spend_change_pct = spend_data["spend_change_pct"]
+        # Skip if values are too small
+        min_revenue = self.thresholds.min_revenue_for_analysis
+        analyzable = (net_revenue >= min_revenue) | (prior_net_revenue >= min_revenue)
 
-            # Check for divergence: opposite directions with significant magnitude
-            threshold = self.thresholds.divergence_pct
-            is_divergent = (
-                (revenue_change_pct < -threshold and spend_change_pct > threshold)
-                or (revenue_change_pct > threshold and spend_change_pct < -threshold)
-            )
+        # Divergence is always at least WARNING severity
+        is_critical = (np.abs(revenue_change_pct) > 25) | (np.abs(spend_change_pct) > 25)
 
-            if not is_divergent:
-                continue
-
-            # Skip if values are too small
-            if (
-                net_revenue < self.thresholds.min_revenue_for_analysis
-                and prior_net_revenue < self.thresholds.min_revenue_for_analysis
-            ):
-                continue
+        insights = []
+        for row in np.flatnonzero(has_spend & is_divergent & analyzable).tolist():
+            group = revenue_group[row]
+            spend = float(group_spend[group])
+            prior_spend = float(group_prior[group])
+            comparison_type = revenue["comparison_type"][row]
 
             metrics = [
                 MetricChange(
                     metric_name="net_revenue",
-                    current_value=Decimal(str(net_revenue)),
-                    prior_value=Decimal(str(prior_net_revenue)),
-                    delta=Decimal(str(rev_row.get("net_revenue_change") or 0)),
-                    delta_pct=revenue_change_pct,
-                    timeframe=rev_row.get("comparison_type") or "period_over_period",
+                    current_value=Decimal(str(float(net_revenue[row]))),
+                    prior_value=Decimal(str(float(prior_net_revenue[row]))),
+                    delta=Decimal(str(float(revenue["net_revenue_change"][row]))),
+                    delta_pct=float(revenue_change_pct[row]),
+                    timeframe=comparison_type or "period_over_period",
                 ),
                 MetricChange(
                     metric_name="spend",
-                    current_value=Decimal(str(spend_data["spend"])),
-                    prior_value=Decimal(str(spend_data["prior_spend"])),
-                    delta=Decimal(
-                        str(spend_data["spend"] - spend_data["prior_spend"])
-                    ),
-                    delta_pct=spend_change_pct,
-                    timeframe=spend_data["comparison_type"],
+                    current_value=Decimal(str(spend)),
+                    prior_value=Decimal(str(prior_spend)),
+                    delta=Decimal(str(spend - prior_spend)),
+                    delta_pct=float(spend_change_pct[row]),
+                    timeframe=marketing["comparison_type"][first_rows[group]] or "",
                 ),
             ]
 
-            # Divergence is always at least WARNING severity
-            severity = InsightSeverity.WARNING
-            if abs(revenue_change_pct) > 25 or abs(spend_change_pct) > 25:
-                severity = InsightSeverity.CRITICAL
-
             insights.append(
                 DetectedInsight(
                     insight_type=InsightType.REVENUE_VS_SPEND_DIVERGENCE,
-                    severity=severity,
+                    severity=(
+                        InsightSeverity.CRITICAL if is_critical[row] else InsightSeverity.WARNING
+                    ),
                     metrics=metrics,
-                    period_type=period_type,
-                    period_start=rev_row["period_start"],
-                    period_end=rev_row["period_end"],
-                    comparison_type=rev_row.get("comparison_type") or "",
-                    currency=currency,
+                    period_type=revenue["period_type"][row],
+                    period_start=revenue["period_start"][row],
+                    period_end=revenue["period_end"][row],
+                    comparison_type=comparison_type or "",
+                    currency=currencies[row],
                     confidence_score=0.85,
                 )
             )
 
         return insights
 
-    def _detect_cac_anomalies(
-        self,
-        marketing_data: list[dict],
-        period_type: str,
-    ) -> list[DetectedInsight]:
+    def _detect_cac_anomalies(self, marketing: MetricFrame) -> list[DetectedInsight]:
         """Detect significant CAC changes."""
-        insights = []
+        abs_change = np.abs(marketing["cac_change_pct"])
 
-        for row in marketing_data:
-            cac = float(row.get("cac") or 0)
-            prior_cac = float(row.get("prior_cac") or 0)
-            change_pct = float(row.get("cac_change_pct") or 0)
+        # Skip if no CAC data
+        has_data = (marketing["cac"] != 0) | (marketing["prior_cac"] != 0)
+        flagged = has_data & (abs_change >= self.thresholds.cac_anomaly_pct)
 
-            # Skip if no CAC data
-            if cac == 0 and prior_cac == 0:
-                continue
-
-            if abs(change_pct) >= self.thresholds.cac_anomaly_pct:
-                severity = self._calculate_severity(
-                    abs(change_pct),
-                    self.thresholds.cac_anomaly_pct,
-                    self.thresholds.cac_critical_pct,
-                )
-
-                metrics = [
-                    MetricChange(
-                        metric_name="cac",
-                        current_value=Decimal(str(cac)),
-                        prior_value=Decimal(str(prior_cac)),
-                        delta=Decimal(str(row.get("cac_change") or 0)),
-                        delta_pct=change_pct,
-                        timeframe=row.get("comparison_type") or "period_over_period",
-                    )
-                ]
-
-                insights.append(
-                    DetectedInsight(
-                        insight_type=InsightType.CAC_ANOMALY,
-                        severity=severity,
-                        metrics=metrics,
-                        period_type=period_type,
-                        period_start=row["period_start"],
-                        period_end=row["period_end"],
-                        comparison_type=row.get("comparison_type") or "",
-                        platform=row.get("platform"),
-                        campaign_id=row.get("campaign_id"),
-                        currency=row.get("currency"),
-                        confidence_score=self._calculate_confidence(
-                            change_pct, cac, prior_cac
-                        ),
-                    )
-                )
-
-        return insights
+        severity = _severity_codes(
+            abs_change,
+            self.thresholds.cac_anomaly_pct,
+            self.thresholds.cac_critical_pct,
+        )
+        return self._collect_changes(marketing, flagged, severity, _CAC_RULE)
 
-    def _detect_aov_changes(
-        self,
-        revenue_data: list[dict],
-        period_type: str,
-    ) -> list[DetectedInsight]:
+    def _detect_aov_changes(self, revenue: MetricFrame) -> list[DetectedInsight]:
         """Detect significant AOV changes."""
-        insights = []
-
-        for row in revenue_data:
-            aov = float(row.get("aov") or 0)
-            prior_aov = float(row.get("prior_aov") or 0)
-            change_pct = float(row.get("aov_change_pct") or 0)
-
-            # Skip if no AOV data
-            if aov == 0 and prior_aov == 0:
-                continue
-
-            if abs(change_pct) >= self.thresholds.aov_change_pct:
-                # AOV changes are typically INFO unless very large
-                severity = InsightSeverity.INFO
-                if abs(change_pct) >= 25:
-                    severity = InsightSeverity.WARNING
-                if abs(change_pct) >= 40:
-                    severity = InsightSeverity.CRITICAL
-
-                metrics = [
-                    MetricChange(
-                        metric_name="aov",
-                        current_value=Decimal(str(aov)),
-                        prior_value=Decimal(str(prior_aov)),
-                        delta=Decimal(str(row.get("aov_change") or 0)),
-                        delta_pct=change_pct,
-                        timeframe=row.get("comparison_type") or "period_over_period",
-                    )
-                ]
-
-                insights.append(
-                    DetectedInsight(
-                        insight_type=InsightType.AOV_CHANGE,
-                        severity=severity,
-                        metrics=metrics,
-                        period_type=period_type,
-                        period_start=row["period_start"],
-                        period_end=row["period_end"],
-                        comparison_type=row.get("comparison_type") or "",
-                        currency=row.get("currency"),
-                        confidence_score=self._calculate_confidence(
-                            change_pct, aov, prior_aov
-                        ),
-                    )
-                )
-
-        return insights
+        abs_change = np.abs(revenue["aov_change_pct"])
 
-    def _calculate_severity(
-        self,
-        change_pct: float,
-        warning_threshold: float,
-        critical_threshold: float,
-    ) -> InsightSeverity:
-        """Calculate severity based on change magnitude."""
-        if change_pct >= critical_threshold:
-            return InsightSeverity.CRITICAL
-        if change_pct >= warning_threshold:
-            return InsightSeverity.WARNING
-        return InsightSeverity.INFO
-
-    def _calculate_confidence(
-        self,
-        change_pct: float,
-        current_value: float,
-        prior_value: float,
-    ) -> float:
-        """
-        Calculate confidence score based on statistical significance.
+        # Skip if no AOV data
+        has_data = (revenue["aov"] != 0) | (revenue["prior_aov"] != 0)
+        flagged = has_data & (abs_change >= self.thresholds.aov_change_pct)
 
-        Higher confidence when:
-        - Both values are non-trivial (not near zero)
-        - Change is larger than threshold
-        """
-        # Low confidence if values are too small
-        if current_value < 100 and prior_value < 100:
-            return 0.5
-
-        # Higher confidence for larger relative changes
-        abs_change = abs(change_pct)
-        if abs_change > 50:
-            return 0.95
-        if abs_change > 30:
-            return 0.85
-        if abs_change > 15:
-            return 0.75
-        return 0.65
+        # AOV changes are typically INFO unless very large
+        severity = _severity_codes(abs_change, 25, 40)
+        return self._collect_changes(revenue, flagged, severity, _AOV_RULE)
 
     def _generate_content_hash(self, detected: DetectedInsight) -> str:
         """Generate deterministic hash for deduplication."""
@@ -625,22 +461,14 @@ class InsightGenerationService:
         content = "|".join(parts)
         return hashlib.sha256(content.encode()).hexdigest()
 
-    def _enhance_with_llm(
+    def _llm_requests(
         self,
         detected: DetectedInsight,
         summary: str,
         why_it_matters: str,
-    ) -> tuple[str, str]:
-        """
-        Optionally enhance insight text with LLM.
-
-        Returns the original deterministic text if:
-        - Tenant is not entitled to LLM routing
-        - LLM templates are not seeded in the database
-        - LLM call fails for any reason
-        - Already running in an async event loop
-        """
-        from src.services.llm_integration import enhance_pair_with_llm_sync
+    ) -> list:
+        """Summary and why-it-matters enhancement requests for one insight."""
+        from src.services.llm_integration import LLMEnhancementRequest
 
         variables = {
             "insight_type": detected.insight_type.value,
@@ -649,35 +477,59 @@ class InsightGenerationService:
             "period_type": detected.period_type,
             "platform": detected.platform or "all",
         }
+        return [
+            LLMEnhancementRequest("insight_summary", variables, summary),
+            LLMEnhancementRequest("insight_why_it_matters", variables, why_it_matters),
+        ]
 
-        return enhance_pair_with_llm_sync(
+    def _enhance_with_llm(
+        self,
+        rendered: list[tuple[DetectedInsight, str, str]],
+    ) -> list[tuple[str, str]]:
+        """
+        Optionally enhance insight text with LLM, for all insights at once.
+
+        Calls run concurrently under the tenant's token budget. Each field
+        keeps its deterministic text if:
+        - Tenant is not entitled to LLM routing
+        - LLM templates are not seeded in the database
+        - LLM call fails or the token budget is spent
+        - Already running in an async event loop
+        """
+        from src.services.llm_integration import enhance_batch_with_llm_sync
+
+        requests = []
+        for detected, summary, why_it_matters in rendered:
+            requests.extend(self._llm_requests(detected, summary, why_it_matters))
+
+        texts = enhance_batch_with_llm_sync(
             db_session=self.db,
             tenant_id=self.tenant_id,
-            template_key_a="insight_summary",
-            template_key_b="insight_why_it_matters",
-            variables=variables,
-            fallback_a=summary,
-            fallback_b=why_it_matters,
+            requests=requests,
         )
+        return list(zip(texts[0::2], texts[1::2]))
+
+    def _existing_content_hashes(self, content_hashes: list[str]) -> set[str]:
+        """Content hashes that already have an insight for this tenant."""
+        if not content_hashes:
+            return set()
+        rows = self.db.execute(
+            select(AIInsight.content_hash).where(
+                AIInsight.tenant_id == self.tenant_id,
+                AIInsight.content_hash.in_(content_hashes),
+            )
+        ).scalars().all()
+        return set(rows)
 
-    def _persist_insight(
+    def _build_insight(
         self,
         detected: DetectedInsight,
         job_id: str,
-    ) -> AIInsight | None:
-        """Persist insight to database, handling deduplication."""
-        from src.services.insight_templates import render_insight_summary, render_why_it_matters
-
-        content_hash = self._generate_content_hash(detected)
-        summary = render_insight_summary(detected)
-        why_it_matters = render_why_it_matters(detected)
-
-        # Optional LLM enhancement (graceful fallback to deterministic text)
-        summary, why_it_matters = self._enhance_with_llm(
-            detected, summary, why_it_matters
-        )
-
-        insight = AIInsight(
+        content_hash: str,
+        summary: str,
+        why_it_matters: str,
+    ) -> AIInsight:
+        return AIInsight(
             tenant_id=self.tenant_id,
             insight_type=detected.insight_type,
             severity=detected.severity,
@@ -699,18 +551,73 @@ class InsightGenerationService:
             is_dismissed=0,
         )
 
+    def _persist_insights(
+        self,
+        all_detected: list[DetectedInsight],
+        job_id: str,
+    ) -> list[AIInsight]:
+        """
+        Render, enhance and bulk-insert all detected insights for a job.
+
+        Duplicates (within the job or already stored) are dropped before any
+        LLM call. New insights are enhanced concurrently, then inserted in a
+        single flush; if a concurrent job inserted the same content in the
+        meantime, falls back to per-row inserts.
+        """
+        from src.services.insight_templates import render_insight_summary, render_why_it_matters
+
+        unique: dict[str, DetectedInsight] = {}
+        for detected in all_detected:
+            unique.setdefault(self._generate_content_hash(detected), detected)
+
+        existing = self._existing_content_hashes(list(unique))
+        pending = [(h, d) for h, d in unique.items() if h not in existing]
+        if not pending:
+            return []
+
+        rendered = [
+            (detected, render_insight_summary(detected), render_why_it_matters(detected))
+            for _, detected in pending
+        ]
+        texts = self._enhance_with_llm(rendered)
+
+        insights = [
+            self._build_insight(detected, job_id, content_hash, summary, why_it_matters)
+            for (content_hash, detected), (summary, why_it_matters) in zip(pending, texts)
+        ]
+
+        try:
+            # Savepoint: a duplicate rolls back only this insert, not the caller's transaction
+            with self.db.begin_nested():
+                self.db.add_all(insights)
+                self.db.flush()
+            return insights
+        except IntegrityError:
+            logger.info(
+                "Bulk insight insert hit duplicates, retrying per row",
+                extra={"tenant_id": self.tenant_id, "job_id": job_id},
+            )
+
+        persisted = []
+        for insight in insights:
+            if self._persist_insight(insight):
+                persisted.append(insight)
+        return persisted
+
+    def _persist_insight(self, insight: AIInsight) -> AIInsight | None:
+        """Persist a single insight, handling deduplication."""
         try:
-            self.db.add(insight)
-            self.db.flush()
+            with self.db.begin_nested():
+                self.db.add(insight)
+                self.db.flush()
             return insight
         except IntegrityError:
             # Duplicate constraint violation - insight already exists
-            self.db.rollback()
             logger.debug(
                 "Insight deduplicated",
                 extra={
                     "tenant_id": self.tenant_id,
-                    "content_hash": content_hash,
+                    "content_hash": insight.content_hash,
                 },
             )
             return None
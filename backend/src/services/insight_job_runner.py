@@ -1,8 +1,9 @@
 """
 Job runner for insight generation.
 
-Processes queued InsightJobs by calling InsightGenerationService.
-Handles job lifecycle: QUEUED -> RUNNING -> SUCCESS/FAILED/SKIPPED.
+Executes InsightJobs claimed by the AI job worker (src.jobs.ai_job_worker)
+by calling InsightGenerationService.
+Handles job lifecycle: RUNNING -> SUCCESS/FAILED/SKIPPED.
 
 SECURITY: All operations are tenant-scoped.
 
@@ -13,8 +14,12 @@ import logging
 
 from sqlalchemy.orm import Session
 
-from src.models.insight_job import InsightJob, InsightJobStatus
-from src.services.insight_generation_service import InsightGenerationService
+from src.models.insight_job import InsightJob
+from src.services.insight_generation_service import (
+    DEFAULT_PERIOD_TYPES,
+    InsightGenerationService,
+)
+from src.services.insight_metric_frame import TenantMetrics
 from src.services.insight_thresholds import get_thresholds_for_tier
 from src.services.billing_entitlements import BillingEntitlementsService
 
@@ -26,8 +31,10 @@ class InsightJobRunner:
     """
     Executes insight generation jobs.
 
-    Processes jobs in QUEUED status, generates insights using
-    InsightGenerationService, and updates job status.
+    Generates insights for a job the AI job worker has claimed, using
+    InsightGenerationService, and updates job status. The worker loads
+    mart metrics for all tenants in a claimed batch (e.g. the hourly
+    enterprise dispatch) together and passes each job its tenant's frames.
     """
 
     def __init__(self, db_session: Session):
@@ -38,12 +45,13 @@ class InsightJobRunner:
         service = BillingEntitlementsService(self.db, tenant_id)
         return service.get_billing_tier()
 
-    def execute_job(self, job: InsightJob) -> None:
+    def execute_job(self, job: InsightJob, metrics: TenantMetrics | None = None) -> None:
         """
         Execute a single insight generation job.
 
         Args:
             job: InsightJob to execute
+            metrics: Preloaded mart frames for the job's tenant
         """
         logger.info(
             "insight_job.started",
@@ -70,14 +78,18 @@ class InsightJobRunner:
                 thresholds=thresholds,
             )
 
-            insights = service.generate_insights(job_id=job.job_id)
+            insights = service.generate_insights(
+                job_id=job.job_id,
+                period_types=list(DEFAULT_PERIOD_TYPES),
+                metrics=metrics,
+            )
 
             # Mark success
             job.mark_success(
                 insights_generated=len(insights),
                 metadata={
                     "tier": tier,
-                    "period_types_analyzed": ["weekly", "last_30_days"],
+                    "period_types_analyzed": list(DEFAULT_PERIOD_TYPES),
                 },
             )
             self.db.flush()
@@ -105,67 +117,3 @@ class InsightJobRunner:
                 },
                 exc_info=True,
             )
-
-    def process_queued_jobs(self, limit: int = 10) -> int:
-        """
-        Process batch of queued insight jobs.
-
-        Args:
-            limit: Maximum number of jobs to process
-
-        Returns:
-            Number of jobs processed
-        """
-        jobs = (
-            self.db.query(InsightJob)
-            .filter(InsightJob.status == InsightJobStatus.QUEUED)
-            .order_by(InsightJob.created_at.asc())
-            .limit(limit)
-            .all()
-        )
-
-        if not jobs:
-            logger.debug("No queued insight jobs to process")
-            return 0
-
-        processed = 0
-        for job in jobs:
-            try:
-                self.execute_job(job)
-                processed += 1
-            except Exception as e:
-                logger.error(
-                    "Error processing insight job",
-                    extra={
-                        "job_id": job.job_id,
-                        "error": str(e),
-                    },
-                    exc_info=True,
-                )
-
-        self.db.commit()
-        return processed
-
-
-def run_insight_worker_cycle(db_session: Session, limit: int = 10) -> dict:
-    """
-    Run one cycle of the insight worker.
-
-    Called by cron trigger or background worker.
-
-    Args:
-        db_session: Database session
-        limit: Maximum jobs to process per cycle
-
-    Returns:
-        Dict with processing results
-    """
-    runner = InsightJobRunner(db_session)
-    processed = runner.process_queued_jobs(limit=limit)
-
-    logger.info(
-        "Insight worker cycle completed",
-        extra={"processed": processed},
-    )
-
-    return {"processed": processed}
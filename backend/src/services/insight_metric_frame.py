@@ -0,0 +1,238 @@
+"""
+Columnar metric frames for insight detection.
+
+Loads mart_marketing_metrics and mart_revenue_metrics for many tenants and
+period types at once (one query per mart, latest period per tenant and
+period type) into NumPy column arrays, so detectors can evaluate thresholds
+as vectorized passes instead of per-row loops.
+
+Numeric columns are float64 with NULL coerced to 0; label columns
+(tenant, platform, currency, dates, ...) are object arrays.
+
+SECURITY: Queries are always filtered by the given tenant_ids.
+
+Story 8.1 - AI Insight Generation (Read-Only Analytics)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+import numpy as np
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+
+MARKETING_NUMERIC_COLUMNS = (
+    "spend",
+    "prior_spend",
+    "spend_change",
+    "spend_change_pct",
+    "gross_roas",
+    "prior_gross_roas",
+    "gross_roas_change",
+    "gross_roas_change_pct",
+    "net_roas",
+    "prior_net_roas",
+    "net_roas_change_pct",
+    "cac",
+    "prior_cac",
+    "cac_change",
+    "cac_change_pct",
+    "new_customers",
+    "prior_new_customers",
+    "orders",
+    "prior_orders",
+)
+MARKETING_LABEL_COLUMNS = (
+    "tenant_id",
+    "platform",
+    "currency",
+    "campaign_id",
+    "period_type",
+    "period_start",
+    "period_end",
+    "comparison_type",
+)
+
+REVENUE_NUMERIC_COLUMNS = (
+    "gross_revenue",
+    "prior_gross_revenue",
+    "gross_revenue_change",
+    "gross_revenue_change_pct",
+    "net_revenue",
+    "prior_net_revenue",
+    "net_revenue_change",
+    "net_revenue_change_pct",
+    "order_count",
+    "prior_order_count",
+    "order_count_change_pct",
+    "aov",
+    "prior_aov",
+    "aov_change",
+    "aov_change_pct",
+)
+REVENUE_LABEL_COLUMNS = (
+    "tenant_id",
+    "currency",
+    "period_type",
+    "period_start",
+    "period_end",
+    "comparison_type",
+)
+
+
+class MetricFrame:
+    """Fixed-length set of named column arrays."""
+
+    __slots__ = ("columns", "length")
+
+    def __init__(self, columns: dict[str, np.ndarray], length: int):
+        self.columns = columns
+        self.length = length
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: list[dict[str, Any]],
+        numeric_columns: Iterable[str],
+        label_columns: Iterable[str],
+        period_type: str | None = None,
+    ) -> "MetricFrame":
+        """
+        Build a frame from row dicts.
+
+        Args:
+            rows: Row mappings (missing keys are treated as NULL)
+            numeric_columns: Columns stored as float64 (NULL -> 0)
+            label_columns: Columns stored as object arrays
+            period_type: If given, overrides the period_type column
+        """
+        n = len(rows)
+        columns: dict[str, np.ndarray] = {}
+        for name in numeric_columns:
+            columns[name] = np.fromiter(
+                (float(row.get(name) or 0) for row in rows), dtype=np.float64, count=n
+            )
+        for name in label_columns:
+            values = np.empty(n, dtype=object)
+            values[:] = [row.get(name) for row in rows]
+            columns[name] = values
+        if period_type is not None:
+            columns["period_type"] = np.full(n, period_type, dtype=object)
+        return cls(columns, n)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def take(self, indices: np.ndarray) -> "MetricFrame":
+        """Frame restricted to the given row indices."""
+        return MetricFrame(
+            {name: values[indices] for name, values in self.columns.items()},
+            len(indices),
+        )
+
+    def split_by(self, name: str) -> dict[Any, "MetricFrame"]:
+        """Partition rows by the value of a label column, keeping row order."""
+        groups: dict[Any, list[int]] = {}
+        for i, key in enumerate(self.columns[name]):
+            groups.setdefault(key, []).append(i)
+        return {
+            key: self.take(np.asarray(indices, dtype=np.intp))
+            for key, indices in groups.items()
+        }
+
+
+def marketing_frame(rows: list[dict[str, Any]], period_type: str | None = None) -> MetricFrame:
+    """Frame over mart_marketing_metrics rows."""
+    return MetricFrame.from_rows(
+        rows, MARKETING_NUMERIC_COLUMNS, MARKETING_LABEL_COLUMNS, period_type
+    )
+
+
+def revenue_frame(rows: list[dict[str, Any]], period_type: str | None = None) -> MetricFrame:
+    """Frame over mart_revenue_metrics rows."""
+    return MetricFrame.from_rows(
+        rows, REVENUE_NUMERIC_COLUMNS, REVENUE_LABEL_COLUMNS, period_type
+    )
+
+
+@dataclass
+class TenantMetrics:
+    """Marketing and revenue frames for one tenant, all period types."""
+
+    marketing: MetricFrame = field(default_factory=lambda: marketing_frame([]))
+    revenue: MetricFrame = field(default_factory=lambda: revenue_frame([]))
+
+
+def _latest_period_query(table: str, columns: Iterable[str]):
+    column_list = ",\n                ".join(columns)
+    return text(f"""
+        SELECT *
+        FROM (
+            SELECT
+                {column_list},
+                MAX(period_end) OVER (
+                    PARTITION BY tenant_id, period_type
+                ) AS latest_period_end
+            FROM marts.{table}
+            WHERE tenant_id IN :tenant_ids
+              AND period_type IN :period_types
+        ) metrics
+        WHERE period_end = latest_period_end
+        ORDER BY tenant_id, period_type
+    """).bindparams(
+        bindparam("tenant_ids", expanding=True),
+        bindparam("period_types", expanding=True),
+    )
+
+
+MARKETING_QUERY = _latest_period_query(
+    "mart_marketing_metrics", MARKETING_LABEL_COLUMNS + MARKETING_NUMERIC_COLUMNS
+)
+REVENUE_QUERY = _latest_period_query(
+    "mart_revenue_metrics", REVENUE_LABEL_COLUMNS + REVENUE_NUMERIC_COLUMNS
+)
+
+
+def load_tenant_metrics(
+    db: Session,
+    tenant_ids: Iterable[str],
+    period_types: Iterable[str],
+) -> dict[str, TenantMetrics]:
+    """
+    Load the latest period of every requested period type for many tenants.
+
+    Args:
+        db: Database session
+        tenant_ids: Tenants to load
+        period_types: Period types to load (e.g. weekly, last_30_days)
+
+    Returns:
+        Mapping of tenant_id to TenantMetrics (empty frames if no data)
+    """
+    tenant_ids = sorted(set(tenant_ids))
+    period_types = list(period_types)
+    if not tenant_ids or not period_types:
+        return {}
+
+    params = {"tenant_ids": tenant_ids, "period_types": period_types}
+    marketing_rows = [dict(row._mapping) for row in db.execute(MARKETING_QUERY, params).fetchall()]
+    revenue_rows = [dict(row._mapping) for row in db.execute(REVENUE_QUERY, params).fetchall()]
+
+    marketing = marketing_frame(marketing_rows).split_by("tenant_id")
+    revenue = revenue_frame(revenue_rows).split_by("tenant_id")
+
+    result = {}
+    for tenant_id in tenant_ids:
+        metrics = TenantMetrics()
+        if tenant_id in marketing:
+            metrics.marketing = marketing[tenant_id]
+        if tenant_id in revenue:
+            metrics.revenue = revenue[tenant_id]
+        result[tenant_id] = metrics
+    return result
@@ -0,0 +1,175 @@
+"""
+Completion cache for LLM routing (Story 8.8 - Model Routing & Prompt Governance).
+
+Insight and recommendation prompts are rendered from deterministic
+variables, so the same request recurs across hourly runs whenever metrics
+have not moved. This cache stores completions keyed by a canonical hash of
+the rendered messages plus model and sampling parameters.
+
+Storage is tenant-scoped Redis:
+- llm:completion:{tenant_id}:{hash}   -> cached completion (JSON, with TTL)
+- llm:completion:{tenant_id}:index    -> sorted set of hashes by last use
+
+Each tenant keeps at most LLM_CACHE_MAX_ENTRIES entries; the least
+recently used are evicted on write.
+
+Graceful degradation: without REDIS_URL, or on any Redis error, the cache
+behaves as a miss and completions go to OpenRouter as before.
+
+SECURITY:
+- Keys are tenant-scoped; a tenant can never read another tenant's entries
+- Only rendered prompts (no PII by policy) are hashed; prompts are not stored
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from threading import Lock
+from typing import Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", "86400"))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "2000"))
+
+KEY_PREFIX = "llm:completion"
+
+
+@dataclass
+class CachedCompletion:
+    """A stored completion; tokens are what the original call consumed."""
+
+    content: str
+    model_id: str
+    input_tokens: int
+    output_tokens: int
+
+
+def completion_cache_key(
+    messages: List[Any],
+    model_id: str,
+    max_tokens: Optional[int],
+    temperature: Optional[float],
+) -> str:
+    """
+    Canonical hash of a completion request.
+
+    Args:
+        messages: ChatMessage objects (role/content)
+        model_id: Model the request is sent to
+        max_tokens: Effective max tokens
+        temperature: Effective temperature
+    """
+    payload = {
+        "messages": [{"role": m.role, "content": m.content} for m in messages],
+        "model": model_id,
+        "max_tokens": max_tokens,
+        "temperature": None if temperature is None else round(float(temperature), 4),
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class LLMCompletionCache:
+    """Tenant-scoped, size-bounded Redis cache of LLM completions."""
+
+    def __init__(
+        self,
+        redis_client=None,
+        ttl_seconds: int = LLM_CACHE_TTL_SECONDS,
+        max_entries: int = LLM_CACHE_MAX_ENTRIES,
+    ):
+        self._redis = redis_client
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+    @property
+    def available(self) -> bool:
+        return self._redis is not None
+
+    def _entry_key(self, tenant_id: str, key: str) -> str:
+        return f"{KEY_PREFIX}:{tenant_id}:{key}"
+
+    def _index_key(self, tenant_id: str) -> str:
+        return f"{KEY_PREFIX}:{tenant_id}:index"
+
+    def get(self, tenant_id: str, key: str) -> Optional[CachedCompletion]:
+        """Return the cached completion, refreshing its recency, or None."""
+        if not self.available:
+            return None
+        try:
+            raw = self._redis.get(self._entry_key(tenant_id, key))
+            if raw is None:
+                return None
+            self._redis.zadd(self._index_key(tenant_id), {key: time.time()})
+            return CachedCompletion(**json.loads(raw))
+        except Exception as e:
+            logger.warning(
+                "LLM cache GET failed",
+                extra={"tenant_id": tenant_id, "error": str(e)},
+            )
+            return None
+
+    def set(self, tenant_id: str, key: str, completion: CachedCompletion) -> bool:
+        """Store a completion and evict the tenant's least recently used overflow."""
+        if not self.available:
+            return False
+        index_key = self._index_key(tenant_id)
+        try:
+            pipe = self._redis.pipeline()
+            pipe.setex(self._entry_key(tenant_id, key), self.ttl_seconds, json.dumps(asdict(completion)))
+            pipe.zadd(index_key, {key: time.time()})
+            pipe.expire(index_key, self.ttl_seconds)
+            pipe.zcard(index_key)
+            size = pipe.execute()[-1]
+
+            overflow = size - self.max_entries
+            if overflow > 0:
+                evicted = [member for member, _ in self._redis.zpopmin(index_key, overflow)]
+                if evicted:
+                    self._redis.delete(*(self._entry_key(tenant_id, m) for m in evicted))
+            return True
+        except Exception as e:
+            logger.warning(
+                "LLM cache SET failed",
+                extra={"tenant_id": tenant_id, "error": str(e)},
+            )
+            return False
+
+
+_cache: Optional[LLMCompletionCache] = None
+_cache_lock = Lock()
+
+
+def get_completion_cache() -> LLMCompletionCache:
+    """Process-wide completion cache (disabled when Redis is not configured)."""
+    global _cache
+    if _cache is not None:
+        return _cache
+
+    with _cache_lock:
+        if _cache is not None:
+            return _cache
+
+        client = None
+        redis_url = os.getenv("REDIS_URL")
+        if LLM_CACHE_ENABLED and redis_url:
+            try:
+                import redis
+
+                client = redis.from_url(
+                    redis_url,
+                    decode_responses=True,
+                    socket_timeout=1.0,
+                    socket_connect_timeout=1.0,
+                )
+                client.ping()
+            except Exception as e:
+                logger.warning(f"Redis connection failed: {e} - LLM completion cache disabled")
+                client = None
+        _cache = LLMCompletionCache(redis_client=client)
+        return _cache
@@ -30,10 +30,21 @@ Usage:
         variables={"metric_name": "ROAS", ...},
         fallback_content=summary,  # Use if LLM fails
     )
+
+    # Or enhance every text field of a job at once (bounded concurrency,
+    # per-tenant token budget, one event loop for the whole job)
+    texts = enhance_batch_with_llm_sync(
+        db_session=self.db,
+        tenant_id=self.tenant_id,
+        requests=[LLMEnhancementRequest("insight_summary", variables, summary), ...],
+    )
 """
 
+import asyncio
 import logging
-from typing import Optional, Dict, Any
+import os
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List
 
 from sqlalchemy.orm import Session
 
@@ -42,6 +53,20 @@ from src.services.billing_entitlements import BillingEntitlementsService, Billin
 
 logger = logging.getLogger(__name__)
 
+# Max concurrent LLM calls per batch enhancement
+LLM_ENHANCE_MAX_CONCURRENCY = int(os.getenv("LLM_ENHANCE_MAX_CONCURRENCY", "8"))
+# Tokens a single tenant's batch may spend before remaining fields keep their fallback
+LLM_ENHANCE_TENANT_TOKEN_BUDGET = int(os.getenv("LLM_ENHANCE_TENANT_TOKEN_BUDGET", "60000"))
+
+
+@dataclass
+class LLMEnhancementRequest:
+    """One text field to enhance; fallback is returned if enhancement is not possible."""
+
+    template_key: str
+    variables: Dict[str, Any]
+    fallback: str
+
 
 async def enhance_with_llm(
     db_session: Session,
@@ -122,35 +147,116 @@ async def enhance_with_llm(
         return fallback_content
 
 
-def enhance_pair_with_llm_sync(
+async def enhance_batch_with_llm(
     db_session: Session,
     tenant_id: str,
-    template_key_a: str,
-    template_key_b: str,
-    variables: Dict[str, Any],
-    fallback_a: str,
-    fallback_b: str,
-) -> tuple:
+    requests: List[LLMEnhancementRequest],
+    max_concurrency: Optional[int] = None,
+    token_budget: Optional[int] = None,
+) -> List[str]:
     """
-    Synchronously enhance two related text fields with LLM.
+    Enhance many text fields concurrently for one tenant.
 
-    Handles asyncio event loop detection: if already in an async context,
-    returns fallbacks immediately. Otherwise batches both LLM calls into
-    a single asyncio.run() with asyncio.gather() for efficiency.
+    Entitlement, org config and prompt templates are resolved once for the
+    whole batch; completions then run through LLMRoutingService.complete
+    with at most max_concurrency in flight. Once the tenant's token budget
+    is spent, remaining fields keep their fallback. The budget is checked
+    before each call, so in-flight calls may overshoot it slightly.
 
     Args:
         db_session: Database session
         tenant_id: Tenant ID from JWT
-        template_key_a: Template key for first text field
-        template_key_b: Template key for second text field
-        variables: Shared variables for both templates
-        fallback_a: Fallback for first text field
-        fallback_b: Fallback for second text field
+        requests: Fields to enhance
+        max_concurrency: Max concurrent LLM calls (default LLM_ENHANCE_MAX_CONCURRENCY)
+        token_budget: Max total tokens for the batch (default LLM_ENHANCE_TENANT_TOKEN_BUDGET)
 
     Returns:
-        Tuple of (enhanced_a, enhanced_b) or (fallback_a, fallback_b)
+        Enhanced text (or fallback) for each request, in request order
+    """
+    fallbacks = [r.fallback for r in requests]
+    if not requests:
+        return fallbacks
+
+    entitlements = BillingEntitlementsService(db_session, tenant_id)
+    if not entitlements.check_feature_entitlement(BillingFeature.LLM_ROUTING).is_entitled:
+        logger.debug(
+            "LLM batch enhancement skipped - not entitled",
+            extra={"tenant_id": tenant_id, "requests": len(requests)},
+        )
+        return fallbacks
+
+    from src.integrations.openrouter import ChatMessage
+    from src.services.llm_routing_service import LLMRoutingService
+
+    service = LLMRoutingService(db_session, tenant_id)
+    templates = {
+        key: service.get_prompt_template(key)
+        for key in {r.template_key for r in requests}
+    }
+
+    semaphore = asyncio.Semaphore(max_concurrency or LLM_ENHANCE_MAX_CONCURRENCY)
+    budget = {
+        "remaining": token_budget if token_budget is not None else LLM_ENHANCE_TENANT_TOKEN_BUDGET,
+        "enhanced": 0,
+    }
+
+    async def _enhance(request: LLMEnhancementRequest) -> str:
+        template = templates.get(request.template_key)
+        if template is None:
+            return request.fallback
+        async with semaphore:
+            if budget["remaining"] <= 0:
+                return request.fallback
+            try:
+                result = await service.complete(
+                    messages=[ChatMessage(role="user", content=template.render(request.variables))],
+                    template_key=request.template_key,
+                    template_version=template.version,
+                )
+            except Exception as e:
+                logger.warning(
+                    "LLM enhancement failed, using fallback",
+                    extra={
+                        "tenant_id": tenant_id,
+                        "template_key": request.template_key,
+                        "error": str(e),
+                    },
+                )
+                return request.fallback
+            budget["remaining"] -= result.total_tokens
+            budget["enhanced"] += 1
+            return result.content
+
+    results = await asyncio.gather(*(_enhance(r) for r in requests))
+
+    logger.info(
+        "LLM batch enhancement complete",
+        extra={
+            "tenant_id": tenant_id,
+            "requests": len(requests),
+            "enhanced": budget["enhanced"],
+            "budget_exhausted": budget["remaining"] <= 0,
+        },
+    )
+    return list(results)
+
+
+def enhance_batch_with_llm_sync(
+    db_session: Session,
+    tenant_id: str,
+    requests: List[LLMEnhancementRequest],
+    max_concurrency: Optional[int] = None,
+    token_budget: Optional[int] = None,
+) -> List[str]:
+    """
+    Synchronous wrapper for enhance_batch_with_llm.
+
+    Runs the whole batch on a single event loop. If already in an async
+    context, or if anything fails, returns the fallbacks.
     """
-    import asyncio
+    fallbacks = [r.fallback for r in requests]
+    if not requests:
+        return fallbacks
 
     try:
         loop = asyncio.get_running_loop()
@@ -159,35 +265,53 @@ def enhance_pair_with_llm_sync(
 
     if loop is not None and loop.is_running():
         # Already in async context — skip LLM to avoid nested loop
-        return fallback_a, fallback_b
+        return fallbacks
 
     try:
-        async def _gather():
-            return await asyncio.gather(
-                enhance_with_llm(
-                    db_session=db_session,
-                    tenant_id=tenant_id,
-                    template_key=template_key_a,
-                    variables=variables,
-                    fallback_content=fallback_a,
-                ),
-                enhance_with_llm(
-                    db_session=db_session,
-                    tenant_id=tenant_id,
-                    template_key=template_key_b,
-                    variables=variables,
-                    fallback_content=fallback_b,
-                ),
+        return asyncio.run(
+            enhance_batch_with_llm(
+                db_session=db_session,
+                tenant_id=tenant_id,
+                requests=requests,
+                max_concurrency=max_concurrency,
+                token_budget=token_budget,
             )
-
-        return asyncio.run(_gather())
+        )
     except Exception as e:
         logger.warning(
             "LLM enhancement failed, using fallback content.",
             extra={"error": str(e)},
             exc_info=True,
         )
-        return fallback_a, fallback_b
+        return fallbacks
+
+
+def enhance_pair_with_llm_sync(
+    db_session: Session,
+    tenant_id: str,
+    template_key_a: str,
+    template_key_b: str,
+    variables: Dict[str, Any],
+    fallback_a: str,
+    fallback_b: str,
+) -> tuple:
+    """
+    Synchronously enhance two related text fields with LLM.
+
+    Thin wrapper over enhance_batch_with_llm_sync for single-item callers.
+
+    Returns:
+        Tuple of (enhanced_a, enhanced_b) or (fallback_a, fallback_b)
+    """
+    enhanced_a, enhanced_b = enhance_batch_with_llm_sync(
+        db_session=db_session,
+        tenant_id=tenant_id,
+        requests=[
+            LLMEnhancementRequest(template_key_a, variables, fallback_a),
+            LLMEnhancementRequest(template_key_b, variables, fallback_b),
+        ],
+    )
+    return enhanced_a, enhanced_b
 
 
 def is_llm_enabled(db_session: Session, tenant_id: str) -> bool:
@@ -6,6 +6,7 @@ Provides:
 - Automatic fallback on primary model failure
 - Versioned prompt template rendering
 - Usage logging for audit and cost tracking
+- Tenant-scoped completion cache (see llm_completion_cache)
 
 SECURITY:
 - Tenant isolation enforced via tenant_id
@@ -19,6 +20,7 @@ NO AUTO-EXECUTION:
 - No autonomous actions
 """
 
+import asyncio
 import logging
 import time
 from dataclasses import dataclass
@@ -43,6 +45,12 @@ from src.integrations.openrouter import (
     OpenRouterTimeoutError,
     OpenRouterModelUnavailableError,
 )
+from src.services.llm_completion_cache import (
+    CachedCompletion,
+    LLMCompletionCache,
+    completion_cache_key,
+    get_completion_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +67,7 @@ class LLMCompletionResult:
     cost_usd: Decimal
     was_fallback: bool
     fallback_reason: Optional[str] = None
+    was_cache_hit: bool = False
 
 
 class LLMRoutingError(Exception):
@@ -84,6 +93,7 @@ class LLMRoutingService:
     - Org-level model configuration
     - Primary and fallback model selection
     - Prompt template rendering
+    - Completion caching
     - Usage logging
 
     SECURITY: tenant_id is required and enforced on all operations.
@@ -97,6 +107,7 @@ class LLMRoutingService:
         db_session: Session,
         tenant_id: str,
         client: Optional[OpenRouterClient] = None,
+        cache: Optional[LLMCompletionCache] = None,
     ):
         """
         Initialize LLM routing service.
@@ -105,6 +116,7 @@ class LLMRoutingService:
             db_session: Database session
             tenant_id: Tenant ID from JWT
             client: Optional OpenRouter client (created if not provided)
+            cache: Optional completion cache (process-wide cache if not provided)
         """
         if not tenant_id:
             raise ValueError("tenant_id is required")
@@ -112,10 +124,11 @@ class LLMRoutingService:
         self.db = db_session
         self.tenant_id = tenant_id
         self._client = client
+        self._cache = cache if cache is not None else get_completion_cache()
         self._org_config: Optional[LLMOrgConfig] = None
 
     def _get_client(self) -> OpenRouterClient:
-        """Get or create OpenRouter client."""
+        """Get the injected client, else the shared pooled OpenRouter client."""
         if self._client is None:
             self._client = get_openrouter_client()
         return self._client
@@ -260,6 +273,7 @@ class LLMRoutingService:
         status: str,
         was_fallback: bool = False,
         fallback_reason: Optional[str] = None,
+        was_cache_hit: bool = False,
         error_message: Optional[str] = None,
         template_key: Optional[str] = None,
         template_version: Optional[int] = None,
@@ -277,6 +291,7 @@ class LLMRoutingService:
             status: Response status
             was_fallback: Whether fallback model was used
             fallback_reason: Reason for fallback
+            was_cache_hit: Whether the response was served from the completion cache
             error_message: Error message if applicable
             template_key: Prompt template key used
             template_version: Prompt template version used
@@ -297,6 +312,7 @@ class LLMRoutingService:
             cost_usd=cost_usd,
             was_fallback=was_fallback,
             fallback_reason=fallback_reason,
+            was_cache_hit=was_cache_hit,
             request_metadata=metadata or {},
             response_status=status,
             error_message=error_message,
@@ -315,6 +331,7 @@ class LLMRoutingService:
                 "cost_usd": str(cost_usd),
                 "status": status,
                 "was_fallback": was_fallback,
+                "was_cache_hit": was_cache_hit,
             },
         )
 
@@ -332,7 +349,8 @@ class LLMRoutingService:
         """
         Complete a chat request with automatic fallback.
 
-        Tries primary model first, falls back on certain errors.
+        Serves identical requests for the primary model from the completion
+        cache; otherwise tries primary model first, falls back on certain errors.
 
         Args:
             messages: Chat messages to send
@@ -361,9 +379,45 @@ class LLMRoutingService:
         if effective_temperature is None:
             effective_temperature = float(org_config.temperature) if org_config else 0.7
 
-        client = self._get_client()
         start_time = time.time()
 
+        # Serve repeated requests from the cache (logged at zero cost)
+        cache_key = completion_cache_key(
+            messages,
+            primary_model.model_id,
+            effective_max_tokens,
+            effective_temperature,
+        )
+        # The cache may be backed by blocking Redis calls; keep them off the loop
+        cached = await asyncio.to_thread(self._cache.get, self.tenant_id, cache_key)
+        if cached is not None:
+            latency_ms = int((time.time() - start_time) * 1000)
+            self._log_usage(
+                model_id=cached.model_id,
+                input_tokens=0,
+                output_tokens=0,
+                latency_ms=latency_ms,
+                cost_usd=Decimal("0"),
+                status=LLMResponseStatus.SUCCESS.value,
+                was_cache_hit=True,
+                template_key=template_key,
+                template_version=template_version,
+                metadata=metadata,
+            )
+            return LLMCompletionResult(
+                content=cached.content,
+                model_id=cached.model_id,
+                input_tokens=0,
+                output_tokens=0,
+                total_tokens=0,
+                latency_ms=latency_ms,
+                cost_usd=Decimal("0"),
+                was_fallback=False,
+                was_cache_hit=True,
+            )
+
+        client = self._get_client()
+
         # Try primary model
         try:
             response = await client.chat_completion(
@@ -392,6 +446,18 @@ class LLMRoutingService:
                 metadata=metadata,
             )
 
+            await asyncio.to_thread(
+                self._cache.set,
+                self.tenant_id,
+                cache_key,
+                CachedCompletion(
+                    content=response.content,
+                    model_id=primary_model.model_id,
+                    input_tokens=response.input_tokens,
+                    output_tokens=response.output_tokens,
+                ),
+            )
+
             return LLMCompletionResult(
                 content=response.content,
                 model_id=primary_model.model_id,
@@ -604,6 +670,9 @@ class LLMRoutingService:
             func.count(LLMUsageLog.id).filter(
                 LLMUsageLog.was_fallback
             ).label("fallback_count"),
+            func.count(LLMUsageLog.id).filter(
+                LLMUsageLog.was_cache_hit
+            ).label("cache_hit_count"),
         ).filter(
             LLMUsageLog.tenant_id == self.tenant_id,
             LLMUsageLog.created_at >= cutoff,
@@ -615,5 +684,6 @@ class LLMRoutingService:
             "request_count": result.request_count or 0,
             "success_count": result.success_count or 0,
             "fallback_count": result.fallback_count or 0,
+            "cache_hit_count": result.cache_hit_count or 0,
             "period_days": days,
         }
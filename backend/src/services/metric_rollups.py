@@ -0,0 +1,295 @@
+"""
+Period metrics from the daily rollup tables.
+
+marts.rollup_daily_channel and marts.rollup_daily_revenue hold one row of
+additive measures (sums and counts) per tenant and day. Any date range is
+answered by summing O(days) rows; ratios — ROAS, CAC, CTR, AOV, rates —
+are derived from the summed measures here, never averaged across rows.
+
+Period types follow dim_date_ranges: "last_N_days" ends today, calendar
+periods (weekly, monthly, ...) are the latest complete one, and the prior
+period is the equally long window immediately before.
+
+SECURITY: Every query is filtered by the tenant_id passed in (from JWT).
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, fields
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+
+ROLLING_PERIOD_DAYS: Dict[str, int] = {
+    "daily": 1,
+    "last_7_days": 7,
+    "last_30_days": 30,
+    "last_90_days": 90,
+}
+
+# Channel key for orders without an ad platform (platform IS NULL)
+ORGANIC_PLATFORM = "organic"
+
+
+@dataclass(frozen=True)
+class DateRange:
+    """Inclusive calendar date range."""
+    start: date
+    end: date
+
+    @property
+    def days(self) -> int:
+        return (self.end - self.start).days + 1
+
+    def __contains__(self, day: date) -> bool:
+        return self.start <= day <= self.end
+
+
+def _add_months(day: date, months: int) -> date:
+    month_index = day.year * 12 + day.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def period_bounds(
+    period_type: str,
+    today: Optional[date] = None,
+) -> Tuple[DateRange, DateRange]:
+    """
+    Current and prior date ranges for a dim_date_ranges period type.
+
+    Unknown period types fall back to last_30_days.
+
+    Returns:
+        (current, prior) inclusive date ranges
+    """
+    today = today or date.today()
+
+    if period_type == "weekly":
+        start = today - timedelta(days=today.weekday())
+        if start + timedelta(days=6) > today:
+            start -= timedelta(days=7)
+        current = DateRange(start, start + timedelta(days=6))
+        return current, DateRange(start - timedelta(days=7), start - timedelta(days=1))
+
+    months = {"monthly": 1, "quarterly": 3, "yearly": 12}.get(period_type)
+    if months:
+        first = today.replace(day=1)
+        if period_type == "quarterly":
+            first = first.replace(month=(first.month - 1) // 3 * 3 + 1)
+        elif period_type == "yearly":
+            first = first.replace(month=1)
+        if _add_months(first, months) - timedelta(days=1) > today:
+            first = _add_months(first, -months)
+        current = DateRange(first, _add_months(first, months) - timedelta(days=1))
+        prior_start = _add_months(first, -months)
+        return current, DateRange(prior_start, first - timedelta(days=1))
+
+    days = ROLLING_PERIOD_DAYS.get(period_type, 30)
+    current = DateRange(today - timedelta(days=days - 1), today)
+    prior = DateRange(current.start - timedelta(days=days), current.start - timedelta(days=1))
+    return current, prior
+
+
+def change_pct(current: float, prior: float) -> float:
+    """Percentage change vs prior, 0 when prior is not positive (as the marts)."""
+    if prior > 0:
+        return round((current - prior) / prior * 100, 2)
+    return 0.0
+
+
+def _ratio(numerator: float, denominator: float) -> float:
+    return numerator / denominator if denominator > 0 else 0.0
+
+
+# ---------------------------------------------------------------------------
+# Measures
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ChannelTotals:
+    """Additive marketing measures summed over a date range."""
+    spend: float = 0.0
+    orders: int = 0
+    gross_revenue: float = 0.0
+    net_revenue: float = 0.0
+    new_customers: int = 0
+    net_new_customers: int = 0
+    impressions: int = 0
+    clicks: int = 0
+    conversions: int = 0
+    attributed_orders: int = 0
+    unattributed_orders: int = 0
+    attributed_revenue: float = 0.0
+
+    def add(self, other: "ChannelTotals") -> None:
+        for f in fields(self):
+            setattr(self, f.name, getattr(self, f.name) + getattr(other, f.name))
+
+    @property
+    def gross_roas(self) -> float:
+        return _ratio(self.gross_revenue, self.spend)
+
+    @property
+    def net_roas(self) -> float:
+        return _ratio(self.net_revenue, self.spend)
+
+    @property
+    def cac(self) -> float:
+        return _ratio(self.spend, self.new_customers)
+
+    @property
+    def ctr(self) -> float:
+        return _ratio(self.clicks, self.impressions)
+
+    @property
+    def conversion_rate(self) -> float:
+        return _ratio(self.conversions, self.clicks)
+
+    @property
+    def attribution_rate(self) -> float:
+        """Attributed share of orders, 0-100."""
+        return _ratio(
+            self.attributed_orders * 100,
+            self.attributed_orders + self.unattributed_orders,
+        )
+
+
+@dataclass
+class RevenueTotals:
+    """Additive store revenue measures summed over a date range."""
+    gross_revenue: float = 0.0
+    refund_amount: float = 0.0
+    cancellation_amount: float = 0.0
+    net_revenue: float = 0.0
+    order_count: int = 0
+
+    def add(self, other: "RevenueTotals") -> None:
+        for f in fields(self):
+            setattr(self, f.name, getattr(self, f.name) + getattr(other, f.name))
+
+    @property
+    def aov(self) -> float:
+        return _ratio(self.net_revenue, self.order_count)
+
+
+def _totals(cls, row) -> object:
+    """Build a totals dataclass from a row, coercing NULL sums to 0."""
+    values = {}
+    for f in fields(cls):
+        value = getattr(row, f.name) or 0
+        values[f.name] = int(value) if f.type == "int" else float(value)
+    return cls(**values)
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+_CHANNEL_SUMS = ",\n".join(
+    f"COALESCE(SUM({f.name}), 0) AS {f.name}" for f in fields(ChannelTotals)
+)
+_REVENUE_SUMS = ",\n".join(
+    f"COALESCE(SUM({f.name}), 0) AS {f.name}" for f in fields(RevenueTotals)
+)
+
+
+def channel_totals_by_platform(
+    db: Session,
+    tenant_id: str,
+    period: DateRange,
+) -> Dict[str, ChannelTotals]:
+    """Per-platform totals for the period; NULL platform is keyed "organic"."""
+    rows = db.execute(text(f"""
+        SELECT
+            COALESCE(platform, '{ORGANIC_PLATFORM}') AS platform,
+            {_CHANNEL_SUMS}
+        FROM marts.rollup_daily_channel
+        WHERE tenant_id = :tenant_id
+          AND date BETWEEN :start_date AND :end_date
+        GROUP BY COALESCE(platform, '{ORGANIC_PLATFORM}')
+    """), {
+        "tenant_id": tenant_id,
+        "start_date": period.start,
+        "end_date": period.end,
+    }).fetchall()
+    return {r.platform: _totals(ChannelTotals, r) for r in rows}
+
+
+def channel_daily(
+    db: Session,
+    tenant_id: str,
+    period: DateRange,
+    platform: Optional[str] = None,
+) -> List[Tuple[date, ChannelTotals]]:
+    """
+    Daily totals (ascending, days without rows omitted) for one platform,
+    or all platforms when platform is None.
+    """
+    rows = db.execute(text(f"""
+        SELECT
+            date,
+            {_CHANNEL_SUMS}
+        FROM marts.rollup_daily_channel
+        WHERE tenant_id = :tenant_id
+          AND date BETWEEN :start_date AND :end_date
+          AND (
+            CAST(:platform AS TEXT) IS NULL
+            OR platform = :platform
+            OR (:platform = '{ORGANIC_PLATFORM}' AND platform IS NULL)
+          )
+        GROUP BY date
+        ORDER BY date
+    """), {
+        "tenant_id": tenant_id,
+        "start_date": period.start,
+        "end_date": period.end,
+        "platform": platform,
+    }).fetchall()
+    return [(r.date, _totals(ChannelTotals, r)) for r in rows]
+
+
+def revenue_totals_by_currency(
+    db: Session,
+    tenant_id: str,
+    periods: List[DateRange],
+) -> Dict[str, List[RevenueTotals]]:
+    """
+    Revenue totals per currency for several periods in one query.
+
+    Reads the daily rows spanning all periods once and sums each period in
+    Python (at most a few hundred rows).
+
+    Returns:
+        currency -> [RevenueTotals per period, in the order given]
+    """
+    start = min(p.start for p in periods)
+    end = max(p.end for p in periods)
+    rows = db.execute(text(f"""
+        SELECT
+            date,
+            currency,
+            {_REVENUE_SUMS}
+        FROM marts.rollup_daily_revenue
+        WHERE tenant_id = :tenant_id
+          AND date BETWEEN :start_date AND :end_date
+        GROUP BY date, currency
+    """), {
+        "tenant_id": tenant_id,
+        "start_date": start,
+        "end_date": end,
+    }).fetchall()
+
+    by_currency: Dict[str, List[RevenueTotals]] = defaultdict(
+        lambda: [RevenueTotals() for _ in periods]
+    )
+    for r in rows:
+        day_totals = _totals(RevenueTotals, r)
+        for i, period in enumerate(periods):
+            if r.date in period:
+                by_currency[r.currency][i].add(day_totals)
+    return dict(by_currency)
@@ -13,6 +13,7 @@ import logging
 from datetime import datetime, timezone
 from typing import Optional, List, Tuple
 
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
@@ -21,12 +22,34 @@ from src.models.notification import (
     NotificationEventType,
     NotificationImportance,
     NotificationStatus,
+    NotificationUnreadCount,
 )
 from src.models.notification_preference import NotificationPreference
 
 
 logger = logging.getLogger(__name__)
 
+UNREAD_STATUSES = (NotificationStatus.PENDING, NotificationStatus.DELIVERED)
+
+# Applies a delta to a user's unread counter, creating the row on first use
+# and never letting the count go below zero
+_ADJUST_UNREAD_COUNT = text("""
+    INSERT INTO notification_unread_counts (tenant_id, user_id, unread_count, version, updated_at)
+    VALUES (
+        :tenant_id, :user_id,
+        CASE WHEN :delta > 0 THEN :delta ELSE 0 END,
+        1, CURRENT_TIMESTAMP
+    )
+    ON CONFLICT (tenant_id, user_id)
+    DO UPDATE SET
+        unread_count = CASE
+            WHEN notification_unread_counts.unread_count + :delta < 0 THEN 0
+            ELSE notification_unread_counts.unread_count + :delta
+        END,
+        version = notification_unread_counts.version + 1,
+        updated_at = CURRENT_TIMESTAMP
+""")
+
 
 class NotificationService:
     """
@@ -107,6 +130,9 @@ class NotificationService:
 
             self.db.flush()
 
+            if user_id:
+                self._adjust_unread_count(user_id, 1)
+
             logger.info(
                 "Notification created",
                 extra={
@@ -407,15 +433,16 @@ class NotificationService:
         Returns:
             List of unread notifications
         """
+        # Most polls find nothing unread; the counter row answers that alone
+        if self.get_unread_count(user_id) == 0:
+            return []
+
         return (
             self.db.query(Notification)
             .filter(
                 Notification.tenant_id == self.tenant_id,
                 Notification.user_id == user_id,
-                Notification.status.in_([
-                    NotificationStatus.PENDING,
-                    NotificationStatus.DELIVERED,
-                ]),
+                Notification.status.in_(UNREAD_STATUSES),
             )
             .order_by(Notification.created_at.desc())
             .limit(limit)
@@ -426,24 +453,53 @@ class NotificationService:
         """
         Get count of unread notifications for a user.
 
+        Reads the user's unread counter row rather than counting
+        notifications.
+
         Args:
             user_id: Target user ID
 
         Returns:
             Count of unread notifications
         """
-        return (
-            self.db.query(Notification)
+        count = (
+            self.db.query(NotificationUnreadCount.unread_count)
             .filter(
-                Notification.tenant_id == self.tenant_id,
-                Notification.user_id == user_id,
-                Notification.status.in_([
-                    NotificationStatus.PENDING,
-                    NotificationStatus.DELIVERED,
-                ]),
+                NotificationUnreadCount.tenant_id == self.tenant_id,
+                NotificationUnreadCount.user_id == user_id,
+            )
+            .scalar()
+        )
+        return count or 0
+
+    def get_unread_state(self, user_id: str) -> Tuple[int, int]:
+        """
+        Get the unread count and counter version for a user.
+
+        The version changes whenever the counter does, including when a new
+        notification and a read cancel out, so pollers can tell something
+        happened without comparing counts.
+
+        Args:
+            user_id: Target user ID
+
+        Returns:
+            Tuple of (unread_count, version); (0, 0) before the first notification
+        """
+        row = (
+            self.db.query(
+                NotificationUnreadCount.unread_count,
+                NotificationUnreadCount.version,
             )
-            .count()
+            .filter(
+                NotificationUnreadCount.tenant_id == self.tenant_id,
+                NotificationUnreadCount.user_id == user_id,
+            )
+            .first()
         )
+        if row is None:
+            return 0, 0
+        return row.unread_count, row.version
 
     def mark_as_read(self, notification_id: str, user_id: str) -> bool:
         """
@@ -456,6 +512,7 @@ class NotificationService:
         Returns:
             True if successful, False if not found or unauthorized
         """
+        # Row lock so concurrent reads of the same notification decrement once
         notification = (
             self.db.query(Notification)
             .filter(
@@ -463,15 +520,20 @@ class NotificationService:
                 Notification.tenant_id == self.tenant_id,
                 Notification.user_id == user_id,
             )
+            .with_for_update()
             .first()
         )
 
         if not notification:
             return False
 
+        was_unread = notification.status in UNREAD_STATUSES
         notification.mark_read()
         self.db.flush()
 
+        if was_unread:
+            self._adjust_unread_count(user_id, -1)
+
         logger.info(
             "Notification marked as read",
             extra={
@@ -500,10 +562,7 @@ class NotificationService:
             .filter(
                 Notification.tenant_id == self.tenant_id,
                 Notification.user_id == user_id,
-                Notification.status.in_([
-                    NotificationStatus.PENDING,
-                    NotificationStatus.DELIVERED,
-                ]),
+                Notification.status.in_(UNREAD_STATUSES),
             )
             .update(
                 {
@@ -516,6 +575,11 @@ class NotificationService:
 
         self.db.flush()
 
+        # Subtract what this update actually marked rather than zeroing, so
+        # notifications created concurrently stay counted
+        if count:
+            self._adjust_unread_count(user_id, -count)
+
         logger.info(
             "All notifications marked as read",
             extra={
@@ -527,6 +591,14 @@ class NotificationService:
 
         return count
 
+    def _adjust_unread_count(self, user_id: str, delta: int) -> None:
+        """Apply delta to the user's unread counter in the current transaction."""
+        self.db.execute(_ADJUST_UNREAD_COUNT, {
+            "tenant_id": self.tenant_id,
+            "user_id": user_id,
+            "delta": delta,
+        })
+
     def _should_send_email(
         self,
         event_type: NotificationEventType,
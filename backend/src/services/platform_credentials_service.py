@@ -29,7 +29,12 @@ from src.models.connector_credential import (
     CredentialStatus,
     HARD_DELETE_AFTER_DAYS,
 )
-from src.platform.secrets import encrypt_secret, decrypt_secret
+from src.platform.secrets import encrypt_secret
+from src.services.credential_vault import (
+    CredentialVault,
+    evict_cached_payload,
+    evict_cached_payload_on_commit,
+)
 from src.services.platform_executors import (
     MetaCredentials,
     GoogleAdsCredentials,
@@ -129,6 +134,15 @@ class PlatformCredentialsService:
         )
         return self.db.execute(stmt).scalar_one_or_none()
 
+    async def _load_payload(
+        self, tenant_id: str, credential: ConnectorCredential
+    ) -> dict:
+        """Decrypt a credential payload through the vault's short-lived cache."""
+        decrypted = await CredentialVault(self.db, tenant_id).decrypt_credential(credential)
+        if decrypted is None:
+            raise ValueError("Credential payload wiped")
+        return decrypted
+
     # =========================================================================
     # Credential Retrieval
     # =========================================================================
@@ -150,7 +164,7 @@ class PlatformCredentialsService:
             return None
 
         try:
-            decrypted = self._decrypt_credentials(credential.encrypted_payload)
+            decrypted = await self._load_payload(tenant_id, credential)
             return MetaCredentials(
                 access_token=decrypted["access_token"],
                 ad_account_id=decrypted.get("ad_account_id", ""),
@@ -179,7 +193,7 @@ class PlatformCredentialsService:
             return None
 
         try:
-            decrypted = self._decrypt_credentials(credential.encrypted_payload)
+            decrypted = await self._load_payload(tenant_id, credential)
             return GoogleAdsCredentials(
                 access_token=decrypted["access_token"],
                 refresh_token=decrypted.get("refresh_token", ""),
@@ -400,6 +414,8 @@ class PlatformCredentialsService:
 
             self.db.flush()
             self.db.commit()
+            if existing:
+                evict_cached_payload(tenant_id, existing.id)
             logger.info(
                 "Credentials stored",
                 extra={"tenant_id": tenant_id, "platform": platform.value},
@@ -447,6 +463,7 @@ class PlatformCredentialsService:
             credential.soft_deleted_at = now
             credential.hard_delete_after = now + timedelta(days=HARD_DELETE_AFTER_DAYS)
             self.db.flush()
+            evict_cached_payload_on_commit(self.db, tenant_id, credential.id)
 
             logger.info(
                 "Credentials revoked",
@@ -490,31 +507,6 @@ class PlatformCredentialsService:
             )
         return asyncio.run(encrypt_secret(plaintext))
 
-    def _decrypt_credentials(self, encrypted_data: str) -> dict:
-        """
-        Decrypt credential data from storage.
-
-        Uses the platform.secrets module (Fernet encryption via ENCRYPTION_KEY).
-
-        Args:
-            encrypted_data: Encrypted credential string from database
-
-        Returns:
-            Decrypted credential dictionary
-        """
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
-
-        if loop is not None and loop.is_running():
-            raise RuntimeError(
-                "Cannot call _decrypt_credentials from running async loop; "
-                "use await decrypt_secret() directly"
-            )
-        plaintext = asyncio.run(decrypt_secret(encrypted_data))
-        return json.loads(plaintext)
-
 
 # =============================================================================
 # Factory Function
@@ -12,6 +12,7 @@ Supported Platforms:
 Each executor implements the BasePlatformExecutor interface and handles:
 - API authentication
 - Rate limiting with exponential backoff
+- Shared connection pools and per-account rate budgets (PlatformGateway)
 - State capture (before/after)
 - Action execution
 - Rollback instruction generation
@@ -27,6 +28,14 @@ from src.services.platform_executors.base_executor import (
     RetryConfig,
     PlatformAPIError,
 )
+from src.services.platform_executors.platform_gateway import (
+    PlatformGateway,
+    RateBudgetConfig,
+    RateBudgetExhaustedError,
+    TokenBucket,
+    get_platform_gateway,
+    close_platform_gateway,
+)
 from src.services.platform_executors.meta_executor import (
     MetaAdsExecutor,
     MetaCredentials,
@@ -48,6 +57,13 @@ __all__ = [
     "StateCapture",
     "RetryConfig",
     "PlatformAPIError",
+    # Gateway
+    "PlatformGateway",
+    "RateBudgetConfig",
+    "RateBudgetExhaustedError",
+    "TokenBucket",
+    "get_platform_gateway",
+    "close_platform_gateway",
     # Meta
     "MetaAdsExecutor",
     "MetaCredentials",
@@ -21,7 +21,12 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import httpx
+
+    from src.services.platform_executors.platform_gateway import PlatformGateway
 
 logger = logging.getLogger(__name__)
 
@@ -256,6 +261,11 @@ class BasePlatformExecutor(ABC):
     - get_entity_state(): Fetch current entity state
     - _execute_action_impl(): Execute the actual action
     - generate_rollback_params(): Generate rollback parameters
+
+    Subclasses may override:
+    - rate_limit_key: Account the platform rate-limits on
+    - get_entity_states(): Batched state reads (defaults to concurrent
+      single reads paced by the shared rate budget)
     """
 
     # Platform identifier (override in subclass)
@@ -264,17 +274,40 @@ class BasePlatformExecutor(ABC):
     def __init__(
         self,
         retry_config: Optional[RetryConfig] = None,
+        gateway: Optional["PlatformGateway"] = None,
     ):
         """
         Initialize the executor.
 
         Args:
             retry_config: Optional retry configuration
+            gateway: Optional platform gateway (defaults to the shared
+                process-wide gateway)
         """
         self.retry_config = retry_config or RetryConfig()
+        self._gateway = gateway
         self._request_count = 0
         self._last_request_time: Optional[float] = None
 
+    @property
+    def gateway(self) -> "PlatformGateway":
+        """Shared connection pools and rate budgets."""
+        if self._gateway is None:
+            from src.services.platform_executors.platform_gateway import (
+                get_platform_gateway,
+            )
+            self._gateway = get_platform_gateway()
+        return self._gateway
+
+    @property
+    def rate_limit_key(self) -> str:
+        """
+        Account identifier the platform applies rate limits to.
+
+        Override in subclass (ad account, customer ID, shop domain).
+        """
+        return "default"
+
     # =========================================================================
     # Abstract Methods (must be implemented by subclasses)
     # =========================================================================
@@ -525,6 +558,38 @@ class BasePlatformExecutor(ABC):
             is_retryable=False,
         )
 
+    async def get_entity_states(
+        self,
+        entities: list[tuple[str, str]],
+    ) -> list[StateCapture]:
+        """
+        Get current state of several entities.
+
+        Default implementation issues single reads concurrently; the shared
+        rate budget paces them. Override in subclass to use a platform batch
+        endpoint.
+
+        Args:
+            entities: (entity_id, entity_type) pairs
+
+        Returns:
+            StateCaptures in the same order as entities
+
+        Raises:
+            PlatformAPIError: If any API call fails
+        """
+        return list(await asyncio.gather(*(
+            self.get_entity_state(entity_id, entity_type)
+            for entity_id, entity_type in entities
+        )))
+
+    async def capture_before_states(
+        self,
+        entities: list[tuple[str, str]],
+    ) -> list[StateCapture]:
+        """Batched form of capture_before_state."""
+        return await self.get_entity_states(entities)
+
     async def capture_before_state(
         self,
         entity_id: str,
@@ -651,6 +716,23 @@ class BasePlatformExecutor(ABC):
 
         return hashlib.sha256(content.encode()).hexdigest()[:32]
 
+    async def _acquire_rate_budget(self, cost: float = 1.0) -> None:
+        """Wait for this account's shared rate budget before a request."""
+        await self.gateway.acquire(self.platform_name, self.rate_limit_key, cost)
+
+    def _observe_rate_limits(self, response: "httpx.Response") -> None:
+        """Feed a response's rate-limit headers back into the shared budget."""
+        self.gateway.observe_response(self.platform_name, self.rate_limit_key, response)
+
+    def _get_shared_client(self, timeout: "httpx.Timeout") -> "httpx.AsyncClient":
+        """Pooled HTTP client shared by every executor for this platform."""
+        return self.gateway.get_client(self.platform_name, timeout)
+
+    async def _release_client(self, client: Optional["httpx.AsyncClient"]) -> None:
+        """Close a client unless it belongs to the shared gateway pool."""
+        if client is not None and not self.gateway.is_shared_client(client):
+            await client.aclose()
+
     def _log_request(
         self,
         method: str,
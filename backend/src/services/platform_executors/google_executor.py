@@ -16,7 +16,7 @@ Story 8.5 - Action Execution (Scoped & Reversible)
 
 import logging
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import httpx
 
@@ -28,6 +28,9 @@ from src.services.platform_executors.base_executor import (
     PlatformAPIError,
 )
 
+if TYPE_CHECKING:
+    from src.services.platform_executors.platform_gateway import PlatformGateway
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,6 +40,7 @@ logger = logging.getLogger(__name__)
 
 GOOGLE_ADS_API_VERSION = "v15"
 GOOGLE_ADS_API_BASE = "https://googleads.googleapis.com"
+GOOGLE_ADS_MAX_IDS_PER_QUERY = 500  # Keep GAQL IN lists well under limits
 
 # Google Ads campaign status values
 class GoogleCampaignStatus:
@@ -98,6 +102,7 @@ class GoogleAdsExecutor(BasePlatformExecutor):
 
     Rate Limiting:
     - Google Ads uses daily operation limits
+    - Requests draw from a shared per-customer budget
     - Executor respects rate limit headers
     - Exponential backoff for 429 responses
 
@@ -114,6 +119,7 @@ class GoogleAdsExecutor(BasePlatformExecutor):
         retry_config: Optional[RetryConfig] = None,
         api_version: str = GOOGLE_ADS_API_VERSION,
         timeout_seconds: float = 30.0,
+        gateway: Optional["PlatformGateway"] = None,
     ):
         """
         Initialize Google Ads executor.
@@ -123,8 +129,9 @@ class GoogleAdsExecutor(BasePlatformExecutor):
             retry_config: Optional retry configuration
             api_version: Google Ads API version (default: v15)
             timeout_seconds: HTTP timeout in seconds
+            gateway: Optional platform gateway (defaults to shared gateway)
         """
-        super().__init__(retry_config)
+        super().__init__(retry_config, gateway)
         self.credentials = credentials
         self.api_version = api_version
         self.base_url = f"{GOOGLE_ADS_API_BASE}/{api_version}"
@@ -132,13 +139,20 @@ class GoogleAdsExecutor(BasePlatformExecutor):
 
         self._client: Optional[httpx.AsyncClient] = None
 
+    @property
+    def rate_limit_key(self) -> str:
+        """Google Ads rate-limits per customer (and developer token)."""
+        return self.credentials.customer_id
+
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client with auth headers."""
+        """
+        Get HTTP client (shared gateway pool unless one was injected).
+
+        The pooled client carries no credentials; auth headers are sent
+        per request via _get_auth_headers().
+        """
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=self.timeout,
-                headers=self._get_auth_headers(),
-            )
+            self._client = self._get_shared_client(self.timeout)
         return self._client
 
     def _get_auth_headers(self) -> dict:
@@ -153,9 +167,9 @@ class GoogleAdsExecutor(BasePlatformExecutor):
         return headers
 
     async def close(self):
-        """Close HTTP client."""
+        """Release HTTP client. Shared pooled clients stay open."""
         if self._client:
-            await self._client.aclose()
+            await self._release_client(self._client)
             self._client = None
 
     async def __aenter__(self):
@@ -214,9 +228,13 @@ class GoogleAdsExecutor(BasePlatformExecutor):
         payload = {"query": query}
 
         client = await self._get_client()
+        await self._acquire_rate_budget()
 
         try:
-            response = await client.post(url, json=payload)
+            response = await client.post(
+                url, json=payload, headers=self._get_auth_headers()
+            )
+            self._observe_rate_limits(response)
             data = response.json()
 
             if response.status_code != 200:
@@ -249,9 +267,12 @@ class GoogleAdsExecutor(BasePlatformExecutor):
 
     def _build_state_query(self, entity_id: str, entity_type: str) -> str:
         """Build GAQL query for fetching entity state."""
+        return self._build_state_query_for_ids([entity_id], entity_type)
+
+    def _build_state_query_for_ids(self, entity_ids: list[str], entity_type: str) -> str:
+        """Build GAQL query for fetching the state of one or more entities."""
         if entity_type == "campaign":
-            return f"""
-                SELECT
+            select = """
                     campaign.id,
                     campaign.name,
                     campaign.status,
@@ -262,67 +283,160 @@ class GoogleAdsExecutor(BasePlatformExecutor):
                     campaign.target_cpa.target_cpa_micros,
                     campaign.target_roas.target_roas,
                     campaign.start_date,
-                    campaign.end_date
-                FROM campaign
-                WHERE campaign.id = {entity_id}
-            """
+                    campaign.end_date"""
+            resource, id_field = "campaign", "campaign.id"
         elif entity_type == "ad_group":
-            return f"""
-                SELECT
+            select = """
                     ad_group.id,
                     ad_group.name,
                     ad_group.status,
                     ad_group.campaign,
                     ad_group.cpc_bid_micros,
                     ad_group.cpm_bid_micros,
-                    ad_group.target_cpa_micros
-                FROM ad_group
-                WHERE ad_group.id = {entity_id}
-            """
+                    ad_group.target_cpa_micros"""
+            resource, id_field = "ad_group", "ad_group.id"
         elif entity_type == "ad":
-            return f"""
-                SELECT
+            select = """
                     ad_group_ad.ad.id,
                     ad_group_ad.ad.name,
                     ad_group_ad.status,
                     ad_group_ad.ad_group,
-                    ad_group_ad.ad.type
-                FROM ad_group_ad
-                WHERE ad_group_ad.ad.id = {entity_id}
-            """
+                    ad_group_ad.ad.type"""
+            resource, id_field = "ad_group_ad", "ad_group_ad.ad.id"
         else:
             # Generic campaign query as fallback
-            return f"""
-                SELECT campaign.id, campaign.name, campaign.status
-                FROM campaign
-                WHERE campaign.id = {entity_id}
+            select = " campaign.id, campaign.name, campaign.status"
+            resource, id_field = "campaign", "campaign.id"
+
+        if len(entity_ids) == 1:
+            condition = f"{id_field} = {entity_ids[0]}"
+        else:
+            condition = f"{id_field} IN ({', '.join(str(i) for i in entity_ids)})"
+
+        return f"""
+                SELECT{select}
+                FROM {resource}
+                WHERE {condition}
             """
 
     def _parse_search_response(self, data: list, entity_type: str) -> dict:
         """Parse Google Ads search stream response."""
-        # Response is a list of batches
-        if not data:
+        results = self._collect_search_results(data)
+        if not results:
             return {}
 
+        # Return first result's entity
+        return self._extract_entity(results[0], entity_type)
+
+    @staticmethod
+    def _collect_search_results(data: list) -> list[dict]:
+        """Flatten the batches of a search stream response."""
+        # Response is a list of batches
         results = []
-        for batch in data:
+        for batch in data or []:
             if "results" in batch:
                 results.extend(batch["results"])
+        return results
 
-        if not results:
-            return {}
-
-        # Return first result's entity
-        first_result = results[0]
-
+    @staticmethod
+    def _extract_entity(result: dict, entity_type: str) -> dict:
+        """Pick the entity object for entity_type out of a search row."""
         if entity_type == "campaign":
-            return first_result.get("campaign", {})
+            return result.get("campaign", {})
         elif entity_type == "ad_group":
-            return first_result.get("adGroup", {})
+            return result.get("adGroup", {})
         elif entity_type == "ad":
-            return first_result.get("adGroupAd", {})
+            return result.get("adGroupAd", {})
         else:
-            return first_result
+            return result
+
+    @staticmethod
+    def _extract_entity_id(entity: dict, entity_type: str) -> Optional[str]:
+        """Read the numeric ID from an extracted entity object."""
+        if entity_type == "ad":
+            entity_id = entity.get("ad", {}).get("id")
+        elif entity_type in ("campaign", "ad_group"):
+            entity_id = entity.get("id")
+        else:
+            entity_id = entity.get("campaign", {}).get("id")
+        return str(entity_id) if entity_id is not None else None
+
+    async def get_entity_states(
+        self,
+        entities: list[tuple[str, str]],
+    ) -> list[StateCapture]:
+        """
+        Get current state of several Google Ads entities.
+
+        Entities are grouped by type and fetched with one GAQL query per
+        type (``WHERE <id> IN (...)``) instead of one query per entity.
+        Entities the API does not return get an empty state, matching
+        get_entity_state().
+
+        Args:
+            entities: (entity_id, entity_type) pairs
+
+        Returns:
+            StateCaptures in the same order as entities
+
+        Raises:
+            PlatformAPIError: If any API call fails
+        """
+        url = f"{self.base_url}/customers/{self.credentials.customer_id}/googleAds:searchStream"
+        ids_by_type: dict[str, list[str]] = {}
+        for entity_id, entity_type in entities:
+            type_ids = ids_by_type.setdefault(entity_type, [])
+            if str(entity_id) not in type_ids:
+                type_ids.append(str(entity_id))
+
+        states: dict[tuple[str, str], dict] = {}
+        client = await self._get_client()
+
+        for entity_type, entity_ids in ids_by_type.items():
+            for start in range(0, len(entity_ids), GOOGLE_ADS_MAX_IDS_PER_QUERY):
+                chunk = entity_ids[start:start + GOOGLE_ADS_MAX_IDS_PER_QUERY]
+                payload = {"query": self._build_state_query_for_ids(chunk, entity_type)}
+                await self._acquire_rate_budget()
+
+                try:
+                    response = await client.post(
+                        url, json=payload, headers=self._get_auth_headers()
+                    )
+                    self._observe_rate_limits(response)
+                    data = response.json()
+                except httpx.RequestError as e:
+                    raise PlatformAPIError(
+                        message=f"Network error getting {entity_type} state: {e}",
+                        platform=self.platform_name,
+                        is_retryable=True,
+                    )
+
+                if response.status_code != 200:
+                    error = data.get("error", {}) if isinstance(data, dict) else {}
+                    raise PlatformAPIError(
+                        message=error.get("message", f"Failed to get {entity_type} state"),
+                        platform=self.platform_name,
+                        status_code=response.status_code,
+                        error_code=error.get("status", ""),
+                        response=data if isinstance(data, dict) else {"results": data},
+                        is_retryable=response.status_code in (429, 500, 502, 503, 504),
+                    )
+
+                for result in self._collect_search_results(data):
+                    entity = self._extract_entity(result, entity_type)
+                    found_id = self._extract_entity_id(entity, entity_type)
+                    if found_id is not None:
+                        states.setdefault((entity_type, found_id), entity)
+
+        return [
+            StateCapture(
+                entity_id=entity_id,
+                entity_type=entity_type,
+                platform=self.platform_name,
+                state=states.get((entity_type, str(entity_id)), {}),
+            )
+            for entity_id, entity_type in entities
+        ]
 
     # =========================================================================
     # Action Execution
@@ -415,9 +529,13 @@ class GoogleAdsExecutor(BasePlatformExecutor):
         logger.info("Executing Google Ads status change", extra=log_entry)
 
         client = await self._get_client()
+        await self._acquire_rate_budget()
 
         try:
-            response = await client.post(url, json=payload)
+            response = await client.post(
+                url, json=payload, headers=self._get_auth_headers()
+            )
+            self._observe_rate_limits(response)
             data = response.json()
 
             if response.status_code == 200:
@@ -515,9 +633,13 @@ class GoogleAdsExecutor(BasePlatformExecutor):
         logger.info("Executing Google Ads budget change", extra=log_entry)
 
         client = await self._get_client()
+        await self._acquire_rate_budget()
 
         try:
-            response = await client.post(url, json=payload)
+            response = await client.post(
+                url, json=payload, headers=self._get_auth_headers()
+            )
+            self._observe_rate_limits(response)
             data = response.json()
 
             if response.status_code == 200:
@@ -626,9 +748,13 @@ class GoogleAdsExecutor(BasePlatformExecutor):
         logger.info("Executing Google Ads campaign bid change", extra=log_entry)
 
         client = await self._get_client()
+        await self._acquire_rate_budget()
 
         try:
-            response = await client.post(url, json=payload)
+            response = await client.post(
+                url, json=payload, headers=self._get_auth_headers()
+            )
+            self._observe_rate_limits(response)
             data = response.json()
 
             if response.status_code == 200:
@@ -700,9 +826,13 @@ class GoogleAdsExecutor(BasePlatformExecutor):
         logger.info("Executing Google Ads ad group bid change", extra=log_entry)
 
         client = await self._get_client()
+        await self._acquire_rate_budget()
 
         try:
-            response = await client.post(url, json=payload)
+            response = await client.post(
+                url, json=payload, headers=self._get_auth_headers()
+            )
+            self._observe_rate_limits(response)
             data = response.json()
 
             if response.status_code == 200:
@@ -14,9 +14,10 @@ API Reference: https://developers.facebook.com/docs/marketing-api
 Story 8.5 - Action Execution (Scoped & Reversible)
 """
 
+import json
 import logging
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import httpx
 
@@ -28,6 +29,9 @@ from src.services.platform_executors.base_executor import (
     PlatformAPIError,
 )
 
+if TYPE_CHECKING:
+    from src.services.platform_executors.platform_gateway import PlatformGateway
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,6 +41,7 @@ logger = logging.getLogger(__name__)
 
 META_API_VERSION = "v18.0"
 META_GRAPH_API_BASE = "https://graph.facebook.com"
+META_BATCH_MAX_REQUESTS = 50  # Graph API batch request limit
 
 # Meta campaign status values
 class MetaCampaignStatus:
@@ -98,6 +103,8 @@ class MetaAdsExecutor(BasePlatformExecutor):
 
     Rate Limiting:
     - Meta uses a points-based rate limit system
+    - Requests draw from a shared per-ad-account budget that tracks
+      Meta's usage headers
     - Executor respects Retry-After headers
     - Exponential backoff for 429 responses
     """
@@ -110,6 +117,7 @@ class MetaAdsExecutor(BasePlatformExecutor):
         retry_config: Optional[RetryConfig] = None,
         api_version: str = META_API_VERSION,
         timeout_seconds: float = 30.0,
+        gateway: Optional["PlatformGateway"] = None,
     ):
         """
         Initialize Meta Ads executor.
@@ -119,8 +127,9 @@ class MetaAdsExecutor(BasePlatformExecutor):
             retry_config: Optional retry configuration
             api_version: Meta API version (default: v18.0)
             timeout_seconds: HTTP timeout in seconds
+            gateway: Optional platform gateway (defaults to shared gateway)
         """
-        super().__init__(retry_config)
+        super().__init__(retry_config, gateway)
         self.credentials = credentials
         self.api_version = api_version
         self.base_url = f"{META_GRAPH_API_BASE}/{api_version}"
@@ -129,16 +138,21 @@ class MetaAdsExecutor(BasePlatformExecutor):
         # HTTP client (created lazily or passed in for testing)
         self._client: Optional[httpx.AsyncClient] = None
 
+    @property
+    def rate_limit_key(self) -> str:
+        """Meta rate-limits per ad account."""
+        return self.credentials.ad_account_id
+
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
+        """Get HTTP client (shared gateway pool unless one was injected)."""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client = self._get_shared_client(self.timeout)
         return self._client
 
     async def close(self):
-        """Close HTTP client."""
+        """Release HTTP client. Shared pooled clients stay open."""
         if self._client:
-            await self._client.aclose()
+            await self._release_client(self._client)
             self._client = None
 
     async def __aenter__(self):
@@ -195,9 +209,11 @@ class MetaAdsExecutor(BasePlatformExecutor):
         }
 
         client = await self._get_client()
+        await self._acquire_rate_budget()
 
         try:
             response = await client.get(url, params=params)
+            self._observe_rate_limits(response)
             data = response.json()
 
             if response.status_code != 200:
@@ -225,6 +241,115 @@ class MetaAdsExecutor(BasePlatformExecutor):
                 is_retryable=True,
             )
 
+    async def get_entity_states(
+        self,
+        entities: list[tuple[str, str]],
+    ) -> list[StateCapture]:
+        """
+        Get current state of several Meta entities via the Graph batch API.
+
+        Up to META_BATCH_MAX_REQUESTS reads are sent per HTTP request, each
+        drawing one unit from the ad account's rate budget.
+
+        Args:
+            entities: (entity_id, entity_type) pairs
+
+        Returns:
+            StateCaptures in the same order as entities
+
+        Raises:
+            PlatformAPIError: If the batch or any entry in it fails
+        """
+        captures: list[StateCapture] = []
+        client = await self._get_client()
+
+        for start in range(0, len(entities), META_BATCH_MAX_REQUESTS):
+            chunk = entities[start:start + META_BATCH_MAX_REQUESTS]
+            batch = [
+                {
+                    "method": "GET",
+                    "relative_url": (
+                        f"{self.api_version}/{entity_id}?fields="
+                        + ",".join(self._get_fields_for_entity_type(entity_type))
+                    ),
+                }
+                for entity_id, entity_type in chunk
+            ]
+            await self._acquire_rate_budget(cost=len(chunk))
+
+            try:
+                response = await client.post(
+                    META_GRAPH_API_BASE,
+                    data={
+                        "access_token": self.credentials.access_token,
+                        "batch": json.dumps(batch),
+                        "include_headers": "false",
+                    },
+                )
+                self._observe_rate_limits(response)
+                data = response.json()
+            except httpx.RequestError as e:
+                raise PlatformAPIError(
+                    message=f"Network error getting batched entity state: {e}",
+                    platform=self.platform_name,
+                    is_retryable=True,
+                )
+
+            if response.status_code != 200:
+                error = data.get("error", {}) if isinstance(data, dict) else {}
+                raise PlatformAPIError(
+                    message=error.get("message", "Failed to get batched entity state"),
+                    platform=self.platform_name,
+                    status_code=response.status_code,
+                    error_code=str(error.get("code", "")),
+                    response=data if isinstance(data, dict) else {"batch": data},
+                    is_retryable=response.status_code in (429, 500, 502, 503, 504),
+                )
+
+            for (entity_id, entity_type), item in zip(chunk, data):
+                captures.append(self._parse_batch_item(entity_id, entity_type, item))
+
+        return captures
+
+    def _parse_batch_item(
+        self,
+        entity_id: str,
+        entity_type: str,
+        item: Optional[dict],
+    ) -> StateCapture:
+        """Convert one Graph batch response entry into a StateCapture."""
+        # Meta returns null for entries it did not get to (timeouts)
+        if item is None:
+            raise PlatformAPIError(
+                message=f"Batch entry for {entity_type} {entity_id} timed out",
+                platform=self.platform_name,
+                is_retryable=True,
+            )
+
+        status_code = item.get("code")
+        try:
+            body = json.loads(item.get("body") or "{}")
+        except ValueError:
+            body = {}
+
+        if status_code != 200:
+            error = body.get("error", {})
+            raise PlatformAPIError(
+                message=error.get("message", f"Failed to get {entity_type} state"),
+                platform=self.platform_name,
+                status_code=status_code,
+                error_code=str(error.get("code", "")),
+                response=body,
+                is_retryable=status_code in (429, 500, 502, 503, 504),
+            )
+
+        return StateCapture(
+            entity_id=entity_id,
+            entity_type=entity_type,
+            platform=self.platform_name,
+            state=body,
+        )
+
     def _get_fields_for_entity_type(self, entity_type: str) -> list[str]:
         """Get relevant fields to fetch for each entity type."""
         base_fields = ["id", "name", "status", "effective_status", "created_time", "updated_time"]
@@ -340,9 +465,11 @@ class MetaAdsExecutor(BasePlatformExecutor):
         logger.info("Executing Meta status change", extra=log_entry)
 
         client = await self._get_client()
+        await self._acquire_rate_budget()
 
         try:
             response = await client.post(url, data=payload)
+            self._observe_rate_limits(response)
             data = response.json()
 
             if response.status_code == 200 and data.get("success", False):
@@ -427,9 +554,11 @@ class MetaAdsExecutor(BasePlatformExecutor):
         logger.info("Executing Meta budget change", extra=log_entry)
 
         client = await self._get_client()
+        await self._acquire_rate_budget()
 
         try:
             response = await client.post(url, data=payload)
+            self._observe_rate_limits(response)
             data = response.json()
 
             if response.status_code == 200 and data.get("success", False):
@@ -508,9 +637,11 @@ class MetaAdsExecutor(BasePlatformExecutor):
         logger.info("Executing Meta bid change", extra=log_entry)
 
         client = await self._get_client()
+        await self._acquire_rate_budget()
 
         try:
             response = await client.post(url, data=payload)
+            self._observe_rate_limits(response)
             data = response.json()
 
             if response.status_code == 200 and data.get("success", False):
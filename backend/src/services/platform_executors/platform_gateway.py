@@ -0,0 +1,455 @@
+"""
+Shared platform gateway for external API executors.
+
+Owns the pieces of executor HTTP traffic that must be shared across
+executors, tenants and actions within one process:
+
+- Connection pools: one httpx.AsyncClient per platform (per event loop),
+  so executors stop paying a TLS handshake per action.
+- Rate budgets: a token bucket per (platform, account) that paces
+  requests up front and is tightened by the platforms' own rate-limit
+  signals (Retry-After, Meta usage headers, Shopify call limits and
+  GraphQL throttle status).
+
+Executors obtain the gateway via get_platform_gateway() and call
+acquire() before each request and observe_response() after it.
+
+Story 8.5 - Action Execution (Scoped & Reversible)
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import httpx
+
+from src.services.platform_executors.base_executor import PlatformAPIError
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Budget Configuration
+# =============================================================================
+
+@dataclass(frozen=True)
+class RateBudgetConfig:
+    """Token bucket sizing for one platform."""
+    capacity: float
+    refill_per_second: float
+    max_wait_seconds: float = 30.0
+
+
+# Conservative defaults, per ad account / shop. Platform headers tighten
+# these further at runtime.
+DEFAULT_RATE_BUDGETS: dict[str, RateBudgetConfig] = {
+    "meta": RateBudgetConfig(capacity=20, refill_per_second=2.0),
+    "google": RateBudgetConfig(capacity=20, refill_per_second=5.0),
+    "shopify": RateBudgetConfig(capacity=40, refill_per_second=2.0),
+}
+FALLBACK_RATE_BUDGET = RateBudgetConfig(capacity=10, refill_per_second=1.0)
+
+# Usage percentage at which Meta budgets are drained to the refill rate,
+# and at which they are paused until the platform's reset window.
+META_USAGE_SLOWDOWN_PCT = 75.0
+META_USAGE_PAUSE_PCT = 95.0
+META_DEFAULT_PAUSE_SECONDS = 60.0
+
+# Fraction of Shopify's REST call limit at which we stop bursting.
+SHOPIFY_CALL_LIMIT_SLOWDOWN_RATIO = 0.8
+# GraphQL points to keep in reserve before pausing.
+SHOPIFY_GRAPHQL_MIN_AVAILABLE = 100.0
+
+# Shared connection pool sizing.
+GATEWAY_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+
+class RateBudgetExhaustedError(PlatformAPIError):
+    """Raised when waiting for rate budget would exceed max_wait_seconds."""
+
+    def __init__(self, platform: str, account_key: str, wait_seconds: float):
+        super().__init__(
+            message=(
+                f"Rate budget exhausted for {platform} account {account_key}; "
+                f"retry in {wait_seconds:.1f}s"
+            ),
+            platform=platform,
+            status_code=429,
+            error_code="RATE_BUDGET_EXHAUSTED",
+            retry_after=wait_seconds,
+            is_retryable=True,
+        )
+        self.account_key = account_key
+
+
+# =============================================================================
+# Token Bucket
+# =============================================================================
+
+class TokenBucket:
+    """
+    Token bucket with debt-based reservations.
+
+    reserve() never blocks: it takes a token immediately (allowing the
+    balance to go negative) and returns how long the caller must wait for
+    that token to exist. Reservations are therefore served in call order
+    without holding an asyncio lock across awaits.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_per_second: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated_at = clock()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill(self._clock())
+            return self._tokens
+
+    def reserve(self, cost: float = 1.0) -> float:
+        """Take cost tokens and return the seconds to wait before using them."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= cost
+            wait = max(0.0, self._blocked_until - now)
+            if self._tokens < 0:
+                wait = max(wait, -self._tokens / self.refill_per_second)
+            return wait
+
+    def refund(self, cost: float = 1.0) -> None:
+        """Return tokens from a reservation that was not used."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + cost)
+
+    def block_for(self, seconds: float) -> None:
+        """Hold all reservations until at least now + seconds."""
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+
+    def drain(self) -> None:
+        """Drop any burst allowance so requests proceed at the refill rate."""
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens = min(self._tokens, 0.0)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._tokens = min(
+                self.capacity, self._tokens + elapsed * self.refill_per_second
+            )
+        self._updated_at = now
+
+
+# =============================================================================
+# Platform Gateway
+# =============================================================================
+
+class PlatformGateway:
+    """
+    Process-wide connection pools and rate budgets for platform executors.
+
+    Rate budgets are keyed by (platform, account_key) where account_key is
+    the Meta ad account, Google customer ID or Shopify shop domain, so
+    tenants sharing an account share its budget.
+    """
+
+    def __init__(
+        self,
+        budgets: Optional[dict[str, RateBudgetConfig]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._budget_configs = dict(DEFAULT_RATE_BUDGETS)
+        if budgets:
+            self._budget_configs.update(budgets)
+        self._clock = clock
+        self._buckets: dict[tuple[str, str], TokenBucket] = {}
+        self._clients: dict[tuple[str, float], tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+        self._closing: set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    # Connection pools
+    # -------------------------------------------------------------------------
+
+    def get_client(
+        self,
+        platform: str,
+        timeout: Optional[httpx.Timeout] = None,
+    ) -> httpx.AsyncClient:
+        """
+        Return the shared AsyncClient for a platform.
+
+        Clients are bound to the running event loop; a new one is created
+        if the loop has changed (e.g. successive asyncio.run() calls in a
+        worker), and the replaced client is closed so its pool is released.
+        """
+        timeout = timeout or httpx.Timeout(30.0)
+        key = (platform, timeout.read or 0.0)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is not None:
+                client_loop, client = entry
+                if client_loop is loop and not client.is_closed:
+                    return client
+                self._close_replaced(client_loop, client)
+            client = httpx.AsyncClient(timeout=timeout, limits=GATEWAY_POOL_LIMITS)
+            self._clients[key] = (loop, client)
+            return client
+
+    def _close_replaced(self, client_loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient) -> None:
+        """
+        Close a client that get_client() is replacing.
+
+        If its loop is still running (another thread), the close runs there.
+        Otherwise the loop is gone (asyncio.run() has returned) and the close
+        is scheduled on the current loop.
+        """
+        if client.is_closed:
+            return
+        if client_loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), client_loop)
+            return
+        task = asyncio.get_running_loop().create_task(client.aclose())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def is_shared_client(self, client: object) -> bool:
+        """True if client is one of the gateway's pooled clients."""
+        with self._lock:
+            return any(c is client for _, c in self._clients.values())
+
+    async def aclose(self) -> None:
+        """Close pooled clients that belong to the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            owned = [
+                (key, client)
+                for key, (client_loop, client) in self._clients.items()
+                if client_loop is loop
+            ]
+            for key, _ in owned:
+                del self._clients[key]
+        for _, client in owned:
+            await client.aclose()
+
+    # -------------------------------------------------------------------------
+    # Rate budgets
+    # -------------------------------------------------------------------------
+
+    def get_bucket(self, platform: str, account_key: str) -> TokenBucket:
+        """Return (creating if needed) the token bucket for an account."""
+        key = (platform, account_key or "default")
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                config = self._budget_configs.get(platform, FALLBACK_RATE_BUDGET)
+                bucket = TokenBucket(
+                    capacity=config.capacity,
+                    refill_per_second=config.refill_per_second,
+                    clock=self._clock,
+                )
+                self._buckets[key] = bucket
+            return bucket
+
+    async def acquire(self, platform: str, account_key: str, cost: float = 1.0) -> float:
+        """
+        Wait for rate budget before issuing a request.
+
+        Returns:
+            Seconds waited
+
+        Raises:
+            RateBudgetExhaustedError: If the wait would exceed the
+                platform's max_wait_seconds (the reservation is refunded).
+        """
+        bucket = self.get_bucket(platform, account_key)
+        wait = bucket.reserve(cost)
+        config = self._budget_configs.get(platform, FALLBACK_RATE_BUDGET)
+        if wait > config.max_wait_seconds:
+            bucket.refund(cost)
+            raise RateBudgetExhaustedError(platform, account_key, wait)
+        if wait > 0:
+            logger.info(
+                "Waiting for platform rate budget",
+                extra={
+                    "platform": platform,
+                    "account_key": account_key,
+                    "wait_seconds": round(wait, 3),
+                },
+            )
+            await asyncio.sleep(wait)
+        return wait
+
+    def observe_response(
+        self,
+        platform: str,
+        account_key: str,
+        response: httpx.Response,
+    ) -> None:
+        """Tighten an account's budget from a response's rate-limit signals."""
+        bucket = self.get_bucket(platform, account_key)
+        headers = response.headers
+
+        retry_after = _parse_retry_after(headers.get("Retry-After"))
+        if response.status_code == 429:
+            bucket.drain()
+            bucket.block_for(retry_after if retry_after is not None else 1.0)
+        elif retry_after is not None:
+            bucket.block_for(retry_after)
+
+        if platform == "meta":
+            self._observe_meta_usage(bucket, headers)
+        elif platform == "shopify":
+            self._observe_shopify_call_limit(bucket, headers)
+
+    def observe_shopify_throttle_status(
+        self,
+        account_key: str,
+        throttle_status: Optional[dict],
+    ) -> None:
+        """Apply Shopify GraphQL extensions.cost.throttleStatus to the budget."""
+        if not throttle_status:
+            return
+        try:
+            available = float(throttle_status["currentlyAvailable"])
+            restore_rate = float(throttle_status["restoreRate"])
+        except (KeyError, TypeError, ValueError):
+            return
+        if available >= SHOPIFY_GRAPHQL_MIN_AVAILABLE or restore_rate <= 0:
+            return
+        bucket = self.get_bucket("shopify", account_key)
+        bucket.drain()
+        bucket.block_for((SHOPIFY_GRAPHQL_MIN_AVAILABLE - available) / restore_rate)
+
+    @staticmethod
+    def _observe_meta_usage(bucket: TokenBucket, headers: httpx.Headers) -> None:
+        """
+        Meta reports utilisation as percentages in X-App-Usage,
+        X-Ad-Account-Usage and X-Business-Use-Case-Usage (JSON values).
+        """
+        usage_pct = 0.0
+        reset_seconds = 0.0
+        regain_seconds = 0.0
+
+        app_usage = _parse_json_header(headers.get("X-App-Usage"))
+        if isinstance(app_usage, dict):
+            for value in app_usage.values():
+                usage_pct = max(usage_pct, _as_float(value))
+
+        account_usage = _parse_json_header(headers.get("X-Ad-Account-Usage"))
+        if isinstance(account_usage, dict):
+            usage_pct = max(usage_pct, _as_float(account_usage.get("acc_id_util_pct")))
+            reset_seconds = _as_float(account_usage.get("reset_time_duration"))
+
+        buc_usage = _parse_json_header(headers.get("X-Business-Use-Case-Usage"))
+        if isinstance(buc_usage, dict):
+            for entries in buc_usage.values():
+                if not isinstance(entries, list):
+                    continue
+                for entry in entries:
+                    if not isinstance(entry, dict):
+                        continue
+                    usage_pct = max(
+                        usage_pct,
+                        _as_float(entry.get("call_count")),
+                        _as_float(entry.get("total_cputime")),
+                        _as_float(entry.get("total_time")),
+                    )
+                    regain_minutes = _as_float(entry.get("estimated_time_to_regain_access"))
+                    regain_seconds = max(regain_seconds, regain_minutes * 60)
+
+        if usage_pct >= META_USAGE_SLOWDOWN_PCT:
+            bucket.drain()
+        if usage_pct >= META_USAGE_PAUSE_PCT:
+            bucket.block_for(reset_seconds or META_DEFAULT_PAUSE_SECONDS)
+        # Meta reports a non-zero regain time only while actively throttling
+        bucket.block_for(regain_seconds)
+
+    @staticmethod
+    def _observe_shopify_call_limit(bucket: TokenBucket, headers: httpx.Headers) -> None:
+        """Shopify REST reports bucket fill as 'used/limit'."""
+        value = headers.get("X-Shopify-Shop-Api-Call-Limit")
+        if not value or "/" not in value:
+            return
+        used, _, limit = value.partition("/")
+        try:
+            ratio = float(used) / float(limit)
+        except (ValueError, ZeroDivisionError):
+            return
+        if ratio >= SHOPIFY_CALL_LIMIT_SLOWDOWN_RATIO:
+            bucket.drain()
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def _parse_json_header(value: Optional[str]):
+    if not value:
+        return None
+    try:
+        return json.loads(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _as_float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+# =============================================================================
+# Module-level singleton
+# =============================================================================
+
+_gateway: Optional[PlatformGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_platform_gateway() -> PlatformGateway:
+    """Return the process-wide PlatformGateway."""
+    global _gateway
+    if _gateway is None:
+        with _gateway_lock:
+            if _gateway is None:
+                _gateway = PlatformGateway()
+    return _gateway
+
+
+async def close_platform_gateway() -> None:
+    """Close pooled clients and reset the singleton (shutdown, tests)."""
+    global _gateway
+    gateway = _gateway
+    _gateway = None
+    if gateway is not None:
+        await gateway.aclose()
@@ -18,7 +18,7 @@ Story 8.5 - Action Execution (Scoped & Reversible)
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import httpx
 
@@ -30,6 +30,9 @@ from src.services.platform_executors.base_executor import (
     PlatformAPIError,
 )
 
+if TYPE_CHECKING:
+    from src.services.platform_executors.platform_gateway import PlatformGateway
+
 logger = logging.getLogger(__name__)
 
 
@@ -95,6 +98,8 @@ class ShopifyExecutor(BasePlatformExecutor):
 
     Rate Limiting:
     - Shopify uses a bucket-based rate limit system
+    - Requests draw from a shared per-shop budget that tracks the
+      GraphQL throttle status returned with each response
     - Executor respects Retry-After headers
     - Exponential backoff for 429 responses
     """
@@ -107,6 +112,7 @@ class ShopifyExecutor(BasePlatformExecutor):
         retry_config: Optional[RetryConfig] = None,
         api_version: str = SHOPIFY_API_VERSION,
         timeout_seconds: float = 30.0,
+        gateway: Optional["PlatformGateway"] = None,
     ):
         """
         Initialize Shopify executor.
@@ -116,8 +122,9 @@ class ShopifyExecutor(BasePlatformExecutor):
             retry_config: Optional retry configuration
             api_version: Shopify API version (default: 2024-01)
             timeout_seconds: HTTP timeout in seconds
+            gateway: Optional platform gateway (defaults to shared gateway)
         """
-        super().__init__(retry_config)
+        super().__init__(retry_config, gateway)
         self.credentials = credentials
         self.api_version = api_version
         self.graphql_url = (
@@ -128,16 +135,21 @@ class ShopifyExecutor(BasePlatformExecutor):
         # HTTP client (created lazily or passed in for testing)
         self._client: Optional[httpx.AsyncClient] = None
 
+    @property
+    def rate_limit_key(self) -> str:
+        """Shopify rate-limits per shop."""
+        return self.credentials.shop_domain
+
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
+        """Get HTTP client (shared gateway pool unless one was injected)."""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client = self._get_shared_client(self.timeout)
         return self._client
 
     async def close(self):
-        """Close HTTP client."""
+        """Release HTTP client. Shared pooled clients stay open."""
         if self._client:
-            await self._client.aclose()
+            await self._release_client(self._client)
             self._client = None
 
     async def __aenter__(self):
@@ -188,6 +200,7 @@ class ShopifyExecutor(BasePlatformExecutor):
             PlatformAPIError: If API call fails
         """
         client = await self._get_client()
+        await self._acquire_rate_budget()
 
         payload = {"query": query}
         if variables:
@@ -203,7 +216,14 @@ class ShopifyExecutor(BasePlatformExecutor):
                 },
             )
 
+            self._observe_rate_limits(response)
+
             data = response.json()
+            if isinstance(data, dict):
+                self.gateway.observe_shopify_throttle_status(
+                    self.rate_limit_key,
+                    data.get("extensions", {}).get("cost", {}).get("throttleStatus"),
+                )
 
             # Handle rate limiting
             if response.status_code == 429:
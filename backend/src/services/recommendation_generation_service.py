@@ -25,6 +25,7 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
@@ -130,12 +131,7 @@ class RecommendationGenerationService:
             all_detected.extend(detected)
             insights_processed += 1
 
-        # Persist recommendations
-        persisted = []
-        for detected in all_detected:
-            recommendation = self._persist_recommendation(detected, job_id)
-            if recommendation:
-                persisted.append(recommendation)
+        persisted = self._persist_recommendations(all_detected, job_id)
 
         logger.info(
             "Recommendations generated",
@@ -336,19 +332,14 @@ class RecommendationGenerationService:
         content = "|".join(parts)
         return hashlib.sha256(content.encode()).hexdigest()
 
-    def _enhance_with_llm(
+    def _llm_requests(
         self,
         detected: DetectedRecommendation,
         recommendation_text: str,
         rationale: str,
-    ) -> tuple[str, str]:
-        """
-        Optionally enhance recommendation text with LLM.
-
-        Returns the original deterministic text if LLM is not available,
-        not entitled, or fails for any reason.
-        """
-        from src.services.llm_integration import enhance_pair_with_llm_sync
+    ) -> list:
+        """Text and rationale enhancement requests for one recommendation."""
+        from src.services.llm_integration import LLMEnhancementRequest
 
         variables = {
             "recommendation_type": detected.recommendation_type.value,
@@ -358,34 +349,108 @@ class RecommendationGenerationService:
             "entity": detected.affected_entity or "account",
             "confidence": detected.confidence_score,
         }
+        return [
+            LLMEnhancementRequest("recommendation_text", variables, recommendation_text),
+            LLMEnhancementRequest("recommendation_rationale", variables, rationale),
+        ]
+
+    def _enhance_with_llm(
+        self,
+        rendered: list[tuple[DetectedRecommendation, str, str]],
+    ) -> list[tuple[str, str]]:
+        """
+        Optionally enhance recommendation text with LLM, for all recommendations at once.
+
+        Calls run concurrently under the tenant's token budget. Each field
+        keeps its deterministic text if LLM is not available, not entitled,
+        over budget, or fails for any reason.
+        """
+        from src.services.llm_integration import enhance_batch_with_llm_sync
 
-        return enhance_pair_with_llm_sync(
+        requests = []
+        for detected, recommendation_text, rationale in rendered:
+            requests.extend(self._llm_requests(detected, recommendation_text, rationale))
+
+        texts = enhance_batch_with_llm_sync(
             db_session=self.db,
             tenant_id=self.tenant_id,
-            template_key_a="recommendation_text",
-            template_key_b="recommendation_rationale",
-            variables=variables,
-            fallback_a=recommendation_text,
-            fallback_b=rationale,
+            requests=requests,
         )
+        return list(zip(texts[0::2], texts[1::2]))
+
+    def _existing_content_hashes(self, content_hashes: list[str]) -> set[str]:
+        """Content hashes that already have a recommendation for this tenant."""
+        if not content_hashes:
+            return set()
+        rows = self.db.execute(
+            select(AIRecommendation.content_hash).where(
+                AIRecommendation.tenant_id == self.tenant_id,
+                AIRecommendation.content_hash.in_(content_hashes),
+            )
+        ).scalars().all()
+        return set(rows)
 
-    def _persist_recommendation(
+    def _persist_recommendations(
         self,
-        detected: DetectedRecommendation,
+        all_detected: list[DetectedRecommendation],
         job_id: str,
-    ) -> AIRecommendation | None:
-        """Persist recommendation to database, handling deduplication."""
-        content_hash = self._generate_content_hash(detected)
+    ) -> list[AIRecommendation]:
+        """
+        Render, enhance and bulk-insert all detected recommendations for a job.
 
-        # Render recommendation text and rationale
-        recommendation_text = render_recommendation_text(detected)
-        rationale = render_rationale(detected)
+        Duplicates (within the job or already stored) are dropped before any
+        LLM call. New recommendations are enhanced concurrently, then
+        inserted in a single flush; if a concurrent job inserted the same
+        content in the meantime, falls back to per-row inserts.
+        """
+        unique: dict[str, DetectedRecommendation] = {}
+        for detected in all_detected:
+            unique.setdefault(self._generate_content_hash(detected), detected)
 
-        # Optional LLM enhancement (graceful fallback to deterministic text)
-        recommendation_text, rationale = self._enhance_with_llm(
-            detected, recommendation_text, rationale
-        )
+        existing = self._existing_content_hashes(list(unique))
+        pending = [d for h, d in unique.items() if h not in existing]
+        if not pending:
+            return []
+
+        rendered = [
+            (detected, render_recommendation_text(detected), render_rationale(detected))
+            for detected in pending
+        ]
+        texts = self._enhance_with_llm(rendered)
+
+        recommendations = [
+            self._build_recommendation(detected, job_id, recommendation_text, rationale)
+            for detected, (recommendation_text, rationale) in zip(pending, texts)
+        ]
+
+        try:
+            # Savepoint: a duplicate rolls back only this insert, not the caller's transaction
+            with self.db.begin_nested():
+                self.db.add_all(recommendations)
+                self.db.flush()
+            return recommendations
+        except IntegrityError:
+            logger.info(
+                "Bulk recommendation insert hit duplicates, retrying per row",
+                extra={"tenant_id": self.tenant_id, "job_id": job_id},
+            )
 
+        persisted = []
+        for detected, (recommendation_text, rationale) in zip(pending, texts):
+            recommendation = self._persist_recommendation(
+                detected, job_id, texts=(recommendation_text, rationale)
+            )
+            if recommendation:
+                persisted.append(recommendation)
+        return persisted
+
+    def _build_recommendation(
+        self,
+        detected: DetectedRecommendation,
+        job_id: str,
+        recommendation_text: str,
+        rationale: str,
+    ) -> AIRecommendation:
         # Validate language rules
         is_valid, error = validate_recommendation_language(recommendation_text)
         if not is_valid:
@@ -408,7 +473,7 @@ class RecommendationGenerationService:
             except ValueError:
                 pass
 
-        recommendation = AIRecommendation(
+        return AIRecommendation(
             tenant_id=self.tenant_id,
             related_insight_id=detected.source_insight_id,
             recommendation_type=detected.recommendation_type,
@@ -423,23 +488,45 @@ class RecommendationGenerationService:
             currency=detected.currency,
             generated_at=datetime.now(timezone.utc),
             job_id=job_id,
-            content_hash=content_hash,
+            content_hash=self._generate_content_hash(detected),
             is_accepted=0,
             is_dismissed=0,
         )
 
+    def _persist_recommendation(
+        self,
+        detected: DetectedRecommendation,
+        job_id: str,
+        texts: tuple[str, str] | None = None,
+    ) -> AIRecommendation | None:
+        """
+        Persist a single recommendation, handling deduplication.
+
+        Args:
+            texts: Pre-enhanced (recommendation_text, rationale); rendered
+                and enhanced here when not given
+        """
+        if texts is None:
+            rendered = (detected, render_recommendation_text(detected), render_rationale(detected))
+            texts = self._enhance_with_llm([rendered])[0]
+        recommendation_text, rationale = texts
+
+        recommendation = self._build_recommendation(
+            detected, job_id, recommendation_text, rationale
+        )
+
         try:
-            self.db.add(recommendation)
-            self.db.flush()
+            with self.db.begin_nested():
+                self.db.add(recommendation)
+                self.db.flush()
             return recommendation
         except IntegrityError:
             # Duplicate constraint violation - recommendation already exists
-            self.db.rollback()
             logger.debug(
                 "Recommendation deduplicated",
                 extra={
                     "tenant_id": self.tenant_id,
-                    "content_hash": content_hash,
+                    "content_hash": recommendation.content_hash,
                     "insight_id": detected.source_insight_id,
                 },
             )
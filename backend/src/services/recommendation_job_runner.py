@@ -1,8 +1,9 @@
 """
 Recommendation Job Runner.
 
-Processes queued recommendation jobs, generating recommendations
-from insights and updating job status.
+Executes recommendation jobs claimed by the AI job worker
+(src.jobs.ai_job_worker), generating recommendations from insights and
+updating job status.
 
 SECURITY:
 - Tenant isolation in all operations
@@ -21,10 +22,7 @@ import logging
 
 from sqlalchemy.orm import Session
 
-from src.models.recommendation_job import (
-    RecommendationJob,
-    RecommendationJobStatus,
-)
+from src.models.recommendation_job import RecommendationJob
 from src.services.recommendation_generation_service import RecommendationGenerationService
 
 
@@ -35,7 +33,7 @@ class RecommendationJobRunner:
     """
     Runner for recommendation generation jobs.
 
-    Processes queued jobs by:
+    Executes claimed jobs by:
     1. Marking job as running
     2. Generating recommendations from insights
     3. Updating job status (success/failed)
@@ -119,53 +117,3 @@ class RecommendationJobRunner:
             self.db.commit()
 
             return False
-
-    def process_queued_jobs(self, limit: int = 10) -> int:
-        """
-        Process queued recommendation jobs.
-
-        Args:
-            limit: Maximum number of jobs to process
-
-        Returns:
-            Number of jobs processed
-        """
-        queued_jobs = (
-            self.db.query(RecommendationJob)
-            .filter(RecommendationJob.status == RecommendationJobStatus.QUEUED)
-            .order_by(RecommendationJob.created_at.asc())
-            .limit(limit)
-            .all()
-        )
-
-        if not queued_jobs:
-            logger.debug("No queued recommendation jobs to process")
-            return 0
-
-        processed = 0
-        for job in queued_jobs:
-            self.execute_job(job)
-            processed += 1
-
-        logger.info(
-            "Recommendation job processing cycle complete",
-            extra={"jobs_processed": processed},
-        )
-
-        return processed
-
-
-def run_recommendation_worker_cycle(db_session: Session) -> int:
-    """
-    Run a single cycle of the recommendation worker.
-
-    Called by background worker process. Processes up to 10 queued jobs.
-
-    Args:
-        db_session: Database session
-
-    Returns:
-        Number of jobs processed
-    """
-    runner = RecommendationJobRunner(db_session)
-    return runner.process_queued_jobs(limit=10)
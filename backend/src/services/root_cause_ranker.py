@@ -11,14 +11,17 @@ SECURITY: All operations are tenant-scoped via tenant_id from JWT.
 
 import logging
 import time
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import uuid
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
 from src.diagnostics.ingestion_diagnostics import (
+    IngestionInputs,
     diagnose_ingestion_failure,
+    load_ingestion_inputs,
 )
 from src.diagnostics.schema_drift import (
     diagnose_schema_drift,
@@ -27,7 +30,9 @@ from src.diagnostics.transformation_regression import (
     diagnose_transformation_regression,
 )
 from src.diagnostics.upstream_shift import (
+    UpstreamInputs,
     diagnose_upstream_shift,
+    load_upstream_inputs,
 )
 from src.ingestion.dbt_artifact_parser import (
     DbtRunSummary,
@@ -76,6 +81,31 @@ class RankedRootCause:
         )
 
 
+# Anomalies on one connector detected within this window of the first
+# one are analyzed together
+DEFAULT_GROUP_WINDOW = timedelta(minutes=60)
+
+# Lookbacks used when loading shared connector evidence for a group
+INGESTION_LOOKBACK = timedelta(hours=48)
+UPSTREAM_LOOKBACK = timedelta(days=30)
+
+
+@dataclass
+class AnomalyInput:
+    """One detected anomaly to analyze as part of a batch."""
+    dataset: str
+    anomaly_type: str
+    detected_at: datetime
+    connector_id: Optional[str] = None
+    correlation_id: Optional[str] = None
+    current_columns: Optional[Dict[str, str]] = None
+    baseline_columns: Optional[Dict[str, str]] = None
+    current_distribution: Optional[Dict[str, float]] = None
+    baseline_distribution: Optional[Dict[str, float]] = None
+    current_cardinality: Optional[Dict[str, int]] = None
+    baseline_cardinality: Optional[Dict[str, int]] = None
+
+
 @dataclass
 class RootCauseAnalysis:
     """Complete root cause analysis result."""
@@ -90,6 +120,46 @@ class RootCauseAnalysis:
     analysis_duration_ms: float
 
 
+@dataclass
+class RootCauseGroupAnalysis:
+    """Root cause analysis for a group of correlated anomalies."""
+    correlation_id: str
+    tenant_id: str
+    connector_id: Optional[str]
+    window_start: datetime
+    window_end: datetime
+    ranked_causes: List[RankedRootCause]
+    analyses: List[RootCauseAnalysis] = field(default_factory=list)
+
+
+def group_anomalies(
+    anomalies: List[AnomalyInput],
+    window: timedelta = DEFAULT_GROUP_WINDOW,
+) -> List[List[AnomalyInput]]:
+    """Group anomalies by connector and detection time window.
+
+    Within a connector, anomalies are ordered by detection time and a new
+    group starts when one is detected more than `window` after the first
+    anomaly of the current group.
+    """
+    by_connector: Dict[Optional[str], List[AnomalyInput]] = {}
+    for anomaly in anomalies:
+        by_connector.setdefault(anomaly.connector_id, []).append(anomaly)
+
+    groups: List[List[AnomalyInput]] = []
+    for members in by_connector.values():
+        members.sort(key=lambda a: a.detected_at)
+        current = [members[0]]
+        for anomaly in members[1:]:
+            if anomaly.detected_at - current[0].detected_at > window:
+                groups.append(current)
+                current = [anomaly]
+            else:
+                current.append(anomaly)
+        groups.append(current)
+    return groups
+
+
 def _normalize_confidences(
     hypotheses: List[RankedRootCause],
 ) -> List[RankedRootCause]:
@@ -143,6 +213,30 @@ def _apply_causal_ordering(
     return hypotheses
 
 
+def _rank(
+    hypotheses: List[RankedRootCause],
+    top_n: int,
+) -> List[RankedRootCause]:
+    """Order, dampen, normalize, truncate to top N and assign ranks."""
+    ranked = _normalize_confidences(_apply_causal_ordering(hypotheses))[:top_n]
+    for i, h in enumerate(ranked):
+        h.rank = i + 1
+    return ranked
+
+
+def _merge_group_hypotheses(
+    per_anomaly: List[List[RankedRootCause]],
+) -> List[RankedRootCause]:
+    """Keep the strongest hypothesis of each cause type across a group."""
+    strongest: Dict[str, RankedRootCause] = {}
+    for hypotheses in per_anomaly:
+        for h in hypotheses:
+            best = strongest.get(h.cause_type)
+            if best is None or h.confidence_score > best.confidence_score:
+                strongest[h.cause_type] = h
+    return [replace(h, evidence=dict(h.evidence)) for h in strongest.values()]
+
+
 class RootCauseRanker:
     """
     Ranks root cause hypotheses from multiple diagnostic detectors.
@@ -224,16 +318,8 @@ class RootCauseRanker:
             baseline_cardinality=baseline_cardinality,
         )
 
-        # Phase 2: Causal ordering and dampening
-        ordered = _apply_causal_ordering(raw_hypotheses)
-
-        # Phase 3: Normalize confidences
-        normalized = _normalize_confidences(ordered)
-
-        # Phase 4: Truncate to top N and assign ranks
-        ranked = normalized[:top_n]
-        for i, h in enumerate(ranked):
-            h.rank = i + 1
+        # Phases 2-4: Causal ordering, normalization, top N
+        ranked = _rank(raw_hypotheses, top_n)
 
         confidence_sum = round(sum(h.confidence_score for h in ranked), 3)
         duration_ms = round((time.monotonic() - start_time) * 1000, 2)
@@ -285,8 +371,14 @@ class RootCauseRanker:
         baseline_distribution: Optional[Dict[str, float]],
         current_cardinality: Optional[Dict[str, int]],
         baseline_cardinality: Optional[Dict[str, int]],
+        ingestion_inputs: Optional[IngestionInputs] = None,
+        upstream_inputs: Optional[UpstreamInputs] = None,
     ) -> List[RankedRootCause]:
-        """Call all diagnostic modules and collect detected hypotheses."""
+        """Call all diagnostic modules and collect detected hypotheses.
+
+        Connector-level inputs, when given, are shared with the detectors
+        instead of being queried per call.
+        """
         hypotheses: List[RankedRootCause] = []
 
         # 1. Ingestion failure
@@ -298,6 +390,7 @@ class RootCauseRanker:
                 connector_id=connector_id or "",
                 dataset=dataset,
                 anomaly_detected_at=anomaly_detected_at,
+                inputs=ingestion_inputs,
             ),
         )
         if ingestion and ingestion.detected:
@@ -348,6 +441,7 @@ class RootCauseRanker:
                 baseline_distribution=baseline_distribution,
                 current_cardinality=current_cardinality,
                 baseline_cardinality=baseline_cardinality,
+                inputs=upstream_inputs,
             ),
         )
         if upstream and upstream.detected:
@@ -355,6 +449,141 @@ class RootCauseRanker:
 
         return hypotheses
 
+    def analyze_batch(
+        self,
+        anomalies: List[AnomalyInput],
+        top_n: int = 3,
+        window: timedelta = DEFAULT_GROUP_WINDOW,
+        dbt_run_summary: Optional[DbtRunSummary] = None,
+        dbt_freshness_summary: Optional[DbtFreshnessSummary] = None,
+        previous_run_summary: Optional[DbtRunSummary] = None,
+    ) -> List[RootCauseGroupAnalysis]:
+        """Analyze correlated anomalies together, then persist and audit in bulk.
+
+        Anomalies are grouped by connector and detection window. Each group
+        loads connector evidence (jobs, sync runs, DQ results) once and
+        shares it, along with the dbt run artifacts, across the per-anomaly
+        detectors. Every anomaly still gets its own ranked RootCauseSignal;
+        signals in a group share a correlation ID (unless the anomaly carries
+        its own), and all signals and audit events are written in one
+        transaction each.
+
+        Args:
+            anomalies: Anomalies detected for this tenant
+            top_n: Maximum hypotheses per anomaly and per group (default 3)
+            window: Grouping window from the first anomaly of a group
+            dbt_run_summary: Current dbt run results
+            dbt_freshness_summary: Current dbt freshness results
+            previous_run_summary: Previous dbt run results
+
+        Returns:
+            One RootCauseGroupAnalysis per group, with group-level ranked
+            causes and the per-anomaly analyses
+        """
+        groups: List[RootCauseGroupAnalysis] = []
+        pending: List[Tuple[AnomalyInput, RootCauseAnalysis, str]] = []
+
+        for members in group_anomalies(anomalies, window):
+            start_time = time.monotonic()
+            connector_id = members[0].connector_id
+            window_start = members[0].detected_at
+            window_end = members[-1].detected_at
+            group_correlation_id = str(uuid.uuid4())
+
+            ingestion_inputs, upstream_inputs = self._load_shared_inputs(
+                connector_id, window_start,
+            )
+
+            per_anomaly: List[List[RankedRootCause]] = []
+            analyses: List[RootCauseAnalysis] = []
+            for anomaly in members:
+                raw_hypotheses = self._collect_hypotheses(
+                    dataset=anomaly.dataset,
+                    anomaly_detected_at=anomaly.detected_at,
+                    connector_id=connector_id,
+                    current_columns=anomaly.current_columns,
+                    baseline_columns=anomaly.baseline_columns,
+                    dbt_run_summary=dbt_run_summary,
+                    dbt_freshness_summary=dbt_freshness_summary,
+                    previous_run_summary=previous_run_summary,
+                    current_distribution=anomaly.current_distribution,
+                    baseline_distribution=anomaly.baseline_distribution,
+                    current_cardinality=anomaly.current_cardinality,
+                    baseline_cardinality=anomaly.baseline_cardinality,
+                    ingestion_inputs=ingestion_inputs,
+                    upstream_inputs=upstream_inputs,
+                )
+                per_anomaly.append([replace(h) for h in raw_hypotheses])
+                ranked = _rank(raw_hypotheses, top_n)
+
+                analysis = RootCauseAnalysis(
+                    signal_id="",  # Assigned on persist
+                    tenant_id=self.tenant_id,
+                    dataset=anomaly.dataset,
+                    anomaly_type=anomaly.anomaly_type,
+                    detected_at=anomaly.detected_at,
+                    ranked_causes=ranked,
+                    total_hypotheses=len(ranked),
+                    confidence_sum=round(sum(h.confidence_score for h in ranked), 3),
+                    analysis_duration_ms=0.0,
+                )
+                analyses.append(analysis)
+                pending.append((
+                    anomaly,
+                    analysis,
+                    anomaly.correlation_id or group_correlation_id,
+                ))
+
+            duration_ms = round((time.monotonic() - start_time) * 1000, 2)
+            for analysis in analyses:
+                analysis.analysis_duration_ms = duration_ms
+
+            groups.append(RootCauseGroupAnalysis(
+                correlation_id=group_correlation_id,
+                tenant_id=self.tenant_id,
+                connector_id=connector_id,
+                window_start=window_start,
+                window_end=window_end,
+                ranked_causes=_rank(_merge_group_hypotheses(per_anomaly), top_n),
+                analyses=analyses,
+            ))
+
+        self._persist_signals(pending)
+
+        logger.info(
+            "root_cause_batch_analyzed",
+            extra={
+                "tenant_id": self.tenant_id,
+                "anomaly_count": len(anomalies),
+                "group_count": len(groups),
+            },
+        )
+        return groups
+
+    def _load_shared_inputs(
+        self,
+        connector_id: Optional[str],
+        window_start: datetime,
+    ) -> Tuple[Optional[IngestionInputs], Optional[UpstreamInputs]]:
+        """Load connector evidence once for a group of anomalies."""
+        ingestion_inputs = None
+        if connector_id:
+            ingestion_inputs = self._safe_diagnose(
+                "ingestion_inputs",
+                lambda: load_ingestion_inputs(
+                    self.db, self.tenant_id, connector_id,
+                    window_start - INGESTION_LOOKBACK,
+                ),
+            )
+        upstream_inputs = self._safe_diagnose(
+            "upstream_inputs",
+            lambda: load_upstream_inputs(
+                self.db, self.tenant_id, connector_id,
+                window_start - UPSTREAM_LOOKBACK,
+            ),
+        )
+        return ingestion_inputs, upstream_inputs
+
     @staticmethod
     def _safe_diagnose(name: str, fn):
         """Run a diagnostic function safely, logging any exceptions."""
@@ -426,6 +655,72 @@ class RootCauseRanker:
 
         return signal.id
 
+    def _persist_signals(
+        self,
+        pending: List[Tuple[AnomalyInput, RootCauseAnalysis, str]],
+    ) -> None:
+        """Persist signals for many analyses in one commit, then audit them."""
+        if not pending:
+            return
+
+        signals = []
+        audit_records = []
+        for anomaly, analysis, correlation_id in pending:
+            ranked = analysis.ranked_causes
+            # IDs are assigned up front so nothing is reloaded after commit
+            analysis.signal_id = str(uuid.uuid4())
+            top_cause_type = ranked[0].cause_type if ranked else None
+            signals.append(RootCauseSignal(
+                id=analysis.signal_id,
+                tenant_id=self.tenant_id,
+                dataset=anomaly.dataset,
+                anomaly_type=anomaly.anomaly_type,
+                detected_at=anomaly.detected_at,
+                correlation_id=correlation_id,
+                connector_id=anomaly.connector_id,
+                hypotheses=[h.to_hypothesis().to_dict() for h in ranked],
+                top_cause_type=top_cause_type,
+                top_confidence=ranked[0].confidence_score if ranked else None,
+                hypothesis_count=len(ranked),
+            ))
+            audit_records.append({
+                "dataset": anomaly.dataset,
+                "anomaly_type": anomaly.anomaly_type,
+                "signal_id": analysis.signal_id,
+                "top_cause_type": top_cause_type,
+                "hypothesis_count": len(ranked),
+                "detected_at": anomaly.detected_at.isoformat(),
+                "correlation_id": correlation_id,
+            })
+
+        self.db.add_all(signals)
+        self.db.commit()
+
+        logger.info(
+            "root_cause_signals_persisted",
+            extra={
+                "tenant_id": self.tenant_id,
+                "signal_count": len(signals),
+            },
+        )
+
+        try:
+            from src.services.audit_logger import (
+                emit_root_cause_signals_generated,
+            )
+
+            emit_root_cause_signals_generated(
+                db=self.db,
+                tenant_id=self.tenant_id,
+                signals=audit_records,
+            )
+        except Exception:
+            logger.warning(
+                "root_cause_ranker.audit_emit_failed",
+                extra={"signal_count": len(signals)},
+                exc_info=True,
+            )
+
     def _emit_audit(
         self,
         dataset: str,
@@ -24,6 +24,11 @@ from typing import Any
 from sqlalchemy.orm import Session
 
 from src.models.dataset_version import DatasetVersion, DatasetVersionStatus
+from src.services.dbt_manifest_index import (
+    ManifestIndex,
+    is_semantic_view as _is_semantic_view,
+    load_manifest_index,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -89,15 +94,6 @@ class CompatibilityResult:
         return list(self.breaking_changes)
 
 
-def _is_semantic_view(model_name: str) -> bool:
-    """True if the model is a semantic view (_current alias or sem_*_v1)."""
-    if model_name.endswith("_current"):
-        return model_name.startswith("fact_")
-    if model_name.startswith("sem_") and "_v1" in model_name:
-        return True
-    return False
-
-
 def _parse_manifest_models(manifest: dict[str, Any]) -> dict[str, DatasetViewSchema]:
     """Extract semantic view schemas from dbt manifest."""
     nodes = manifest.get("nodes", {})
@@ -128,6 +124,13 @@ def _parse_manifest_models(manifest: dict[str, Any]) -> dict[str, DatasetViewSch
     return result
 
 
+def _manifest_models(manifest: dict[str, Any] | ManifestIndex) -> dict[str, DatasetViewSchema]:
+    """Semantic view schemas, memoised on the shared index when one is given."""
+    if isinstance(manifest, ManifestIndex):
+        return manifest.derive("semantic_view_schemas", _parse_manifest_models)
+    return _parse_manifest_models(manifest)
+
+
 def _normalize_type(data_type: str) -> str:
     """Normalize type string for comparison (e.g. VARCHAR vs varchar)."""
     if not data_type:
@@ -141,10 +144,10 @@ class SchemaCompatibilityChecker:
     def validate(
         self,
         current_state: DatasetSchemaSnapshot,
-        new_manifest: dict[str, Any],
+        new_manifest: dict[str, Any] | ManifestIndex,
     ) -> CompatibilityResult:
         """
-        Compare current dataset state to new manifest.
+        Compare current dataset state to new manifest (parsed dict or shared index).
 
         Returns CompatibilityResult with compatibility_passed=False if any
         breaking change is detected (exposed column removed, type changed,
@@ -153,7 +156,7 @@ class SchemaCompatibilityChecker:
         breaking: list[BreakingChange] = []
         additive: list[str] = []
 
-        new_views = _parse_manifest_models(new_manifest)
+        new_views = _manifest_models(new_manifest)
 
         # 1. No semantic view removed
         for name in current_state.datasets:
@@ -228,13 +231,8 @@ class SchemaCompatibilityChecker:
         current_state: DatasetSchemaSnapshot,
         manifest_path: str | Path,
     ) -> CompatibilityResult:
-        """Load manifest from file and run validation."""
-        path = Path(manifest_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Manifest not found: {path}")
-        with open(path) as f:
-            manifest = json.load(f)
-        return self.validate(current_state, manifest)
+        """Load manifest from file (shared index) and run validation."""
+        return self.validate(current_state, load_manifest_index(manifest_path))
 
 
 def build_snapshot_from_manifest(manifest: dict[str, Any]) -> DatasetSchemaSnapshot:
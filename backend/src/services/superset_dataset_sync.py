@@ -2,13 +2,12 @@
 Idempotent sync of dbt semantic views to Superset datasets.
 
 Orchestrates: compatibility check, snapshot of last-known-good, upsert via
-Superset API, versioned metadata, observability writes. Rollback on failure
+Superset API, dataset catalog and versioned metadata, observability writes. Rollback on failure
 means no partial apply: we record failure and do not update remaining datasets.
 
 Story 5.2 — Prompt 5.2.4
 """
 
-import hashlib
 import json
 import logging
 import time
@@ -26,8 +25,13 @@ from src.services.audit_logger import (
     emit_dataset_sync_started,
     emit_dataset_version_activated,
 )
+from src.services.dataset_discovery_service import upsert_catalog_entry
 from src.services.dataset_observability import DatasetObservabilityService
 from src.services.dataset_version_manager import DatasetVersionManager
+from src.services.dbt_manifest_index import (
+    load_manifest_index,
+    semantic_exposed_columns,
+)
 from src.services.schema_compatibility_checker import (
     SchemaCompatibilityChecker,
     DatasetSchemaSnapshot,
@@ -56,47 +60,13 @@ class SyncResult:
 
 
 def _parse_manifest(manifest_path: str | Path) -> dict[str, Any]:
-    """Load and parse dbt manifest.json."""
-    path = Path(manifest_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Manifest not found: {path}")
-    with open(path) as f:
-        return json.load(f)
-
-
-def _is_semantic_view(name: str) -> bool:
-    if name.endswith("_current") and name.startswith("fact_"):
-        return True
-    if name.startswith("sem_") and "_v1" in name:
-        return True
-    return False
+    """Load and parse dbt manifest.json (via the shared manifest index)."""
+    return load_manifest_index(manifest_path).manifest
 
 
 def _get_semantic_models_with_exposed_columns(manifest: dict[str, Any]) -> dict[str, list[dict]]:
     """Extract semantic view name -> list of {column_name, description, data_type} for exposed only."""
-    nodes = manifest.get("nodes", {})
-    result: dict[str, list[dict]] = {}
-
-    for node_id, node in nodes.items():
-        if not node_id.startswith("model."):
-            continue
-        name = node.get("name", "")
-        if not _is_semantic_view(name):
-            continue
-
-        columns = []
-        for col_name, col_info in node.get("columns", {}).items():
-            meta = col_info.get("meta", {}) if isinstance(col_info, dict) else {}
-            if not meta.get("superset_expose", False):
-                continue
-            columns.append({
-                "column_name": col_name,
-                "description": col_info.get("description", "") if isinstance(col_info, dict) else "",
-                "data_type": col_info.get("data_type", "VARCHAR") if isinstance(col_info, dict) else "VARCHAR",
-            })
-        result[name] = columns
-
-    return result
+    return semantic_exposed_columns(manifest)
 
 
 def _get_column_snapshot_for_version(manifest: dict[str, Any], dataset_name: str) -> list[dict]:
@@ -238,6 +208,20 @@ class SupersetApiClient:
             )
             r.raise_for_status()
 
+    def get_dataset_columns(self, dataset_id: int) -> list[dict]:
+        with httpx.Client(timeout=self.timeout) as client:
+            self._ensure_auth(client)
+            r = client.get(
+                f"{self.base_url}/api/v1/dataset/{dataset_id}",
+                headers={
+                    "Authorization": f"Bearer {self._token}",
+                    "X-CSRFToken": self._csrf or "",
+                    "Content-Type": "application/json",
+                },
+            )
+            r.raise_for_status()
+            return r.json().get("result", {}).get("columns", []) or []
+
     def refresh_dataset_columns(self, dataset_id: int) -> None:
         with httpx.Client(timeout=self.timeout) as client:
             self._ensure_auth(client)
@@ -251,6 +235,33 @@ class SupersetApiClient:
             r.raise_for_status()
 
 
+def _catalog_columns(exposed: list[dict], superset_columns: list[dict]) -> list[dict]:
+    """
+    Catalog columns for a dataset: the manifest's exposed columns, typed by Superset.
+
+    schema.yml rarely declares data_type, so types come from the Superset
+    dataset's refreshed columns. Exposed columns Superset does not have
+    are left out, since charts could not query them.
+    """
+    by_name = {col.get("column_name"): col for col in superset_columns}
+    columns = []
+    for col in exposed:
+        superset_col = by_name.get(col["column_name"])
+        if superset_col is None:
+            continue
+        columns.append({
+            "column_name": col["column_name"],
+            "data_type": superset_col.get("type") or col.get("data_type") or "VARCHAR",
+            "description": (
+                col.get("description")
+                or superset_col.get("description")
+                or superset_col.get("verbose_name")
+                or ""
+            ),
+        })
+    return columns
+
+
 class SupersetDatasetSync:
     """Idempotent sync of dbt semantic views to Superset datasets."""
 
@@ -302,7 +313,7 @@ class SupersetDatasetSync:
         result = SyncResult(success=False)
 
         try:
-            manifest = _parse_manifest(manifest_path)
+            index = load_manifest_index(manifest_path)
         except Exception as e:
             logger.exception("superset_dataset_sync.load_manifest_failed")
             result.errors.append({"stage": "load_manifest", "error": str(e)})
@@ -315,7 +326,7 @@ class SupersetDatasetSync:
         if current_state is None:
             current_state = build_snapshot_from_db(self.db)
 
-        compat = self.checker.validate(current_state, manifest)
+        compat = self.checker.validate(current_state, index)
         if not compat.compatibility_passed:
             result.blocked = True
             result.blocking_reasons = [b.message for b in compat.breaking_changes]
@@ -338,7 +349,8 @@ class SupersetDatasetSync:
             result.duration_seconds = time.perf_counter() - start
             return result
 
-        models = _get_semantic_models_with_exposed_columns(manifest)
+        manifest = index.manifest
+        models = index.semantic_exposed_columns
         if not models:
             result.success = True
             result.duration_seconds = time.perf_counter() - start
@@ -355,11 +367,8 @@ class SupersetDatasetSync:
             result.duration_seconds = time.perf_counter() - start
             return result
 
-        manifest_hash = hashlib.sha256(
-            json.dumps(manifest, sort_keys=True).encode()
-        ).hexdigest()
+        manifest_hash = index.content_hash
         schema_name = "semantic"
-        nodes = manifest.get("nodes", {}) or {}
 
         for dataset_name, columns in models.items():
             t0 = time.perf_counter()
@@ -374,16 +383,17 @@ class SupersetDatasetSync:
             emit_dataset_sync_started(self.db, dataset_name, "v1")
             try:
                 existing = self.client.get_dataset(dataset_name, schema_name)
-                node = nodes.get(f"model.markinsight.{dataset_name}", {})
+                node = index.node(dataset_name) or {}
                 description = node.get("description", "") or f"Semantic view: {dataset_name}"
                 total_column_count = len(node.get("columns", {}))
 
                 if existing:
-                    self.client.update_dataset(existing["id"], description)
-                    self.client.refresh_dataset_columns(existing["id"])
+                    superset_dataset_id = existing["id"]
+                    self.client.update_dataset(superset_dataset_id, description)
+                    self.client.refresh_dataset_columns(superset_dataset_id)
                     result.updated.append(dataset_name)
                 else:
-                    self.client.create_dataset(
+                    superset_dataset_id = self.client.create_dataset(
                         table_name=dataset_name,
                         schema=schema_name,
                         database_id=db_id,
@@ -393,8 +403,20 @@ class SupersetDatasetSync:
                     result.created.append(dataset_name)
                     existing = self.client.get_dataset(dataset_name, schema_name)
                     if existing:
-                        self.client.refresh_dataset_columns(existing["id"])
+                        superset_dataset_id = existing["id"]
+                        self.client.refresh_dataset_columns(superset_dataset_id)
 
+                # Discovery serves the chart builder from the catalog, not Superset
+                upsert_catalog_entry(
+                    self.db,
+                    dataset_name,
+                    superset_dataset_id,
+                    schema_name,
+                    description,
+                    _catalog_columns(
+                        columns, self.client.get_dataset_columns(superset_dataset_id)
+                    ),
+                )
                 self.version_manager.activate_version(version.id)
                 duration = time.perf_counter() - t0
                 emit_dataset_sync_completed(self.db, dataset_name, "v1", duration)
@@ -440,4 +462,41 @@ class SupersetDatasetSync:
                 "blocking": True,
             },
         ]
-        return result
\ No newline at end of file
+        return result
+
+    def warm_catalog(self, manifest_path: str | Path) -> int:
+        """
+        Fill the dataset catalog from the Superset datasets that already exist.
+
+        For deploys where the catalog is empty until the next dbt run: no
+        versions, audit events or Superset writes, only catalog entries.
+        The caller commits.
+
+        Returns:
+            Number of catalog entries created or changed
+        """
+        index = load_manifest_index(manifest_path)
+        schema_name = "semantic"
+        written = 0
+
+        for dataset_name, columns in index.semantic_exposed_columns.items():
+            try:
+                existing = self.client.get_dataset(dataset_name, schema_name)
+                if not existing:
+                    continue
+                node = index.node(dataset_name) or {}
+                written += upsert_catalog_entry(
+                    self.db,
+                    dataset_name,
+                    existing["id"],
+                    schema_name,
+                    node.get("description", "") or f"Semantic view: {dataset_name}",
+                    _catalog_columns(columns, self.client.get_dataset_columns(existing["id"])),
+                )
+            except Exception as e:
+                logger.warning(
+                    "superset_dataset_sync.catalog_warm_failed",
+                    extra={"dataset_name": dataset_name, "error": str(e)},
+                )
+
+        return written
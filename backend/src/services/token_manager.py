@@ -42,7 +42,11 @@ from src.models.connector_credential import (
     ConnectorCredential,
     CredentialStatus,
 )
-from src.platform.secrets import encrypt_secret, decrypt_secret
+from src.platform.secrets import encrypt_secret
+from src.services.credential_vault import (
+    CredentialVault,
+    evict_cached_payload_on_commit,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -277,6 +281,7 @@ class TokenManager:
 
         previous_status = credential.status
         credential.status = CredentialStatus.REVOKED
+        evict_cached_payload_on_commit(self.db, self.tenant_id, credential.id)
 
         metadata = dict(credential.credential_metadata or {})
         metadata["revoked_at"] = datetime.now(timezone.utc).isoformat()
@@ -477,8 +482,9 @@ class TokenManager:
                     attempt_number=error_count,
                 )
 
-            plaintext = await decrypt_secret(credential.encrypted_payload)
-            current_tokens = json.loads(plaintext)
+            current_tokens = await CredentialVault(
+                self.db, self.tenant_id
+            ).decrypt_credential(credential)
         except Exception as exc:
             logger.error(
                 "Failed to decrypt credential for refresh",
@@ -563,6 +569,7 @@ class TokenManager:
 
         credential.encrypted_payload = encrypted
         credential.status = CredentialStatus.ACTIVE
+        evict_cached_payload_on_commit(self.db, self.tenant_id, credential.id)
 
         # Update metadata with new expiry info
         new_expires_at = None
@@ -800,6 +807,7 @@ class TokenManager:
     def _mark_expired(self, credential: ConnectorCredential, reason: str) -> None:
         """Mark a credential as expired after refresh failures."""
         credential.status = CredentialStatus.EXPIRED
+        evict_cached_payload_on_commit(self.db, self.tenant_id, credential.id)
 
         metadata = dict(credential.credential_metadata or {})
         metadata["expired_at"] = datetime.now(timezone.utc).isoformat()
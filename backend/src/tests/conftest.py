@@ -48,6 +48,16 @@ def _httpx_app_kwarg_patch():
         httpx.Client.__init__ = original_init
 
 
+@pytest.fixture(autouse=True)
+def _reset_credential_payload_cache():
+    """Keep the per-process decrypted credential cache from leaking between tests."""
+    from src.services.credential_vault import reset_payload_cache
+
+    reset_payload_cache()
+    yield
+    reset_payload_cache()
+
+
 def _get_test_database_url() -> str:
     """Get database URL for tests."""
     database_url = os.getenv("DATABASE_URL")
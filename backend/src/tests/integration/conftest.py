@@ -86,19 +86,18 @@ def dbt_absent_client():
     mock_session.execute.side_effect = _make_programmatic_error
     mock_session.close = MagicMock()
 
-    # Both patterns routes use to open sessions:
-    #   channels.py:    db = get_session_factory()()
-    #   orders.py:      from src.database.session import SessionLocal; db = SessionLocal()
-    #   attribution.py: from src.database.session import SessionLocal; db = SessionLocal()
+    # Analytics routes open read sessions (replica when configured):
+    #   channels.py:    db = get_read_session_factory()()  (module-scope import)
+    #   orders.py:      from src.database.session import get_read_session_factory
+    #   attribution.py: from src.database.session import get_read_session_factory
     mock_session_factory = MagicMock(return_value=mock_session)
-    mock_session_class = MagicMock(return_value=mock_session)
 
     patches = [
-        # channels.py imports get_session_factory at module scope
-        patch("src.api.routes.channels.get_session_factory", return_value=mock_session_factory),
-        # orders.py and attribution.py import SessionLocal inside functions
-        patch("src.database.session.SessionLocal", mock_session_class),
-        # Belt-and-suspenders: also patch at the top-level session module
+        # channels.py imports get_read_session_factory at module scope
+        patch("src.api.routes.channels.get_read_session_factory", return_value=mock_session_factory),
+        # orders.py and attribution.py import it inside their dependencies
+        patch("src.database.session.get_read_session_factory", return_value=mock_session_factory),
+        # Belt-and-suspenders: also patch the primary session factory
         patch("src.database.session.get_session_factory", return_value=mock_session_factory),
     ]
 
@@ -0,0 +1,165 @@
+"""
+Unit tests for the action job worker.
+
+Covers lease-based claiming, stale lease recovery and the per-platform
+worker pool.
+
+Story 8.5 - Action Execution (Scoped & Reversible)
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from sqlalchemy.orm import sessionmaker
+
+from src.jobs.action_job_worker import ActionJobWorker, parse_platform_concurrency
+from src.models.action_job import ActionJob, ActionJobStatus
+from src.models.ai_action import AIAction  # noqa: F401 - table for platform lookup
+
+
+def _add_job(db_session, status=ActionJobStatus.QUEUED, **fields) -> ActionJob:
+    job = ActionJob(
+        job_id=str(uuid.uuid4()),
+        tenant_id=f"tenant-{uuid.uuid4().hex[:8]}",
+        status=status,
+        action_ids=[str(uuid.uuid4())],
+        **fields,
+    )
+    db_session.add(job)
+    db_session.commit()
+    return job
+
+
+class TestParsePlatformConcurrency:
+
+    def test_parses_limits(self):
+        assert parse_platform_concurrency("meta=4, Google=2,shopify=1") == {
+            "meta": 4,
+            "google": 2,
+            "shopify": 1,
+        }
+
+    def test_ignores_malformed_entries(self):
+        assert parse_platform_concurrency("meta=x,google,shopify=0,=3") == {}
+
+
+class TestLeaseClaiming:
+
+    def test_claim_jobs_leases_queued_jobs(self, db_session):
+        job = _add_job(db_session)
+        worker = ActionJobWorker(db_session, worker_id="worker-a")
+
+        claimed = worker.claim_jobs(limit=10)
+
+        assert claimed == [job.job_id]
+        db_session.refresh(job)
+        assert job.status == ActionJobStatus.RUNNING
+        assert job.lease_owner == "worker-a"
+        assert job.lease_expires_at is not None
+
+        # A second worker finds nothing left to claim
+        assert ActionJobWorker(db_session, worker_id="worker-b").claim_jobs() == []
+
+    def test_recover_expired_leases_requeues_only_stale_jobs(self, db_session):
+        now = datetime.now(timezone.utc)
+        stale = _add_job(
+            db_session,
+            status=ActionJobStatus.RUNNING,
+            lease_owner="dead-worker",
+            lease_expires_at=now - timedelta(minutes=5),
+        )
+        live = _add_job(
+            db_session,
+            status=ActionJobStatus.RUNNING,
+            lease_owner="live-worker",
+            lease_expires_at=now + timedelta(minutes=5),
+        )
+        worker = ActionJobWorker(db_session, worker_id="worker-a")
+
+        assert worker.recover_expired_leases() == 1
+
+        db_session.refresh(stale)
+        db_session.refresh(live)
+        assert stale.status == ActionJobStatus.QUEUED
+        assert stale.lease_owner is None
+        assert live.status == ActionJobStatus.RUNNING
+        assert live.lease_owner == "live-worker"
+
+
+class TestWorkerPool:
+
+    async def test_platform_limit_bounds_concurrency(self, db_session):
+        jobs = [_add_job(db_session) for _ in range(3)]
+        factory = sessionmaker(bind=db_session.get_bind(), autoflush=False)
+        worker = ActionJobWorker(db_session, session_factory=factory, worker_id="worker-a")
+        worker.platform_limits = {"meta": 1}
+
+        running = 0
+        peak = 0
+
+        async def fake_process_job(job, db=None):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            job.finalize(actions_succeeded=1, actions_failed=0)
+            return True
+
+        with patch.object(worker, "dispatch_new_jobs", return_value=0), \
+                patch.object(worker, "_get_job_platforms", return_value=["meta"]), \
+                patch.object(worker, "process_job", side_effect=fake_process_job):
+            stats = await worker.run()
+
+        assert peak == 1
+        assert stats["jobs_claimed"] == 3
+        assert stats["tenants_processed"] == 3
+        for job in jobs:
+            db_session.refresh(job)
+            assert job.status == ActionJobStatus.SUCCEEDED
+            assert job.lease_owner is None
+
+    async def test_skips_job_claimed_by_another_worker(self, db_session):
+        job = _add_job(db_session)
+        ActionJobWorker(db_session, worker_id="worker-b").claim_jobs()
+        worker = ActionJobWorker(db_session, worker_id="worker-a")
+
+        with patch.object(worker, "process_job") as process_job:
+            assert await worker._run_claimed_job(job.job_id, db_session) is None
+
+        process_job.assert_not_called()
+
+    async def test_lost_lease_aborts_job(self, db_session):
+        job = _add_job(db_session)
+        job_id = job.job_id
+        factory = sessionmaker(bind=db_session.get_bind(), autoflush=False)
+        worker = ActionJobWorker(db_session, session_factory=factory, worker_id="worker-a")
+        committed = []
+
+        async def fake_process_job(job, db=None):
+            # Two actions, each committed on the job's session; the lease is
+            # stolen while the second one is in flight
+            for action_number in (1, 2):
+                job.heartbeat_at = datetime.now(timezone.utc)
+                db.commit()
+                committed.append(action_number)
+                await asyncio.sleep(0.1)
+            return True
+
+        with patch("src.jobs.action_job_worker.ACTION_JOB_HEARTBEAT_SECONDS", 0.01), \
+                patch.object(worker, "dispatch_new_jobs", return_value=0), \
+                patch.object(worker, "_get_job_platforms", return_value=["meta"]), \
+                patch.object(worker, "_extend_lease", return_value=False), \
+                patch.object(worker, "process_job", side_effect=fake_process_job):
+            stats = await worker.run()
+
+        assert committed == [1]
+        assert stats["jobs_claimed"] == 1
+        assert stats["jobs_aborted"] == 1
+        assert stats["tenants_processed"] == 0
+        assert db_session.query(ActionJob).filter(
+            ActionJob.job_id == job_id,
+            ActionJob.status == ActionJobStatus.SUCCEEDED,
+        ).count() == 0
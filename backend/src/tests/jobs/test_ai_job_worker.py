@@ -0,0 +1,219 @@
+"""
+Unit tests for the AI job worker.
+
+Covers lease-based claiming across stages, stale lease recovery, tenant
+fairness and in-process insight -> recommendation -> proposal chaining.
+
+Story 8.1 / 8.3 / 8.4 - AI Insights, Recommendations and Action Proposals
+"""
+
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from sqlalchemy.orm import sessionmaker
+
+from src.jobs.ai_job_worker import AIJobWorker, interleave_by_tenant
+from src.models.action_proposal_job import ActionProposalJob, ActionProposalJobStatus
+from src.models.insight_job import InsightJob, InsightJobCadence, InsightJobStatus
+from src.models.recommendation_job import RecommendationJob, RecommendationJobStatus
+
+
+def _add_insight_job(db_session, tenant_id=None, status=InsightJobStatus.QUEUED, **fields) -> InsightJob:
+    job = InsightJob(
+        job_id=str(uuid.uuid4()),
+        tenant_id=tenant_id or f"tenant-{uuid.uuid4().hex[:8]}",
+        cadence=InsightJobCadence.DAILY,
+        status=status,
+        insights_generated=0,
+        job_metadata={},
+        **fields,
+    )
+    db_session.add(job)
+    db_session.commit()
+    return job
+
+
+def _fake_execute(db, stage, job):
+    """Complete a job as if its generation service produced output."""
+    if stage.name == "insight":
+        job.mark_success(insights_generated=2)
+    elif stage.name == "recommendation":
+        job.mark_success(recommendations_generated=1, insights_processed=2)
+    else:
+        job.mark_success(proposals_generated=1, recommendations_processed=1)
+    return True
+
+
+class TestInterleaveByTenant:
+
+    def test_round_robin_across_tenants(self):
+        claims = [
+            ("insight", "i-a", "a"),
+            ("insight", "i-b", "b"),
+            ("recommendation", "r-a", "a"),
+            ("proposal", "p-a", "a"),
+            ("proposal", "p-c", "c"),
+        ]
+
+        assert [job_id for _, job_id, _ in interleave_by_tenant(claims)] == [
+            "i-a", "i-b", "p-c", "r-a", "p-a",
+        ]
+
+
+class TestLeaseClaiming:
+
+    def test_claim_jobs_leases_queued_jobs(self, db_session):
+        job = _add_insight_job(db_session)
+        worker = AIJobWorker(db_session, worker_id="worker-a")
+
+        claimed = worker.claim_jobs(limit=10)
+
+        assert claimed == [("insight", job.job_id, job.tenant_id)]
+        db_session.refresh(job)
+        assert job.status == InsightJobStatus.RUNNING
+        assert job.lease_owner == "worker-a"
+        assert job.lease_expires_at is not None
+
+        # A second worker finds nothing left to claim
+        assert AIJobWorker(db_session, worker_id="worker-b").claim_jobs() == []
+
+    def test_recover_expired_leases_requeues_only_stale_jobs(self, db_session):
+        now = datetime.now(timezone.utc)
+        stale = _add_insight_job(
+            db_session,
+            status=InsightJobStatus.RUNNING,
+            lease_owner="dead-worker",
+            lease_expires_at=now - timedelta(minutes=5),
+        )
+        live = _add_insight_job(
+            db_session,
+            status=InsightJobStatus.RUNNING,
+            lease_owner="live-worker",
+            lease_expires_at=now + timedelta(minutes=5),
+        )
+
+        assert AIJobWorker(db_session, worker_id="worker-a").recover_expired_leases() == 1
+
+        db_session.refresh(stale)
+        db_session.refresh(live)
+        assert stale.status == InsightJobStatus.QUEUED
+        assert stale.lease_owner is None
+        assert live.status == InsightJobStatus.RUNNING
+
+
+class TestChaining:
+
+    async def test_insight_success_chains_recommendation_and_proposal(self, db_session):
+        insight_job = _add_insight_job(db_session)
+        tenant_id = insight_job.tenant_id
+
+        def dispatch_recommendation(self, cadence):
+            job = RecommendationJob(tenant_id=self.tenant_id, cadence=cadence)
+            self.db.add(job)
+            self.db.commit()
+            return job
+
+        def dispatch_proposal(self, cadence):
+            job = ActionProposalJob(tenant_id=self.tenant_id, cadence=cadence)
+            self.db.add(job)
+            self.db.flush()
+            return job
+
+        worker = AIJobWorker(db_session, worker_id="worker-a")
+        with patch("src.jobs.ai_job_worker.load_tenant_metrics", return_value={}), \
+                patch.object(worker, "_execute_stage", side_effect=_fake_execute), \
+                patch(
+                    "src.jobs.ai_job_worker.RecommendationJobDispatcher.dispatch",
+                    dispatch_recommendation,
+                ), \
+                patch(
+                    "src.jobs.ai_job_worker.ActionProposalJobDispatcher.dispatch_if_needed",
+                    dispatch_proposal,
+                ):
+            stats = await worker.run()
+
+        assert stats["jobs_claimed"] == 3
+        assert stats["jobs_succeeded"] == 3
+        assert stats["jobs_chained"] == 2
+
+        recommendation = db_session.query(RecommendationJob).filter_by(tenant_id=tenant_id).one()
+        proposal = db_session.query(ActionProposalJob).filter_by(tenant_id=tenant_id).one()
+        assert recommendation.status == RecommendationJobStatus.SUCCESS
+        assert proposal.status == ActionProposalJobStatus.SUCCESS
+        assert recommendation.lease_owner is None
+        assert proposal.lease_owner is None
+
+    async def test_no_chain_without_new_insights(self, db_session):
+        _add_insight_job(db_session)
+
+        def execute(db, stage, job):
+            job.mark_success(insights_generated=0)
+            return True
+
+        worker = AIJobWorker(db_session, worker_id="worker-a")
+        with patch("src.jobs.ai_job_worker.load_tenant_metrics", return_value={}), \
+                patch.object(worker, "_execute_stage", side_effect=execute), \
+                patch("src.jobs.ai_job_worker.RecommendationJobDispatcher.dispatch") as dispatch:
+            stats = await worker.run()
+
+        dispatch.assert_not_called()
+        assert stats["jobs_chained"] == 0
+
+
+class TestWorkerPool:
+
+    async def test_one_chain_per_tenant_at_a_time(self, db_session):
+        jobs = [_add_insight_job(db_session, tenant_id="tenant-a")]
+        jobs += [_add_insight_job(db_session) for _ in range(2)]
+        # Second queued stage for tenant-a
+        recommendation = RecommendationJob(tenant_id="tenant-a")
+        db_session.add(recommendation)
+        db_session.commit()
+        tenant_of = {job.job_id: job.tenant_id for job in jobs + [recommendation]}
+
+        factory = sessionmaker(bind=db_session.get_bind(), autoflush=False)
+        worker = AIJobWorker(db_session, session_factory=factory, worker_id="worker-a")
+
+        lock = threading.Lock()
+        running = {}
+        peak = {}
+
+        def fake_chain(stage_name, job_id, current):
+            tenant = tenant_of[job_id]
+            with lock:
+                running[tenant] = running.get(tenant, 0) + 1
+                peak[tenant] = max(peak.get(tenant, 0), running[tenant])
+            time.sleep(0.02)
+            with lock:
+                running[tenant] -= 1
+
+        with patch("src.jobs.ai_job_worker.load_tenant_metrics", return_value={}), \
+                patch.object(worker, "_run_chain_in_session", side_effect=fake_chain):
+            stats = await worker.run()
+
+        assert stats["jobs_claimed"] == 4
+        assert stats["tenants_processed"] == 3
+        assert peak["tenant-a"] == 1
+
+    async def test_lost_lease_aborts_job(self, db_session):
+        tenant_id = _add_insight_job(db_session).tenant_id
+        factory = sessionmaker(bind=db_session.get_bind(), autoflush=False)
+        worker = AIJobWorker(db_session, session_factory=factory, worker_id="worker-a")
+
+        def slow_execute(db, stage, job):
+            time.sleep(0.1)  # the heartbeat finds the lease gone meanwhile
+            return _fake_execute(db, stage, job)
+
+        with patch("src.jobs.ai_job_worker.AI_JOB_HEARTBEAT_SECONDS", 0.01), \
+                patch("src.jobs.ai_job_worker.load_tenant_metrics", return_value={}), \
+                patch.object(worker, "_extend_lease", return_value=False), \
+                patch.object(worker, "_execute_stage", side_effect=slow_execute):
+            stats = await worker.run()
+
+        assert stats["jobs_aborted"] == 1
+        assert stats["jobs_processed"] == 0
+        assert stats["jobs_chained"] == 0
+        assert db_session.query(RecommendationJob).filter_by(tenant_id=tenant_id).count() == 0
@@ -1,12 +1,15 @@
-"""Unit tests for notification email worker Clerk lookup and failure handling."""
+"""Unit tests for notification email worker Clerk lookup, failure handling and batching."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
+from src.jobs import notification_email_worker as worker_module
 from src.jobs.notification_email_worker import NotificationEmailWorker, validate_worker_environment
 from src.models.notification import Notification, NotificationEventType
+from src.services.email_sender import MockEmailSender
 
 
 class TestGetUserEmail:
@@ -33,7 +36,7 @@ class TestGetUserEmail:
         }
 
         with patch("src.jobs.notification_email_worker.httpx.Client") as mock_client_cls:
-            mock_client = mock_client_cls.return_value.__enter__.return_value
+            mock_client = mock_client_cls.return_value
             mock_client.get.return_value = mock_response
 
             email = worker._get_user_email("user_123")
@@ -48,7 +51,7 @@ class TestGetUserEmail:
         mock_response.status_code = 404
 
         with patch("src.jobs.notification_email_worker.httpx.Client") as mock_client_cls:
-            mock_client = mock_client_cls.return_value.__enter__.return_value
+            mock_client = mock_client_cls.return_value
             mock_client.get.return_value = mock_response
 
             email = worker._get_user_email("missing_user")
@@ -68,7 +71,7 @@ class TestGetUserEmail:
         )
 
         with patch("src.jobs.notification_email_worker.httpx.Client") as mock_client_cls:
-            mock_client = mock_client_cls.return_value.__enter__.return_value
+            mock_client = mock_client_cls.return_value
             mock_client.get.return_value = mock_response
 
             email = worker._get_user_email("user_123")
@@ -113,3 +116,101 @@ class TestWorkerEnvironmentValidation:
         monkeypatch.setenv("CLERK_SECRET_KEY", "sk_test_123")
 
         validate_worker_environment()
+
+
+def _queued(user_id, entity_id, tenant_id="tenant-1"):
+    notification = Notification.create(
+        tenant_id=tenant_id,
+        event_type=NotificationEventType.CONNECTOR_FAILED,
+        title=f"Data sync failed: {entity_id}",
+        message="Your connection failed to sync.",
+        user_id=user_id,
+        entity_id=entity_id,
+        action_url=f"/connectors/{entity_id}",
+    )
+    notification.id = f"{user_id}:{entity_id}"
+    notification.mark_email_queued()
+    return notification
+
+
+class TestBatchedDelivery:
+    @pytest.mark.asyncio
+    async def test_bursts_for_one_user_are_sent_as_digest(self, monkeypatch):
+        monkeypatch.setenv("CLERK_SECRET_KEY", "sk_test_123")
+        sender = MockEmailSender()
+        storm = [_queued("user_a", f"conn-{i}") for i in range(4)]
+        single = _queued("user_b", "conn-9")
+        db = MagicMock()
+        worker = NotificationEmailWorker(db_session=db, email_sender=sender)
+
+        with patch.object(worker, "_get_pending_emails", return_value=storm + [single]), \
+                patch.object(worker, "_get_user_email", side_effect=lambda uid: f"{uid}@example.com") as lookup:
+            stats = await worker.run()
+
+        assert lookup.call_count == 2
+        assert sorted(m.to_email for m in sender.sent_messages) == [
+            "user_a@example.com", "user_b@example.com",
+        ]
+        digest = next(m for m in sender.sent_messages if m.to_email == "user_a@example.com")
+        assert digest.subject == "Action Required: Data Sync Failed (4 updates)"
+        assert all(f"conn-{i}" in digest.text_body for i in range(4))
+        assert all(n.email_sent_at is not None for n in storm + [single])
+        assert stats["sent"] == 5 and stats["digests"] == 1
+        db.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_digest_marks_every_notification(self, monkeypatch):
+        monkeypatch.setenv("CLERK_SECRET_KEY", "sk_test_123")
+        sender = MagicMock()
+        sender.send = AsyncMock(return_value=False)
+        storm = [_queued("user_a", f"conn-{i}") for i in range(3)]
+        worker = NotificationEmailWorker(db_session=MagicMock(), email_sender=sender)
+
+        with patch.object(worker, "_get_user_email", return_value="a@example.com"):
+            assert await worker.process_digest(storm) is False
+
+        assert all(n.email_failed_at is not None for n in storm)
+        assert worker.stats["failed"] == 3
+
+    @pytest.mark.asyncio
+    async def test_sends_to_recipients_concurrently_within_limit(self, monkeypatch):
+        monkeypatch.setenv("CLERK_SECRET_KEY", "sk_test_123")
+        monkeypatch.setattr(worker_module, "NOTIFICATION_EMAIL_CONCURRENCY", 3)
+        in_flight = 0
+        peak = 0
+
+        async def slow_send(message):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return True
+
+        sender = MagicMock()
+        sender.send = slow_send
+        pending = [_queued(f"user_{i}", "conn-1") for i in range(7)]
+        db = MagicMock()
+        worker = NotificationEmailWorker(db_session=db, email_sender=sender)
+
+        with patch.object(worker, "_get_pending_emails", return_value=pending), \
+                patch.object(worker, "_get_user_email", return_value="user@example.com"):
+            stats = await worker.run()
+
+        assert stats["sent"] == 7
+        assert peak == 3
+        assert db.commit.call_count == 3
+
+    def test_clerk_client_is_reused_across_lookups(self, monkeypatch):
+        monkeypatch.setenv("CLERK_SECRET_KEY", "sk_test_123")
+        worker = NotificationEmailWorker(db_session=MagicMock(), email_sender=MagicMock())
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+
+        with patch("src.jobs.notification_email_worker.httpx.Client") as mock_client_cls:
+            mock_client_cls.return_value.get.return_value = mock_response
+            worker._get_user_email("user_1")
+            worker._get_user_email("user_2")
+
+        mock_client_cls.assert_called_once()
+        assert mock_client_cls.return_value.get.call_count == 2
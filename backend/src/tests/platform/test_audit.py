@@ -22,6 +22,7 @@ from src.platform.audit import (
     extract_client_info,
     get_correlation_id,
     write_audit_log_sync,
+    write_audit_logs_sync,
     _write_fallback_log,
 )
 
@@ -673,6 +674,32 @@ class TestFallbackLogging:
             result = write_audit_log_sync(mock_db, event)
             assert result is None  # Returns None, doesn't crash
 
+    def test_write_audit_logs_sync_single_commit(self):
+        """Bulk write should add all events and commit once."""
+        mock_db = Mock()
+        events = [
+            AuditEvent(tenant_id="tenant-123", action=AuditAction.AUTH_LOGIN)
+            for _ in range(3)
+        ]
+
+        assert write_audit_logs_sync(mock_db, events) == 3
+        assert len(mock_db.add_all.call_args.args[0]) == 3
+        mock_db.commit.assert_called_once()
+
+    def test_write_audit_logs_sync_falls_back_per_event(self):
+        """Bulk write failure should fall back for every event."""
+        mock_db = Mock()
+        mock_db.commit.side_effect = Exception("DB connection error")
+        events = [
+            AuditEvent(tenant_id="tenant-123", action=AuditAction.AUTH_LOGIN)
+            for _ in range(2)
+        ]
+
+        with patch("src.platform.audit.fallback_logger") as mock_logger:
+            assert write_audit_logs_sync(mock_db, events) == 0
+            assert mock_logger.error.call_count == 2
+            mock_db.rollback.assert_called_once()
+
 
 # ============================================================================
 # TEST SUITE: AUDIT OUTCOME (Story 10.1)
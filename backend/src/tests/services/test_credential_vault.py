@@ -10,6 +10,7 @@ Covers:
 - Soft delete: sets timestamps, schedules hard delete
 - Restore: within window, past window, wiped payload
 - Hard delete purge: wipes payload and deletes row
+- Decrypted payload cache: hits, TTL, size cap, eviction on mutation
 - Tenant isolation: queries always scoped to tenant_id
 
 Security:
@@ -24,6 +25,8 @@ from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
 
 from src.models.connector_credential import (
     ConnectorCredential,
@@ -36,6 +39,10 @@ from src.services.credential_vault import (
     CredentialNotFoundError,
     CredentialNotRestorableError,
     CredentialVaultError,
+    _DecryptedPayloadCache,
+    evict_cached_payload,
+    evict_cached_payload_on_commit,
+    get_payload_cache_stats,
 )
 
 
@@ -328,6 +335,183 @@ class TestCredentialVaultDecrypt:
         assert result is None
 
 
+# =============================================================================
+# Decrypted payload cache Tests
+# =============================================================================
+
+def _vault_returning(cred):
+    session = _mock_session()
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = cred
+    session.execute.return_value = mock_result
+    return CredentialVault(db_session=session, tenant_id=TENANT_ID), session
+
+
+class TestCredentialVaultPayloadCache:
+    """Tests for the short-lived decrypted payload cache."""
+
+    @pytest.mark.asyncio
+    @patch("src.services.credential_vault.decrypt_secret", new_callable=AsyncMock)
+    async def test_second_call_is_served_from_cache(self, mock_decrypt):
+        """Repeated reads within the TTL decrypt once and skip the DB."""
+        raw = {"access_token": "tok-1"}
+        mock_decrypt.return_value = json.dumps(raw)
+        cred = _make_credential()
+        vault, session = _vault_returning(cred)
+
+        first = await vault.get_decrypted_payload(cred.id)
+        second = await vault.get_decrypted_payload(cred.id)
+
+        assert first == second == raw
+        mock_decrypt.assert_called_once()
+        assert session.execute.call_count == 1
+        stats = get_payload_cache_stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.decrypts_saved == 1
+
+    @pytest.mark.asyncio
+    @patch("src.services.credential_vault.decrypt_secret", new_callable=AsyncMock)
+    async def test_cached_payload_is_copy(self, mock_decrypt):
+        """Mutating a returned dict must not poison the cache."""
+        mock_decrypt.return_value = json.dumps({"access_token": "tok-1"})
+        cred = _make_credential()
+        vault, _ = _vault_returning(cred)
+
+        first = await vault.get_decrypted_payload(cred.id)
+        first["access_token"] = "tampered"
+        second = await vault.get_decrypted_payload(cred.id)
+
+        assert second["access_token"] == "tok-1"
+
+    @pytest.mark.asyncio
+    @patch("src.services.credential_vault.encrypt_secret", new_callable=AsyncMock)
+    @patch("src.services.credential_vault.decrypt_secret", new_callable=AsyncMock)
+    async def test_rotate_evicts_cached_payload(self, mock_decrypt, mock_encrypt):
+        """Rotating a credential forces the next read to decrypt again."""
+        mock_decrypt.return_value = json.dumps({"access_token": "old"})
+        mock_encrypt.return_value = "gAAAAABf_new"
+        cred = _make_credential()
+        vault, _ = _vault_returning(cred)
+
+        await vault.get_decrypted_payload(cred.id)
+        await vault.rotate(cred.id, {"access_token": "new"}, rotated_by=USER_ID)
+        mock_decrypt.return_value = json.dumps({"access_token": "new"})
+        result = await vault.get_decrypted_payload(cred.id)
+
+        assert result == {"access_token": "new"}
+        assert mock_decrypt.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("src.services.credential_vault.decrypt_secret", new_callable=AsyncMock)
+    async def test_status_change_and_soft_delete_evict(self, mock_decrypt):
+        """update_status() and soft_delete() drop the cached payload."""
+        mock_decrypt.return_value = json.dumps({"access_token": "tok"})
+        cred = _make_credential()
+        vault, _ = _vault_returning(cred)
+
+        await vault.get_decrypted_payload(cred.id)
+        vault.update_status(cred.id, CredentialStatus.EXPIRED)
+        assert get_payload_cache_stats().size == 0
+
+        await vault.get_decrypted_payload(cred.id)
+        vault.soft_delete(cred.id, deleted_by=USER_ID)
+        assert get_payload_cache_stats().size == 0
+
+    @pytest.mark.asyncio
+    @patch("src.services.credential_vault.decrypt_secret", new_callable=AsyncMock)
+    async def test_decrypt_credential_shares_cache(self, mock_decrypt):
+        """Callers that load the row themselves hit the same cache entry."""
+        mock_decrypt.return_value = json.dumps({"access_token": "tok"})
+        cred = _make_credential()
+        vault, session = _vault_returning(cred)
+
+        assert await vault.decrypt_credential(cred) == {"access_token": "tok"}
+        assert await vault.get_decrypted_payload(cred.id) == {"access_token": "tok"}
+        mock_decrypt.assert_called_once()
+        session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_decrypt_credential_rejects_other_tenant(self):
+        vault, _ = _vault_returning(None)
+
+        with pytest.raises(CredentialVaultError):
+            await vault.decrypt_credential(_make_credential(tenant_id=OTHER_TENANT_ID))
+
+    @pytest.mark.asyncio
+    @patch("src.services.credential_vault.decrypt_secret", new_callable=AsyncMock)
+    async def test_eviction_waits_for_commit(self, mock_decrypt):
+        """Pending evictions apply when the session commits, not before."""
+        mock_decrypt.return_value = json.dumps({"access_token": "tok"})
+        cred = _make_credential()
+        vault, _ = _vault_returning(cred)
+        await vault.decrypt_credential(cred)
+
+        engine = create_engine("sqlite:///:memory:")
+        with Session(engine) as session:
+            evict_cached_payload_on_commit(session, TENANT_ID, cred.id)
+            assert get_payload_cache_stats().size == 1
+
+            session.commit()
+            assert get_payload_cache_stats().size == 0
+            assert not session.info
+        engine.dispose()
+
+    @pytest.mark.asyncio
+    @patch("src.services.credential_vault.decrypt_secret", new_callable=AsyncMock)
+    async def test_cache_is_tenant_scoped(self, mock_decrypt):
+        """A cached payload is never returned to another tenant's vault."""
+        mock_decrypt.return_value = json.dumps({"access_token": "tok"})
+        cred = _make_credential()
+        vault, _ = _vault_returning(cred)
+        await vault.get_decrypted_payload(cred.id)
+
+        other_session = _mock_session()
+        other_result = MagicMock()
+        other_result.scalar_one_or_none.return_value = None
+        other_session.execute.return_value = other_result
+        other_vault = CredentialVault(
+            db_session=other_session, tenant_id=OTHER_TENANT_ID
+        )
+
+        assert await other_vault.get_decrypted_payload(cred.id) is None
+
+    def test_ttl_expiry_and_size_cap(self):
+        """Expired entries miss; the oldest entry is dropped past max_entries."""
+        cache = _DecryptedPayloadCache(max_entries=2, ttl=60)
+        cache.set(TENANT_ID, "a", '{"k": 1}')
+        cache.set(TENANT_ID, "b", '{"k": 2}')
+        cache.set(TENANT_ID, "c", '{"k": 3}')
+
+        assert cache.get(TENANT_ID, "a") is None
+        assert cache.get(TENANT_ID, "c") == {"k": 3}
+        assert cache.stats().evictions == 1
+
+        expired = _DecryptedPayloadCache(max_entries=2, ttl=60)
+        with patch("src.services.credential_vault.time.monotonic", return_value=0):
+            expired.set(TENANT_ID, "a", '{"k": 1}')
+        with patch("src.services.credential_vault.time.monotonic", return_value=61):
+            assert expired.get(TENANT_ID, "a") is None
+
+    def test_evicted_entries_are_zeroized_and_redacted(self):
+        """Dropped buffers are wiped and repr never contains the secret."""
+        cache = _DecryptedPayloadCache(max_entries=4, ttl=60)
+        cache.set(TENANT_ID, "a", '{"access_token": "sk-live-secret"}')
+        entry = cache._store[(TENANT_ID, "a")]
+        buffer = entry._buffer
+
+        assert "sk-live-secret" not in repr(entry)
+        assert "sk-live-secret" not in repr(cache)
+
+        cache.evict(TENANT_ID, "a")
+        assert set(buffer) == {0}
+
+    def test_evict_cached_payload_unknown_key_is_noop(self):
+        """Module-level eviction tolerates credentials that were never cached."""
+        evict_cached_payload(TENANT_ID, "never-cached")
+        assert get_payload_cache_stats().evictions == 0
+
+
 # =============================================================================
 # CredentialVault.soft_delete Tests
 # =============================================================================
@@ -11,10 +11,12 @@ Tests:
 Run with: pytest src/tests/test_admin_backfills.py -v
 """
 
+import asyncio
 import hashlib
 import pytest
 from datetime import date, datetime, timedelta, timezone
-from unittest.mock import MagicMock, patch
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.api.schemas.backfill_request import (
     CreateBackfillRequest,
@@ -1212,6 +1214,237 @@ class TestBackfillExecutorRecovery:
         mock_db.commit.assert_not_called()
 
 
+# =============================================================================
+# Manifest-derived graph & pipelined execution
+# =============================================================================
+
+
+from src.services.backfill_planner import (  # noqa: E402
+    DbtModel,
+    load_manifest_registry,
+    registry_from_manifest,
+)
+
+
+def _manifest_node(name, folder, materialized="view", deps=()):
+    return {
+        "resource_type": "model",
+        "name": name,
+        "fqn": ["markinsight", folder, name],
+        "config": {"materialized": materialized},
+        "depends_on": {"nodes": [f"model.markinsight.{d}" for d in deps]},
+        "tags": [],
+    }
+
+
+class TestManifestRegistry:
+    """The planner graph can be derived from dbt's manifest.json."""
+
+    MANIFEST = {
+        "nodes": {
+            "model.markinsight.stg_shopify_orders": _manifest_node("stg_shopify_orders", "staging"),
+            "model.markinsight.orders": _manifest_node(
+                "orders", "canonical", "incremental", deps=("stg_shopify_orders",)),
+            "model.markinsight.orders_helper": _manifest_node(
+                "orders_helper", "utils", deps=("orders",)),
+            "model.markinsight.mart_revenue": _manifest_node(
+                "mart_revenue", "marts", "table", deps=("orders", "orders_helper")),
+            "test.markinsight.not_null_orders": {"resource_type": "test", "name": "not_null_orders"},
+        }
+    }
+
+    def test_layers_and_dependencies(self):
+        registry = registry_from_manifest(self.MANIFEST)
+        assert set(registry) == {"stg_shopify_orders", "orders", "orders_helper", "mart_revenue"}
+        assert registry["orders"].layer == ModelLayer.CANONICAL
+        assert registry["orders"].materialization == "incremental"
+        assert registry["mart_revenue"].depends_on == ("orders", "orders_helper")
+        # Unknown folder inherits the highest upstream layer
+        assert registry["orders_helper"].layer == ModelLayer.CANONICAL
+
+    def test_plan_waves_follow_dependencies(self):
+        planner = BackfillPlanner(registry_from_manifest(self.MANIFEST))
+        plan = planner.plan("t1", "shopify", date(2024, 1, 1), date(2024, 1, 7))
+        assert plan.execution_waves == [
+            ["stg_shopify_orders"], ["orders"], ["orders_helper"], ["mart_revenue"],
+        ]
+        assert [s.model_name for s in plan.execution_steps].index("orders_helper") < \
+            [s.model_name for s in plan.execution_steps].index("mart_revenue")
+
+    def test_load_from_file_and_fallback(self, tmp_path):
+        import json
+
+        path = tmp_path / "manifest.json"
+        path.write_text(json.dumps(self.MANIFEST))
+        assert "mart_revenue" in load_manifest_registry(str(path))
+        assert load_manifest_registry(str(tmp_path / "missing.json")) is None
+        assert BackfillPlanner.from_manifest(str(tmp_path / "missing.json")).registry is MODEL_REGISTRY
+
+
+_PIPELINE_REGISTRY = {
+    "stg_shopify_orders": DbtModel("stg_shopify_orders", ModelLayer.STAGING, "view"),
+    "orders": DbtModel("orders", ModelLayer.CANONICAL, "incremental",
+                       depends_on=("stg_shopify_orders",)),
+    "mart_revenue": DbtModel("mart_revenue", ModelLayer.MARTS, "table",
+                             depends_on=("orders",)),
+}
+
+
+def _chunk_job(idx, metadata=None):
+    return BackfillJob(
+        id=f"job_{idx}",
+        backfill_request_id="req_1",
+        tenant_id="t1",
+        source_system="shopify",
+        chunk_start_date=date(2024, 1, 1) + timedelta(days=7 * idx),
+        chunk_end_date=date(2024, 1, 7) + timedelta(days=7 * idx),
+        chunk_index=idx,
+        status=BackfillJobStatus.QUEUED,
+        attempt=0,
+        max_retries=3,
+        job_metadata=metadata,
+    )
+
+
+class TestBackfillExecutorPipeline:
+    """Chunks run as one pipelined model DAG with per-model checkpoints."""
+
+    def _executor(self, fail=None):
+        executor = BackfillExecutor(MagicMock(), session_factory=MagicMock())
+        executor._planner = BackfillPlanner(_PIPELINE_REGISTRY)
+        executor._update_parent_status = MagicMock()
+        calls = []
+
+        async def fake_execute_model(job, model_name):
+            calls.append(("start", job.chunk_index, model_name))
+            await asyncio.sleep(0.01)
+            calls.append(("end", job.chunk_index, model_name))
+            if fail and fail == (job.chunk_index, model_name):
+                return MagicMock(is_successful=False, error_message="dbt error")
+            return MagicMock(is_successful=True, rows_affected=1)
+
+        executor._execute_model = fake_execute_model
+        return executor, calls
+
+    @pytest.mark.asyncio
+    async def test_pipelines_chunks_and_checkpoints(self):
+        executor, calls = self._executor()
+        jobs = [_chunk_job(0), _chunk_job(1)]
+
+        await executor.execute_jobs(jobs)
+
+        assert all(j.status == BackfillJobStatus.SUCCESS for j in jobs)
+        assert jobs[0].job_metadata["completed_models"] == [
+            "mart_revenue", "orders", "stg_shopify_orders",
+        ]
+        # Chunk 1 staging starts before chunk 0's mart finishes
+        assert calls.index(("start", 1, "stg_shopify_orders")) < calls.index(("end", 0, "mart_revenue"))
+        # Same model never runs for two chunks at once
+        assert calls.index(("end", 0, "orders")) < calls.index(("start", 1, "orders"))
+        executor._update_parent_status.assert_called_once_with("req_1")
+
+    @pytest.mark.asyncio
+    async def test_failed_model_skips_downstream_only_in_its_chunk(self):
+        executor, calls = self._executor(fail=(0, "orders"))
+        jobs = [_chunk_job(0), _chunk_job(1)]
+
+        await executor.execute_jobs(jobs)
+
+        assert jobs[0].status == BackfillJobStatus.QUEUED  # retry scheduled
+        assert "orders: dbt error" in jobs[0].error_message
+        assert jobs[0].job_metadata["completed_models"] == ["stg_shopify_orders"]
+        assert ("start", 0, "mart_revenue") not in calls
+        assert jobs[1].status == BackfillJobStatus.SUCCESS
+
+    @pytest.mark.asyncio
+    async def test_retry_resumes_from_checkpoint(self):
+        executor, calls = self._executor()
+        job = _chunk_job(0, metadata={"completed_models": ["stg_shopify_orders"]})
+
+        await executor.execute_job(job)
+
+        started = [model for event, _, model in calls if event == "start"]
+        assert started == ["orders", "mart_revenue"]
+        assert job.status == BackfillJobStatus.SUCCESS
+
+    @pytest.mark.asyncio
+    async def test_warehouse_concurrency_bound(self):
+        executor, _ = self._executor()
+        running = peak = 0
+
+        async def tracking_execute_model(job, model_name):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return MagicMock(is_successful=True, rows_affected=0)
+
+        executor._execute_model = tracking_execute_model
+        with patch("src.services.backfill_executor.WAREHOUSE_CONCURRENCY", 2):
+            await executor.execute_jobs([_chunk_job(i) for i in range(4)])
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_chunk_marked_running_when_its_first_model_starts(self):
+        executor, _ = self._executor()
+        jobs = [_chunk_job(0), _chunk_job(1)]
+        seen = []
+
+        async def recording_execute_model(job, model_name):
+            seen.append((job.chunk_index, model_name, [j.status for j in jobs]))
+            return MagicMock(is_successful=True, rows_affected=0)
+
+        executor._execute_model = recording_execute_model
+        with patch("src.services.backfill_executor.WAREHOUSE_CONCURRENCY", 1):
+            await executor.execute_jobs(jobs)
+
+        assert seen[0] == (
+            0, "stg_shopify_orders", [BackfillJobStatus.RUNNING, BackfillJobStatus.QUEUED],
+        )
+        assert all(j.attempt == 1 and j.started_at is not None for j in jobs)
+
+    @pytest.mark.asyncio
+    async def test_progress_persisted_without_committing_shared_session(self):
+        executor, _ = self._executor()
+        session = executor._session_factory.return_value
+
+        await executor.execute_jobs([_chunk_job(0)])
+
+        # One final commit on the shared session; start and 3 checkpoints on their own
+        executor.db.commit.assert_called_once()
+        assert session.commit.call_count == 4
+        assert session.close.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_each_dbt_invocation_gets_its_own_target_path(self):
+        executor = BackfillExecutor(MagicMock(), session_factory=MagicMock())
+        service = MagicMock()
+        service.analytics_dir = Path("/nonexistent")
+        service.execute_backfill = AsyncMock(return_value=MagicMock(is_successful=True))
+
+        with patch("src.services.backfill_service.BackfillService", return_value=service):
+            await executor._execute_model(_chunk_job(0), "orders")
+            await executor._execute_model(_chunk_job(0), "orders")
+
+        paths = [c.kwargs["target_path"] for c in service.execute_backfill.call_args_list]
+        assert len(set(paths)) == 2
+        assert not any(Path(p).exists() for p in paths)
+
+    def test_pick_next_jobs_adds_following_chunks(self):
+        mock_db = MagicMock()
+        executor = BackfillExecutor(mock_db)
+        first, second = _chunk_job(0), _chunk_job(1)
+        executor.pick_next_job = MagicMock(return_value=first)
+        mock_db.query.return_value.filter.return_value.order_by.return_value \
+            .limit.return_value.all.return_value = [second]
+
+        assert executor.pick_next_jobs(limit=3) == [first, second]
+        mock_db.query.return_value.filter.return_value.order_by.return_value \
+            .limit.assert_called_once_with(2)
+
+
 class TestBackfillWorkerStats:
     """Tests for the worker stats dataclass."""
 
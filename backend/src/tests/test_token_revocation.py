@@ -364,7 +364,7 @@ class TestProactiveRefresh:
 
     @pytest.mark.asyncio
     @patch("src.services.token_manager.encrypt_secret", new_callable=AsyncMock)
-    @patch("src.services.token_manager.decrypt_secret", new_callable=AsyncMock)
+    @patch("src.services.credential_vault.decrypt_secret", new_callable=AsyncMock)
     async def test_refresh_expiring_credential(self, mock_decrypt, mock_encrypt):
         """Credentials expiring within threshold should be refreshed."""
         expires_soon = (
@@ -441,7 +441,7 @@ class TestReactiveRefresh:
 
     @pytest.mark.asyncio
     @patch("src.services.token_manager.encrypt_secret", new_callable=AsyncMock)
-    @patch("src.services.token_manager.decrypt_secret", new_callable=AsyncMock)
+    @patch("src.services.credential_vault.decrypt_secret", new_callable=AsyncMock)
     @patch("src.platform.audit.log_system_audit_event_sync")
     async def test_reactive_refresh_success(
         self, mock_audit, mock_decrypt, mock_encrypt
@@ -501,7 +501,7 @@ class TestReactiveRefresh:
         assert outcome.result == RefreshResult.SKIPPED_REVOKED
 
     @pytest.mark.asyncio
-    @patch("src.services.token_manager.decrypt_secret", new_callable=AsyncMock)
+    @patch("src.services.credential_vault.decrypt_secret", new_callable=AsyncMock)
     @patch("src.platform.audit.log_system_audit_event_sync")
     async def test_reactive_refresh_no_refresh_token(
         self, mock_audit, mock_decrypt
@@ -575,7 +575,7 @@ class TestRefreshBackoff:
         assert cred.status == CredentialStatus.EXPIRED
 
     @pytest.mark.asyncio
-    @patch("src.services.token_manager.decrypt_secret", new_callable=AsyncMock)
+    @patch("src.services.credential_vault.decrypt_secret", new_callable=AsyncMock)
     @patch("src.platform.audit.log_system_audit_event_sync")
     async def test_backoff_skips_if_too_soon(self, mock_audit, mock_decrypt):
         """Refresh should be skipped if within backoff window."""
@@ -605,7 +605,7 @@ class TestRefreshBackoff:
 
     @pytest.mark.asyncio
     @patch("src.services.token_manager.encrypt_secret", new_callable=AsyncMock)
-    @patch("src.services.token_manager.decrypt_secret", new_callable=AsyncMock)
+    @patch("src.services.credential_vault.decrypt_secret", new_callable=AsyncMock)
     @patch("src.platform.audit.log_system_audit_event_sync")
     async def test_backoff_allows_after_window(
         self, mock_audit, mock_decrypt, mock_encrypt
@@ -641,7 +641,7 @@ class TestRefreshBackoff:
         mock_decrypt.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch("src.services.token_manager.decrypt_secret", new_callable=AsyncMock)
+    @patch("src.services.credential_vault.decrypt_secret", new_callable=AsyncMock)
     @patch("src.platform.audit.log_system_audit_event_sync")
     async def test_refresh_failure_increments_error_count(
         self, mock_audit, mock_decrypt
@@ -670,7 +670,7 @@ class TestRefreshBackoff:
         assert cred.credential_metadata["refresh_error_count"] == 1
 
     @pytest.mark.asyncio
-    @patch("src.services.token_manager.decrypt_secret", new_callable=AsyncMock)
+    @patch("src.services.credential_vault.decrypt_secret", new_callable=AsyncMock)
     @patch("src.platform.audit.log_system_audit_event_sync")
     async def test_permanent_failure_on_unsupported_source(
         self, mock_audit, mock_decrypt
@@ -737,7 +737,7 @@ class TestTokenExpiryUpdate:
 
     @pytest.mark.asyncio
     @patch("src.services.token_manager.encrypt_secret", new_callable=AsyncMock)
-    @patch("src.services.token_manager.decrypt_secret", new_callable=AsyncMock)
+    @patch("src.services.credential_vault.decrypt_secret", new_callable=AsyncMock)
     @patch("src.platform.audit.log_system_audit_event_sync")
     async def test_refresh_resets_error_count(
         self, mock_audit, mock_decrypt, mock_encrypt
@@ -768,7 +768,7 @@ class TestTokenExpiryUpdate:
 
     @pytest.mark.asyncio
     @patch("src.services.token_manager.encrypt_secret", new_callable=AsyncMock)
-    @patch("src.services.token_manager.decrypt_secret", new_callable=AsyncMock)
+    @patch("src.services.credential_vault.decrypt_secret", new_callable=AsyncMock)
     @patch("src.platform.audit.log_system_audit_event_sync")
     async def test_refresh_clears_last_error(
         self, mock_audit, mock_decrypt, mock_encrypt
@@ -909,7 +909,7 @@ class TestEdgeCases:
     """Edge case and security tests."""
 
     @pytest.mark.asyncio
-    @patch("src.services.token_manager.decrypt_secret", new_callable=AsyncMock)
+    @patch("src.services.credential_vault.decrypt_secret", new_callable=AsyncMock)
     @patch("src.platform.audit.log_system_audit_event_sync")
     async def test_decrypt_failure_returns_permanent(
         self, mock_audit, mock_decrypt
@@ -934,7 +934,7 @@ class TestEdgeCases:
 
     @pytest.mark.asyncio
     @patch("src.services.token_manager.encrypt_secret", new_callable=AsyncMock)
-    @patch("src.services.token_manager.decrypt_secret", new_callable=AsyncMock)
+    @patch("src.services.credential_vault.decrypt_secret", new_callable=AsyncMock)
     @patch("src.platform.audit.log_system_audit_event_sync")
     async def test_encrypt_failure_returns_retryable(
         self, mock_audit, mock_decrypt, mock_encrypt
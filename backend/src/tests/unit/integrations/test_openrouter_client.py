@@ -7,15 +7,22 @@ Tests cover:
 - Model listing
 - Error handling for various HTTP status codes
 - Timeout and connection error handling
+- Streamed chat completions
+- Shared client registry and per-model in-flight cap
 """
 
+import asyncio
+import json
+
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 
 import httpx
 
+from src.integrations.openrouter import client as client_module
 from src.integrations.openrouter.client import (
     OpenRouterClient,
+    close_openrouter_clients,
     get_openrouter_client,
     DEFAULT_BASE_URL,
 )
@@ -30,7 +37,9 @@ from src.integrations.openrouter.exceptions import (
 )
 from src.integrations.openrouter.models import (
     ChatMessage,
+    ChatCompletionChunk,
     ChatCompletionResponse,
+    StreamedCompletion,
     TokenUsage,
     ModelInfo,
 )
@@ -182,6 +191,218 @@ class TestOpenRouterClientChatCompletion:
                 await client.chat_completion(messages=messages, model="openai/gpt-4")
 
 
+def _sse_body(*events):
+    lines = [f"data: {json.dumps(e)}" for e in events] + ["data: [DONE]"]
+    return ("\n\n".join(lines) + "\n\n").encode()
+
+
+def _use_transport(client, handler):
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestOpenRouterClientStreamChatCompletion:
+    """Tests for streamed chat completions."""
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_chunks_and_usage(self, client):
+        """Should send stream flags and yield one chunk per event."""
+        sent = {}
+
+        def handler(request):
+            sent.update(json.loads(request.content))
+            return httpx.Response(200, content=_sse_body(
+                {"model": "gpt-4", "choices": [{"delta": {"role": "assistant", "content": "Hel"}}]},
+                {"model": "gpt-4", "choices": [{"delta": {"content": "lo"}, "finish_reason": "stop"}]},
+                {"model": "gpt-4", "choices": [],
+                 "usage": {"prompt_tokens": 7, "completion_tokens": 2, "total_tokens": 9}},
+            ), headers={"content-type": "text/event-stream"})
+
+        _use_transport(client, handler)
+        completion = StreamedCompletion()
+        contents = []
+        async for chunk in client.stream_chat_completion(
+            messages=[ChatMessage(role="user", content="Hi")], model="gpt-4",
+        ):
+            contents.append(chunk.content)
+            completion.add(chunk)
+
+        assert sent["stream"] is True
+        assert sent["stream_options"] == {"include_usage": True}
+        assert contents == ["Hel", "lo", ""]
+        assert completion.content == "Hello"
+        assert completion.finish_reason == "stop"
+        assert completion.input_tokens == 7
+        assert completion.output_tokens == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_error_status_raises_before_first_chunk(self, client):
+        """HTTP errors should map to the same exceptions as chat_completion."""
+        _use_transport(client, lambda request: httpx.Response(
+            429, json={"error": {"message": "Rate limited"}}, headers={"Retry-After": "30"},
+        ))
+
+        with pytest.raises(OpenRouterRateLimitError):
+            async for _ in client.stream_chat_completion(
+                messages=[ChatMessage(role="user", content="Hi")], model="gpt-4",
+            ):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_stream_mid_stream_error_raises(self, client):
+        """An error event after chunks were sent should raise."""
+        _use_transport(client, lambda request: httpx.Response(200, content=_sse_body(
+            {"choices": [{"delta": {"content": "Hel"}}]},
+            {"error": {"message": "provider overloaded", "code": 502}},
+        )))
+
+        received = []
+        with pytest.raises(OpenRouterError, match="provider overloaded"):
+            async for chunk in client.stream_chat_completion(
+                messages=[ChatMessage(role="user", content="Hi")], model="gpt-4",
+            ):
+                received.append(chunk.content)
+        assert received == ["Hel"]
+
+    def test_streamed_completion_accumulates_tool_calls(self):
+        """Tool call fragments should be joined by index."""
+        completion = StreamedCompletion()
+        for data in [
+            {"choices": [{"delta": {"tool_calls": [
+                {"index": 0, "id": "call_a", "function": {"name": "get_kpis", "arguments": ""}},
+                {"index": 1, "id": "call_b", "function": {"name": "get_top_products", "arguments": '{"lim'}},
+            ]}}]},
+            {"choices": [{"delta": {"tool_calls": [
+                {"index": 1, "function": {"arguments": 'it": 3}'}},
+            ]}, "finish_reason": "tool_calls"}]},
+        ]:
+            completion.add(ChatCompletionChunk.from_dict(data))
+
+        calls = completion.tool_calls
+        assert [(c.id, c.name) for c in calls] == [
+            ("call_a", "get_kpis"), ("call_b", "get_top_products"),
+        ]
+        assert calls[0].arguments == "{}"
+        assert json.loads(calls[1].arguments) == {"limit": 3}
+        assert completion.finish_reason == "tool_calls"
+
+
+@pytest.fixture
+def empty_registry():
+    """Isolate tests from shared clients created elsewhere."""
+    client_module._clients.clear()
+    yield
+    client_module._clients.clear()
+
+
+class TestOpenRouterClientPool:
+    """Tests for the shared client registry and connection settings."""
+
+    def test_shared_client_is_reused(self, mock_env, empty_registry):
+        """Same key and base URL should return the same pooled client."""
+        first = get_openrouter_client()
+        assert get_openrouter_client() is first
+        assert get_openrouter_client(base_url=DEFAULT_BASE_URL + "/") is first
+        assert first.max_in_flight_per_model == client_module.OPENROUTER_MODEL_CONCURRENCY
+
+    def test_different_key_gets_own_client(self, mock_env, empty_registry):
+        """An API key override should not share the default client."""
+        assert get_openrouter_client(api_key="sk-other") is not get_openrouter_client()
+
+    def test_missing_key_is_not_cached(self, monkeypatch, empty_registry):
+        """A failed construction should leave the registry empty."""
+        monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+        with pytest.raises(ValueError):
+            get_openrouter_client()
+        assert client_module._clients == {}
+
+    @pytest.mark.asyncio
+    async def test_close_clears_registry(self, mock_env, empty_registry):
+        """Shutdown should close every shared client."""
+        shared = get_openrouter_client()
+        await close_openrouter_clients()
+
+        assert shared._client.is_closed
+        assert get_openrouter_client() is not shared
+
+    def test_each_event_loop_gets_own_client(self, mock_env, empty_registry):
+        """Successive asyncio.run() calls must not share a pool bound to a closed loop."""
+        async def shared_client():
+            client = get_openrouter_client()
+            assert get_openrouter_client() is client
+            await asyncio.sleep(0)  # let the close of a dropped client run
+            return client
+
+        first = asyncio.run(shared_client())
+        second = asyncio.run(shared_client())
+
+        assert second is not first
+        assert first._client.is_closed
+        assert first not in client_module._clients.values()
+
+    @pytest.mark.asyncio
+    async def test_close_leaves_other_running_loops(self, mock_env, empty_registry):
+        """Shutdown of one loop should not close a client another loop is using."""
+        other_loop = MagicMock(is_closed=MagicMock(return_value=False))
+        other = OpenRouterClient()
+        client_module._clients[("sk-test-key-12345", DEFAULT_BASE_URL, other_loop)] = other
+
+        await close_openrouter_clients()
+
+        assert not other._client.is_closed
+        await other.close()
+
+    def test_http2_falls_back_without_h2(self, mock_env, monkeypatch):
+        """HTTP/2 should only be enabled when h2 is importable."""
+        monkeypatch.setattr(client_module, "_http2_available", lambda: False)
+        assert OpenRouterClient(http2=True).http2 is False
+
+    @pytest.mark.asyncio
+    async def test_in_flight_cap_per_model(self, mock_env):
+        """Requests beyond the cap should wait; other models are unaffected."""
+        client = OpenRouterClient(max_in_flight_per_model=2)
+        active = {"gpt-4": 0, "claude": 0}
+        peak = {"gpt-4": 0, "claude": 0}
+        release = asyncio.Event()
+
+        async def handler(request):
+            model = json.loads(request.content)["model"]
+            active[model] += 1
+            peak[model] = max(peak[model], active[model])
+            await release.wait()
+            active[model] -= 1
+            return httpx.Response(200, json={
+                "id": "x", "model": model, "choices": [], "usage": {},
+            })
+
+        _use_transport(client, handler)
+        messages = [ChatMessage(role="user", content="Hi")]
+        tasks = [
+            asyncio.create_task(client.chat_completion(messages=messages, model=model))
+            for model in ["gpt-4"] * 4 + ["claude"]
+        ]
+        await asyncio.sleep(0.05)
+        assert active == {"gpt-4": 2, "claude": 1}
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert peak == {"gpt-4": 2, "claude": 1}
+
+
+    def test_in_flight_cap_works_across_event_loops(self, mock_env):
+        """Per-model semaphores should not stay bound to the first loop that waited on them."""
+        client = OpenRouterClient(max_in_flight_per_model=1)
+
+        async def contend():
+            async def hold():
+                async with client._model_slot("gpt-4"):
+                    await asyncio.sleep(0.01)
+
+            await asyncio.gather(hold(), hold())
+
+        asyncio.run(contend())
+        asyncio.run(contend())
+
+
 class TestOpenRouterClientListModels:
     """Tests for model listing."""
 
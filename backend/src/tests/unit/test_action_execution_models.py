@@ -524,6 +524,27 @@ class TestActionJobModel:
         sample_job.finalize(actions_succeeded=1, actions_failed=2)
         assert sample_job.actions_failed == 2
 
+    def test_claim_sets_running_and_lease(self, sample_job):
+        """claim() should mark running and record the lease owner/expiry."""
+        sample_job.claim("worker-1", lease_seconds=300)
+
+        assert sample_job.status == ActionJobStatus.RUNNING
+        assert sample_job.lease_owner == "worker-1"
+        assert sample_job.heartbeat_at is not None
+        assert not sample_job.is_lease_expired()
+
+    def test_requeue_clears_lease(self, sample_job):
+        """requeue() should return the job to QUEUED without a lease."""
+        sample_job.claim("worker-1", lease_seconds=0)
+        assert sample_job.is_lease_expired()
+
+        sample_job.requeue()
+
+        assert sample_job.status == ActionJobStatus.QUEUED
+        assert sample_job.lease_owner is None
+        assert sample_job.lease_expires_at is None
+        assert sample_job.started_at is None
+
 
 # =============================================================================
 # Enum Tests
@@ -85,7 +85,7 @@ class TestAlertEvaluationWorkerRun:
         call_count = 0
 
         with patch("src.jobs.alert_evaluation_job.AlertRuleService") as MockService:
-            def service_factory(db, tenant_id):
+            def service_factory(db, tenant_id, **kwargs):
                 nonlocal call_count
                 call_count += 1
                 mock_svc = MagicMock()
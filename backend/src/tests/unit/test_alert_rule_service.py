@@ -234,6 +234,18 @@ class TestGetMetricValue:
     def test_returns_none_for_unknown_metric(self, service, mock_db):
         assert service._get_metric_value("unknown_metric") is None
 
+    def test_budget_pace_ratio_uses_precomputed_pacing(self, mock_db, tenant_id):
+        svc = AlertRuleService(
+            mock_db, tenant_id,
+            pacing=[{"pace_ratio": 0.9}, {"pace_ratio": 1.4}],
+        )
+        assert svc._get_metric_value("budget_pace_ratio") == 1.4
+        mock_db.execute.assert_not_called()
+
+    def test_budget_pace_ratio_none_without_budgets(self, mock_db, tenant_id):
+        svc = AlertRuleService(mock_db, tenant_id, pacing=[])
+        assert svc._get_metric_value("budget_pace_ratio") is None
+
     def test_weekly_period_passes_weekly_type(self, service, mock_db):
         mock_row = Mock()
         mock_row.gross_roas = 4.2
@@ -0,0 +1,237 @@
+"""
+Unit tests for AnalyticsAgent streaming and parallel tool execution.
+
+Covers concurrent tool calls on per-call sessions, tool timeouts, the
+run_stream event sequence, and fallback before the first token.
+"""
+
+import json
+import threading
+import time
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.agents.analytics_agent import AnalyticsAgent
+from src.integrations.openrouter.exceptions import OpenRouterRateLimitError
+from src.integrations.openrouter.models import (
+    ChatCompletionChunk,
+    ChatMessage,
+    ToolCall,
+    ToolCallDelta,
+    TokenUsage,
+)
+
+
+def _model(model_id):
+    return SimpleNamespace(
+        model_id=model_id,
+        calculate_cost=lambda i, o: Decimal("0.001") * (i + o),
+    )
+
+
+def _text_chunks(*parts, input_tokens=10, output_tokens=5):
+    chunks = [ChatCompletionChunk(content=p) for p in parts]
+    chunks.append(ChatCompletionChunk(
+        finish_reason="stop",
+        usage=TokenUsage(input_tokens, output_tokens, input_tokens + output_tokens),
+    ))
+    return chunks
+
+
+def _tool_call_chunks(*names):
+    return [
+        ChatCompletionChunk(tool_calls=[
+            ToolCallDelta(index=i, id=f"call_{i}", name=name, arguments="{}")
+            for i, name in enumerate(names)
+        ], finish_reason="tool_calls", usage=TokenUsage(20, 3, 23)),
+    ]
+
+
+class FakeStreamingClient:
+    """Serves one scripted turn per stream_chat_completion call.
+
+    A turn is a list of chunks, or an exception raised before any chunk.
+    """
+
+    def __init__(self, *turns):
+        self.turns = list(turns)
+        self.calls = []
+
+    async def stream_chat_completion(self, messages, model, **kwargs):
+        self.calls.append({"model": model, "messages": list(messages), **kwargs})
+        turn = self.turns.pop(0)
+        if isinstance(turn, Exception):
+            raise turn
+        for chunk in turn:
+            yield chunk
+
+
+def _agent(client, session_factory=None, fallback=None, **kwargs):
+    return AnalyticsAgent(
+        client=client,
+        primary_model=_model("primary/model"),
+        fallback_model=fallback,
+        db=MagicMock(),
+        tenant_id="tenant-1",
+        session_factory=session_factory,
+        **kwargs,
+    )
+
+
+async def _collect(agent):
+    messages = [ChatMessage(role="user", content="How did we do?")]
+    return [event async for event in agent.run_stream(messages=messages)]
+
+
+class TestParallelTools:
+
+    @pytest.mark.asyncio
+    async def test_tools_run_concurrently_on_own_sessions(self):
+        sessions = []
+
+        def session_factory():
+            session = MagicMock()
+            sessions.append(session)
+            return session
+
+        # Each tool waits for the other: only passes if both run at once
+        barrier = threading.Barrier(2, timeout=2)
+
+        def fake_execute(call, tenant_id, db):
+            barrier.wait()
+            return json.dumps({"result": call.name, "db": id(db)})
+
+        agent = _agent(MagicMock(), session_factory=session_factory)
+        calls = [
+            ToolCall(id="a", name="get_revenue_breakdown", arguments="{}"),
+            ToolCall(id="b", name="query_marketing_metrics", arguments="{}"),
+        ]
+        with patch("src.agents.analytics_agent._execute_tool", side_effect=fake_execute):
+            runs = await agent._execute_tools(calls)
+
+        assert [json.loads(r.result)["result"] for r in runs] == [
+            "get_revenue_breakdown", "query_marketing_metrics",
+        ]
+        assert len({json.loads(r.result)["db"] for r in runs}) == 2
+        assert all(s.close.called for s in sessions)
+        assert not any(r.timed_out for r in runs)
+
+    @pytest.mark.asyncio
+    async def test_slow_tool_times_out(self):
+        def fake_execute(call, tenant_id, db):
+            if call.name == "slow":
+                time.sleep(0.5)
+            return json.dumps({"result": "ok"})
+
+        agent = _agent(MagicMock(), session_factory=MagicMock, tool_timeout=0.05)
+        calls = [
+            ToolCall(id="a", name="slow", arguments="{}"),
+            ToolCall(id="b", name="fast", arguments="{}"),
+        ]
+        with patch("src.agents.analytics_agent._execute_tool", side_effect=fake_execute):
+            slow, fast = await agent._execute_tools(calls)
+
+        assert slow.timed_out
+        assert "timed out" in json.loads(slow.result)["error"]
+        assert json.loads(fast.result) == {"result": "ok"}
+
+    @pytest.mark.asyncio
+    async def test_without_session_factory_tools_share_request_session(self):
+        agent = _agent(MagicMock())
+        seen = []
+
+        def fake_execute(call, tenant_id, db):
+            seen.append(db)
+            return "{}"
+
+        calls = [ToolCall(id=str(i), name="t", arguments="{}") for i in range(3)]
+        with patch("src.agents.analytics_agent._execute_tool", side_effect=fake_execute):
+            await agent._execute_tools(calls)
+
+        assert seen == [agent._db] * 3
+
+
+class TestRunStream:
+
+    @pytest.mark.asyncio
+    async def test_streams_deltas_then_done(self):
+        client = FakeStreamingClient(_text_chunks("Revenue ", "is up."))
+
+        events = await _collect(_agent(client))
+
+        assert [e["type"] for e in events] == ["delta", "delta", "span", "done"]
+        assert "".join(e["content"] for e in events if e["type"] == "delta") == "Revenue is up."
+        span = events[2]
+        assert span["phase"] == "llm"
+        assert span["detail"]["model"] == "primary/model"
+        assert span["detail"]["first_token_ms"] is not None
+        done = events[-1]
+        assert done["model_id"] == "primary/model"
+        assert done["total_tokens"] == 15
+        assert done["cost_usd"] == "0.015"
+        assert done["tool_calls_made"] == 0
+        assert done["was_fallback"] is False
+
+    @pytest.mark.asyncio
+    async def test_tool_turn_feeds_results_back(self):
+        client = FakeStreamingClient(
+            _tool_call_chunks("get_revenue_breakdown", "get_attribution_by_channel"),
+            _text_chunks("Done."),
+        )
+
+        with patch(
+            "src.agents.analytics_agent._execute_tool",
+            side_effect=lambda call, tenant_id, db: json.dumps({"result": call.name}),
+        ):
+            events = await _collect(_agent(client, session_factory=MagicMock))
+
+        types = [e["type"] for e in events]
+        assert types == ["span", "tool_calls", "span", "delta", "span", "done"]
+        assert events[1]["tools"] == ["get_revenue_breakdown", "get_attribution_by_channel"]
+        assert events[2]["phase"] == "tools"
+        assert [t["name"] for t in events[2]["detail"]["tools"]] == events[1]["tools"]
+
+        second_turn = client.calls[1]["messages"]
+        assert [m.role for m in second_turn[-3:]] == ["assistant", "tool", "tool"]
+        assert second_turn[-1].tool_call_id == "call_1"
+        assert events[-1]["tool_calls_made"] == 2
+        assert events[-1]["input_tokens"] == 30
+
+    @pytest.mark.asyncio
+    async def test_falls_back_before_first_token(self):
+        client = FakeStreamingClient(
+            OpenRouterRateLimitError("Rate limited"),
+            _text_chunks("From fallback."),
+        )
+
+        events = await _collect(_agent(client, fallback=_model("fallback/model")))
+
+        assert [c["model"] for c in client.calls] == ["primary/model", "fallback/model"]
+        done = events[-1]
+        assert done["model_id"] == "fallback/model"
+        assert done["was_fallback"] is True
+        assert done["fallback_reason"] == "OpenRouterRateLimitError"
+
+    @pytest.mark.asyncio
+    async def test_no_fallback_after_text_was_sent(self):
+        class FailingMidStream(FakeStreamingClient):
+            async def stream_chat_completion(self, messages, model, **kwargs):
+                self.calls.append({"model": model})
+                yield ChatCompletionChunk(content="Partial")
+                raise OpenRouterRateLimitError("Rate limited")
+
+        client = FailingMidStream()
+        agent = _agent(client, fallback=_model("fallback/model"))
+
+        received = []
+        with pytest.raises(OpenRouterRateLimitError):
+            async for event in agent.run_stream(
+                messages=[ChatMessage(role="user", content="Hi")],
+            ):
+                received.append(event)
+
+        assert received == [{"type": "delta", "content": "Partial"}]
+        assert len(client.calls) == 1
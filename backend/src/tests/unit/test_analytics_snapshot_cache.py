@@ -0,0 +1,208 @@
+"""
+Unit tests for the analytics snapshot cache.
+
+Covers data versioning, tenant scoping, Redis failure degradation, the
+cached chat snapshot, and tool result reuse in AnalyticsAgent.
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.agents.analytics_agent import AnalyticsAgent
+from src.integrations.openrouter.models import ToolCall
+from src.services.analytics_context_service import get_analytics_snapshot
+from src.services.analytics_snapshot_cache import (
+    SNAPSHOT_ENTRY,
+    AnalyticsSnapshotCache,
+    tool_cache_entry,
+)
+
+
+class FakeRedis:
+    """In-memory subset of the redis-py API used by the cache."""
+
+    def __init__(self):
+        self.values = {}
+        self.fail = False
+
+    def _check(self):
+        if self.fail:
+            raise ConnectionError("redis down")
+
+    def get(self, key):
+        self._check()
+        return self.values.get(key)
+
+    def mget(self, *keys):
+        self._check()
+        return [self.values.get(k) for k in keys]
+
+    def setex(self, key, ttl, value):
+        self._check()
+        self.values[key] = value
+
+    def incr(self, key):
+        self._check()
+        self.values[key] = str(int(self.values.get(key, 0)) + 1)
+        return int(self.values[key])
+
+
+def _revenue_row():
+    return SimpleNamespace(
+        gross_revenue=1000, net_revenue=900, order_count=10, aov=90,
+        gross_revenue_change_pct=5.0, order_count_change_pct=None,
+        aov_change_pct=None, currency="USD", period_start=None, period_end=None,
+    )
+
+
+def _mart_db(revenue_row=None, channel_rows=()):
+    db = MagicMock()
+    db.execute.return_value.fetchone.return_value = revenue_row
+    db.execute.return_value.fetchall.return_value = list(channel_rows)
+    return db
+
+
+class TestAnalyticsSnapshotCache:
+
+    def test_version_bumps_move_to_new_entries(self):
+        cache = AnalyticsSnapshotCache(redis_client=FakeRedis())
+        v1 = cache.data_version("tenant-a")
+        cache.set("tenant-a", v1, "snapshot", {"x": 1})
+
+        cache.bump_data_version()
+        v2 = cache.data_version("tenant-a")
+        cache.bump_data_version("tenant-a")
+        v3 = cache.data_version("tenant-a")
+
+        assert (v1, v2, v3) == ("0.0", "1.0", "1.1")
+        assert cache.get("tenant-a", v1, "snapshot") == (True, {"x": 1})
+        assert cache.get("tenant-a", v3, "snapshot") == (False, None)
+        # Per-tenant bumps leave other tenants' versions alone
+        assert cache.data_version("tenant-b") == "1.0"
+
+    def test_entries_are_tenant_scoped(self):
+        cache = AnalyticsSnapshotCache(redis_client=FakeRedis())
+        cache.set("tenant-a", "0.0", "snapshot", {"x": 1})
+        assert cache.get("tenant-b", "0.0", "snapshot") == (False, None)
+
+    def test_cached_none_is_a_hit(self):
+        cache = AnalyticsSnapshotCache(redis_client=FakeRedis())
+        cache.set("tenant-a", "0.0", "snapshot", None)
+        assert cache.get("tenant-a", "0.0", "snapshot") == (True, None)
+
+    def test_redis_errors_and_missing_redis_are_misses(self):
+        redis = FakeRedis()
+        cache = AnalyticsSnapshotCache(redis_client=redis)
+        redis.fail = True
+
+        assert cache.data_version("tenant-a") is None
+        assert cache.bump_data_version() is False
+        assert cache.set("tenant-a", "0.0", "snapshot", {}) is False
+        assert cache.get("tenant-a", "0.0", "snapshot") == (False, None)
+        assert AnalyticsSnapshotCache().data_version("tenant-a") is None
+
+    def test_tool_entry_ignores_argument_formatting(self):
+        assert tool_cache_entry("t", '{"a": 1, "b": 2}') == tool_cache_entry("t", '{"b":2,"a":1}')
+        assert tool_cache_entry("t", None) == tool_cache_entry("t", "{}")
+        assert tool_cache_entry("t", '{"a": 1}') != tool_cache_entry("t", '{"a": 2}')
+        assert tool_cache_entry("t", "{}") != tool_cache_entry("u", "{}")
+
+
+class TestCachedSnapshot:
+
+    def test_marts_are_read_once_per_data_version(self):
+        cache = AnalyticsSnapshotCache(redis_client=FakeRedis())
+        db = _mart_db(revenue_row=_revenue_row())
+
+        first = get_analytics_snapshot("tenant-a", db, cache=cache)
+        second = get_analytics_snapshot("tenant-a", db, cache=cache)
+
+        assert first == second
+        assert first["revenue"]["gross_revenue"] == "$1,000.00"
+        assert db.execute.call_count == 2  # revenue + channels, once
+
+        cache.bump_data_version()
+        get_analytics_snapshot("tenant-a", db, cache=cache)
+        assert db.execute.call_count == 4
+
+    def test_no_data_is_cached(self):
+        cache = AnalyticsSnapshotCache(redis_client=FakeRedis())
+        db = _mart_db()
+
+        assert get_analytics_snapshot("tenant-a", db, cache=cache) is None
+        assert get_analytics_snapshot("tenant-a", db, cache=cache) is None
+        assert db.execute.call_count == 2
+
+    def test_query_errors_are_not_cached(self):
+        redis = FakeRedis()
+        cache = AnalyticsSnapshotCache(redis_client=redis)
+        db = MagicMock()
+        db.execute.side_effect = RuntimeError("mart missing")
+
+        assert get_analytics_snapshot("tenant-a", db, cache=cache) is None
+        assert not any(SNAPSHOT_ENTRY in key for key in redis.values)
+
+
+class TestAgentToolCache:
+
+    def _agent(self, cache):
+        return AnalyticsAgent(
+            client=MagicMock(),
+            primary_model=MagicMock(),
+            fallback_model=None,
+            db=MagicMock(),
+            tenant_id="tenant-a",
+            cache=cache,
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeated_call_is_memoized_within_conversation(self):
+        agent = self._agent(AnalyticsSnapshotCache())
+        call = ToolCall(id="1", name="get_revenue_breakdown", arguments='{"period_type": "last_7_days"}')
+        same = ToolCall(id="2", name="get_revenue_breakdown", arguments='{"period_type":"last_7_days"}')
+
+        with patch(
+            "src.agents.analytics_agent._execute_tool", return_value='{"result": 1}',
+        ) as execute:
+            first = await agent._execute_tools([call])
+            second = await agent._execute_tools([same])
+
+        assert execute.call_count == 1
+        assert second[0].cached and second[0].call.id == "2"
+        assert second[0].result == first[0].result
+
+    @pytest.mark.asyncio
+    async def test_results_shared_across_agents_until_version_bump(self):
+        cache = AnalyticsSnapshotCache(redis_client=FakeRedis())
+        call = ToolCall(id="1", name="get_attribution_by_channel", arguments="{}")
+
+        with patch(
+            "src.agents.analytics_agent._execute_tool", return_value='{"result": []}',
+        ) as execute:
+            await self._agent(cache)._execute_tools([call])
+            runs = await self._agent(cache)._execute_tools([call])
+            assert execute.call_count == 1
+            assert runs[0].cached
+
+            cache.bump_data_version("tenant-a")
+            await self._agent(cache)._execute_tools([call])
+            assert execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self):
+        cache = AnalyticsSnapshotCache(redis_client=FakeRedis())
+        agent = self._agent(cache)
+        call = ToolCall(id="1", name="query_marketing_metrics", arguments="{}")
+
+        with patch(
+            "src.agents.analytics_agent._execute_tool",
+            side_effect=[json.dumps({"error": "Tool failed: boom"}), '{"result": 1}'],
+        ) as execute:
+            await agent._execute_tools([call])
+            runs = await agent._execute_tools([call])
+
+        assert execute.call_count == 2
+        assert runs[0].result == '{"result": 1}'
@@ -10,15 +10,22 @@ Tests cover:
 - Status thresholds (on_pace, slightly_over, over_budget)
 - Dollar-to-cents conversion from marketing_spend
 - Edge cases (zero budget, disabled budgets, no spend data)
+- Daily spend rollups (read path, fallback, refresh, batch pacing)
 """
 
 import uuid
-from datetime import date
+from datetime import date, datetime, timedelta, timezone
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
-
-from src.services.budget_pacing_service import BudgetPacingService
+from sqlalchemy.exc import ProgrammingError
+
+from src.services.budget_pacing_service import (
+    SPEND_ROLLUP_OVERLAP_MINUTES,
+    BudgetPacingService,
+    get_pacing_for_tenants,
+    refresh_spend_rollups,
+)
 from src.models.ad_budget import AdBudget
 
 
@@ -311,3 +318,149 @@ class TestGetPacing:
         assert len(result) == 1
         assert result[0]["spent_cents"] == 0
         assert result[0]["pct_spent"] == 0
+
+
+class TestSpendRollups:
+    """MTD spend comes from daily rollups, with a live fallback."""
+
+    def _budget_query(self, mock_db, budgets):
+        mock_query = MagicMock()
+        mock_query.filter.return_value = mock_query
+        mock_query.order_by.return_value = mock_query
+        mock_query.all.return_value = budgets
+        mock_db.query.return_value = mock_query
+
+    def _rows(self, *rows):
+        result = MagicMock()
+        result.fetchall.return_value = list(rows)
+        return result
+
+    def test_reads_rollups_without_scanning_marketing_spend(self, service, mock_db, sample_budget):
+        self._budget_query(mock_db, [sample_budget])
+        mock_db.execute.return_value = self._rows(Mock(source_platform="meta", total_spend="250.50"))
+
+        result = service.get_pacing()
+
+        assert result[0]["spent_cents"] == 25050
+        assert mock_db.execute.call_count == 1
+        assert "ad_spend_daily_rollups" in str(mock_db.execute.call_args[0][0])
+
+    def test_falls_back_to_marketing_spend_when_no_rollups(self, service, mock_db, sample_budget):
+        self._budget_query(mock_db, [sample_budget])
+        mock_db.execute.side_effect = [
+            self._rows(),
+            self._rows(Mock(source_platform="meta", total_spend="10.00")),
+        ]
+
+        result = service.get_pacing()
+
+        assert result[0]["spent_cents"] == 1000
+        assert "analytics.marketing_spend" in str(mock_db.execute.call_args[0][0])
+
+    def test_refresh_replaces_window_for_tenant(self, mock_db):
+        mock_db.execute.return_value = MagicMock(rowcount=4)
+
+        written = refresh_spend_rollups(mock_db, since=date(2026, 3, 1), tenant_id="t1")
+
+        assert written == 4
+        delete_sql, insert_sql = (str(c[0][0]) for c in mock_db.execute.call_args_list)
+        assert "DELETE FROM ad_spend_daily_rollups" in delete_sql
+        assert "tenant_id = :tenant_id" in insert_sql
+        assert mock_db.execute.call_args_list[0][0][1] == {"since": date(2026, 3, 1), "tenant_id": "t1"}
+        mock_db.commit.assert_called_once()
+
+    @patch("src.services.budget_pacing_service.date")
+    def test_first_refresh_starts_at_month_start(self, mock_date, mock_db):
+        mock_date.today.return_value = date(2026, 3, 2)
+        mock_db.execute.return_value = MagicMock(rowcount=0, **{"scalar.return_value": None})
+
+        refresh_spend_rollups(mock_db)
+
+        # No rollups yet; lookback crosses into February, so all of February is built
+        assert "MAX(updated_at)" in str(mock_db.execute.call_args_list[0][0][0])
+        assert mock_db.execute.call_args_list[1][0][1] == {"since": date(2026, 2, 1)}
+
+    def test_refresh_rebuilds_only_days_dbt_changed(self, mock_db):
+        last_refresh = datetime(2026, 3, 2, 6, 0, tzinfo=timezone.utc)
+        mock_db.execute.return_value = MagicMock(rowcount=2, **{"scalar.return_value": last_refresh})
+
+        written = refresh_spend_rollups(mock_db, tenant_id="t1")
+
+        assert written == 2
+        _, delete_call, insert_call = mock_db.execute.call_args_list
+        assert "dbt_updated_at > :updated_after" in str(delete_call[0][0])
+        assert "USING changed" in str(delete_call[0][0])
+        assert "JOIN changed" in str(insert_call[0][0])
+        assert delete_call[0][1] == {
+            "tenant_id": "t1",
+            "updated_after": last_refresh - timedelta(minutes=SPEND_ROLLUP_OVERLAP_MINUTES),
+        }
+
+    def test_refresh_rolls_back_on_error(self, mock_db):
+        mock_db.execute.side_effect = ProgrammingError(
+            "SELECT", {}, Exception("relation does not exist"),
+        )
+
+        with pytest.raises(ProgrammingError):
+            refresh_spend_rollups(mock_db)
+
+        mock_db.rollback.assert_called_once()
+        mock_db.commit.assert_not_called()
+
+    @patch("src.services.budget_pacing_service.date")
+    def test_batch_pacing_groups_by_tenant(self, mock_date, mock_db):
+        mock_date.today.return_value = date(2026, 3, 15)
+        budgets = [
+            AdBudget(id="b1", tenant_id="t1", source_platform="meta",
+                     budget_monthly_cents=100000, start_date=date(2026, 1, 1), enabled=True),
+            AdBudget(id="b2", tenant_id="t2", source_platform="google",
+                     budget_monthly_cents=50000, start_date=date(2026, 1, 1), enabled=True),
+        ]
+        self._budget_query(mock_db, budgets)
+        mock_db.execute.side_effect = [
+            self._rows(Mock(tenant_id="t1", source_platform="meta", total_spend="484.00")),
+            self._rows(),
+        ]
+
+        result = get_pacing_for_tenants(mock_db, ["t1", "t2"])
+
+        assert result["t1"][0]["spent_cents"] == 48400
+        assert result["t1"][0]["status"] == "on_pace"
+        assert result["t2"][0]["spent_cents"] == 0
+
+    def test_batch_pacing_falls_back_to_marketing_spend(self, mock_db):
+        budgets = [
+            AdBudget(id="b1", tenant_id="t1", source_platform="meta",
+                     budget_monthly_cents=100000, start_date=date(2026, 1, 1), enabled=True),
+            AdBudget(id="b2", tenant_id="t2", source_platform="google",
+                     budget_monthly_cents=50000, start_date=date(2026, 1, 1), enabled=True),
+        ]
+        self._budget_query(mock_db, budgets)
+        mock_db.execute.side_effect = [
+            self._rows(Mock(tenant_id="t1", source_platform="meta", total_spend="484.00")),
+            self._rows(Mock(tenant_id="t2", source_platform="google", total_spend="12.00")),
+        ]
+
+        result = get_pacing_for_tenants(mock_db, ["t1", "t2"])
+
+        rollup_call, fallback_call = mock_db.execute.call_args_list
+        assert rollup_call[0][1]["tenant_ids"] == ["t1", "t2"]
+        assert "analytics.marketing_spend" in str(fallback_call[0][0])
+        assert fallback_call[0][1]["tenant_ids"] == ["t2"]
+        assert result["t2"][0]["spent_cents"] == 1200
+
+    def test_batch_pacing_skips_fallback_when_all_have_rollups(self, mock_db):
+        budget = AdBudget(id="b1", tenant_id="t1", source_platform="meta",
+                          budget_monthly_cents=100000, start_date=date(2026, 1, 1), enabled=True)
+        self._budget_query(mock_db, [budget])
+        mock_db.execute.return_value = self._rows(
+            Mock(tenant_id="t1", source_platform="meta", total_spend="5.00"),
+        )
+
+        get_pacing_for_tenants(mock_db, ["t1"])
+
+        assert mock_db.execute.call_count == 1
+
+    def test_batch_pacing_empty_tenant_list(self, mock_db):
+        assert get_pacing_for_tenants(mock_db, []) == {}
+        mock_db.query.assert_not_called()
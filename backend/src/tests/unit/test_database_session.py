@@ -0,0 +1,193 @@
+"""
+Unit tests for database session management.
+
+Covers read-replica routing, async URL handling, pool settings, and the
+checkout wait / overflow metrics reported by the instrumented pools.
+"""
+
+import inspect
+import sqlite3
+import time
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, exc as sa_exc, text
+
+from src.database import session as db_session
+from src.database.pool_metrics import InstrumentedQueuePool, pool_metrics
+
+ENGINE_GLOBALS = (
+    "_engine",
+    "_SessionLocal",
+    "_replica_engine",
+    "_ReadSessionLocal",
+    "_async_engine",
+    "_AsyncSessionLocal",
+)
+
+
+@pytest.fixture
+def fresh_engines(monkeypatch, tmp_path):
+    """Empty engine singletons and file-backed SQLite primary/replica URLs."""
+    for name in ENGINE_GLOBALS:
+        monkeypatch.setattr(db_session, name, None)
+    for var in ("DB_POOL_SIZE", "DB_POOL_MAX_OVERFLOW", "DB_REPLICA_POOL_SIZE", "DATABASE_REPLICA_URL"):
+        monkeypatch.delenv(var, raising=False)
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'primary.db'}")
+    yield tmp_path
+    for engine in (db_session._engine, db_session._replica_engine):
+        if engine is not None:
+            engine.dispose()
+
+
+class TestReadRouting:
+
+    def test_reads_use_primary_without_replica(self, fresh_engines):
+        assert db_session.get_read_engine() is db_session.get_engine()
+        assert db_session.get_read_session_factory().kw["bind"] is db_session.get_engine()
+
+    def test_reads_use_replica_when_configured(self, fresh_engines, monkeypatch):
+        monkeypatch.setenv("DATABASE_REPLICA_URL", f"sqlite:///{fresh_engines / 'replica.db'}")
+        monkeypatch.setenv("DB_REPLICA_POOL_SIZE", "3")
+
+        read_engine = db_session.get_read_engine()
+
+        assert read_engine is not db_session.get_engine()
+        assert read_engine.url.database.endswith("replica.db")
+        assert read_engine.pool.size() == 3
+        assert db_session.get_engine().pool.size() == 20
+
+        session = next(db_session.get_read_db_session())
+        assert session.get_bind() is read_engine
+        session.close()
+
+    def test_read_dependency_is_503_without_database(self, fresh_engines, monkeypatch):
+        monkeypatch.delenv("DATABASE_URL")
+
+        with pytest.raises(HTTPException) as exc_info:
+            next(db_session.get_read_db_session())
+        assert exc_info.value.status_code == 503
+
+    def test_session_dependencies_are_sync_generators(self):
+        # FastAPI runs sync generator dependencies in its threadpool
+        assert inspect.isgeneratorfunction(db_session.get_db_session)
+        assert inspect.isgeneratorfunction(db_session.get_read_db_session)
+
+
+class TestUrls:
+
+    @pytest.mark.parametrize("url, expected", [
+        ("postgresql://u:p@db/app", "postgresql+asyncpg://u:p@db/app"),
+        ("postgresql+psycopg2://u:p@db/app", "postgresql+asyncpg://u:p@db/app"),
+        ("sqlite:///app.db", "sqlite:///app.db"),
+    ])
+    def test_async_url(self, url, expected):
+        assert db_session._async_url(url) == expected
+
+    def test_replica_url_normalized(self, monkeypatch):
+        monkeypatch.setenv("DATABASE_REPLICA_URL", "postgres://u:p@replica/app")
+
+        assert db_session._get_replica_url() == "postgresql://u:p@replica/app"
+
+    def test_replica_connections_are_read_only_on_postgres(self):
+        assert db_session._read_only_connect_args("postgresql://r/app") == {
+            "options": "-c default_transaction_read_only=on",
+        }
+        assert db_session._read_only_connect_args("sqlite:///r.db") == {}
+
+
+class TestAsyncSessions:
+
+    @pytest.mark.asyncio
+    async def test_async_dependency_is_503_without_database(self, fresh_engines, monkeypatch):
+        monkeypatch.delenv("DATABASE_URL")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await db_session.get_async_db_session().__anext__()
+        assert exc_info.value.status_code == 503
+
+    @pytest.mark.asyncio
+    async def test_async_engine_uses_asyncpg(self, fresh_engines, monkeypatch):
+        pytest.importorskip("asyncpg")
+        monkeypatch.setenv("DATABASE_URL", "postgres://u:p@db/app")
+
+        engine = db_session.get_async_engine()
+
+        assert engine.url.drivername == "postgresql+asyncpg"
+        assert "async_primary" in db_session.get_pool_metrics()
+        await db_session.close_async_engines()
+        assert db_session._async_engine is None
+
+
+class TestPoolMetrics:
+
+    def _engine(self, tmp_path, **pool):
+        return create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedQueuePool,
+            **pool,
+        )
+
+    def test_reports_checked_out_and_overflow(self, tmp_path):
+        engine = self._engine(tmp_path, pool_size=1, max_overflow=1)
+
+        first = engine.connect()
+        second = engine.connect()
+        metrics = pool_metrics(engine)
+        assert metrics["pool_class"] == "InstrumentedQueuePool"
+        assert metrics["size"] == 1
+        assert metrics["checked_out"] == 2
+        assert metrics["overflow"] == 1
+        assert metrics["checkouts"] == 2
+
+        first.close()
+        second.close()
+        assert pool_metrics(engine)["checked_out"] == 0
+        engine.dispose()
+
+    def test_records_checkout_timeouts(self, tmp_path):
+        engine = self._engine(tmp_path, pool_size=1, max_overflow=0, pool_timeout=0.05)
+
+        with engine.connect():
+            with pytest.raises(sa_exc.TimeoutError):
+                engine.connect()
+
+        metrics = pool_metrics(engine)
+        assert metrics["timeouts"] == 1
+        assert metrics["max_wait_ms"] >= 50
+        engine.dispose()
+
+    def test_connection_setup_is_not_counted_as_wait(self, tmp_path):
+        path = tmp_path / "pool.db"
+
+        def slow_connect():
+            time.sleep(0.05)
+            return sqlite3.connect(path)
+
+        engine = create_engine("sqlite://", poolclass=InstrumentedQueuePool, creator=slow_connect)
+        with engine.connect():
+            pass
+
+        metrics = pool_metrics(engine)
+        assert metrics["checkouts"] == 1
+        assert metrics["max_wait_ms"] < 25
+        engine.dispose()
+
+    def test_totals_survive_dispose(self, tmp_path):
+        engine = self._engine(tmp_path)
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        engine.dispose()
+
+        assert pool_metrics(engine)["checkouts"] == 1
+
+    def test_only_created_engines_are_listed(self, fresh_engines):
+        assert db_session.get_pool_metrics() == {}
+
+        with db_session.get_engine().connect():
+            pass
+
+        metrics = db_session.get_pool_metrics()
+        assert list(metrics) == ["primary"]
+        assert metrics["primary"]["checkouts"] == 1
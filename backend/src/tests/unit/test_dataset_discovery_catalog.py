@@ -0,0 +1,146 @@
+"""
+Unit tests for dataset discovery over the dataset catalog.
+
+Covers catalog upserts and ETags, column classification from catalog
+rows, in-process caching with ETag revalidation, and stale fallback
+when the catalog cannot be read.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.models.dataset_catalog import DatasetCatalogEntry
+from src.services.dataset_discovery_service import (
+    DatasetDiscoveryService,
+    read_catalog_etag,
+    upsert_catalog_entry,
+)
+
+ORDERS_COLUMNS = [
+    {"column_name": "order_date", "data_type": "DATE", "description": "Order day"},
+    {"column_name": "revenue", "data_type": "NUMERIC", "description": ""},
+    {"column_name": "channel", "data_type": "VARCHAR", "description": None},
+]
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    DatasetCatalogEntry.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def statements(db):
+    """SQL statements issued on the session's connection."""
+    issued = []
+    event.listen(
+        db.get_bind(), "before_cursor_execute",
+        lambda conn, cursor, statement, *args: issued.append(statement),
+    )
+    return issued
+
+
+def _seed(db, name="fact_orders_current", superset_id=7, columns=ORDERS_COLUMNS):
+    upsert_catalog_entry(db, name, superset_id, "semantic", f"{name} view", columns)
+    db.commit()
+
+
+class TestCatalogStore:
+
+    def test_upsert_skips_unchanged_entries(self, db):
+        assert upsert_catalog_entry(db, "fact_orders_current", 7, "semantic", "d", ORDERS_COLUMNS)
+        etag = read_catalog_etag(db)
+
+        assert not upsert_catalog_entry(db, "fact_orders_current", 7, "semantic", "d", ORDERS_COLUMNS)
+        assert read_catalog_etag(db) == etag
+
+        assert upsert_catalog_entry(db, "fact_orders_current", 7, "semantic", "d", ORDERS_COLUMNS[:2])
+        assert read_catalog_etag(db) != etag
+        assert db.query(DatasetCatalogEntry).count() == 1
+
+    def test_empty_catalog_has_no_etag(self, db):
+        assert read_catalog_etag(db) is None
+
+
+class TestDiscovery:
+
+    def test_datasets_and_columns_come_from_catalog(self, db):
+        _seed(db)
+        service = DatasetDiscoveryService()
+
+        result = service.discover_datasets(db)
+
+        assert result.stale is False and result.error is None
+        (dataset,) = result.datasets
+        assert (dataset.dataset_name, dataset.dataset_id, dataset.schema) == (
+            "fact_orders_current", 7, "semantic",
+        )
+        order_date, revenue, channel = dataset.columns
+        assert order_date.is_temporal and order_date.description == "Order day"
+        assert revenue.is_metric and not revenue.is_dimension
+        assert channel.is_dimension and channel.description == ""
+
+        assert service.get_dataset_columns(db, 7) == dataset.columns
+        assert service.get_dataset_columns(db, 999) == []
+
+    def test_serves_from_memory_between_revalidations(self, db, statements):
+        _seed(db)
+        service = DatasetDiscoveryService(revalidate_seconds=60)
+        service.discover_datasets(db)
+        statements.clear()
+
+        service.discover_datasets(db)
+        service.get_dataset_columns(db, 7)
+
+        assert statements == []
+
+    def test_revalidation_reloads_only_when_etag_changes(self, db, statements):
+        _seed(db)
+        service = DatasetDiscoveryService(revalidate_seconds=0)
+        first = service.discover_datasets(db)
+        statements.clear()
+
+        # Unchanged catalog: one ETag read, rows are not reloaded
+        assert service.discover_datasets(db).datasets is first.datasets
+        assert len(statements) == 1
+
+        # Another process syncs a new dataset
+        _seed(db, name="fact_ad_spend_current", superset_id=8)
+        names = [ds.dataset_name for ds in service.discover_datasets(db).datasets]
+        assert names == ["fact_ad_spend_current", "fact_orders_current"]
+        assert service.get_dataset_columns(db, 8)
+
+    def test_unreadable_catalog_returns_stale_copy(self, db):
+        _seed(db)
+        service = DatasetDiscoveryService(revalidate_seconds=0)
+        service.discover_datasets(db)
+
+        broken = MagicMock()
+        broken.query.side_effect = RuntimeError("connection refused")
+        result = service.discover_datasets(broken)
+
+        assert result.stale is True
+        assert result.cached_at is not None
+        assert [ds.dataset_name for ds in result.datasets] == ["fact_orders_current"]
+        assert service.get_dataset_columns(broken, 7)
+
+    def test_unreadable_catalog_without_cache(self):
+        broken = MagicMock()
+        broken.query.side_effect = RuntimeError("connection refused")
+
+        result = DatasetDiscoveryService().discover_datasets(broken)
+
+        assert result.datasets == []
+        assert result.error is not None
@@ -0,0 +1,139 @@
+"""
+Unit tests for the shared dbt manifest index.
+
+Covers parsing, per-file caching and invalidation, adjacency, exposed
+semantic columns and derived-structure memoisation.
+"""
+
+import json
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.services import dbt_manifest_index
+from src.services.dbt_manifest_index import (
+    ManifestIndex,
+    clear_manifest_index_cache,
+    load_manifest_index,
+)
+
+
+def _manifest(extra_column: bool = False) -> dict:
+    columns = {
+        "id": {"name": "id", "data_type": "text", "meta": {}},
+        "tenant_id": {"name": "tenant_id", "data_type": "text", "meta": {"superset_expose": True}},
+    }
+    if extra_column:
+        columns["revenue"] = {"name": "revenue", "data_type": "numeric", "meta": {"superset_expose": True}}
+    return {
+        "nodes": {
+            "model.markinsight.orders": {"name": "orders", "depends_on": {"nodes": []}},
+            "model.markinsight.fact_orders_current": {
+                "name": "fact_orders_current",
+                "depends_on": {"nodes": ["model.markinsight.orders"]},
+                "columns": columns,
+            },
+            "test.markinsight.not_null_orders_id": {
+                "name": "not_null_orders_id",
+                "depends_on": {"nodes": ["model.markinsight.orders"]},
+            },
+        },
+    }
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    clear_manifest_index_cache()
+    yield
+    clear_manifest_index_cache()
+
+
+def _write(path, manifest: dict, mtime_ns: int | None = None) -> None:
+    path.write_text(json.dumps(manifest))
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestLoadManifestIndex:
+
+    def test_builds_indexes(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        _write(path, _manifest())
+
+        index = load_manifest_index(path)
+
+        assert set(index.nodes_by_name) == {"orders", "fact_orders_current"}
+        assert index.node("fact_orders_current")["name"] == "fact_orders_current"
+        assert index.semantic_exposed_columns == {
+            "fact_orders_current": [
+                {"column_name": "tenant_id", "description": "", "data_type": "text"},
+            ],
+        }
+        assert index.parents["model.markinsight.fact_orders_current"] == ("model.markinsight.orders",)
+        assert set(index.children["model.markinsight.orders"]) == {
+            "model.markinsight.fact_orders_current",
+            "test.markinsight.not_null_orders_id",
+        }
+        assert len(index.content_hash) == 64
+
+    def test_cached_until_file_changes(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        _write(path, _manifest(), mtime_ns=1_000_000_000)
+
+        first = load_manifest_index(path)
+        assert load_manifest_index(str(path)) is first
+
+        _write(path, _manifest(extra_column=True), mtime_ns=2_000_000_000)
+        second = load_manifest_index(path)
+
+        assert second is not first
+        assert second.content_hash != first.content_hash
+        assert len(second.semantic_exposed_columns["fact_orders_current"]) == 2
+
+    def test_prefers_dbt_parent_and_child_maps(self, tmp_path):
+        manifest = _manifest()
+        manifest["parent_map"] = {"model.markinsight.orders": ["source.raw.orders"]}
+        manifest["child_map"] = {"source.raw.orders": ["model.markinsight.orders"]}
+        path = tmp_path / "manifest.json"
+        _write(path, manifest)
+
+        index = load_manifest_index(path)
+
+        assert index.parents == {"model.markinsight.orders": ("source.raw.orders",)}
+        assert index.children == {"source.raw.orders": ("model.markinsight.orders",)}
+
+    def test_stdlib_json_fallback(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        _write(path, _manifest())
+
+        with patch.object(dbt_manifest_index, "orjson", None):
+            index = load_manifest_index(path)
+
+        assert "orders" in index.nodes_by_name
+
+    def test_missing_manifest_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_manifest_index(tmp_path / "missing.json")
+
+    def test_empty_or_invalid_manifest_raises(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        path.write_text("")
+        with pytest.raises(ValueError):
+            load_manifest_index(path)
+
+        path.write_text("[]")
+        with pytest.raises(ValueError):
+            load_manifest_index(path)
+
+
+class TestDerive:
+
+    def test_builder_runs_once_per_index(self):
+        index = ManifestIndex.from_manifest(_manifest())
+        builder = MagicMock(return_value={"built": True})
+
+        assert index.derive("registry", builder) == {"built": True}
+        assert index.derive("registry", builder) == {"built": True}
+
+        builder.assert_called_once_with(index.manifest)
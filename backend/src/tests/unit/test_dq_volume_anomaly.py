@@ -226,6 +226,7 @@ class TestCheckVolumeAnomaly:
         assert result.metadata["anomaly_score"] == 0.5
         assert result.metadata["severity_label"] == "medium"
         assert result.metadata["rolling_avg"] == 100.0
+        assert result.metadata["median_count"] == 100.0
         assert result.metadata["lookback_days"] == 7
 
     @patch("src.api.dq.service.get_quality_thresholds_loader")
@@ -0,0 +1,169 @@
+"""
+Unit tests for the fast-path JSON response class.
+
+Covers encoding of the types DB rows carry (with and without orjson) and
+that each opted-in route returns the same JSON the Pydantic response model
+path produced.
+"""
+
+import json
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import UUID
+
+import pytest
+
+from src.api import responses
+from src.api.responses import FastJSONResponse, dumps
+from src.api.routes import attribution, notifications, orders, what_changed
+from src.models.notification import (
+    NotificationEventType,
+    NotificationImportance,
+    NotificationStatus,
+)
+
+UTC_TS = datetime(2026, 3, 1, 12, 30, 5, 250000, tzinfo=timezone.utc)
+TENANT = SimpleNamespace(tenant_id="tenant-1", user_id="user-1")
+
+
+def _typed_content():
+    return {
+        "revenue": Decimal("19.90"),
+        "created_at": UTC_TS,
+        "offset_at": datetime(2026, 3, 1, 9, 0, tzinfo=timezone(timedelta(hours=-5))),
+        "naive_at": datetime(2026, 3, 1, 9, 0),
+        "day": date(2026, 3, 1),
+        "status": NotificationStatus.READ,
+        "id": UUID("12345678-1234-5678-1234-567812345678"),
+        "name": "Café",
+    }
+
+
+EXPECTED = {
+    "revenue": 19.9,
+    "created_at": "2026-03-01T12:30:05.250000Z",
+    "offset_at": "2026-03-01T09:00:00-05:00",
+    "naive_at": "2026-03-01T09:00:00",
+    "day": "2026-03-01",
+    "status": "read",
+    "id": "12345678-1234-5678-1234-567812345678",
+    "name": "Café",
+}
+
+
+class TestDumps:
+
+    def test_encodes_db_types(self):
+        assert json.loads(dumps(_typed_content())) == EXPECTED
+
+    def test_stdlib_fallback_matches(self):
+        with patch.object(responses, "orjson", None):
+            body = dumps(_typed_content())
+
+        assert json.loads(body) == EXPECTED
+        assert b" " not in body.replace(b"Caf\xc3\xa9", b"")
+
+    def test_unknown_type_raises(self):
+        with pytest.raises(TypeError):
+            dumps({"value": object()})
+
+    def test_response_renders_json(self):
+        response = FastJSONResponse({"total": Decimal("2")}, status_code=200)
+
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == {"total": 2.0}
+
+
+def _order_row(**overrides):
+    row = dict(
+        order_id=1001, order_number=42, order_name="#1042", revenue=Decimal("125.50"),
+        currency="USD", financial_status="paid", created_at=UTC_TS,
+        utm_source="facebook", utm_medium="cpc", utm_campaign="spring", platform="meta_ads",
+        attribution_status="attributed",
+    )
+    row.update(overrides)
+    return SimpleNamespace(**row)
+
+
+def _orders_db(rows, total):
+    db = MagicMock()
+    db.execute.return_value.fetchall.return_value = rows
+    db.execute.return_value.fetchone.return_value = SimpleNamespace(total=total)
+    return db
+
+
+class TestRouteParity:
+
+    def test_orders_match_response_model(self):
+        rows = [_order_row(), _order_row(order_number=None, created_at=None, utm_source=None)]
+
+        with patch.object(orders, "get_tenant_context", return_value=TENANT):
+            response = orders.get_orders(
+                request=MagicMock(), timeframe="30days", limit=1, offset=0,
+                db=_orders_db(rows, total=2), _rate_limit=None,
+            )
+
+        expected = orders.OrdersListResponse(
+            orders=[orders.Order(**orders._order_row(r)) for r in rows],
+            total=2,
+            has_more=True,
+        )
+        assert isinstance(response, FastJSONResponse)
+        assert json.loads(response.body) == expected.model_dump(mode="json")
+
+    def test_attributed_orders_match_response_model(self):
+        rows = [_order_row(), _order_row(attribution_status=None)]
+
+        with patch.object(attribution, "get_tenant_context", return_value=TENANT):
+            response = attribution.get_attributed_orders(
+                request=MagicMock(), timeframe="30days", platform=None, limit=50,
+                offset=0, db=_orders_db(rows, total=2), _rate_limit=None,
+            )
+
+        body = json.loads(response.body)
+        expected = attribution.AttributedOrdersResponse(
+            orders=[attribution.AttributedOrder(**o) for o in body["orders"]],
+            total=2,
+            has_more=False,
+        )
+        assert body == expected.model_dump(mode="json")
+        assert body["orders"][1]["attribution_status"] == "unattributed_no_utm"
+
+    def test_notification_row_matches_response_model(self):
+        notification = SimpleNamespace(
+            id="n-1",
+            event_type=NotificationEventType.ACTION_EXECUTED,
+            importance=NotificationImportance.ROUTINE,
+            title="Action executed",
+            message="Done",
+            action_url="/actions/1",
+            entity_type="action",
+            entity_id="a-1",
+            status=NotificationStatus.READ,
+            created_at=UTC_TS,
+            read_at=None,
+        )
+
+        fast = json.loads(dumps(notifications._notification_row(notification)))
+
+        assert fast == notifications._notification_to_response(notification).model_dump(mode="json")
+
+    def test_change_event_row_matches_response_model(self):
+        event = SimpleNamespace(
+            id="e-1",
+            event_type="sync_completed",
+            title="Shopify sync completed",
+            description="Orders refreshed",
+            affected_metrics=None,
+            affected_connector_name="Shopify",
+            impact_summary=None,
+            affected_date_start=UTC_TS - timedelta(days=1),
+            affected_date_end=UTC_TS,
+            occurred_at=UTC_TS,
+        )
+
+        fast = json.loads(dumps(what_changed._event_row(event)))
+
+        assert fast == what_changed._event_to_response(event).model_dump(mode="json")
@@ -11,12 +11,16 @@ Tests cover:
 Story 8.1 - AI Insight Generation (Read-Only Analytics)
 """
 
+import numpy as np
 import pytest
 from datetime import datetime, timezone
 from decimal import Decimal
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
-from src.models.ai_insight import InsightType, InsightSeverity
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.models.ai_insight import AIInsight, InsightType, InsightSeverity
 from src.services.insight_thresholds import (
     InsightThresholds,
     DEFAULT_THRESHOLDS,
@@ -27,7 +31,11 @@ from src.services.insight_generation_service import (
     InsightGenerationService,
     MetricChange,
     DetectedInsight,
+    _SEVERITIES,
+    _confidence_scores,
+    _severity_codes,
 )
+from src.services.insight_metric_frame import TenantMetrics, marketing_frame, revenue_frame
 from src.services.insight_templates import (
     render_insight_summary,
     render_why_it_matters,
@@ -226,6 +234,29 @@ class TestTemplateRendering:
         assert "spend anomaly" in summary.lower()
 
 
+def _spend_insight(delta_pct):
+    return DetectedInsight(
+        insight_type=InsightType.SPEND_ANOMALY,
+        severity=InsightSeverity.WARNING,
+        metrics=[
+            MetricChange(
+                metric_name="spend",
+                current_value=Decimal("1500"),
+                prior_value=Decimal("1000"),
+                delta=Decimal("500"),
+                delta_pct=delta_pct,
+                timeframe="week_over_week",
+            )
+        ],
+        period_type="weekly",
+        period_start=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        period_end=datetime(2024, 1, 7, tzinfo=timezone.utc),
+        comparison_type="week_over_week",
+        platform="meta_ads",
+        currency="USD",
+    )
+
+
 class TestInsightGenerationService:
     """Tests for InsightGenerationService."""
 
@@ -248,36 +279,6 @@ class TestInsightGenerationService:
         with pytest.raises(ValueError, match="tenant_id is required"):
             InsightGenerationService(mock_db_session, tenant_id="")
 
-    def test_calculate_severity_info(self, service):
-        """Test severity calculation returns INFO below threshold."""
-        severity = service._calculate_severity(10.0, 15.0, 30.0)
-        assert severity == InsightSeverity.INFO
-
-    def test_calculate_severity_warning(self, service):
-        """Test severity calculation returns WARNING at threshold."""
-        severity = service._calculate_severity(20.0, 15.0, 30.0)
-        assert severity == InsightSeverity.WARNING
-
-    def test_calculate_severity_critical(self, service):
-        """Test severity calculation returns CRITICAL above critical threshold."""
-        severity = service._calculate_severity(35.0, 15.0, 30.0)
-        assert severity == InsightSeverity.CRITICAL
-
-    def test_calculate_confidence_low_values(self, service):
-        """Test low confidence for small values."""
-        confidence = service._calculate_confidence(20.0, 50, 40)
-        assert confidence == 0.5
-
-    def test_calculate_confidence_high_change(self, service):
-        """Test high confidence for large changes."""
-        confidence = service._calculate_confidence(60.0, 10000, 6000)
-        assert confidence == 0.95
-
-    def test_calculate_confidence_moderate(self, service):
-        """Test moderate confidence for medium changes."""
-        confidence = service._calculate_confidence(20.0, 5000, 4000)
-        assert confidence == 0.75
-
     def test_generate_content_hash_deterministic(self, service):
         """Test same inputs produce same hash."""
         detected = DetectedInsight(
@@ -359,6 +360,178 @@ class TestInsightGenerationService:
 
         assert hash1 != hash2
 
+    def test_persist_insights_enhances_once_and_bulk_inserts(self, service, mock_db_session):
+        """Test new insights share one LLM batch and one flush; stored duplicates are skipped."""
+        stored, new_a, new_b = _spend_insight(10.0), _spend_insight(20.0), _spend_insight(30.0)
+        mock_db_session.execute.return_value.scalars.return_value.all.return_value = [
+            service._generate_content_hash(stored),
+        ]
+
+        with patch(
+            "src.services.llm_integration.enhance_batch_with_llm_sync",
+            side_effect=lambda **kw: [r.fallback for r in kw["requests"]],
+        ) as enhance:
+            persisted = service._persist_insights([stored, new_a, new_b, new_a], job_id="job-1")
+
+        enhance.assert_called_once()
+        assert len(enhance.call_args.kwargs["requests"]) == 4
+        assert len(persisted) == 2
+        mock_db_session.add_all.assert_called_once_with(persisted)
+        mock_db_session.flush.assert_called_once()
+
+    def test_persist_insights_duplicate_keeps_caller_transaction(self):
+        """Test a bulk insert racing a concurrent job only rolls back its savepoint."""
+        engine = create_engine("sqlite://")
+        AIInsight.__table__.create(engine)
+        raced, fresh = _spend_insight(10.0), _spend_insight(20.0)
+
+        with Session(engine) as other:
+            other_service = InsightGenerationService(other, tenant_id="test-tenant-123")
+            with patch(
+                "src.services.llm_integration.enhance_batch_with_llm_sync",
+                side_effect=lambda **kw: [r.fallback for r in kw["requests"]],
+            ):
+                other_service._persist_insights([raced], job_id="job-other")
+            other.commit()
+
+        with Session(engine) as db:
+            service = InsightGenerationService(db, tenant_id="test-tenant-123")
+            caller_row = service._build_insight(
+                _spend_insight(5.0), "job-1", "caller-hash", "summary", "why"
+            )
+            db.add(caller_row)
+            db.flush()
+
+            with patch.object(service, "_existing_content_hashes", return_value=set()), patch(
+                "src.services.llm_integration.enhance_batch_with_llm_sync",
+                side_effect=lambda **kw: [r.fallback for r in kw["requests"]],
+            ):
+                persisted = service._persist_insights([raced, fresh], job_id="job-1")
+            db.commit()
+
+            assert [i.content_hash for i in persisted] == [service._generate_content_hash(fresh)]
+            assert db.query(AIInsight).count() == 3
+
+
+class TestSeverityAndConfidenceScoring:
+    """Tests for the vectorized severity and confidence rules."""
+
+    def test_severity_by_threshold(self):
+        """Test INFO below, WARNING at, CRITICAL at or above the critical threshold."""
+        codes = _severity_codes(np.array([10.0, 15.0, 20.0, 35.0]), 15.0, 30.0)
+
+        assert [_SEVERITIES[c] for c in codes] == [
+            InsightSeverity.INFO,
+            InsightSeverity.WARNING,
+            InsightSeverity.WARNING,
+            InsightSeverity.CRITICAL,
+        ]
+
+    def test_confidence_by_change_magnitude(self):
+        """Test larger relative changes score higher confidence."""
+        scores = _confidence_scores(
+            np.array([60.0, -40.0, 20.0, 10.0]),
+            np.array([10000, 6000, 5000, 5000]),
+            np.array([6000, 10000, 4000, 4500]),
+        )
+
+        assert scores.tolist() == [0.95, 0.85, 0.75, 0.65]
+
+    def test_confidence_low_for_small_values(self):
+        """Test low confidence when both values are too small to be meaningful."""
+        scores = _confidence_scores(np.array([20.0, 60.0]), np.array([50, 150]), np.array([40, 90]))
+
+        assert scores.tolist() == [0.5, 0.95]
+
+
+class TestMultiPeriodDetection:
+    """Tests for running all detectors over a multi-period frame."""
+
+    @pytest.fixture
+    def service(self):
+        """Create service with mock session."""
+        return InsightGenerationService(
+            db_session=MagicMock(),
+            tenant_id="test-tenant",
+            thresholds=DEFAULT_THRESHOLDS,
+        )
+
+    @staticmethod
+    def _marketing_row(period_type, **values):
+        row = {
+            "platform": "meta_ads",
+            "currency": "USD",
+            "campaign_id": None,
+            "period_type": period_type,
+            "period_start": datetime(2024, 1, 1, tzinfo=timezone.utc),
+            "period_end": datetime(2024, 1, 7, tzinfo=timezone.utc),
+            "comparison_type": "week_over_week",
+        }
+        row.update(values)
+        return row
+
+    def test_detects_across_periods_in_period_then_detector_order(self, service):
+        """Test one pass over both periods matches per-period detection order."""
+        metrics = TenantMetrics(
+            marketing=marketing_frame([
+                self._marketing_row(
+                    "last_30_days", cac=60, prior_cac=40, cac_change=20, cac_change_pct=50.0,
+                ),
+                self._marketing_row(
+                    "weekly", spend=1500, prior_spend=1000, spend_change=500, spend_change_pct=50.0,
+                    gross_roas=2.0, prior_gross_roas=3.0, gross_roas_change=-1.0,
+                    gross_roas_change_pct=-33.3,
+                ),
+            ]),
+            revenue=revenue_frame([
+                {
+                    "currency": "USD",
+                    "period_type": "weekly",
+                    "period_start": datetime(2024, 1, 1, tzinfo=timezone.utc),
+                    "period_end": datetime(2024, 1, 7, tzinfo=timezone.utc),
+                    "comparison_type": "week_over_week",
+                    "net_revenue": 8000,
+                    "prior_net_revenue": 10000,
+                    "net_revenue_change": -2000,
+                    "net_revenue_change_pct": -20.0,
+                    "aov": 80,
+                    "prior_aov": 100,
+                    "aov_change": -20,
+                    "aov_change_pct": -20.0,
+                },
+            ]),
+        )
+
+        detected = service._detect_all(metrics, ["weekly", "last_30_days"])
+
+        assert [(d.period_type, d.insight_type) for d in detected] == [
+            ("weekly", InsightType.SPEND_ANOMALY),
+            ("weekly", InsightType.ROAS_CHANGE),
+            ("weekly", InsightType.REVENUE_VS_SPEND_DIVERGENCE),
+            ("weekly", InsightType.AOV_CHANGE),
+            ("last_30_days", InsightType.CAC_ANOMALY),
+        ]
+        spend, roas, divergence, aov, cac = detected
+        assert spend.severity == InsightSeverity.CRITICAL
+        assert spend.metrics[0].delta == Decimal("500")
+        assert spend.confidence_score == 0.85
+        assert roas.metrics[0].delta_pct == -33.3
+        assert divergence.metrics[1].delta_pct == 50.0
+        assert divergence.severity == InsightSeverity.CRITICAL
+        assert aov.severity == InsightSeverity.INFO
+        assert aov.platform is None
+        assert cac.confidence_score == 0.5
+
+    def test_generate_insights_uses_preloaded_metrics(self, service):
+        """Test preloaded frames skip the mart queries."""
+        with patch(
+            "src.services.insight_generation_service.load_tenant_metrics"
+        ) as load, patch.object(service, "_persist_insights", return_value=[]) as persist:
+            service.generate_insights(job_id="job-1", metrics=TenantMetrics())
+
+        load.assert_not_called()
+        persist.assert_called_once_with([], "job-1")
+
 
 class TestSpendAnomalyDetection:
     """Tests for spend anomaly detection."""
@@ -393,7 +566,7 @@ class TestSpendAnomalyDetection:
             }
         ]
 
-        insights = service._detect_spend_anomalies(marketing_data, "weekly")
+        insights = service._detect_spend_anomalies(marketing_frame(marketing_data, "weekly"))
 
         assert len(insights) == 1
         assert insights[0].insight_type == InsightType.SPEND_ANOMALY
@@ -416,7 +589,7 @@ class TestSpendAnomalyDetection:
             }
         ]
 
-        insights = service._detect_spend_anomalies(marketing_data, "weekly")
+        insights = service._detect_spend_anomalies(marketing_frame(marketing_data, "weekly"))
 
         assert len(insights) == 0
 
@@ -437,7 +610,7 @@ class TestSpendAnomalyDetection:
             }
         ]
 
-        insights = service._detect_spend_anomalies(marketing_data, "weekly")
+        insights = service._detect_spend_anomalies(marketing_frame(marketing_data, "weekly"))
 
         assert len(insights) == 0
 
@@ -474,7 +647,7 @@ class TestROASDetection:
             }
         ]
 
-        insights = service._detect_roas_changes(marketing_data, "weekly")
+        insights = service._detect_roas_changes(marketing_frame(marketing_data, "weekly"))
 
         assert len(insights) == 1
         assert insights[0].insight_type == InsightType.ROAS_CHANGE
@@ -497,7 +670,7 @@ class TestROASDetection:
             }
         ]
 
-        insights = service._detect_roas_changes(marketing_data, "weekly")
+        insights = service._detect_roas_changes(marketing_frame(marketing_data, "weekly"))
 
         assert len(insights) == 0
 
@@ -545,7 +718,8 @@ class TestDivergenceDetection:
         ]
 
         insights = service._detect_revenue_spend_divergence(
-            marketing_data, revenue_data, "weekly"
+            marketing_frame(marketing_data, "weekly"),
+            revenue_frame(revenue_data, "weekly"),
         )
 
         assert len(insights) == 1
@@ -580,7 +754,8 @@ class TestDivergenceDetection:
         ]
 
         insights = service._detect_revenue_spend_divergence(
-            marketing_data, revenue_data, "weekly"
+            marketing_frame(marketing_data, "weekly"),
+            revenue_frame(revenue_data, "weekly"),
         )
 
         assert len(insights) == 0
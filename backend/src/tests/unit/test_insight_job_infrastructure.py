@@ -285,60 +285,6 @@ class TestInsightJobRunner:
         assert InsightJobStatus.RUNNING in statuses
         assert sample_job.status == InsightJobStatus.SUCCESS
 
-    def test_process_queued_jobs_empty(self, mock_db_session):
-        """Test processing with no queued jobs."""
-        mock_db_session.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = (
-            []
-        )
-
-        runner = InsightJobRunner(mock_db_session)
-        processed = runner.process_queued_jobs(limit=10)
-
-        assert processed == 0
-
-    @patch("src.services.insight_job_runner.InsightGenerationService")
-    @patch("src.services.insight_job_runner.BillingEntitlementsService")
-    def test_process_queued_jobs_batch(
-        self, mock_entitlements, mock_generation_service, mock_db_session
-    ):
-        """Test batch processing of queued jobs."""
-        # Mock entitlements
-        mock_ent_instance = MagicMock()
-        mock_ent_instance.get_billing_tier.return_value = "growth"
-        mock_entitlements.return_value = mock_ent_instance
-
-        # Mock generation service
-        mock_gen_instance = MagicMock()
-        mock_gen_instance.generate_insights.return_value = []
-        mock_generation_service.return_value = mock_gen_instance
-
-        # Create 3 queued jobs
-        jobs = [
-            InsightJob(
-                job_id=f"job-{i}",
-                tenant_id=f"tenant-{i}",
-                cadence=InsightJobCadence.DAILY,
-                status=InsightJobStatus.QUEUED,
-                insights_generated=0,
-                job_metadata={},
-            )
-            for i in range(3)
-        ]
-
-        mock_db_session.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = (
-            jobs
-        )
-
-        runner = InsightJobRunner(mock_db_session)
-        processed = runner.process_queued_jobs(limit=10)
-
-        assert processed == 3
-        mock_db_session.commit.assert_called_once()
-
-        # All jobs should be SUCCESS
-        for job in jobs:
-            assert job.status == InsightJobStatus.SUCCESS
-
 
 class TestMonthlyLimitEnforcement:
     """Tests for monthly insight limit enforcement."""
@@ -0,0 +1,97 @@
+"""
+Unit tests for columnar insight metric frames.
+
+Covers row-to-column conversion, tenant partitioning and the batched
+multi-tenant, multi-period mart loader.
+
+Story 8.1 - AI Insight Generation (Read-Only Analytics)
+"""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from src.services.insight_metric_frame import (
+    TenantMetrics,
+    load_tenant_metrics,
+    marketing_frame,
+    revenue_frame,
+)
+
+
+PERIOD_END = datetime(2024, 1, 7, tzinfo=timezone.utc)
+
+
+def _result(rows):
+    result = MagicMock()
+    result.fetchall.return_value = [SimpleNamespace(_mapping=row) for row in rows]
+    return result
+
+
+class TestMetricFrame:
+
+    def test_from_rows_coerces_nulls(self):
+        frame = marketing_frame([
+            {"tenant_id": "t1", "spend": None, "prior_spend": 100, "platform": "meta_ads"},
+            {"tenant_id": "t1", "spend": 250.5},
+        ])
+
+        assert len(frame) == 2
+        assert frame["spend"].dtype == np.float64
+        assert frame["spend"].tolist() == [0.0, 250.5]
+        assert frame["prior_spend"].tolist() == [100.0, 0.0]
+        assert frame["platform"].tolist() == ["meta_ads", None]
+
+    def test_period_type_override(self):
+        frame = revenue_frame([{"aov": 10}, {"aov": 20}], period_type="weekly")
+        assert frame["period_type"].tolist() == ["weekly", "weekly"]
+
+    def test_split_by_keeps_row_order(self):
+        frame = marketing_frame([
+            {"tenant_id": "a", "spend": 1},
+            {"tenant_id": "b", "spend": 2},
+            {"tenant_id": "a", "spend": 3},
+        ])
+
+        parts = frame.split_by("tenant_id")
+
+        assert parts["a"]["spend"].tolist() == [1.0, 3.0]
+        assert parts["b"]["spend"].tolist() == [2.0]
+
+
+class TestLoadTenantMetrics:
+
+    def test_one_query_per_mart_for_all_tenants(self):
+        db = MagicMock()
+        db.execute.side_effect = [
+            _result([
+                {"tenant_id": "t1", "period_type": "weekly", "period_end": PERIOD_END, "spend": 100},
+                {"tenant_id": "t2", "period_type": "last_30_days", "period_end": PERIOD_END, "spend": 200},
+            ]),
+            _result([
+                {"tenant_id": "t1", "period_type": "weekly", "period_end": PERIOD_END, "aov": 50},
+            ]),
+        ]
+
+        metrics = load_tenant_metrics(db, ["t2", "t1", "t3"], ["weekly", "last_30_days"])
+
+        assert db.execute.call_count == 2
+        params = db.execute.call_args_list[0].args[1]
+        assert params == {"tenant_ids": ["t1", "t2", "t3"], "period_types": ["weekly", "last_30_days"]}
+        assert metrics["t1"].marketing["spend"].tolist() == [100.0]
+        assert metrics["t1"].revenue["aov"].tolist() == [50.0]
+        assert metrics["t2"].marketing["period_type"].tolist() == ["last_30_days"]
+        assert len(metrics["t2"].revenue) == 0
+        assert len(metrics["t3"].marketing) == 0
+
+    def test_no_tenants_skips_queries(self):
+        db = MagicMock()
+        assert load_tenant_metrics(db, [], ["weekly"]) == {}
+        db.execute.assert_not_called()
+
+    def test_empty_tenant_metrics(self):
+        metrics = TenantMetrics()
+        assert len(metrics.marketing) == 0
+        assert len(metrics.revenue) == 0
@@ -0,0 +1,117 @@
+"""
+Unit tests for GET /api/datasets/kpi-summary.
+
+Covers the single mart_kpi_summary lookup, the zeroed response for
+tenants without data, and Redis caching per data version (invalidated by
+each successful dbt run).
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from src.api.routes.datasets import get_kpi_summary
+from src.services.analytics_snapshot_cache import AnalyticsSnapshotCache
+from src.tests.unit.test_analytics_snapshot_cache import FakeRedis
+from src.workers.dbt_runner import run_dbt_incremental
+
+
+def _summary_row():
+    return SimpleNamespace(
+        total_revenue=1200.0,
+        revenue_change_pct=20.0,
+        total_spend=300.0,
+        spend_change_pct=None,
+        average_roas=4.0,
+        roas_change_pct=-5.5,
+        total_conversions=12,
+        conversions_change_pct=50.0,
+        revenue_by_channel=[
+            {"channel": "meta_ads", "revenue": 1000.0, "spend": 250.0},
+            {"channel": "organic", "revenue": 200.0, "spend": 0},
+        ],
+        active_channels=2,
+    )
+
+
+def _db(row):
+    db = MagicMock()
+    db.execute.return_value.fetchone.return_value = row
+    return db
+
+
+def _call(db, cache, timeframe="30days"):
+    with patch(
+        "src.api.routes.datasets.get_tenant_context",
+        return_value=SimpleNamespace(tenant_id="tenant-1"),
+    ), patch("src.api.routes.datasets.get_analytics_cache", return_value=cache):
+        response = get_kpi_summary(
+            request=MagicMock(), timeframe=timeframe, db_session=db, _rate_limit=None,
+        )
+    return json.loads(response.body)
+
+
+class TestKpiSummary:
+
+    def test_reads_one_snapshot_row(self):
+        db = _db(_summary_row())
+
+        result = _call(db, AnalyticsSnapshotCache(), timeframe="7days")
+
+        assert db.execute.call_count == 1
+        sql, params = db.execute.call_args.args
+        assert "marts.mart_kpi_summary" in str(sql)
+        assert params == {"tenant_id": "tenant-1", "period_type": "last_7_days"}
+        assert result["total_revenue"] == {"value": 1200.0, "change_pct": 20.0}
+        assert result["total_ad_spend"]["change_pct"] is None
+        assert result["average_roas"]["change_pct"] == -5.5
+        assert [bar["channel"] for bar in result["revenue_by_channel"]] == ["meta_ads", "organic"]
+        assert result["active_channels"] == 2
+
+    def test_tenant_without_data_gets_zeros(self):
+        result = _call(_db(None), AnalyticsSnapshotCache())
+
+        assert result["total_revenue"] == {"value": 0.0, "change_pct": None}
+        assert result["revenue_by_channel"] == []
+        assert result["active_channels"] == 0
+
+    def test_cached_until_data_version_changes(self):
+        cache = AnalyticsSnapshotCache(redis_client=FakeRedis())
+        db = _db(_summary_row())
+
+        first = _call(db, cache)
+        second = _call(db, cache)
+        assert db.execute.call_count == 1
+        assert second == first
+
+        cache.bump_data_version()
+        _call(db, cache)
+        assert db.execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_successful_dbt_run_invalidates_cached_summary(self):
+        cache = AnalyticsSnapshotCache(redis_client=FakeRedis())
+        db = _db(_summary_row())
+        _call(db, cache)
+
+        dbt = AsyncMock(returncode=0)
+        dbt.communicate.return_value = (b"ok", b"")
+        with patch("asyncio.create_subprocess_exec", return_value=dbt), \
+             patch("src.database.session.get_db_session_sync", return_value=iter([MagicMock()])), \
+             patch("src.services.budget_pacing_service.refresh_spend_rollups"), \
+             patch("src.services.analytics_snapshot_cache.get_analytics_cache", return_value=cache):
+            assert await run_dbt_incremental() is True
+
+        _call(db, cache)
+        assert db.execute.call_count == 2
+
+    def test_query_failure_is_503(self):
+        db = MagicMock()
+        db.execute.side_effect = RuntimeError("relation does not exist")
+
+        with pytest.raises(HTTPException) as exc_info:
+            _call(db, AnalyticsSnapshotCache())
+        assert exc_info.value.status_code == 503
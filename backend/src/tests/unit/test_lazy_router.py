@@ -0,0 +1,141 @@
+"""
+Unit tests for lazy router registration.
+
+Covers deferred import until the first matching request, route precedence,
+405 handling, dependency overrides, OpenAPI completeness, and that the
+prefixes main.py declares cover every route of each lazy module.
+"""
+
+import importlib
+import sys
+import types
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from src.platform.lazy_router import (
+    LazyRouter,
+    include_lazy_router,
+    install_lazy_openapi,
+    load_lazy_routers,
+)
+
+MODULE = "tests_lazy_admin_routes"
+
+
+def _current_user():
+    return "real-user"
+
+
+@pytest.fixture
+def admin_module(monkeypatch):
+    """Fake route module; records how many times it was imported."""
+    imports = []
+
+    def build():
+        imports.append(1)
+        module = types.ModuleType(MODULE)
+        router = APIRouter(prefix="/api/admin/things", tags=["admin"])
+
+        @router.get("")
+        def list_things(user: str = Depends(_current_user)):
+            return {"user": user}
+
+        @router.get("/{thing_id}", name="get_thing")
+        def get_thing(thing_id: int):
+            return {"id": thing_id}
+
+        module.router = router
+        return module
+
+    real_import = importlib.import_module
+
+    def fake_import(name, package=None):
+        if name == MODULE:
+            if MODULE not in sys.modules:
+                sys.modules[MODULE] = build()
+            return sys.modules[MODULE]
+        return real_import(name, package)
+
+    monkeypatch.setattr(importlib, "import_module", fake_import)
+    yield imports
+    sys.modules.pop(MODULE, None)
+
+
+@pytest.fixture
+def app():
+    app = FastAPI()
+
+    @app.get("/api/admin/things/fixed")
+    def eager_before():
+        return {"route": "eager"}
+
+    include_lazy_router(app, MODULE, "/api/admin/things")
+    install_lazy_openapi(app)
+    return app
+
+
+class TestLazyLoading:
+
+    def test_module_loads_on_first_matching_request(self, app, admin_module):
+        client = TestClient(app)
+
+        assert client.get("/api/other").status_code == 404
+        assert admin_module == []
+
+        assert client.get("/api/admin/things/7").json() == {"id": 7}
+        assert client.get("/api/admin/things/8").json() == {"id": 8}
+        assert admin_module == [1]
+
+    def test_earlier_routes_keep_precedence(self, app, admin_module):
+        response = TestClient(app).get("/api/admin/things/fixed")
+
+        assert response.json() == {"route": "eager"}
+        assert admin_module == []
+
+    def test_wrong_method_is_405(self, app, admin_module):
+        assert TestClient(app).delete("/api/admin/things/7").status_code == 405
+
+    def test_dependency_overrides_apply(self, app, admin_module):
+        app.dependency_overrides[_current_user] = lambda: "override-user"
+
+        assert TestClient(app).get("/api/admin/things").json() == {"user": "override-user"}
+
+    def test_url_path_for_resolves_lazy_routes(self, app, admin_module):
+        assert app.url_path_for("get_thing", thing_id=3) == "/api/admin/things/3"
+
+    def test_requires_prefix(self, app):
+        with pytest.raises(ValueError):
+            include_lazy_router(app, MODULE)
+
+
+class TestLoadAll:
+
+    def test_load_replaces_placeholders_in_place(self, app, admin_module):
+        assert load_lazy_routers(app) == 1
+        assert not any(isinstance(r, LazyRouter) for r in app.router.routes)
+
+        paths = [getattr(r, "path", None) for r in app.router.routes]
+        assert paths.index("/api/admin/things/fixed") < paths.index("/api/admin/things/{thing_id}")
+        assert load_lazy_routers(app) == 0
+
+    def test_openapi_includes_lazy_routes(self, app, admin_module):
+        schema = TestClient(app).get("/openapi.json").json()
+
+        assert "/api/admin/things/{thing_id}" in schema["paths"]
+
+
+class TestMainLazyRouters:
+
+    def test_declared_prefixes_cover_module_routes(self):
+        main = importlib.import_module("main")
+        lazy = [r for r in main.app.router.routes if isinstance(r, LazyRouter)]
+
+        for placeholder in lazy:
+            module = importlib.import_module(placeholder.module_path)
+            for route in module.router.routes:
+                assert route.path.startswith(placeholder.prefixes), (
+                    f"{placeholder.module_path} route {route.path} is outside "
+                    f"its lazy prefixes {placeholder.prefixes}"
+                )
@@ -0,0 +1,190 @@
+"""
+Unit tests for the LLM completion cache.
+
+Covers canonical keys, tenant scoping, LRU eviction, Redis failure
+degradation and cache-hit handling in LLMRoutingService.complete.
+
+Story 8.8 - Model Routing & Prompt Governance
+"""
+
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+from src.integrations.openrouter import (
+    ChatChoice,
+    ChatCompletionResponse,
+    ChatMessage,
+    TokenUsage,
+)
+from src.models.llm_routing import LLMModelRegistry
+from src.services.llm_completion_cache import (
+    CachedCompletion,
+    LLMCompletionCache,
+    completion_cache_key,
+)
+from src.services.llm_routing_service import LLMRoutingService
+
+
+class FakeRedis:
+    """In-memory subset of the redis-py API used by the cache."""
+
+    def __init__(self):
+        self.values = {}
+        self.zsets = {}
+        self.fail = False
+
+    def _check(self):
+        if self.fail:
+            raise ConnectionError("redis down")
+
+    def get(self, key):
+        self._check()
+        return self.values.get(key)
+
+    def setex(self, key, ttl, value):
+        self._check()
+        self.values[key] = value
+
+    def zadd(self, key, mapping):
+        self._check()
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    def expire(self, key, ttl):
+        self._check()
+
+    def zcard(self, key):
+        self._check()
+        return len(self.zsets.get(key, {}))
+
+    def zpopmin(self, key, count):
+        self._check()
+        zset = self.zsets.get(key, {})
+        popped = sorted(zset.items(), key=lambda kv: kv[1])[:count]
+        for member, _ in popped:
+            del zset[member]
+        return popped
+
+    def delete(self, *keys):
+        self._check()
+        for key in keys:
+            self.values.pop(key, None)
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.ops.append((getattr(self.redis, name), args, kwargs))
+        return queue
+
+    def execute(self):
+        return [op(*args, **kwargs) for op, args, kwargs in self.ops]
+
+
+def _completion(content="cached"):
+    return CachedCompletion(content=content, model_id="m", input_tokens=10, output_tokens=5)
+
+
+class TestCompletionCacheKey:
+
+    def test_key_depends_on_messages_model_and_params(self):
+        messages = [ChatMessage(role="user", content="Hi")]
+        key = completion_cache_key(messages, "m", 100, 0.7)
+
+        assert key == completion_cache_key([ChatMessage(role="user", content="Hi")], "m", 100, 0.7)
+        assert key != completion_cache_key([ChatMessage(role="user", content="Hey")], "m", 100, 0.7)
+        assert key != completion_cache_key(messages, "other", 100, 0.7)
+        assert key != completion_cache_key(messages, "m", 200, 0.7)
+        assert key != completion_cache_key(messages, "m", 100, 0.2)
+
+
+class TestLLMCompletionCache:
+
+    def test_roundtrip_is_tenant_scoped(self):
+        cache = LLMCompletionCache(redis_client=FakeRedis())
+        cache.set("tenant-a", "k", _completion())
+
+        assert cache.get("tenant-a", "k") == _completion()
+        assert cache.get("tenant-b", "k") is None
+
+    def test_evicts_least_recently_used(self):
+        cache = LLMCompletionCache(redis_client=FakeRedis(), max_entries=2)
+        cache.set("tenant-a", "k1", _completion("1"))
+        cache.set("tenant-a", "k2", _completion("2"))
+        cache.get("tenant-a", "k1")
+        cache.set("tenant-a", "k3", _completion("3"))
+
+        assert cache.get("tenant-a", "k1") is not None
+        assert cache.get("tenant-a", "k2") is None
+        assert cache.get("tenant-a", "k3") is not None
+
+    def test_redis_errors_and_missing_redis_are_misses(self):
+        redis = FakeRedis()
+        cache = LLMCompletionCache(redis_client=redis)
+        redis.fail = True
+
+        assert cache.set("tenant-a", "k", _completion()) is False
+        assert cache.get("tenant-a", "k") is None
+        assert LLMCompletionCache(redis_client=None).get("tenant-a", "k") is None
+
+
+class TestRoutingServiceCache:
+
+    def _service(self, cache):
+        session = MagicMock()
+        model = LLMModelRegistry(
+            model_id="openai/gpt-4",
+            display_name="GPT-4",
+            provider="openai",
+            cost_per_input_token=Decimal("0.00001"),
+            cost_per_output_token=Decimal("0.00003"),
+            is_enabled=True,
+        )
+        # No org config; default model from the registry
+        session.query.return_value.filter.return_value.first.side_effect = lambda: None
+        client = AsyncMock()
+        client.chat_completion.return_value = ChatCompletionResponse(
+            id="chat-123",
+            model="openai/gpt-4",
+            choices=[ChatChoice(index=0, message=ChatMessage(role="assistant", content="Hello!"))],
+            usage=TokenUsage(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+        )
+        service = LLMRoutingService(session, tenant_id="tenant-123", client=client, cache=cache)
+        service.get_primary_model = MagicMock(return_value=model)
+        service.get_fallback_model = MagicMock(return_value=None)
+        return service, session, client
+
+    async def test_second_identical_request_served_from_cache(self):
+        service, session, client = self._service(LLMCompletionCache(redis_client=FakeRedis()))
+        messages = [ChatMessage(role="user", content="Hi")]
+
+        first = await service.complete(messages)
+        second = await service.complete(messages)
+
+        assert client.chat_completion.await_count == 1
+        assert first.was_cache_hit is False
+        assert second.content == "Hello!"
+        assert second.was_cache_hit is True
+        assert second.total_tokens == 0
+        assert second.cost_usd == Decimal("0")
+
+        logged = [call.args[0] for call in session.add.call_args_list]
+        assert [log.was_cache_hit for log in logged] == [False, True]
+        assert logged[1].cost_usd == Decimal("0")
+        assert logged[1].total_tokens == 0
+
+    async def test_disabled_cache_always_calls_model(self):
+        service, _, client = self._service(LLMCompletionCache(redis_client=None))
+        messages = [ChatMessage(role="user", content="Hi")]
+
+        await service.complete(messages)
+        await service.complete(messages)
+
+        assert client.chat_completion.await_count == 2
@@ -0,0 +1,116 @@
+"""
+Unit tests for batch LLM enhancement.
+
+Covers bounded concurrency, the per-tenant token budget, fallbacks and
+result ordering of enhance_batch_with_llm.
+
+Story 8.8 - Model Routing & Prompt Governance
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.services.llm_integration import (
+    LLMEnhancementRequest,
+    enhance_batch_with_llm,
+    enhance_batch_with_llm_sync,
+)
+
+
+class FakeRoutingService:
+    """Stands in for LLMRoutingService; echoes the rendered prompt."""
+
+    def __init__(self, tokens_per_call=10, templates=("t",), fail_on=()):
+        self.tokens_per_call = tokens_per_call
+        self.templates = set(templates)
+        self.fail_on = set(fail_on)
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = 0
+
+    def get_prompt_template(self, key):
+        if key not in self.templates:
+            return None
+        return SimpleNamespace(version=1, render=lambda v: f"{key}:{v['n']}")
+
+    async def complete(self, messages, template_key=None, template_version=None):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if messages[0].content in self.fail_on:
+            raise RuntimeError("boom")
+        return SimpleNamespace(content=messages[0].content.upper(), total_tokens=self.tokens_per_call)
+
+
+def _requests(n, key="t"):
+    return [LLMEnhancementRequest(key, {"n": i}, f"fallback-{i}") for i in range(n)]
+
+
+@pytest.fixture
+def entitled():
+    with patch("src.services.llm_integration.BillingEntitlementsService") as svc:
+        svc.return_value.check_feature_entitlement.return_value.is_entitled = True
+        yield svc
+
+
+def _patch_service(fake):
+    return patch("src.services.llm_routing_service.LLMRoutingService", return_value=fake)
+
+
+class TestEnhanceBatch:
+
+    async def test_results_in_order_with_bounded_concurrency(self, entitled):
+        fake = FakeRoutingService()
+        with _patch_service(fake):
+            out = await enhance_batch_with_llm(
+                MagicMock(), "tenant-1", _requests(6), max_concurrency=2, token_budget=1000,
+            )
+
+        assert out == [f"T:{i}" for i in range(6)]
+        assert fake.peak == 2
+
+    async def test_token_budget_leaves_remaining_fallbacks(self, entitled):
+        fake = FakeRoutingService(tokens_per_call=50)
+        with _patch_service(fake):
+            out = await enhance_batch_with_llm(
+                MagicMock(), "tenant-1", _requests(4), max_concurrency=1, token_budget=100,
+            )
+
+        assert out == ["T:0", "T:1", "fallback-2", "fallback-3"]
+        assert fake.calls == 2
+
+    async def test_failures_and_missing_templates_fall_back(self, entitled):
+        fake = FakeRoutingService(fail_on={"t:1"})
+        requests = _requests(2) + [LLMEnhancementRequest("missing", {"n": 9}, "fallback-9")]
+        with _patch_service(fake):
+            out = await enhance_batch_with_llm(MagicMock(), "tenant-1", requests, token_budget=1000)
+
+        assert out == ["T:0", "fallback-1", "fallback-9"]
+
+    async def test_not_entitled_skips_llm(self):
+        fake = FakeRoutingService()
+        with patch("src.services.llm_integration.BillingEntitlementsService") as svc, _patch_service(fake):
+            svc.return_value.check_feature_entitlement.return_value.is_entitled = False
+            out = await enhance_batch_with_llm(MagicMock(), "tenant-1", _requests(2))
+
+        assert out == ["fallback-0", "fallback-1"]
+        assert fake.calls == 0
+
+
+class TestEnhanceBatchSync:
+
+    def test_runs_batch_on_one_loop(self, entitled):
+        fake = FakeRoutingService()
+        with _patch_service(fake):
+            out = enhance_batch_with_llm_sync(MagicMock(), "tenant-1", _requests(3), token_budget=1000)
+
+        assert out == ["T:0", "T:1", "T:2"]
+
+    async def test_inside_running_loop_returns_fallbacks(self):
+        out = enhance_batch_with_llm_sync(MagicMock(), "tenant-1", _requests(2))
+        assert out == ["fallback-0", "fallback-1"]
@@ -0,0 +1,147 @@
+"""
+Unit tests for period metrics over the daily rollup tables.
+
+Covers period bounds (matching dim_date_ranges), ratio derivation from
+summed measures, and multi-period revenue sums from one query.
+"""
+
+import json
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.agents.analytics_agent import _tool_revenue_breakdown
+from src.services.metric_rollups import (
+    ChannelTotals,
+    DateRange,
+    change_pct,
+    period_bounds,
+    revenue_totals_by_currency,
+)
+
+
+def _db_returning(rows):
+    db = MagicMock()
+    db.execute.return_value.fetchall.return_value = rows
+    return db
+
+
+def _revenue_row(day, currency="USD", gross=0.0, net=0.0, orders=0, refunds=0.0):
+    return SimpleNamespace(
+        date=day, currency=currency, gross_revenue=gross, refund_amount=refunds,
+        cancellation_amount=None, net_revenue=net, order_count=orders,
+    )
+
+
+class TestPeriodBounds:
+
+    def test_rolling_periods_end_today(self):
+        today = date(2024, 3, 15)
+        current, prior = period_bounds("last_7_days", today)
+
+        assert current == DateRange(date(2024, 3, 9), date(2024, 3, 15))
+        assert prior == DateRange(date(2024, 3, 2), date(2024, 3, 8))
+        assert current.days == prior.days == 7
+
+    def test_unknown_period_falls_back_to_30_days(self):
+        current, _ = period_bounds("fortnightly", date(2024, 3, 30))
+        assert current == DateRange(date(2024, 3, 1), date(2024, 3, 30))
+
+    def test_weekly_is_latest_complete_week(self):
+        # Friday -> the Monday-Sunday week before
+        current, prior = period_bounds("weekly", date(2024, 3, 15))
+        assert current == DateRange(date(2024, 3, 4), date(2024, 3, 10))
+        assert prior == DateRange(date(2024, 2, 26), date(2024, 3, 3))
+
+        # Sunday completes the current week
+        current, _ = period_bounds("weekly", date(2024, 3, 17))
+        assert current == DateRange(date(2024, 3, 11), date(2024, 3, 17))
+
+    @pytest.mark.parametrize("period_type,today,current,prior", [
+        ("monthly", date(2024, 3, 15),
+         (date(2024, 2, 1), date(2024, 2, 29)), (date(2024, 1, 1), date(2024, 1, 31))),
+        ("monthly", date(2024, 3, 31),
+         (date(2024, 3, 1), date(2024, 3, 31)), (date(2024, 2, 1), date(2024, 2, 29))),
+        ("quarterly", date(2024, 2, 10),
+         (date(2023, 10, 1), date(2023, 12, 31)), (date(2023, 7, 1), date(2023, 9, 30))),
+        ("yearly", date(2024, 6, 1),
+         (date(2023, 1, 1), date(2023, 12, 31)), (date(2022, 1, 1), date(2022, 12, 31))),
+    ])
+    def test_calendar_periods(self, period_type, today, current, prior):
+        assert period_bounds(period_type, today) == (DateRange(*current), DateRange(*prior))
+
+
+class TestChannelTotals:
+
+    def test_ratios_come_from_summed_measures(self):
+        totals = ChannelTotals(spend=100.0, gross_revenue=50.0, new_customers=1)
+        totals.add(ChannelTotals(spend=100.0, gross_revenue=350.0, new_customers=3))
+
+        # sum/sum = 2.0, not the average of the daily ROAS (0.5 + 3.5) / 2
+        assert totals.gross_roas == 2.0
+        assert totals.cac == 50.0
+
+    def test_zero_denominators(self):
+        totals = ChannelTotals()
+        assert totals.gross_roas == 0.0
+        assert totals.ctr == 0.0
+        assert totals.conversion_rate == 0.0
+        assert totals.attribution_rate == 0.0
+
+    def test_attribution_rate(self):
+        assert ChannelTotals(attributed_orders=3, unattributed_orders=1).attribution_rate == 75.0
+
+    def test_change_pct(self):
+        assert change_pct(150.0, 100.0) == 50.0
+        assert change_pct(10.0, 0.0) == 0.0
+
+
+class TestRevenueTotals:
+
+    def test_sums_each_period_from_one_query(self):
+        current = DateRange(date(2024, 3, 9), date(2024, 3, 15))
+        prior = DateRange(date(2024, 3, 2), date(2024, 3, 8))
+        db = _db_returning([
+            _revenue_row(date(2024, 3, 3), gross=100.0, net=90.0, orders=2),
+            _revenue_row(date(2024, 3, 10), gross=200.0, net=180.0, orders=3),
+            _revenue_row(date(2024, 3, 15), gross=100.0, net=120.0, orders=1),
+            _revenue_row(date(2024, 3, 12), currency="EUR", gross=40.0, net=40.0, orders=1),
+        ])
+
+        result = revenue_totals_by_currency(db, "tenant-1", [current, prior])
+
+        assert db.execute.call_count == 1
+        params = db.execute.call_args.args[1]
+        assert params == {
+            "tenant_id": "tenant-1",
+            "start_date": prior.start,
+            "end_date": current.end,
+        }
+        usd_current, usd_prior = result["USD"]
+        assert usd_current.gross_revenue == 300.0
+        assert usd_current.order_count == 4
+        assert usd_current.aov == 75.0
+        assert usd_prior.net_revenue == 90.0
+        assert result["EUR"][1].gross_revenue == 0.0
+
+    def test_agent_revenue_breakdown_uses_main_currency(self):
+        today = date.today()
+        db = _db_returning([
+            _revenue_row(today, gross=500.0, net=400.0, orders=4, refunds=100.0),
+            _revenue_row(today, currency="EUR", gross=50.0, net=50.0, orders=1),
+        ])
+
+        result = json.loads(_tool_revenue_breakdown("tenant-1", db, {}))["result"]
+
+        assert result["currency"] == "USD"
+        assert result["gross_revenue"] == 500.0
+        assert result["aov"] == 100.0
+        assert result["refund_amount"] == 100.0
+        assert result["gross_revenue_change_pct"] == 0.0
+        assert result["period_end"] == str(today)
+
+    def test_agent_revenue_breakdown_without_rows(self):
+        result = json.loads(_tool_revenue_breakdown("tenant-1", _db_returning([]), {}))
+        assert result == {"result": "No revenue data available for this period."}
@@ -275,7 +275,7 @@ class TestNotificationQueries:
         """Should return unread count for user."""
         mock_query = MagicMock()
         mock_query.filter.return_value = mock_query
-        mock_query.count.return_value = 5
+        mock_query.scalar.return_value = 5
         mock_db_session.query.return_value = mock_query
 
         service = NotificationService(mock_db_session, tenant_id)
@@ -289,7 +289,7 @@ class TestNotificationQueries:
         mock_notification.mark_read = Mock()
 
         mock_query = MagicMock()
-        mock_query.filter.return_value.first.return_value = mock_notification
+        mock_query.filter.return_value.with_for_update.return_value.first.return_value = mock_notification
         mock_db_session.query.return_value = mock_query
 
         service = NotificationService(mock_db_session, tenant_id)
@@ -301,7 +301,7 @@ class TestNotificationQueries:
     def test_mark_as_read_not_found(self, mock_db_session, tenant_id, user_id):
         """Should return False if notification not found."""
         mock_query = MagicMock()
-        mock_query.filter.return_value.first.return_value = None
+        mock_query.filter.return_value.with_for_update.return_value.first.return_value = None
         mock_db_session.query.return_value = mock_query
 
         service = NotificationService(mock_db_session, tenant_id)
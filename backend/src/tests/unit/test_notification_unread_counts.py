@@ -0,0 +1,200 @@
+"""
+Unit tests for per-user unread notification counters.
+
+Covers counter maintenance in notify / mark_as_read / mark_all_as_read,
+counter-backed reads, and the unread count server-sent event stream.
+
+Story 9.1 - Notification Framework (Events → Channels)
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.api.routes import notifications as notification_routes
+from src.db_base import Base
+from src.models.notification import (
+    Notification,
+    NotificationEventType,
+    NotificationUnreadCount,
+)
+from src.models.notification_preference import NotificationPreference
+from src.services.notification_service import NotificationService
+
+TENANT = "tenant-1"
+USER = "user-1"
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine, tables=[
+        Notification.__table__,
+        NotificationPreference.__table__,
+        NotificationUnreadCount.__table__,
+    ])
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+def _notify(db, entity_id, user_id=USER, tenant_id=TENANT):
+    notification = NotificationService(db, tenant_id).notify(
+        event_type=NotificationEventType.ACTION_EXECUTED,
+        title="Action executed",
+        message="Done",
+        user_id=user_id,
+        entity_id=entity_id,
+    )
+    db.commit()
+    return notification
+
+
+def _counted_unread(db, user_id=USER):
+    return (
+        db.query(Notification)
+        .filter(Notification.tenant_id == TENANT, Notification.user_id == user_id)
+        .filter(Notification.read_at.is_(None))
+        .count()
+    )
+
+
+class TestCounterMaintenance:
+
+    def test_notify_increments_user_counter(self, db):
+        _notify(db, "a-1")
+        _notify(db, "a-2")
+        _notify(db, "a-3", user_id="user-2")
+        _notify(db, "a-4", user_id=None)
+        _notify(db, "a-5", tenant_id="tenant-2")
+
+        service = NotificationService(db, TENANT)
+        assert service.get_unread_count(USER) == 2
+        assert service.get_unread_count("user-2") == 1
+        assert service.get_unread_count("user-3") == 0
+
+    def test_mark_as_read_decrements_once(self, db):
+        first = _notify(db, "a-1")
+        _notify(db, "a-2")
+        service = NotificationService(db, TENANT)
+
+        assert service.mark_as_read(first.id, USER)
+        assert service.mark_as_read(first.id, USER)
+        db.commit()
+
+        assert service.get_unread_count(USER) == 1 == _counted_unread(db)
+
+    def test_mark_all_as_read_subtracts_marked(self, db):
+        for i in range(3):
+            _notify(db, f"a-{i}")
+        service = NotificationService(db, TENANT)
+
+        assert service.mark_all_as_read(USER) == 3
+        db.commit()
+        assert service.get_unread_count(USER) == 0
+
+        _notify(db, "a-9")
+        assert service.get_unread_count(USER) == 1 == _counted_unread(db)
+
+    def test_duplicate_notify_leaves_counter_alone(self, db):
+        _notify(db, "a-1")
+        assert _notify(db, "a-1") is None
+
+        assert NotificationService(db, TENANT).get_unread_count(USER) == 1
+
+    def test_version_moves_when_count_does_not(self, db):
+        first = _notify(db, "a-1")
+        service = NotificationService(db, TENANT)
+        count, version = service.get_unread_state(USER)
+
+        service.mark_as_read(first.id, USER)
+        _notify(db, "a-2")
+
+        new_count, new_version = service.get_unread_state(USER)
+        assert new_count == count == 1
+        assert new_version > version
+        assert service.get_unread_state("nobody") == (0, 0)
+
+
+class TestCounterReads:
+
+    def test_unread_list_skips_query_when_counter_is_zero(self, db):
+        statements = []
+        event.listen(
+            db.get_bind(), "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+
+        assert NotificationService(db, TENANT).get_unread_notifications(USER) == []
+        assert len(statements) == 1
+        assert "notification_unread_counts" in statements[0]
+
+    def test_unread_list_returns_unread(self, db):
+        first = _notify(db, "a-1")
+        _notify(db, "a-2")
+        service = NotificationService(db, TENANT)
+        service.mark_as_read(first.id, USER)
+
+        assert [n.entity_id for n in service.get_unread_notifications(USER)] == ["a-2"]
+
+
+class FakeRequest:
+    """Request stand-in for the stream route: connected for a fixed number of checks."""
+
+    def __init__(self, checks):
+        self.state = SimpleNamespace()
+        self._checks = checks
+
+    async def is_disconnected(self):
+        self._checks -= 1
+        return self._checks < 0
+
+
+class TestUnreadStream:
+
+    async def _stream(self, session_factory, request, between_polls=None):
+        chunks = []
+        with patch.object(notification_routes, "get_session_factory", return_value=session_factory), \
+                patch.object(notification_routes, "get_tenant_context",
+                             return_value=SimpleNamespace(tenant_id=TENANT, user_id=USER)), \
+                patch.object(notification_routes, "UNREAD_STREAM_POLL_SECONDS", 0):
+            response = await notification_routes.stream_unread_count(request, _rate_limit=None)
+            async for chunk in response.body_iterator:
+                chunks.append(chunk)
+                if between_polls and len(chunks) == 1:
+                    between_polls()
+        return chunks
+
+    @pytest.mark.asyncio
+    async def test_sends_count_on_connect_and_on_change(self, session_factory):
+        db = session_factory()
+        _notify(db, "a-1")
+
+        chunks = await self._stream(
+            session_factory,
+            FakeRequest(checks=3),
+            between_polls=lambda: _notify(db, "a-2"),
+        )
+
+        counts = [
+            json.loads(chunk.split("data: ", 1)[1])["count"]
+            for chunk in chunks if "event: unread" in chunk
+        ]
+        assert counts == [1, 2]
+        assert chunks[-1] == ": keepalive\n\n"
+        db.close()
@@ -7,7 +7,7 @@ Covers:
 - store_credentials: encrypts + creates ConnectorCredential row
 - revoke_credentials: sets REVOKED status + soft_deleted_at
 - _encrypt_credentials: delegates to encrypt_secret
-- _decrypt_credentials: delegates to decrypt_secret + json.loads
+- _load_payload: decrypts through the credential vault (shared payload cache)
 - check_credentials_exist: returns True/False based on get_credentials_for_platform
 - get_credentials_for_platform: dispatches to correct getter
 - validate_credentials: missing returns CredentialStatus.MISSING
@@ -90,15 +90,15 @@ class TestPlatformSourceTypeMapping:
 
 
 # =============================================================================
-# _encrypt_credentials / _decrypt_credentials
+# _encrypt_credentials / _load_payload
 # =============================================================================
 
 class TestEncryptDecryptCredentials:
-    """Tests for _encrypt_credentials (async, uses asyncio.run internally)
-    and _decrypt_credentials (sync, uses asyncio.run internally).
+    """Tests for _encrypt_credentials (sync, uses asyncio.run internally)
+    and _load_payload (async, decrypts through CredentialVault).
 
-    Both methods detect a running event loop and raise RuntimeError,
-    so we must patch asyncio.run to avoid that guard.
+    _encrypt_credentials detects a running event loop and raises
+    RuntimeError, so we must patch asyncio.run to avoid that guard.
     """
 
     @patch("src.services.platform_credentials_service.asyncio.run")
@@ -119,32 +119,38 @@ class TestEncryptDecryptCredentials:
         # asyncio.run was called with the encrypt_secret coroutine
         mock_aio_run.assert_called_once()
 
-    @patch("src.services.platform_credentials_service.asyncio.run")
-    @patch("src.services.platform_credentials_service.asyncio.get_running_loop", side_effect=RuntimeError)
-    @patch("src.services.platform_credentials_service.decrypt_secret", new_callable=AsyncMock)
-    def test_decrypt_parses_json_from_decrypt_secret(
-        self, mock_decrypt, _mock_loop, mock_aio_run,
-    ):
+    @pytest.mark.asyncio
+    @patch("src.services.credential_vault.decrypt_secret", new_callable=AsyncMock)
+    async def test_load_payload_decrypts_once_through_vault_cache(self, mock_decrypt):
         payload = {"access_token": "tok123", "ad_account_id": "act_456"}
-        mock_aio_run.return_value = json.dumps(payload)
+        mock_decrypt.return_value = json.dumps(payload)
         service = _service()
+        cred = _make_credential("meta", payload)
 
-        result = service._decrypt_credentials("ENCRYPTED_BLOB")
+        assert await service._load_payload(TENANT_ID, cred) == payload
+        assert await service._load_payload(TENANT_ID, cred) == payload
+        mock_decrypt.assert_awaited_once_with("FAKE_ENCRYPTED_DATA")
 
-        assert result == payload
-        mock_aio_run.assert_called_once()
+    @pytest.mark.asyncio
+    @patch("src.services.credential_vault.decrypt_secret", new_callable=AsyncMock)
+    async def test_load_payload_raises_on_invalid_json(self, mock_decrypt):
+        from src.services.credential_vault import CredentialVaultError
 
-    @patch("src.services.platform_credentials_service.asyncio.run")
-    @patch("src.services.platform_credentials_service.asyncio.get_running_loop", side_effect=RuntimeError)
-    @patch("src.services.platform_credentials_service.decrypt_secret", new_callable=AsyncMock)
-    def test_decrypt_raises_on_invalid_json(
-        self, mock_decrypt, _mock_loop, mock_aio_run,
-    ):
-        mock_aio_run.return_value = "NOT_VALID_JSON{{{"
+        mock_decrypt.return_value = "NOT_VALID_JSON{{{"
         service = _service()
 
-        with pytest.raises(json.JSONDecodeError):
-            service._decrypt_credentials("BAD_PAYLOAD")
+        with pytest.raises(CredentialVaultError):
+            await service._load_payload(TENANT_ID, _make_credential("meta", {}))
+
+    @pytest.mark.asyncio
+    async def test_load_payload_rejects_other_tenant_credential(self):
+        from src.services.credential_vault import CredentialVaultError
+
+        cred = _make_credential("meta", {})
+        cred.tenant_id = "other-tenant"
+
+        with pytest.raises(CredentialVaultError):
+            await _service()._load_payload(TENANT_ID, cred)
 
 
 # =============================================================================
@@ -162,8 +168,7 @@ class TestGetMetaCredentials:
         session.execute.return_value.scalar_one_or_none.return_value = cred
 
         service = _service(session)
-        # Patch _decrypt_credentials (sync) to bypass asyncio.run guard
-        service._decrypt_credentials = MagicMock(return_value=payload)
+        service._load_payload = AsyncMock(return_value=payload)
         result = await service.get_meta_credentials(TENANT_ID)
 
         assert result is not None
@@ -191,7 +196,7 @@ class TestGetMetaCredentials:
         # Missing ad_account_id — .get("ad_account_id", "") returns empty string,
         # which the service treats as valid (returns MetaCredentials with empty ad_account_id).
         # Simulate a decrypt failure (exception) to exercise the None-return path.
-        service._decrypt_credentials = MagicMock(side_effect=RuntimeError("bad payload"))
+        service._load_payload = AsyncMock(side_effect=RuntimeError("bad payload"))
         result = await service.get_meta_credentials(TENANT_ID)
 
         assert result is None
@@ -204,7 +209,7 @@ class TestGetMetaCredentials:
         session.execute.return_value.scalar_one_or_none.return_value = cred
 
         service = _service(session)
-        service._decrypt_credentials = MagicMock(
+        service._load_payload = AsyncMock(
             return_value={"access_token": "tok", "ad_account_id": "act_1"}
         )
         await service.get_meta_credentials(TENANT_ID)
@@ -237,7 +242,7 @@ class TestGetGoogleCredentials:
         session.execute.return_value.scalar_one_or_none.return_value = cred
 
         service = _service(session)
-        service._decrypt_credentials = MagicMock(return_value=payload)
+        service._load_payload = AsyncMock(return_value=payload)
         result = await service.get_google_credentials(TENANT_ID)
 
         assert result is not None
@@ -273,7 +278,7 @@ class TestGetGoogleCredentials:
         session.execute.return_value.scalar_one_or_none.return_value = cred
 
         service = _service(session)
-        service._decrypt_credentials = MagicMock(return_value=payload)
+        service._load_payload = AsyncMock(return_value=payload)
         result = await service.get_google_credentials(TENANT_ID)
 
         assert result is not None
@@ -445,7 +450,7 @@ class TestGetCredentialsForPlatform:
         session.execute.return_value.scalar_one_or_none.return_value = cred
 
         service = _service(session)
-        service._decrypt_credentials = MagicMock(return_value=payload)
+        service._load_payload = AsyncMock(return_value=payload)
         result = await service.get_credentials_for_platform(TENANT_ID, Platform.META)
 
         assert result is not None
@@ -468,7 +473,7 @@ class TestGetCredentialsForPlatform:
         session.execute.return_value.scalar_one_or_none.return_value = cred
 
         service = _service(session)
-        service._decrypt_credentials = MagicMock(return_value=payload)
+        service._load_payload = AsyncMock(return_value=payload)
         result = await service.get_credentials_for_platform(TENANT_ID, Platform.GOOGLE)
 
         assert result is not None
@@ -499,7 +504,7 @@ class TestCheckCredentialsExist:
         session.execute.return_value.scalar_one_or_none.return_value = cred
 
         service = _service(session)
-        service._decrypt_credentials = MagicMock(return_value=payload)
+        service._load_payload = AsyncMock(return_value=payload)
         result = await service.check_credentials_exist(TENANT_ID, Platform.META)
 
         assert result is True
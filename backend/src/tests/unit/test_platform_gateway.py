@@ -0,0 +1,319 @@
+"""
+Unit tests for the shared platform gateway and batched executor state reads.
+
+Covers:
+- TokenBucket: burst, debt-based waits, blocking, refunds
+- PlatformGateway: shared clients, per-account budgets, rate-limit headers
+- MetaAdsExecutor.get_entity_states: Graph batch API
+- GoogleAdsExecutor.get_entity_states: GAQL multi-get
+- ActionExecutionService: prefetched before-state reuse
+"""
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from src.services.platform_executors import (
+    GoogleAdsCredentials,
+    GoogleAdsExecutor,
+    MetaAdsExecutor,
+    MetaCredentials,
+    PlatformAPIError,
+    PlatformGateway,
+    RateBudgetConfig,
+    RateBudgetExhaustedError,
+    StateCapture,
+    TokenBucket,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _response(status_code: int = 200, headers: dict | None = None) -> httpx.Response:
+    return httpx.Response(status_code, headers=headers or {}, json={})
+
+
+# =============================================================================
+# TokenBucket
+# =============================================================================
+
+class TestTokenBucket:
+
+    def test_burst_then_wait_for_refill(self):
+        clock = FakeClock()
+        bucket = TokenBucket(capacity=2, refill_per_second=1.0, clock=clock)
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(1.0)
+        assert bucket.reserve() == pytest.approx(2.0)
+
+        clock.now += 2.0
+        assert bucket.reserve() == pytest.approx(1.0)
+
+    def test_block_for_delays_all_reservations(self):
+        clock = FakeClock()
+        bucket = TokenBucket(capacity=10, refill_per_second=1.0, clock=clock)
+
+        bucket.block_for(5.0)
+
+        assert bucket.reserve() == pytest.approx(5.0)
+        clock.now += 5.0
+        assert bucket.reserve() == 0
+
+    def test_drain_removes_burst(self):
+        clock = FakeClock()
+        bucket = TokenBucket(capacity=10, refill_per_second=2.0, clock=clock)
+
+        bucket.drain()
+
+        assert bucket.reserve() == pytest.approx(0.5)
+
+    def test_refund_restores_tokens(self):
+        bucket = TokenBucket(capacity=1, refill_per_second=1.0, clock=FakeClock())
+        bucket.reserve()
+        bucket.refund()
+        assert bucket.reserve() == 0
+
+
+# =============================================================================
+# PlatformGateway
+# =============================================================================
+
+class TestPlatformGateway:
+
+    @pytest.mark.asyncio
+    async def test_client_shared_per_platform(self):
+        gateway = PlatformGateway()
+        try:
+            meta_a = gateway.get_client("meta")
+            meta_b = gateway.get_client("meta")
+            google = gateway.get_client("google")
+
+            assert meta_a is meta_b
+            assert meta_a is not google
+            assert gateway.is_shared_client(meta_a)
+        finally:
+            await gateway.aclose()
+
+        assert meta_a.is_closed
+
+    def test_client_from_finished_loop_is_closed_on_replace(self):
+        gateway = PlatformGateway()
+
+        async def get_meta_client():
+            client = gateway.get_client("meta")
+            await asyncio.sleep(0)  # let a scheduled close of the replaced client run
+            return client
+
+        first = asyncio.run(get_meta_client())
+        second = asyncio.run(get_meta_client())
+
+        assert first is not second
+        assert first.is_closed
+        assert not gateway.is_shared_client(first)
+
+    def test_budgets_are_per_account(self):
+        gateway = PlatformGateway()
+        assert gateway.get_bucket("meta", "act_1") is gateway.get_bucket("meta", "act_1")
+        assert gateway.get_bucket("meta", "act_1") is not gateway.get_bucket("meta", "act_2")
+
+    @pytest.mark.asyncio
+    async def test_acquire_raises_when_wait_exceeds_max(self):
+        clock = FakeClock()
+        gateway = PlatformGateway(
+            budgets={"meta": RateBudgetConfig(capacity=1, refill_per_second=1.0, max_wait_seconds=5)},
+            clock=clock,
+        )
+        gateway.get_bucket("meta", "act_1").block_for(60)
+
+        with pytest.raises(RateBudgetExhaustedError) as exc_info:
+            await gateway.acquire("meta", "act_1")
+
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.is_retryable
+        assert exc_info.value.retry_after == pytest.approx(60)
+
+    def test_429_retry_after_blocks_budget(self):
+        clock = FakeClock()
+        gateway = PlatformGateway(clock=clock)
+
+        gateway.observe_response("google", "123", _response(429, {"Retry-After": "7"}))
+
+        assert gateway.get_bucket("google", "123").reserve() >= 7
+
+    def test_meta_high_usage_pauses_account(self):
+        clock = FakeClock()
+        gateway = PlatformGateway(clock=clock)
+        headers = {
+            "X-Business-Use-Case-Usage": json.dumps({
+                "123": [{
+                    "type": "ads_management",
+                    "call_count": 98,
+                    "total_cputime": 10,
+                    "total_time": 10,
+                    "estimated_time_to_regain_access": 2,
+                }]
+            }),
+        }
+
+        gateway.observe_response("meta", "act_123", _response(200, headers))
+
+        assert gateway.get_bucket("meta", "act_123").reserve() >= 120
+        assert gateway.get_bucket("meta", "act_other").reserve() == 0
+
+    def test_meta_ignores_malformed_business_use_case_entries(self):
+        gateway = PlatformGateway(clock=FakeClock())
+        headers = {
+            "X-Business-Use-Case-Usage": json.dumps({
+                "123": ["ads_management", None, {"call_count": 98}],
+            }),
+        }
+
+        gateway.observe_response("meta", "act_123", _response(200, headers))
+
+        assert gateway.get_bucket("meta", "act_123").reserve() >= 60
+
+    def test_meta_moderate_usage_drains_burst(self):
+        gateway = PlatformGateway(clock=FakeClock())
+        headers = {"X-Ad-Account-Usage": json.dumps({"acc_id_util_pct": 80, "reset_time_duration": 300})}
+
+        gateway.observe_response("meta", "act_1", _response(200, headers))
+
+        wait = gateway.get_bucket("meta", "act_1").reserve()
+        assert 0 < wait < 300
+
+    def test_shopify_throttle_status_pauses_until_restored(self):
+        gateway = PlatformGateway(clock=FakeClock())
+
+        gateway.observe_shopify_throttle_status(
+            "shop.myshopify.com",
+            {"maximumAvailable": 1000, "currentlyAvailable": 50, "restoreRate": 50},
+        )
+
+        assert gateway.get_bucket("shopify", "shop.myshopify.com").reserve() >= 1.0
+
+
+# =============================================================================
+# Batched state reads
+# =============================================================================
+
+def _mock_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestMetaBatchStateReads:
+
+    @pytest.mark.asyncio
+    async def test_batch_reads_in_one_request(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=[
+                {"code": 200, "body": json.dumps({"id": "1", "status": "ACTIVE"})},
+                {"code": 200, "body": json.dumps({"id": "2", "status": "PAUSED"})},
+            ])
+
+        executor = MetaAdsExecutor(
+            credentials=MetaCredentials(access_token="tok", ad_account_id="123"),
+            gateway=PlatformGateway(),
+        )
+        executor._client = _mock_client(handler)
+
+        captures = await executor.capture_before_states([("1", "campaign"), ("2", "ad_set")])
+
+        assert len(requests) == 1
+        batch = json.loads(dict(httpx.QueryParams(requests[0].content.decode()))["batch"])
+        assert batch[0]["relative_url"].startswith("v18.0/1?fields=")
+        assert [c.state["status"] for c in captures] == ["ACTIVE", "PAUSED"]
+        assert [c.entity_type for c in captures] == ["campaign", "ad_set"]
+
+    @pytest.mark.asyncio
+    async def test_batch_entry_error_raises(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=[
+                {"code": 400, "body": json.dumps({"error": {"message": "bad id", "code": 100}})},
+            ])
+
+        executor = MetaAdsExecutor(
+            credentials=MetaCredentials(access_token="tok", ad_account_id="123"),
+            gateway=PlatformGateway(),
+        )
+        executor._client = _mock_client(handler)
+
+        with pytest.raises(PlatformAPIError, match="bad id"):
+            await executor.get_entity_states([("1", "campaign")])
+
+
+class TestGoogleMultiGetStateReads:
+
+    @pytest.mark.asyncio
+    async def test_groups_ids_into_single_query(self):
+        queries = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            queries.append(json.loads(request.content)["query"])
+            assert request.headers["developer-token"] == "dev"
+            return httpx.Response(200, json=[{"results": [
+                {"campaign": {"id": "222", "status": "PAUSED"}},
+                {"campaign": {"id": "111", "status": "ENABLED"}},
+            ]}])
+
+        executor = GoogleAdsExecutor(
+            credentials=GoogleAdsCredentials(
+                access_token="tok",
+                refresh_token="r",
+                client_id="c",
+                client_secret="s",
+                developer_token="dev",
+                customer_id="123-456-7890",
+            ),
+            gateway=PlatformGateway(),
+        )
+        executor._client = _mock_client(handler)
+
+        captures = await executor.get_entity_states([
+            ("111", "campaign"), ("222", "campaign"), ("333", "campaign"),
+        ])
+
+        assert len(queries) == 1
+        assert "campaign.id IN (111, 222, 333)" in queries[0]
+        assert [c.state.get("status") for c in captures] == ["ENABLED", "PAUSED", None]
+        assert captures[2].state == {}
+
+
+# =============================================================================
+# ActionExecutionService prefetch
+# =============================================================================
+
+class TestPrefetchedBeforeState:
+
+    @pytest.mark.asyncio
+    async def test_prefetched_state_used_once(self):
+        from src.services.action_execution_service import ActionExecutionService
+
+        service = ActionExecutionService(db_session=MagicMock(), tenant_id="tenant-1")
+        action = SimpleNamespace(
+            platform="Meta",
+            target_entity_type=SimpleNamespace(value="campaign"),
+            target_entity_id="111",
+        )
+        capture = StateCapture(entity_id="111", entity_type="campaign", platform="meta", state={"s": 1})
+        service._prefetched_states[("meta", "campaign", "111")] = (time.monotonic(), capture)
+        executor = MagicMock()
+        executor.capture_before_state = AsyncMock(return_value="live")
+
+        assert await service._capture_before_state(action, executor) is capture
+        assert await service._capture_before_state(action, executor) == "live"
@@ -444,7 +444,8 @@ class TestRecommendationGenerationService:
         result = service._persist_recommendation(detected, job_id="job-123")
 
         assert result is None
-        mock_db_session.rollback.assert_called_once()
+        mock_db_session.begin_nested.assert_called_once()
+        mock_db_session.rollback.assert_not_called()
 
 
 # =============================================================================
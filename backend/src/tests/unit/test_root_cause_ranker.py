@@ -4,14 +4,16 @@ Unit tests for the root cause ranking engine.
 Story 4.2 - Data Quality Root Cause Signals (Prompt 4.2.5)
 """
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from src.services.root_cause_ranker import (
+    AnomalyInput,
     RootCauseRanker,
     RankedRootCause,
+    group_anomalies,
     _normalize_confidences,
     _apply_causal_ordering,
 )
@@ -473,3 +475,126 @@ class TestRankedRootCause:
         )
         h = rc.to_hypothesis()
         assert h.first_seen_at is None
+
+
+# ===========================================================================
+# Batch Analysis
+# ===========================================================================
+
+
+def _anomaly(dataset, minutes=0, connector_id="conn-001", **fields):
+    return AnomalyInput(
+        dataset=dataset,
+        anomaly_type="freshness",
+        detected_at=_NOW + timedelta(minutes=minutes),
+        connector_id=connector_id,
+        **fields,
+    )
+
+
+class TestGroupAnomalies:
+    """Tests for group_anomalies."""
+
+    def test_groups_by_connector_and_window(self):
+        anomalies = [
+            _anomaly("orders", minutes=0),
+            _anomaly("refunds", minutes=45),
+            _anomaly("customers", minutes=90),
+            _anomaly("ads", minutes=10, connector_id="conn-002"),
+        ]
+
+        groups = group_anomalies(anomalies, window=timedelta(minutes=60))
+
+        assert [[a.dataset for a in g] for g in groups] == [
+            ["orders", "refunds"],
+            ["customers"],
+            ["ads"],
+        ]
+
+    def test_empty(self):
+        assert group_anomalies([]) == []
+
+
+class TestBatchAnalysis:
+    """Tests for RootCauseRanker.analyze_batch."""
+
+    @patch("src.services.root_cause_ranker.load_upstream_inputs")
+    @patch("src.services.root_cause_ranker.load_ingestion_inputs")
+    @patch("src.services.root_cause_ranker.diagnose_ingestion_failure")
+    @patch("src.services.root_cause_ranker.diagnose_schema_drift")
+    @patch("src.services.root_cause_ranker.diagnose_transformation_regression")
+    @patch("src.services.root_cause_ranker.diagnose_upstream_shift")
+    @patch("src.services.audit_logger.emit_root_cause_signals_generated")
+    def test_shared_inputs_loaded_once_and_bulk_persisted(
+        self, mock_audit, mock_upstream, mock_transform, mock_schema,
+        mock_ingestion, mock_load_ingestion, mock_load_upstream,
+    ):
+        mock_ingestion.return_value = IngestionDiagnosticResult(
+            detected=True, confidence_score=0.85,
+            evidence={"signal": "sync_failure"}, suggested_next_step="Check",
+        )
+        mock_schema.side_effect = lambda **kw: SchemaDriftResult(
+            detected=kw["dataset"] == "refunds", confidence_score=0.9,
+            evidence={"signal": "column_removed"}, suggested_next_step="Schema",
+        )
+        mock_transform.return_value = TransformationRegressionResult(detected=False)
+        mock_upstream.return_value = UpstreamShiftResult(detected=False)
+
+        db = _mock_db()
+        db.add_all = MagicMock()
+        ranker = RootCauseRanker(db, _TENANT)
+        groups = ranker.analyze_batch([
+            _anomaly("orders"),
+            _anomaly("refunds", minutes=5),
+            _anomaly("customers", minutes=10, correlation_id="corr-own"),
+        ])
+
+        # One upstream outage -> one group, connector evidence loaded once
+        assert len(groups) == 1
+        mock_load_ingestion.assert_called_once()
+        mock_load_upstream.assert_called_once()
+        for call in mock_ingestion.call_args_list:
+            assert call.kwargs["inputs"] is mock_load_ingestion.return_value
+
+        # Per-anomaly ranking still applies
+        group = groups[0]
+        by_dataset = {a.dataset: a for a in group.analyses}
+        assert by_dataset["orders"].ranked_causes[0].cause_type == "ingestion_failure"
+        assert by_dataset["refunds"].ranked_causes[0].cause_type == "schema_drift"
+
+        # Group ranking keeps the strongest hypothesis per cause type
+        assert [c.cause_type for c in group.ranked_causes] == [
+            "schema_drift", "ingestion_failure",
+        ]
+        assert [c.rank for c in group.ranked_causes] == [1, 2]
+
+        # Bulk persist: one add_all, one commit, one audit write
+        db.add_all.assert_called_once()
+        signals = db.add_all.call_args.args[0]
+        assert len(signals) == 3
+        assert db.commit.call_count == 1
+        assert {a.signal_id for a in group.analyses} == {s.id for s in signals}
+        assert [s.correlation_id for s in signals] == [
+            group.correlation_id, group.correlation_id, "corr-own",
+        ]
+        records = mock_audit.call_args.kwargs["signals"]
+        assert [r["dataset"] for r in records] == ["orders", "refunds", "customers"]
+
+    @patch("src.services.root_cause_ranker.load_upstream_inputs")
+    @patch("src.services.root_cause_ranker.load_ingestion_inputs")
+    @patch("src.services.audit_logger.emit_root_cause_signals_generated")
+    def test_one_load_per_group(self, mock_audit, mock_load_ingestion, mock_load_upstream):
+        mock_load_ingestion.return_value = None
+        mock_load_upstream.return_value = None
+
+        db = _mock_db()
+        db.add_all = MagicMock()
+        groups = RootCauseRanker(db, _TENANT).analyze_batch([
+            _anomaly("orders"),
+            _anomaly("ads", connector_id="conn-002"),
+        ])
+
+        assert len(groups) == 2
+        assert mock_load_ingestion.call_count == 2
+        assert db.commit.call_count == 1
+        assert mock_audit.call_count == 1
@@ -0,0 +1,142 @@
+"""
+Unit tests for the diagnostics stats kernels.
+
+Covers key alignment, JSD, argpartition top-k, medians, robust z-scores
+and ratio thresholding, plus agreement with the diagnostics that use them.
+
+Story 4.2 - Data Quality Root Cause Signals
+"""
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from src.diagnostics import stats_kernels
+from src.diagnostics.ingestion_diagnostics import _compute_median
+from src.diagnostics.transformation_regression import _detect_execution_time_regression
+from src.diagnostics.upstream_shift import _compute_top_movers, _jensen_shannon_divergence
+from src.ingestion.dbt_artifact_parser import DbtModelResult
+
+
+def _loop_jsd(p, q):
+    keys = set(p) | set(q)
+    p_vec = [p.get(k, 0.0) + 1e-10 for k in keys]
+    q_vec = [q.get(k, 0.0) + 1e-10 for k in keys]
+    p_vec = [x / sum(p_vec) for x in p_vec]
+    q_vec = [x / sum(q_vec) for x in q_vec]
+    m_vec = [(a + b) / 2 for a, b in zip(p_vec, q_vec)]
+    kl = lambda a, b: sum(x * math.log2(x / y) for x, y in zip(a, b))  # noqa: E731
+    return (kl(p_vec, m_vec) + kl(q_vec, m_vec)) / 2
+
+
+def _model(name, seconds):
+    return DbtModelResult(
+        model_name=name, schema_name="analytics", status="pass",
+        execution_time_seconds=seconds,
+    )
+
+
+class TestAlign:
+
+    def test_union_in_first_seen_order(self):
+        keys, current, baseline = stats_kernels.align({"a": 1, "b": 2}, {"b": 3, "c": 4})
+
+        assert keys == ["a", "b", "c"]
+        assert current.tolist() == [1.0, 2.0, 0.0]
+        assert baseline.tolist() == [0.0, 3.0, 4.0]
+
+
+class TestJensenShannonDivergence:
+
+    def test_identical_is_zero(self):
+        assert stats_kernels.jensen_shannon_divergence([0.5, 0.5], [0.5, 0.5]) == pytest.approx(0.0)
+
+    def test_disjoint_is_one(self):
+        assert stats_kernels.distribution_divergence({"a": 1.0}, {"b": 1.0}) == pytest.approx(1.0, abs=1e-6)
+
+    def test_empty_is_zero(self):
+        assert stats_kernels.distribution_divergence({}, {}) == 0.0
+
+    def test_matches_loop_at_scale(self):
+        rng = random.Random(7)
+        p = {f"c{i}": rng.random() for i in range(10_000)}
+        q = {f"c{i}": rng.random() for i in range(500, 10_500)}
+
+        assert _jensen_shannon_divergence(p, q) == pytest.approx(_loop_jsd(p, q), rel=1e-9)
+
+
+class TestTopMovers:
+
+    def test_top_k_indices_largest_first(self):
+        scores = np.array([0.1, 0.9, 0.5, 0.9, 0.2])
+        assert stats_kernels.top_k_indices(scores, 3).tolist() == [1, 3, 2]
+        assert stats_kernels.top_k_indices(scores, 10).tolist() == [1, 3, 2, 4, 0]
+        assert stats_kernels.top_k_indices(scores, 0).tolist() == []
+
+    def test_top_movers_by_absolute_change(self):
+        movers = _compute_top_movers(
+            {"search": 0.2, "social": 0.7, "email": 0.1},
+            {"search": 0.6, "social": 0.3, "display": 0.1},
+        )
+
+        assert movers == [
+            {"category": "search", "change": -0.4},
+            {"category": "social", "change": 0.4},
+            {"category": "email", "change": 0.1},
+        ]
+
+
+class TestMedians:
+
+    def test_median(self):
+        assert _compute_median([]) == 0.0
+        assert _compute_median([3.0, 1.0, 2.0]) == 2.0
+        assert _compute_median([4.0, 1.0, 3.0, 2.0]) == 2.5
+
+    def test_rolling_median(self):
+        result = stats_kernels.rolling_median([1, 9, 2, 8, 3], window=3)
+        assert result.tolist() == [2.0, 8.0, 3.0]
+        assert stats_kernels.rolling_median([1, 2], window=3).size == 0
+
+
+class TestRobustZScore:
+
+    def test_scores_against_baseline_spread(self):
+        baseline = [10, 11, 9, 10, 12, 8]
+        z = stats_kernels.robust_zscore(20, baseline)
+        assert z == pytest.approx((20 - 10) / (1.4826 * 1.0))
+
+    def test_vector_input(self):
+        z = stats_kernels.robust_zscore([10, 12], [10, 11, 9])
+        assert z.tolist() == pytest.approx([0.0, 2 / 1.4826])
+
+    def test_flat_baseline(self):
+        assert stats_kernels.robust_zscore(5, [5, 5, 5]) == 0.0
+        assert stats_kernels.robust_zscore(6, [5, 5, 5]) == math.inf
+        assert stats_kernels.robust_zscore(6, []) == 0.0
+
+
+class TestExecutionTimeRegression:
+
+    def test_flags_ratio_at_or_above_threshold(self):
+        previous = [_model("a", 1.0), _model("b", 2.0), _model("c", 0.0)]
+        current = [_model("a", 3.0), _model("b", 4.0), _model("c", 9.0), _model("d", 9.0)]
+
+        assert _detect_execution_time_regression(current, previous) == [
+            {
+                "model_name": "a",
+                "previous_seconds": 1.0,
+                "current_seconds": 3.0,
+                "execution_time_ratio": 3.0,
+            },
+        ]
+
+    def test_thousand_models(self):
+        previous = [_model(f"m{i}", 1.0 + i % 7) for i in range(1_000)]
+        current = [_model(f"m{i}", (1.0 + i % 7) * (4 if i % 10 == 0 else 1)) for i in range(1_000)]
+
+        regressions = _detect_execution_time_regression(current, previous)
+
+        assert [r["model_name"] for r in regressions] == [f"m{i}" for i in range(0, 1_000, 10)]
@@ -14,6 +14,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.services.dbt_manifest_index import is_semantic_view as _is_semantic_view
 from src.services.schema_compatibility_checker import (
     DatasetSchemaSnapshot,
     DatasetViewSchema,
@@ -22,8 +23,8 @@ from src.services.schema_compatibility_checker import (
 from src.services.superset_dataset_sync import (
     SupersetDatasetSync,
     _parse_manifest,
+    _catalog_columns,
     _get_semantic_models_with_exposed_columns,
-    _is_semantic_view,
 )
 
 
@@ -51,13 +52,17 @@ def _minimal_manifest_one_model() -> dict:
 
 def _make_sync_service(db=None):
     db = db or MagicMock()
-    return SupersetDatasetSync(
+    svc = SupersetDatasetSync(
         db=db,
         superset_url="http://superset.example.com",
         superset_username="u",
         superset_password="p",
         database_name="markinsight",
     )
+    svc.client.get_dataset_columns = MagicMock(
+        return_value=[{"column_name": "tenant_id", "type": "VARCHAR"}]
+    )
+    return svc
 
 
 def _mock_db_empty_baseline(db: MagicMock) -> None:
@@ -285,3 +290,100 @@ class TestSyncVersionLifecycle:
             assert "API error" in svc.version_manager.mark_failed.call_args[1]["error"]
         finally:
             Path(path).unlink(missing_ok=True)
+
+
+class TestSyncWritesDatasetCatalog:
+    """Each synced dataset is written to the discovery catalog with its Superset id."""
+
+    def test_catalog_entry_written_on_update(self):
+        db = MagicMock()
+        _mock_db_empty_baseline(db)
+        svc = _make_sync_service(db)
+        svc.version_manager = MagicMock()
+        manifest = _minimal_manifest_one_model()
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump(manifest, f)
+            path = f.name
+        try:
+            with patch(
+                "src.services.superset_dataset_sync.upsert_catalog_entry",
+            ) as upsert:
+                with patch.object(svc.client, "get_database_id", return_value=1):
+                    with patch.object(svc.client, "get_dataset", return_value={"id": 42}):
+                        with patch.object(svc.client, "update_dataset"):
+                            with patch.object(svc.client, "refresh_dataset_columns"):
+                                svc.sync(path)
+            args = upsert.call_args[0]
+            assert args[1:4] == ("fact_orders_current", 42, "semantic")
+            assert [c["column_name"] for c in args[5]] == ["tenant_id"]
+            svc.client.get_dataset_columns.assert_called_once_with(42)
+        finally:
+            Path(path).unlink(missing_ok=True)
+
+    def test_catalog_not_written_on_api_error(self):
+        db = MagicMock()
+        _mock_db_empty_baseline(db)
+        svc = _make_sync_service(db)
+        svc.version_manager = MagicMock()
+        manifest = _minimal_manifest_one_model()
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump(manifest, f)
+            path = f.name
+        try:
+            with patch(
+                "src.services.superset_dataset_sync.upsert_catalog_entry",
+            ) as upsert:
+                with patch.object(svc.client, "get_database_id", return_value=1):
+                    with patch.object(svc.client, "get_dataset", side_effect=Exception("API error")):
+                        svc.sync(path)
+            upsert.assert_not_called()
+        finally:
+            Path(path).unlink(missing_ok=True)
+
+    def test_catalog_columns_typed_by_superset(self):
+        exposed = [
+            {"column_name": "order_date", "description": "Order day", "data_type": None},
+            {"column_name": "revenue", "description": "", "data_type": None},
+            {"column_name": "not_in_superset", "description": "", "data_type": "VARCHAR"},
+        ]
+        superset_columns = [
+            {"column_name": "order_date", "type": "DATE"},
+            {"column_name": "revenue", "type": "NUMERIC(12,2)", "verbose_name": "Revenue"},
+            {"column_name": "tenant_id", "type": "VARCHAR"},
+        ]
+
+        assert _catalog_columns(exposed, superset_columns) == [
+            {"column_name": "order_date", "data_type": "DATE", "description": "Order day"},
+            {"column_name": "revenue", "data_type": "NUMERIC(12,2)", "description": "Revenue"},
+        ]
+
+    def test_warm_catalog_writes_existing_datasets_only(self):
+        db = MagicMock()
+        svc = _make_sync_service(db)
+        svc.version_manager = MagicMock()
+        manifest = _minimal_manifest_one_model()
+        manifest["nodes"]["model.markinsight.sem_orders_v1"] = {
+            "unique_id": "model.markinsight.sem_orders_v1",
+            "name": "sem_orders_v1",
+            "schema": "semantic",
+            "columns": {"tenant_id": {"meta": {"superset_expose": True}}},
+        }
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump(manifest, f)
+            path = f.name
+        try:
+            existing = {"fact_orders_current": {"id": 42}}
+            with patch(
+                "src.services.superset_dataset_sync.upsert_catalog_entry", return_value=True,
+            ) as upsert:
+                with patch.object(
+                    svc.client, "get_dataset", side_effect=lambda name, schema: existing.get(name),
+                ):
+                    written = svc.warm_catalog(path)
+            assert written == 1
+            args = upsert.call_args[0]
+            assert args[1:4] == ("fact_orders_current", 42, "semantic")
+            assert args[5] == [{"column_name": "tenant_id", "data_type": "VARCHAR", "description": ""}]
+            svc.version_manager.create_pending_version.assert_not_called()
+        finally:
+            Path(path).unlink(missing_ok=True)
@@ -60,7 +60,7 @@ def _mock_async_client(method_name: str, response_or_exc):
 @pytest.mark.asyncio
 @patch("src.platform.audit.log_system_audit_event_sync")
 @patch("src.services.token_manager.encrypt_secret", new_callable=AsyncMock)
-@patch("src.services.token_manager.decrypt_secret", new_callable=AsyncMock)
+@patch("src.services.credential_vault.decrypt_secret", new_callable=AsyncMock)
 async def test_proactive_refresh_meta_updates_payload_and_metadata(
     mock_decrypt, mock_encrypt, _mock_audit, monkeypatch
 ):
@@ -113,7 +113,7 @@ async def test_proactive_refresh_meta_updates_payload_and_metadata(
 @pytest.mark.asyncio
 @patch("src.platform.audit.log_system_audit_event_sync")
 @patch("src.services.token_manager.encrypt_secret", new_callable=AsyncMock)
-@patch("src.services.token_manager.decrypt_secret", new_callable=AsyncMock)
+@patch("src.services.credential_vault.decrypt_secret", new_callable=AsyncMock)
 async def test_reactive_refresh_google_success_normalizes_expiry(
     mock_decrypt, mock_encrypt, _mock_audit, monkeypatch
 ):
@@ -157,7 +157,7 @@ async def test_reactive_refresh_google_success_normalizes_expiry(
 
 @pytest.mark.asyncio
 @patch("src.platform.audit.log_system_audit_event_sync")
-@patch("src.services.token_manager.decrypt_secret", new_callable=AsyncMock)
+@patch("src.services.credential_vault.decrypt_secret", new_callable=AsyncMock)
 async def test_reactive_refresh_google_invalid_grant_is_permanent(
     mock_decrypt, _mock_audit, monkeypatch
 ):
@@ -190,7 +190,7 @@ async def test_reactive_refresh_google_invalid_grant_is_permanent(
 
 @pytest.mark.asyncio
 @patch("src.platform.audit.log_system_audit_event_sync")
-@patch("src.services.token_manager.decrypt_secret", new_callable=AsyncMock)
+@patch("src.services.credential_vault.decrypt_secret", new_callable=AsyncMock)
 async def test_reactive_refresh_meta_network_error_is_retryable(
     mock_decrypt, _mock_audit, monkeypatch
 ):
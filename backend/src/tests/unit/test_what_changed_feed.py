@@ -0,0 +1,227 @@
+"""
+Unit tests for the incremental "What Changed?" feed.
+
+Covers the daily counters and feed state maintained by record_* writes,
+the summary read from those counters, keyset pagination, and the live
+server-sent event stream.
+
+Story 9.8 - "What Changed?" Debug Panel
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.api.routes import what_changed
+from src.db_base import Base
+from src.models.action_approval_audit import ActionApprovalAudit
+from src.models.airbyte_connection import TenantAirbyteConnection
+from src.models.data_change_event import (
+    DataChangeDailyCount,
+    DataChangeEvent,
+    DataChangeEventType,
+    DataChangeFeedState,
+)
+from src.models.dq_models import DQIncident, SyncRun
+from src.services.data_change_aggregator import (
+    DataChangeAggregator,
+    InvalidCursorError,
+)
+
+TENANT = "tenant-1"
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine, tables=[
+        DataChangeEvent.__table__,
+        DataChangeDailyCount.__table__,
+        DataChangeFeedState.__table__,
+        SyncRun.__table__,
+        ActionApprovalAudit.__table__,
+        DQIncident.__table__,
+        TenantAirbyteConnection.__table__,
+    ])
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+def _record_syncs(db, count, tenant_id=TENANT):
+    aggregator = DataChangeAggregator(db, tenant_id)
+    for i in range(count):
+        aggregator.record_sync_completed_simple(
+            connection_id="conn-1", connector_name="Shopify", rows_synced=i + 1,
+        )
+    db.commit()
+
+
+class TestCounters:
+
+    def test_record_updates_daily_counts_and_feed_state(self, db):
+        _record_syncs(db, 2)
+        aggregator = DataChangeAggregator(db, TENANT)
+        aggregator.record_sync_failed_simple(connection_id="conn-1", connector_name="Shopify")
+        db.commit()
+
+        counts = {
+            row.event_type: row.event_count
+            for row in db.query(DataChangeDailyCount).filter_by(tenant_id=TENANT)
+        }
+        assert counts == {
+            DataChangeEventType.SYNC_COMPLETED.value: 2,
+            DataChangeEventType.SYNC_FAILED.value: 1,
+        }
+        assert aggregator.get_feed_version() == 3
+        assert DataChangeAggregator(db, "tenant-2").get_feed_version() == 0
+
+    def test_summary_counts_metric_changes_from_daily_counts(self, db):
+        _record_syncs(db, 3)
+        aggregator = DataChangeAggregator(db, TENANT)
+        aggregator.record_sync_failed_simple(connection_id="conn-1", connector_name="Shopify")
+        aggregator.record_ai_action_executed_simple(
+            action_id="a-1", action_type="pause_campaign", target_name="Campaign",
+        )
+        db.commit()
+        _record_syncs(db, 5, tenant_id="tenant-2")
+
+        summary = aggregator.get_summary(days=7)
+
+        assert summary["metric_changes_count"] == 4
+        assert summary["recent_syncs_count"] == 0
+        assert summary["recent_ai_actions_count"] == 0
+        assert summary["open_incidents_count"] == 0
+
+
+class TestKeysetPages:
+
+    def test_pages_follow_cursor_without_overlap(self, db):
+        _record_syncs(db, 5)
+        aggregator = DataChangeAggregator(db, TENANT)
+
+        first, total = aggregator.get_change_events(limit=2)
+        cursor = aggregator.cursor_for(first[-1])
+        second, cursor = aggregator.get_change_events_page(cursor, limit=2)
+        third, last_cursor = aggregator.get_change_events_page(cursor, limit=2)
+
+        assert total == 5
+        ids = [e.id for e in first + second + third]
+        assert len(set(ids)) == 5
+        assert ids == [e.id for e in aggregator.get_change_events(limit=5)[0]]
+        assert last_cursor is None
+
+    def test_invalid_cursor(self, db):
+        with pytest.raises(InvalidCursorError):
+            DataChangeAggregator(db, TENANT).get_change_events_page("not-a-cursor")
+
+
+class TestRecordedAfter:
+
+    def test_late_events_with_old_occurred_at_are_delivered(self, db):
+        _record_syncs(db, 1)
+        aggregator = DataChangeAggregator(db, TENANT)
+        seen = aggregator.get_feed_version()
+
+        run = SimpleNamespace(
+            rows_synced=10, duration_seconds=None, connector_id="conn-2",
+            run_id="run-1", completed_at=datetime.now(timezone.utc) - timedelta(days=2),
+        )
+        aggregator.record_sync_completed(run, "Meta Ads")
+        db.commit()
+
+        events = aggregator.get_events_recorded_after(seen)
+        assert [e.affected_connector_name for e in events] == ["Meta Ads"]
+        assert events[0].feed_sequence == aggregator.get_feed_version() == 2
+        assert aggregator.get_events_recorded_after(2) == []
+
+
+class FakeRequest:
+    """Request stand-in for the stream route: connected for a fixed number of checks."""
+
+    def __init__(self, checks, headers=None):
+        self.state = SimpleNamespace()
+        self.headers = headers or {}
+        self._checks = checks
+
+    async def is_disconnected(self):
+        self._checks -= 1
+        return self._checks < 0
+
+
+class TestStream:
+
+    async def _stream(self, session_factory, request, between_polls=None):
+        chunks = []
+        with patch.object(what_changed, "get_session_factory", return_value=session_factory), \
+                patch.object(what_changed, "get_tenant_context",
+                             return_value=SimpleNamespace(tenant_id=TENANT)), \
+                patch.object(what_changed, "STREAM_POLL_SECONDS", 0):
+            response = await what_changed.stream_change_events(request)
+            async for chunk in response.body_iterator:
+                chunks.append(chunk)
+                if between_polls and len(chunks) == 1:
+                    between_polls()
+        return chunks
+
+    def _changes(self, chunks):
+        return [
+            json.loads(chunk.split("data: ", 1)[1])
+            for chunk in chunks if "event: change" in chunk
+        ]
+
+    @pytest.mark.asyncio
+    async def test_pushes_events_recorded_after_connect(self, session_factory):
+        db = session_factory()
+        _record_syncs(db, 2)
+
+        chunks = await self._stream(
+            session_factory,
+            FakeRequest(checks=3),
+            between_polls=lambda: _record_syncs(db, 1),
+        )
+
+        changes = self._changes(chunks)
+        assert len(changes) == 1
+        assert changes[0]["event_type"] == DataChangeEventType.SYNC_COMPLETED.value
+        db.close()
+
+    @pytest.mark.asyncio
+    async def test_resumes_after_last_event_id(self, session_factory):
+        db = session_factory()
+        _record_syncs(db, 3)
+
+        chunks = await self._stream(
+            session_factory,
+            FakeRequest(checks=1, headers={"last-event-id": "1"}),
+        )
+
+        assert len(self._changes(chunks)) == 2
+        assert chunks[-1].startswith("id: 3\n")
+        db.close()
+
+    @pytest.mark.asyncio
+    async def test_invalid_last_event_id_is_400(self, session_factory):
+        with pytest.raises(HTTPException) as exc_info:
+            await self._stream(
+                session_factory,
+                FakeRequest(checks=1, headers={"last-event-id": "bogus"}),
+            )
+        assert exc_info.value.status_code == 400
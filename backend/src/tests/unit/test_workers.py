@@ -92,8 +92,8 @@ class TestBackfillRunCycle:
             executor.recover_stale_jobs.return_value = 2
             executor.find_approved_requests.return_value = [mock_request]
             executor.get_tenants_with_running_jobs.return_value = set()
-            executor.pick_next_job.side_effect = [mock_job, None]
-            executor.execute_job = AsyncMock()
+            executor.pick_next_jobs.side_effect = [[mock_job], []]
+            executor.execute_jobs = AsyncMock()
 
             await run_cycle(mock_db, stats)
 
@@ -103,7 +103,7 @@ class TestBackfillRunCycle:
         assert stats.cycles == 1
         assert stats.errors == 0
         executor.create_jobs_for_request.assert_called_once_with(mock_request)
-        executor.execute_job.assert_awaited_once_with(mock_job)
+        executor.execute_jobs.assert_awaited_once_with([mock_job])
 
     @pytest.mark.asyncio
     async def test_run_cycle_updates_stats(self, mock_db, stats):
@@ -115,7 +115,7 @@ class TestBackfillRunCycle:
             executor.recover_stale_jobs.return_value = 0
             executor.find_approved_requests.return_value = []
             executor.get_tenants_with_running_jobs.return_value = set()
-            executor.pick_next_job.return_value = None
+            executor.pick_next_jobs.return_value = []
 
             await run_cycle(mock_db, stats)
 
@@ -154,14 +154,14 @@ class TestBackfillRunCycle:
             executor.recover_stale_jobs.return_value = 0
             executor.find_approved_requests.return_value = []
             executor.get_tenants_with_running_jobs.return_value = set()
-            # Provide more jobs than the limit
-            executor.pick_next_job.side_effect = jobs
-            executor.execute_job = AsyncMock()
+            # Provide more pipelines than the limit
+            executor.pick_next_jobs.side_effect = [[job] for job in jobs]
+            executor.execute_jobs = AsyncMock()
 
             await run_cycle(mock_db, stats)
 
         assert stats.jobs_executed == 2
-        assert executor.execute_job.await_count == 2
+        assert executor.execute_jobs.await_count == 2
 
     @pytest.mark.asyncio
     async def test_run_cycle_rate_limits_per_tenant(self, mock_db, stats):
@@ -177,22 +177,42 @@ class TestBackfillRunCycle:
             executor.recover_stale_jobs.return_value = 0
             executor.find_approved_requests.return_value = []
             executor.get_tenants_with_running_jobs.return_value = {"busy_t"}
-            # First call returns a job, second returns None
-            executor.pick_next_job.side_effect = [job1, None]
-            executor.execute_job = AsyncMock()
+            # First call returns a pipeline, second returns nothing
+            executor.pick_next_jobs.side_effect = [[job1], []]
+            executor.execute_jobs = AsyncMock()
 
             await run_cycle(mock_db, stats)
 
         # After executing job1 (tenant_id="t1"), busy_tenants set is mutated
         # in-place to include "t1". Since it's the same set object, the final
         # state should contain both "busy_t" and "t1".
-        calls = executor.pick_next_job.call_args_list
+        calls = executor.pick_next_jobs.call_args_list
         assert len(calls) == 2
         # The set is mutated in-place, so both calls see the final state
         final_exclusions = calls[1].kwargs["exclude_tenant_ids"]
         assert "t1" in final_exclusions
         assert "busy_t" in final_exclusions
 
+    @pytest.mark.asyncio
+    async def test_run_cycle_counts_every_chunk_in_pipeline(self, mock_db, stats):
+        """A pipeline of several chunks counts each chunk as executed."""
+        chunks = [Mock(tenant_id="t1") for _ in range(3)]
+
+        with patch(
+            "src.services.backfill_executor.BackfillExecutor"
+        ) as MockExecutor:
+            executor = MockExecutor.return_value
+            executor.recover_stale_jobs.return_value = 0
+            executor.find_approved_requests.return_value = []
+            executor.get_tenants_with_running_jobs.return_value = set()
+            executor.pick_next_jobs.side_effect = [chunks, []]
+            executor.execute_jobs = AsyncMock()
+
+            await run_cycle(mock_db, stats)
+
+        assert stats.jobs_executed == 3
+        executor.execute_jobs.assert_awaited_once_with(chunks)
+
 
 # ---------------------------------------------------------------------------
 # dbt_runner — run_dbt_incremental
@@ -209,7 +229,8 @@ class TestDbtRunner:
         mock_process.communicate.return_value = (b"ok", b"")
         mock_process.returncode = 0
 
-        with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process), \
+             patch("src.workers.dbt_runner._after_successful_run"):
             result = await run_dbt_incremental()
 
         assert result is True
@@ -221,10 +242,64 @@ class TestDbtRunner:
         mock_process.communicate.return_value = (b"", b"error")
         mock_process.returncode = 1
 
-        with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process), \
+             patch("src.workers.dbt_runner._after_successful_run") as after_run:
             result = await run_dbt_incremental()
 
         assert result is False
+        after_run.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_success_refreshes_spend_rollups(self):
+        """A successful run refreshes budget pacing rollups."""
+        mock_process = AsyncMock()
+        mock_process.communicate.return_value = (b"ok", b"")
+        mock_process.returncode = 0
+        db = MagicMock()
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process), \
+             patch("src.database.session.get_db_session_sync", return_value=iter([db])), \
+             patch("src.services.budget_pacing_service.refresh_spend_rollups") as refresh:
+            result = await run_dbt_incremental()
+
+        assert result is True
+        refresh.assert_called_once_with(db)
+
+    @pytest.mark.asyncio
+    async def test_success_bumps_analytics_data_version(self):
+        """A successful run moves cached mart reads to a new data version."""
+        mock_process = AsyncMock()
+        mock_process.communicate.return_value = (b"ok", b"")
+        mock_process.returncode = 0
+        cache = MagicMock()
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process), \
+             patch("src.database.session.get_db_session_sync", return_value=iter([MagicMock()])), \
+             patch("src.services.budget_pacing_service.refresh_spend_rollups"), \
+             patch("src.services.analytics_snapshot_cache.get_analytics_cache", return_value=cache):
+            result = await run_dbt_incremental()
+
+        assert result is True
+        cache.bump_data_version.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_rollup_refresh_failure_keeps_run_successful(self):
+        """Post-run refresh errors are logged, not reported as a failed run."""
+        mock_process = AsyncMock()
+        mock_process.communicate.return_value = (b"ok", b"")
+        mock_process.returncode = 0
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process), \
+             patch("src.database.session.get_db_session_sync", return_value=iter([MagicMock()])), \
+             patch(
+                 "src.services.budget_pacing_service.refresh_spend_rollups",
+                 side_effect=RuntimeError("relation does not exist"),
+             ), \
+             patch("src.services.analytics_snapshot_cache.get_analytics_cache") as get_cache:
+            result = await run_dbt_incremental()
+
+        assert result is True
+        get_cache.return_value.bump_data_version.assert_called_once_with()
 
     @pytest.mark.asyncio
     async def test_exception_returns_false(self):
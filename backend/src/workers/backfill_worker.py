@@ -5,10 +5,11 @@ historical data backfills.
 Runs as a long-lived process. Each cycle:
 1. Recovers stale RUNNING jobs (crash recovery)
 2. Creates chunk jobs for newly approved requests
-3. Picks and executes queued jobs (one per tenant at a time)
+3. Picks and executes queued jobs (one pipeline of chunks per tenant
+   at a time; see BackfillExecutor.execute_jobs)
 
 CONSTRAINTS:
-- One active backfill job per tenant (rate limit)
+- One active backfill pipeline per tenant (rate limit)
 - No Celery, no Temporal — driven by Postgres job state
 - Graceful shutdown on SIGTERM/SIGINT
 - Survives worker restarts (progress persisted in DB)
@@ -107,21 +108,21 @@ async def run_cycle(db_session: Session, stats: WorkerStats) -> None:
             executor.create_jobs_for_request(request)
             stats.requests_created += 1
 
-        # Phase 3: Execute queued jobs (one per tenant — rate limit)
+        # Phase 3: Execute queued jobs (one pipeline per tenant — rate limit)
         busy_tenants = executor.get_tenants_with_running_jobs()
         executed_this_cycle = 0
 
         for _ in range(MAX_JOBS_PER_CYCLE):
-            job = executor.pick_next_job(exclude_tenant_ids=busy_tenants)
-            if not job:
+            jobs = executor.pick_next_jobs(exclude_tenant_ids=busy_tenants)
+            if not jobs:
                 break
 
-            await executor.execute_job(job)
-            executed_this_cycle += 1
-            stats.jobs_executed += 1
+            await executor.execute_jobs(jobs)
+            executed_this_cycle += len(jobs)
+            stats.jobs_executed += len(jobs)
 
-            # Block this tenant from running another job this cycle
-            busy_tenants.add(job.tenant_id)
+            # Block this tenant from running another pipeline this cycle
+            busy_tenants.add(jobs[0].tenant_id)
 
         stats.cycles += 1
 
@@ -165,7 +166,7 @@ async def run_worker() -> None:
         "Backfill worker starting",
         extra={
             "poll_interval_seconds": POLL_INTERVAL_SECONDS,
-            "max_jobs_per_cycle": MAX_JOBS_PER_CYCLE,
+            "max_pipelines_per_cycle": MAX_JOBS_PER_CYCLE,
         },
     )
 
@@ -9,6 +9,10 @@ Called two ways:
   2. Scheduled:    invoked directly as a Render cron job (hourly fallback) via
                    `python -m src.workers.dbt_runner`.
 
+After a successful run, state derived from the marts is refreshed before
+the lock is released: budget pacing spend rollups, and the analytics data
+version that keys cached mart reads.
+
 Concurrency guard: a module-level asyncio.Lock prevents two simultaneous dbt
 runs regardless of how many executor cycles trigger it at the same time. If
 dbt is already running when the trigger fires, the new request is dropped and
@@ -78,6 +82,7 @@ async def run_dbt_incremental() -> bool:
                         "output_tail": stdout.decode()[-500:] if stdout else "",
                     },
                 )
+                await asyncio.to_thread(_after_successful_run)
                 return True
 
             logger.error(
@@ -97,6 +102,30 @@ async def run_dbt_incremental() -> bool:
             return False
 
 
+def _after_successful_run() -> None:
+    """
+    Refresh state derived from the marts dbt just rebuilt.
+
+    Best effort: the run itself succeeded, so failures are logged and the
+    next successful run catches up.
+    """
+    from src.database.session import get_db_session_sync
+    from src.services.analytics_snapshot_cache import get_analytics_cache
+    from src.services.budget_pacing_service import refresh_spend_rollups
+
+    try:
+        for db in get_db_session_sync():
+            refresh_spend_rollups(db)
+    except Exception as exc:
+        logger.warning(
+            "dbt_runner.spend_rollup_refresh_failed",
+            extra={"error": str(exc)},
+        )
+
+    # Cached mart reads (AI chat snapshots, KPI summary) move to new keys
+    get_analytics_cache().bump_data_version()
+
+
 def main() -> None:
     """Entry point for the Render dbt-incremental cron job."""
     logging.basicConfig(